@@ -140,6 +140,82 @@ class DiversityMetrics:
         
         return metrics
     
+    def compute_grouped_metrics(self, df: pd.DataFrame, group_cols: List[str],
+                                name_col: str = 'name', count_col: str = 'count') -> pd.DataFrame:
+        """
+        Compute all diversity metrics for every group in a single pass.
+        
+        Equivalent to calling compute_all_metrics on each group's
+        groupby(name)[count].sum(), but aggregates once, sorts counts within
+        each group, and reduces every metric with grouped sums instead of
+        boolean-filtering the full table per group.
+        
+        Returns one row per group with the group columns plus the
+        compute_all_metrics fields (without 'label').
+        """
+        keys = list(group_cols)
+        
+        counts = df.groupby(keys + [name_col], sort=False, observed=True)[count_col].sum().reset_index()
+        counts = counts.sort_values(keys + [count_col], ascending=[True] * len(keys) + [False],
+                                    kind='mergesort', ignore_index=True)
+        
+        grouped = counts.groupby(keys, sort=False, observed=True)
+        c = counts[count_col].to_numpy(dtype=np.float64)
+        total = grouped[count_col].transform('sum').to_numpy(dtype=np.float64)
+        n = grouped[count_col].transform('size').to_numpy(dtype=np.float64)
+        rank_desc = grouped.cumcount().to_numpy()
+        
+        p = np.divide(c, total, out=np.zeros_like(c), where=total > 0)
+        plogp = np.zeros_like(p)
+        np.log2(p, out=plogp, where=p > 0)
+        
+        parts = counts[keys].copy()
+        parts['count'] = c
+        parts['plogp'] = p * plogp
+        parts['p2'] = p ** 2
+        # Ascending 1-based rank for the Gini numerator (ties do not change the sum)
+        parts['rank_weighted'] = (n - rank_desc) * c
+        for top_n in (10, 50, 100):
+            parts[f'top_{top_n}'] = np.where(rank_desc < top_n, c, 0.0)
+        
+        summary = parts.groupby(keys, sort=True, observed=True).agg(
+            total_unique_names=('count', 'size'),
+            total_count=('count', 'sum'),
+            plogp=('plogp', 'sum'),
+            p2=('p2', 'sum'),
+            rank_weighted=('rank_weighted', 'sum'),
+            top_10=('top_10', 'sum'),
+            top_50=('top_50', 'sum'),
+            top_100=('top_100', 'sum'),
+        ).reset_index()
+        
+        size = summary['total_unique_names'].to_numpy(dtype=np.float64)
+        totals = summary['total_count'].to_numpy(dtype=np.float64)
+        has_total = totals > 0
+        
+        def share(values):
+            return np.divide(values, totals, out=np.zeros_like(totals), where=has_total)
+        
+        entropy = np.where(has_total, -summary['plogp'].to_numpy(), 0.0)
+        
+        result = summary[keys].copy()
+        result['total_unique_names'] = summary['total_unique_names'].astype(int)
+        result['total_count'] = totals.astype(np.int64)
+        result['shannon_entropy'] = entropy
+        result['simpson_index'] = np.where(has_total, 1 - summary['p2'].to_numpy(), 0.0)
+        result['gini_coefficient'] = np.where(
+            has_total,
+            2 * share(summary['rank_weighted'].to_numpy()) / np.maximum(size, 1) - (size + 1) / np.maximum(size, 1),
+            0.0
+        )
+        result['top_10_concentration_pct'] = share(summary['top_10'].to_numpy()) * 100
+        result['top_50_concentration_pct'] = share(summary['top_50'].to_numpy()) * 100
+        result['top_100_concentration_pct'] = share(summary['top_100'].to_numpy()) * 100
+        result['hhi'] = np.where(has_total, summary['p2'].to_numpy() * 10000, 0.0)
+        result['effective_num_names'] = 2 ** entropy
+        
+        return result
+    
     def analyze_usa_diversity(self) -> pd.DataFrame:
         """
         Analyze U.S. name diversity over time.
@@ -152,51 +228,35 @@ class DiversityMetrics:
             print("  ✗ U.S. processed data not found")
             return None
         
-        df = pd.read_parquet(usa_file)
+        df = pd.read_parquet(usa_file, columns=['year', 'sex', 'name', 'count'])
+        df = df[df['sex'].isin(['M', 'F'])]
+        df['decade'] = (df['year'] // 10) * 10
         
-        results = []
+        metric_columns = [
+            'total_unique_names', 'total_count', 'shannon_entropy', 'simpson_index',
+            'gini_coefficient', 'top_10_concentration_pct', 'top_50_concentration_pct',
+            'top_100_concentration_pct', 'hhi', 'effective_num_names'
+        ]
         
         # Yearly metrics by sex
-        for year in sorted(df['year'].unique()):
-            year_data = df[df['year'] == year]
-            
-            for sex in ['M', 'F']:
-                sex_data = year_data[year_data['sex'] == sex]
-                if len(sex_data) == 0:
-                    continue
-                
-                name_counts = sex_data.groupby('name')['count'].sum()
-                metrics = self.compute_all_metrics(
-                    name_counts, 
-                    label=f"USA_{year}_{sex}"
-                )
-                metrics['year'] = year
-                metrics['sex'] = sex
-                metrics['country'] = 'USA'
-                results.append(metrics)
+        yearly = self.compute_grouped_metrics(df, ['year', 'sex'])
+        yearly['label'] = 'USA_' + yearly['year'].astype(str) + '_' + yearly['sex']
         
         # Decade aggregates
-        df['decade'] = (df['year'] // 10) * 10
-        for decade in sorted(df['decade'].unique()):
-            decade_data = df[df['decade'] == decade]
-            
-            for sex in ['M', 'F']:
-                sex_data = decade_data[decade_data['sex'] == sex]
-                if len(sex_data) == 0:
-                    continue
-                
-                name_counts = sex_data.groupby('name')['count'].sum()
-                metrics = self.compute_all_metrics(
-                    name_counts,
-                    label=f"USA_{decade}s_{sex}"
-                )
-                metrics['year'] = decade
-                metrics['sex'] = sex
-                metrics['country'] = 'USA'
-                metrics['period_type'] = 'decade'
-                results.append(metrics)
-        
-        results_df = pd.DataFrame(results)
+        decades = self.compute_grouped_metrics(df, ['decade', 'sex']).rename(columns={'decade': 'year'})
+        decades['label'] = 'USA_' + decades['year'].astype(str) + 's_' + decades['sex']
+        decades['period_type'] = 'decade'
+        
+        # Same row order as before: period, then M before F
+        frames = []
+        for frame in (yearly, decades):
+            frame['country'] = 'USA'
+            frame = frame.sort_values(['year', 'sex'], ascending=[True, False], kind='mergesort')
+            frames.append(frame)
+        
+        results_df = pd.concat(frames, ignore_index=True)
+        results_df = results_df[['label'] + metric_columns + ['year', 'sex', 'country', 'period_type']]
+        
         output_path = self.results_dir / "usa_diversity_metrics.parquet"
         results_df.to_parquet(output_path, index=False)
         
@@ -27,6 +27,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler
 
 from core.models import db, Band, BandAnalysis
+from analyzers.phonetic_similarity_join import PhoneticSimilarityJoin
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,10 @@ class BandPhoneticLineageAnalyzer:
     def __init__(self):
         self.similarity_threshold = 0.7  # Threshold for "phonetically similar"
         
+        # Sample caps for the mean-similarity baselines (every pair still needs an edit distance)
+        self.cross_cohort_sample_size = 50
+        self.cross_decade_sample_size = 100
+        
         # Phonetic feature groups for similarity matching
         self.plosives = set('ptkbdg')
         self.fricatives = set('fvsθðszʃʒhç')
@@ -135,28 +140,25 @@ class BandPhoneticLineageAnalyzer:
         """
         bands = df.to_dict('records')
         
-        # Compute all pairwise similarities
+        # Blocked similarity join over all pairs (edit distance only on candidates)
+        join = PhoneticSimilarityJoin(bands)
+        
         similarity_edges = []
         
-        for i, band1 in enumerate(bands):
-            for j, band2 in enumerate(bands):
-                if i >= j:  # Avoid duplicates and self-comparison
-                    continue
-                
-                # Compute composite similarity
-                similarity = self._compute_phonetic_similarity(band1, band2)
-                
-                if similarity >= self.similarity_threshold:
-                    similarity_edges.append({
-                        'band1': band1['name'],
-                        'band2': band2['name'],
-                        'band1_year': band1['formation_year'],
-                        'band2_year': band2['formation_year'],
-                        'similarity': similarity,
-                        'year_gap': abs(band1['formation_year'] - band2['formation_year']) if band1['formation_year'] and band2['formation_year'] else None,
-                        'same_decade': band1['formation_decade'] == band2['formation_decade'],
-                        'same_genre': band1['genre_cluster'] == band2['genre_cluster']
-                    })
+        for match in join.join(self.similarity_threshold):
+            band1 = bands[match['i']]
+            band2 = bands[match['j']]
+            
+            similarity_edges.append({
+                'band1': band1['name'],
+                'band2': band2['name'],
+                'band1_year': band1['formation_year'],
+                'band2_year': band2['formation_year'],
+                'similarity': match['similarity'],
+                'year_gap': abs(band1['formation_year'] - band2['formation_year']) if band1['formation_year'] and band2['formation_year'] else None,
+                'same_decade': band1['formation_decade'] == band2['formation_decade'],
+                'same_genre': band1['genre_cluster'] == band2['genre_cluster']
+            })
         
         # Sort by similarity
         similarity_edges.sort(key=lambda x: x['similarity'], reverse=True)
@@ -254,37 +256,39 @@ class BandPhoneticLineageAnalyzer:
         influence_patterns = []
         
         # Define "highly successful" early bands (formation < 1980, high popularity)
-        influential_bands = df[
+        influential_mask = (
             (df['formation_year'] < 1980) & 
             (df['popularity_score'] > 75)
-        ]
+        ).to_numpy()
+        influential_bands = df[influential_mask]
         
         logger.info(f"Found {len(influential_bands)} highly successful early bands")
         
-        for idx, influential in influential_bands.iterrows():
+        join = PhoneticSimilarityJoin(df)
+        years = df['formation_year'].to_numpy()
+        
+        for position in np.flatnonzero(influential_mask):
+            influential = df.iloc[position]
+            
             # Find later bands that are phonetically similar
-            later_bands = df[
-                (df['formation_year'] > influential['formation_year']) &
-                (df['formation_year'] < influential['formation_year'] + 20)  # Within 20 years
-            ]
+            later_positions = np.flatnonzero(
+                (years > influential['formation_year']) &
+                (years < influential['formation_year'] + 20)  # Within 20 years
+            )
             
             similar_later = []
             
-            for idx2, later in later_bands.iterrows():
-                similarity = self._compute_phonetic_similarity(
-                    influential.to_dict(),
-                    later.to_dict()
-                )
-                
-                if similarity >= 0.65:  # Lower threshold for influence detection
-                    similar_later.append({
-                        'name': later['name'],
-                        'year': later['formation_year'],
-                        'year_gap': later['formation_year'] - influential['formation_year'],
-                        'similarity': float(similarity),
-                        'genre': later['genre_cluster'],
-                        'popularity': later['popularity_score']
-                    })
+            # Lower threshold for influence detection
+            for match in join.join(0.65, rows=[position], cols=later_positions):
+                later = df.iloc[match['j']]
+                similar_later.append({
+                    'name': later['name'],
+                    'year': later['formation_year'],
+                    'year_gap': later['formation_year'] - influential['formation_year'],
+                    'similarity': float(match['similarity']),
+                    'genre': later['genre_cluster'],
+                    'popularity': later['popularity_score']
+                })
             
             if similar_later:
                 # Sort by similarity
@@ -324,39 +328,31 @@ class BandPhoneticLineageAnalyzer:
         cohort_patterns = {}
         
         decades = df['formation_decade'].dropna().unique()
+        join = PhoneticSimilarityJoin(df)
+        decade_values = df['formation_decade'].to_numpy()
         
         for decade in sorted(decades):
-            decade_bands = df[df['formation_decade'] == decade]
+            decade_positions = np.flatnonzero(decade_values == decade)
+            decade_bands = df.iloc[decade_positions]
             
             if len(decade_bands) < 10:
                 continue
             
             # Compute within-cohort similarity
-            within_cohort_similarities = []
-            
-            bands_list = decade_bands.to_dict('records')
-            
-            for i, band1 in enumerate(bands_list):
-                for j, band2 in enumerate(bands_list):
-                    if i >= j:
-                        continue
-                    
-                    similarity = self._compute_phonetic_similarity(band1, band2)
-                    within_cohort_similarities.append(similarity)
+            within_cohort_similarities = join.pairwise_similarities(decade_positions)
             
             if not within_cohort_similarities:
                 continue
             
             avg_similarity = np.mean(within_cohort_similarities)
             
-            # Compare to cross-cohort similarity (baseline)
-            other_decades = df[df['formation_decade'] != decade]
-            cross_cohort_similarities = []
-            
-            for band1 in decade_bands.to_dict('records')[:50]:  # Sample for efficiency
-                for band2 in other_decades.sample(min(50, len(other_decades))).to_dict('records'):
-                    similarity = self._compute_phonetic_similarity(band1, band2)
-                    cross_cohort_similarities.append(similarity)
+            # Compare to cross-cohort similarity (baseline) on a random sample of other decades
+            other_positions = np.flatnonzero(decade_values != decade)
+            sample_size = min(self.cross_cohort_sample_size, len(other_positions))
+            cross_cohort_similarities = join.pairwise_similarities(
+                decade_positions[:self.cross_cohort_sample_size],
+                np.random.choice(other_positions, sample_size, replace=False)
+            ) if sample_size else []
             
             baseline_similarity = np.mean(cross_cohort_similarities) if cross_cohort_similarities else 0
             
@@ -555,6 +551,7 @@ class BandPhoneticLineageAnalyzer:
         logger.info("Identifying phonetic families...")
         
         families = {}
+        join = None  # built on the first seed found in df
         
         # Seed families with highly influential bands
         seeds = [
@@ -587,20 +584,21 @@ class BandPhoneticLineageAnalyzer:
             
             # Find descendants (later similar bands)
             if seed_year:
-                later_bands = df[df['formation_year'] > seed_year]
+                if join is None:
+                    join = PhoneticSimilarityJoin(df)
+                seed_position = int(np.flatnonzero((df['name'] == seed_name).to_numpy())[0])
+                later_positions = np.flatnonzero((df['formation_year'] > seed_year).to_numpy())
                 
                 descendants = []
-                for idx, later in later_bands.iterrows():
-                    similarity = self._compute_phonetic_similarity(seed_dict, later.to_dict())
-                    
-                    if similarity >= 0.65:
-                        descendants.append({
-                            'name': later['name'],
-                            'year': later['formation_year'],
-                            'year_gap': later['formation_year'] - seed_year,
-                            'similarity': float(similarity),
-                            'popularity': later['popularity_score']
-                        })
+                for match in join.join(0.65, rows=[seed_position], cols=later_positions):
+                    later = df.iloc[match['j']]
+                    descendants.append({
+                        'name': later['name'],
+                        'year': later['formation_year'],
+                        'year_gap': later['formation_year'] - seed_year,
+                        'similarity': float(match['similarity']),
+                        'popularity': later['popularity_score']
+                    })
                 
                 families[seed['pattern']] = {
                     'archetype': seed_name,
@@ -638,25 +636,22 @@ class BandPhoneticLineageAnalyzer:
         
         # Build similarity matrix (decade × decade)
         similarity_matrix = {}
+        join = PhoneticSimilarityJoin(df)
+        decade_values = df['formation_decade'].to_numpy()
         
         for decade1 in decades:
             similarity_matrix[f"{int(decade1)}s"] = {}
             
-            bands1 = df[df['formation_decade'] == decade1].to_dict('records')
+            positions1 = np.flatnonzero(decade_values == decade1)[:self.cross_decade_sample_size]
             
             for decade2 in decades:
                 if decade1 == decade2:
                     continue
                 
-                bands2 = df[df['formation_decade'] == decade2].to_dict('records')
+                positions2 = np.flatnonzero(decade_values == decade2)[:self.cross_decade_sample_size]
                 
                 # Compute average cross-decade similarity
-                similarities = []
-                
-                for band1 in bands1[:100]:  # Sample for efficiency
-                    for band2 in bands2[:100]:
-                        sim = self._compute_phonetic_similarity(band1, band2)
-                        similarities.append(sim)
+                similarities = join.pairwise_similarities(positions1, positions2)
                 
                 avg_sim = np.mean(similarities) if similarities else 0
                 
@@ -783,25 +778,23 @@ class BandPhoneticLineageAnalyzer:
             return {'error': f'Band "{target_band}" not found'}
         
         target_dict = target.iloc[0].to_dict()
+        target_position = int(np.flatnonzero((df['name'].str.lower() == target_band.lower()).to_numpy())[0])
+        other_positions = np.flatnonzero((df['name'].str.lower() != target_band.lower()).to_numpy())
         
-        # Compute similarity to all other bands
+        # Compute similarity to all other bands (moderate threshold)
+        join = PhoneticSimilarityJoin(df)
         neighbors = []
         
-        for idx, other in df.iterrows():
-            if other['name'].lower() == target_band.lower():
-                continue
-            
-            similarity = self._compute_phonetic_similarity(target_dict, other.to_dict())
-            
-            if similarity >= 0.5:  # Moderate threshold
-                neighbors.append({
-                    'name': other['name'],
-                    'similarity': float(similarity),
-                    'year': other['formation_year'],
-                    'year_relative': 'earlier' if other['formation_year'] < target_dict['formation_year'] else 'later',
-                    'genre': other['genre_cluster'],
-                    'popularity': other['popularity_score']
-                })
+        for match in join.join(0.5, rows=[target_position], cols=other_positions):
+            other = df.iloc[match['j']]
+            neighbors.append({
+                'name': other['name'],
+                'similarity': float(match['similarity']),
+                'year': other['formation_year'],
+                'year_relative': 'earlier' if other['formation_year'] < target_dict['formation_year'] else 'later',
+                'genre': other['genre_cluster'],
+                'popularity': other['popularity_score']
+            })
         
         # Sort by similarity
         neighbors.sort(key=lambda x: x['similarity'], reverse=True)
@@ -6,8 +6,10 @@ Tests if name pattern correlations translate to profitable betting edge
 
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional
+from itertools import product
+from typing import Dict, List, Optional, Sequence
 import numpy as np
+import pandas as pd
 import logging
 from analyzers.sports_betting_analyzer import SportsBettingAnalyzer
 from analyzers.betting_ev_calculator import BettingEVCalculator
@@ -15,6 +17,16 @@ from utils.betting_bankroll_manager import BettingBankrollManager
 
 logger = logging.getLogger(__name__)
 
+# -110 American odds
+DECIMAL_ODDS = 100 / 110 + 1
+MARKET_LINE = 50
+
+DEFAULT_SWEEP_GRID = {
+    'min_scores': [50, 55, 60, 65, 70, 75],
+    'min_confidences': [40, 50, 60, 70],
+    'min_evs': [0.0, 0.02, 0.03, 0.04, 0.05, 0.08],
+}
+
 
 class BettingBacktester:
     """Backtest betting strategies on historical data"""
@@ -358,6 +370,300 @@ class BettingBacktester:
             }
         
         return results
+    
+    # =========================================================================
+    # PARAMETER SWEEP / WALK-FORWARD
+    # =========================================================================
+    
+    def _betting_sequence(self, sport: str, athletes: Optional[List[Dict]] = None,
+                          sort_key: Optional[str] = None) -> List[Dict]:
+        """
+        Athletes in betting order
+        
+        Athlete records carry no timestamps, so unless sort_key names a
+        chronological field the order is the seeded shuffle run_backtest uses.
+        """
+        if athletes is None:
+            athletes = self.betting_analyzer.get_athlete_data(sport, limit=2000)
+        athletes = list(athletes)
+        
+        if sort_key:
+            athletes.sort(key=lambda a: a[sort_key])
+        else:
+            np.random.seed(42)
+            np.random.shuffle(athletes)
+        
+        return athletes
+    
+    def _precompute_bets(self, athletes: List[Dict], sport: str) -> Dict[str, np.ndarray]:
+        """
+        Threshold-independent inputs for every athlete, computed once
+        
+        Score, confidence, edge, EV and Kelly fraction do not depend on the
+        thresholds being tuned, so a sweep only has to mask these arrays.
+        """
+        sizing = BettingBankrollManager(
+            initial_bankroll=self.initial_bankroll,
+            max_bet_percentage=0.05,
+            max_simultaneous_exposure=0.25
+        )
+        
+        n = len(athletes)
+        columns = {key: np.zeros(n) for key in ('score', 'confidence', 'edge', 'ev', 'kelly')}
+        columns['won'] = np.zeros(n, dtype=bool)
+        
+        for i, athlete in enumerate(athletes):
+            linguistic_features = {
+                'syllables': athlete['syllables'],
+                'harshness': athlete['harshness'],
+                'memorability': athlete['memorability'],
+                'length': athlete['length']
+            }
+            score_result = self.betting_analyzer.calculate_player_score(linguistic_features, sport)
+            predicted_value = score_result['overall_score']
+            confidence = score_result['confidence']
+            edge = (predicted_value - MARKET_LINE) / 100
+            
+            ev_result = self.ev_calculator.calculate_prop_ev(
+                predicted_value=predicted_value,
+                market_line=MARKET_LINE,
+                over_odds=-110,
+                under_odds=-110,
+                confidence=confidence
+            )
+            
+            if predicted_value > MARKET_LINE:
+                columns['ev'][i] = ev_result['over']['ev']
+                columns['won'][i] = athlete['actual_success'] > MARKET_LINE
+            else:
+                columns['ev'][i] = ev_result['under']['ev']
+                columns['won'][i] = athlete['actual_success'] < MARKET_LINE
+            
+            columns['score'][i] = predicted_value
+            columns['confidence'][i] = confidence
+            columns['edge'][i] = edge
+            columns['kelly'][i] = sizing.kelly_criterion(
+                abs(edge) * confidence / 100, DECIMAL_ODDS, fractional_kelly=0.25
+            )
+        
+        return columns
+    
+    def _evaluate_grid(self, bets: Dict[str, np.ndarray], grid: np.ndarray) -> pd.DataFrame:
+        """
+        Evaluate every threshold configuration over the same bet sequence
+        
+        Builds a (configs x athletes) mask and compounds the bankroll with a
+        cumulative sum of log-growth per bet, reproducing run_backtest's sizing
+        rules (Kelly fraction of current bankroll, half size after 10
+        consecutive losses, halt at 20% drawdown) without per-bet Python calls.
+        Bet amounts are not rounded to cents.
+        
+        Args:
+            bets: Output of _precompute_bets
+            grid: Array of (min_score, min_confidence, min_ev) rows
+            
+        Returns:
+            DataFrame with one row per configuration
+        """
+        min_score, min_confidence, min_ev = (grid[:, [j]] for j in range(3))
+        n = len(bets['score'])
+        
+        mask = (
+            (bets['score'] >= min_score) &
+            (bets['confidence'] >= min_confidence) &
+            (np.abs(bets['edge']) >= min_ev) &
+            (bets['ev'] >= min_ev) &
+            (bets['kelly'] > 0)
+        )
+        won = np.broadcast_to(bets['won'], mask.shape)
+        payoff = np.where(bets['won'], DECIMAL_ODDS - 1, -1.0)
+        
+        # Consecutive losses before each bet (only placed bets count)
+        losses = mask & ~won
+        loss_count = np.cumsum(losses, axis=1)
+        last_win = np.maximum.accumulate(np.where(mask & won, np.arange(n), -1), axis=1)
+        last_win_before = np.full_like(last_win, -1)
+        last_win_before[:, 1:] = last_win[:, :-1]
+        losses_at_last_win = np.where(
+            last_win_before >= 0,
+            np.take_along_axis(loss_count, np.maximum(last_win_before, 0), axis=1),
+            0
+        )
+        streak = (loss_count - losses) - losses_at_last_win
+        
+        fraction = bets['kelly'] * np.where(streak >= 10, 0.5, 1.0) * mask
+        growth = np.log1p(fraction * payoff)
+        
+        # Betting halts for good once drawdown from peak reaches 20%
+        log_path = np.cumsum(growth, axis=1)
+        log_peak = np.maximum(np.maximum.accumulate(log_path, axis=1), 0)
+        halted = np.logical_or.accumulate(1 - np.exp(log_path - log_peak) >= 0.20, axis=1)
+        placed = mask.copy()
+        placed[:, 1:] &= ~halted[:, :-1]
+        
+        growth = growth * placed
+        log_path = np.cumsum(growth, axis=1)
+        bankroll_before = self.initial_bankroll * np.exp(log_path - growth)
+        stake = fraction * bankroll_before * placed
+        profit = stake * payoff
+        
+        total_bets = placed.sum(axis=1)
+        wins = (placed & won).sum(axis=1)
+        total_staked = stake.sum(axis=1)
+        total_profit = profit.sum(axis=1)
+        final_bankroll = self.initial_bankroll * np.exp(log_path[:, -1]) if n else np.full(len(grid), float(self.initial_bankroll))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            win_rate = np.where(total_bets > 0, wins / total_bets, 0.0)
+            roi = np.where(total_staked > 0, total_profit / total_staked * 100, 0.0)
+            
+            mean_profit = np.where(total_bets > 0, total_profit / total_bets, 0.0)
+            variance = np.where(total_bets > 0, (profit ** 2).sum(axis=1) / total_bets - mean_profit ** 2, 0.0)
+            std_profit = np.sqrt(np.maximum(variance, 0))
+            sharpe = np.where((total_bets >= 2) & (std_profit > 0),
+                              mean_profit / std_profit * np.sqrt(total_bets), 0.0)
+            
+            cumulative = np.cumsum(profit, axis=1)
+            peak = np.maximum.accumulate(cumulative, axis=1)
+            drawdown = np.where(peak > 0, (peak - cumulative) / peak * 100, 0.0)
+            max_drawdown = drawdown.max(axis=1) if n else np.zeros(len(grid))
+            
+            avg_ev = np.where(total_bets > 0, (bets['ev'] * placed).sum(axis=1) / total_bets, np.nan)
+            avg_confidence = np.where(total_bets > 0, (bets['confidence'] * placed).sum(axis=1) / total_bets, np.nan)
+        
+        return pd.DataFrame({
+            'min_score': grid[:, 0],
+            'min_confidence': grid[:, 1],
+            'min_ev': grid[:, 2],
+            'total_bets': total_bets,
+            'wins': wins,
+            'losses': total_bets - wins,
+            'win_rate': win_rate * 100,
+            'total_staked': total_staked,
+            'total_profit': total_profit,
+            'roi': roi,
+            'final_bankroll': final_bankroll,
+            'total_return': (final_bankroll - self.initial_bankroll) / self.initial_bankroll * 100,
+            'sharpe_ratio': sharpe,
+            'max_drawdown': max_drawdown,
+            'avg_ev': avg_ev,
+            'avg_confidence': avg_confidence,
+            'edge_validated': (roi > 0) & (win_rate > 0.524),  # 52.4% = breakeven at -110
+            'profitable': roi > 0,
+        })
+    
+    @staticmethod
+    def _threshold_grid(min_scores: Optional[Sequence[float]],
+                        min_confidences: Optional[Sequence[float]],
+                        min_evs: Optional[Sequence[float]]) -> np.ndarray:
+        return np.array(list(product(
+            min_scores if min_scores is not None else DEFAULT_SWEEP_GRID['min_scores'],
+            min_confidences if min_confidences is not None else DEFAULT_SWEEP_GRID['min_confidences'],
+            min_evs if min_evs is not None else DEFAULT_SWEEP_GRID['min_evs'],
+        )), dtype=float)
+    
+    def parameter_sweep(self, sport: str,
+                        min_scores: Optional[Sequence[float]] = None,
+                        min_confidences: Optional[Sequence[float]] = None,
+                        min_evs: Optional[Sequence[float]] = None,
+                        athletes: Optional[List[Dict]] = None) -> pd.DataFrame:
+        """
+        Evaluate a full grid of thresholds in one pass
+        
+        Uses the same held-out 20% as run_backtest, so each row matches what
+        run_backtest reports for that (min_score, min_confidence, min_ev).
+        
+        Args:
+            sport: 'football', 'basketball', or 'baseball'
+            min_scores, min_confidences, min_evs: Threshold values to cross
+                (defaults from DEFAULT_SWEEP_GRID)
+            athletes: Preloaded athlete records (loaded from the sport DB if None)
+            
+        Returns:
+            DataFrame with one row per configuration, sorted by ROI
+        """
+        sequence = self._betting_sequence(sport, athletes)
+        if not sequence:
+            return pd.DataFrame()
+        
+        test_athletes = sequence[int(len(sequence) * 0.8):]
+        bets = self._precompute_bets(test_athletes, sport)
+        grid = self._threshold_grid(min_scores, min_confidences, min_evs)
+        
+        results = self._evaluate_grid(bets, grid)
+        results.insert(0, 'sport', sport)
+        results['bet_rate'] = results['total_bets'] / max(len(test_athletes), 1) * 100
+        
+        logger.info(f"Swept {len(grid)} configurations for {sport} on {len(test_athletes)} athletes")
+        
+        return results.sort_values('roi', ascending=False).reset_index(drop=True)
+    
+    def walk_forward(self, sport: str,
+                     min_scores: Optional[Sequence[float]] = None,
+                     min_confidences: Optional[Sequence[float]] = None,
+                     min_evs: Optional[Sequence[float]] = None,
+                     n_splits: int = 4, min_bets: int = 10,
+                     select_by: str = 'roi',
+                     athletes: Optional[List[Dict]] = None,
+                     sort_key: Optional[str] = None) -> pd.DataFrame:
+        """
+        Walk-forward threshold selection
+        
+        The betting sequence is cut into n_splits + 1 consecutive windows. For
+        each fold the grid is evaluated on all windows so far (expanding train
+        window), the best configuration by `select_by` (with at least
+        `min_bets` bets) is selected, and every configuration is evaluated on
+        the next window with a fresh bankroll.
+        
+        Args:
+            sport: 'football', 'basketball', or 'baseball'
+            min_scores, min_confidences, min_evs: Threshold values to cross
+            n_splits: Number of train/test folds
+            min_bets: Minimum training bets for a configuration to be selectable
+            select_by: Result column used to pick the configuration
+            athletes: Preloaded athlete records (loaded from the sport DB if None)
+            sort_key: Athlete field giving chronological order, if available
+            
+        Returns:
+            Tidy DataFrame with one row per (fold, phase, configuration) and a
+            'selected' flag marking the configuration chosen on each train window
+        """
+        sequence = self._betting_sequence(sport, athletes, sort_key)
+        if len(sequence) < n_splits + 1:
+            return pd.DataFrame()
+        
+        bets = self._precompute_bets(sequence, sport)
+        grid = self._threshold_grid(min_scores, min_confidences, min_evs)
+        bounds = np.linspace(0, len(sequence), n_splits + 2).astype(int)
+        
+        frames = []
+        for fold in range(1, n_splits + 1):
+            train_slice = slice(0, bounds[fold])
+            test_slice = slice(bounds[fold], bounds[fold + 1])
+            
+            train = self._evaluate_grid({k: v[train_slice] for k, v in bets.items()}, grid)
+            test = self._evaluate_grid({k: v[test_slice] for k, v in bets.items()}, grid)
+            
+            eligible = train[train['total_bets'] >= min_bets]
+            selected = eligible[select_by].idxmax() if len(eligible) else None
+            
+            for phase, frame, window in (('train', train, train_slice), ('test', test, test_slice)):
+                frame.insert(0, 'phase', phase)
+                frame.insert(0, 'fold', fold)
+                frame.insert(0, 'sport', sport)
+                frame['window_start'] = window.start
+                frame['window_end'] = window.stop
+                frame['selected'] = frame.index == selected
+                frames.append(frame)
+        
+        results = pd.concat(frames, ignore_index=True)
+        
+        chosen = results[results['selected'] & (results['phase'] == 'test')]
+        if len(chosen):
+            logger.info(f"Walk-forward {sport}: out-of-sample ROI of selected configs "
+                        f"{chosen['roi'].mean():.2f}% across {len(chosen)} folds")
+        
+        return results
 
 
 if __name__ == "__main__":
@@ -9,23 +9,41 @@ from core.models import db, Cryptocurrency, NameAnalysis, PriceHistory
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.model_selection import cross_val_score, train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score
+from utils.model_registry import ModelRegistry
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Bump when features or model configuration change
+MODEL_VERSION = 1
+
+# Seconds between registry checks for a newer model version in ensure_trained()
+FRESHNESS_CHECK_INTERVAL = 60
+
 
 class BreakoutPredictor:
     """Predict breakout potential based on name characteristics"""
     
-    def __init__(self):
+    def __init__(self, registry=None, check_interval=FRESHNESS_CHECK_INTERVAL):
         self.model = None
         self.feature_names = []
         self.is_trained = False
         self.accuracy = 0
         self.feature_importance = {}
+        self.registry = registry or ModelRegistry()
+        self.fingerprint = None
+        self.training_result = None
+        self.check_interval = check_interval
+        self._checked_at = None
     
     def train_model(self):
-        """Train breakout prediction model"""
+        """
+        Train breakout prediction model
+        
+        The fitted model is stored in the model registry keyed by a fingerprint
+        of the training data; unchanged data loads it instead of refitting.
+        """
         try:
             df = self._get_training_data()
             
@@ -38,49 +56,119 @@ class BreakoutPredictor:
             if len(y.unique()) < 2:
                 return {'success': False, 'error': 'Need both breakout and non-breakout examples'}
             
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-            
-            # Train model
-            self.model = GradientBoostingClassifier(
-                n_estimators=100,
-                max_depth=5,
-                learning_rate=0.1,
-                random_state=42
+            fingerprint = ModelRegistry.fingerprint(
+                MODEL_VERSION, df.sort_values('crypto_id').reset_index(drop=True)
             )
+            if self.is_trained and fingerprint == self.fingerprint:
+                return self.training_result
             
-            self.model.fit(X_train, y_train)
-            
-            # Evaluate
-            y_pred = self.model.predict(X_test)
-            self.accuracy = accuracy_score(y_test, y_pred)
-            precision = precision_score(y_test, y_pred, zero_division=0)
-            recall = recall_score(y_test, y_pred, zero_division=0)
-            
-            # Cross-validation
-            cv_scores = cross_val_score(self.model, X, y, cv=5)
-            
-            # Feature importance
-            self.feature_importance = dict(zip(self.feature_names, self.model.feature_importances_))
-            
-            self.is_trained = True
+            registered = self.registry.get_or_train(
+                'breakout_predictor', fingerprint, lambda: self._fit(X, y)
+            )
+            self._install(registered, fingerprint)
             
-            return {
-                'success': True,
-                'accuracy': round(self.accuracy, 3),
-                'precision': round(precision, 3),
-                'recall': round(recall, 3),
-                'cv_mean': round(cv_scores.mean(), 3),
-                'cv_std': round(cv_scores.std(), 3),
-                'training_samples': len(df),
-                'breakout_count': int(y.sum()),
-                'feature_importance': {k: round(v, 3) for k, v in sorted(self.feature_importance.items(), key=lambda x: x[1], reverse=True)}
-            }
+            return self.training_result
         
         except Exception as e:
             logger.error(f"Training error: {e}")
             return {'success': False, 'error': str(e)}
     
+    def ensure_trained(self):
+        """
+        Install the newest registered model (never retrains on data changes)
+        
+        The model is retrained out of band by train_model() after collection
+        runs. This checks the registry pointer at most once per check_interval
+        seconds and loads a newer version if one was registered. Only when
+        nothing is registered yet does it train, under the registry's lock.
+        
+        Returns:
+            True if a trained model is available
+        """
+        now = time.monotonic()
+        if self.is_trained and self._checked_at is not None \
+                and now - self._checked_at < self.check_interval:
+            return True
+        self._checked_at = now
+        
+        current = self.registry.current_fingerprint('breakout_predictor')
+        if current is not None and current != self.fingerprint:
+            registered = self.registry.load('breakout_predictor', current)
+            if registered is not None:
+                self._install(registered, current)
+        
+        if not self.is_trained:
+            self.train_model()
+        return self.is_trained
+    
+    def load_registered_model(self):
+        """Load the most recently registered model (worker startup, no database access)"""
+        registered = self.registry.load_current('breakout_predictor')
+        if registered is None:
+            return False
+        self._install(registered, registered['metadata']['fingerprint'])
+        return True
+    
+    def _install(self, registered, fingerprint):
+        metadata = registered['metadata']
+        self.model = registered['artifacts']['model']
+        self.feature_names = list(metadata['feature_names'])
+        self.feature_importance = dict(metadata['feature_importance'])
+        self.accuracy = metadata['result']['accuracy']
+        self.training_result = metadata['result']
+        self.fingerprint = fingerprint
+        self.is_trained = True
+    
+    def _fit(self, X, y):
+        """Fit and evaluate the classifier; returns (artifacts, metadata) for the registry"""
+        # Split data
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        
+        # Train model
+        model = GradientBoostingClassifier(
+            n_estimators=100,
+            max_depth=5,
+            learning_rate=0.1,
+            random_state=42
+        )
+        
+        model.fit(X_train, y_train)
+        
+        # Evaluate
+        y_pred = model.predict(X_test)
+        accuracy = accuracy_score(y_test, y_pred)
+        precision = precision_score(y_test, y_pred, zero_division=0)
+        recall = recall_score(y_test, y_pred, zero_division=0)
+        
+        # Cross-validation
+        cv_scores = cross_val_score(model, X, y, cv=5)
+        
+        # Feature importance
+        feature_importance = {
+            name: float(importance)
+            for name, importance in zip(self.feature_names, model.feature_importances_)
+        }
+        
+        result = {
+            'success': True,
+            'accuracy': round(float(accuracy), 3),
+            'precision': round(float(precision), 3),
+            'recall': round(float(recall), 3),
+            'cv_mean': round(float(cv_scores.mean()), 3),
+            'cv_std': round(float(cv_scores.std()), 3),
+            'training_samples': len(y),
+            'breakout_count': int(y.sum()),
+            'feature_importance': {k: round(v, 3) for k, v in sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)}
+        }
+        
+        metadata = {
+            'feature_names': list(self.feature_names),
+            'feature_importance': feature_importance,
+            'result': result,
+            'model_version': MODEL_VERSION,
+        }
+        return {'model': model}, metadata
+    
     def _get_training_data(self):
         """Get dataset for training"""
         latest_prices_subq = db.session.query(
@@ -141,10 +229,8 @@ class BreakoutPredictor:
     def predict_breakout_probability(self, crypto_id):
         """Predict breakout probability for a cryptocurrency"""
         try:
-            if not self.is_trained:
-                train_result = self.train_model()
-                if not train_result['success']:
-                    return None
+            if not self.ensure_trained():
+                return None
             
             # Get crypto data
             analysis = NameAnalysis.query.filter_by(crypto_id=crypto_id).first()
@@ -267,8 +353,7 @@ class BreakoutPredictor:
     def get_top_breakout_candidates(self, min_rank=50, limit=20):
         """Get top breakout candidates from lower-ranked coins"""
         try:
-            if not self.is_trained:
-                self.train_model()
+            self.ensure_trained()
             
             # Get all cryptocurrencies ranked below threshold
             candidates = Cryptocurrency.query.filter(Cryptocurrency.rank >= min_rank).all()
@@ -5,12 +5,72 @@ Theory: More signal = better predictions = higher ROI
 Expected Impact: +5-10% ROI from complete information utilization
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fixed column schema for extract_feature_matrix (same keys and order as extract_all_features)
+FEATURE_COLUMNS = [
+    # Linguistic base
+    'syllables', 'harshness', 'memorability', 'length', 'vowel_ratio',
+    'consonant_clusters', 'first_letter_harsh', 'last_letter_harsh', 'name_uniqueness', 'pronounceability',
+    # Linguistic advanced
+    'plosive_count', 'fricative_count', 'front_vowels', 'back_vowels', 'liquid_count',
+    'nasal_count', 'syllables_squared', 'harshness_squared', 'memorability_squared', 'syllable_harshness_ratio',
+    'memorability_length_ratio', 'consonant_vowel_balance', 'phonetic_complexity', 'name_rhythm_score', 'phoneme_diversity',
+    # Phonetic microstructure
+    'optimal_phoneme_match', 'power_phonemes', 'speed_phonemes', 'precision_phonemes', 'vowel_quality_score',
+    'initial_consonant_strength', 'final_consonant_strength', 'sonority_profile', 'phonetic_weight', 'phoneme_position_score',
+    'consonant_harmony', 'vowel_harmony',
+    # Position-specific
+    'position_contact_level', 'position_precision_demands', 'position_recognition_importance', 'position_power_demands',
+    'position_optimal_harshness', 'position_formula_match', 'position_tier', 'position_sample_quality',
+    # Opponent-relative
+    'harshness_differential', 'syllables_differential', 'memorability_differential', 'length_differential', 'dominance_factor',
+    'phonetic_clash', 'name_contrast', 'dominance_absolute', 'memorability_advantage', 'linguistic_superiority',
+    # Temporal
+    'years_in_league', 'career_stage', 'is_prime', 'is_rookie', 'is_veteran',
+    'performance_trend', 'career_trajectory', 'games_this_season',
+    # Context
+    'is_primetime', 'is_playoff', 'is_championship', 'is_rivalry', 'is_national_broadcast',
+    'is_home_game', 'is_contract_year', 'broadcast_reach', 'stakes_score', 'attention_score',
+    'pressure_score', 'context_count', 'universal_ratio', 'weather_factor', 'altitude_factor',
+    # Media
+    'media_buzz', 'market_size_mult', 'fantasy_ownership', 'social_media_mentions', 'google_trends',
+    'espn_mentions', 'hype_vs_substance', 'visibility_score',
+    # Market basic
+    'market_line', 'player_baseline', 'line_displacement', 'line_displacement_pct', 'over_odds',
+    'under_odds', 'odds_sum', 'odds_imbalance', 'total_vig', 'public_percentage',
+    # Market advanced
+    'opening_line', 'line_movement', 'line_movement_pct', 'time_to_game', 'sharp_money_indicator',
+    'steam_move', 'contrarian_signal', 'public_trap', 'line_volatility', 'closing_line_value_historical',
+    'bet_volume', 'sharp_percentage',
+    # Interaction terms
+    'harsh_short', 'memorable_short', 'harsh_memorable', 'harsh_playoff', 'memorable_primetime',
+    'harshness_contact', 'syllables_team_size', 'dominance_stakes', 'contrast_attention', 'superiority_pressure',
+    'edge_public', 'movement_time', 'contrarian_confidence', 'steam_edge', 'harsh_playoff_contrarian',
+    'memorable_primetime_big_market', 'dominance_championship_steam', 'prime_rivalry', 'rookie_hype', 'veteran_stability',
+    # Meta-features
+    'total_nominative_score', 'universal_constant_alignment', 'cross_domain_score', 'enhancement_count', 'signal_strength',
+    'prediction_confidence', 'edge_quality', 'risk_factor', 'opportunity_score', 'conviction_level',
+]
+
+# Features derived only from the player's name (computed once per unique name)
+NAME_FEATURE_COLUMNS = [
+    'last_letter_harsh', 'plosive_count', 'fricative_count', 'front_vowels', 'back_vowels',
+    'liquid_count', 'nasal_count', 'phoneme_diversity', 'power_phonemes', 'speed_phonemes',
+    'precision_phonemes', 'vowel_quality_score', 'initial_consonant_strength', 'final_consonant_strength',
+    'sonority_profile', 'phoneme_position_score', 'consonant_harmony', 'vowel_harmony',
+]
+
+# Features derived only from the position code (computed once per unique position)
+POSITION_FEATURE_COLUMNS = [
+    'position_contact_level', 'position_precision_demands', 'position_recognition_importance',
+    'position_power_demands', 'position_optimal_harshness', 'position_tier', 'position_sample_quality',
+]
+
 
 class ComprehensiveFeatureExtractor:
     """Extract all 100+ features for maximum predictive power"""
@@ -165,8 +225,8 @@ class ComprehensiveFeatureExtractor:
             'stakes_score': self._calculate_stakes(game_context),
             'attention_score': self._calculate_attention(game_context),
             'pressure_score': self._calculate_pressure(game_context, player_data),
-            'context_count': sum([game_context.get('is_primetime'), game_context.get('is_playoff'),
-                                 game_context.get('is_rivalry'), game_context.get('is_championship')]),
+            'context_count': sum(1 for key in ('is_primetime', 'is_playoff', 'is_rivalry', 'is_championship')
+                                 if game_context.get(key)),
             'universal_ratio': self._get_context_ratio(game_context),
             'weather_factor': game_context.get('weather_severity', 0) / 10,
             'altitude_factor': game_context.get('altitude', 0) / 5000
@@ -273,6 +333,348 @@ class ComprehensiveFeatureExtractor:
         
         return features
     
+    def extract_feature_matrix(self, players: Sequence[Dict],
+                               opponents: Optional[Sequence[Optional[Dict]]] = None,
+                               game_contexts: Union[Dict, Sequence[Dict], None] = None,
+                               market_data: Union[Dict, Sequence[Dict], None] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Extract the full feature set for a slate of players as one matrix
+        
+        Columnar equivalent of calling extract_all_features per row. Name-derived
+        features are computed once per unique name and position lookups once per
+        unique position, then broadcast; everything else is computed column-wise.
+        
+        Args:
+            players: Player dicts (same shape as extract_all_features player_data)
+            opponents: Opponent dicts aligned with players (None entries allowed)
+            game_contexts: One context per player, or a single dict shared by all
+            market_data: One market dict per player, or a single dict shared by all
+            
+        Returns:
+            (float32 matrix of shape (n_players, len(FEATURE_COLUMNS)), FEATURE_COLUMNS)
+        """
+        n = len(players)
+        opponents = list(opponents) if opponents is not None else [None] * n
+        contexts = self._broadcast_records(game_contexts, n)
+        markets = self._broadcast_records(market_data, n)
+        lings = [p.get('linguistic_features', {}) for p in players]
+        
+        def col(records, key, default):
+            return np.array([r.get(key, default) for r in records], dtype=np.float64)
+        
+        def flag(records, key):
+            return np.array([1.0 if r.get(key) else 0.0 for r in records])
+        
+        f = {}
+        
+        # CATEGORY 1-2: LINGUISTIC BASE + ADVANCED (numeric part)
+        syllables = col(lings, 'syllables', 2.5)
+        harshness = col(lings, 'harshness', 50)
+        memorability = col(lings, 'memorability', 50)
+        length = col(lings, 'length', 7)
+        vowel_ratio = col(lings, 'vowel_ratio', 0.4)
+        clusters = col(lings, 'consonant_clusters', 0)
+        
+        f.update({
+            'syllables': syllables,
+            'harshness': harshness,
+            'memorability': memorability,
+            'length': length,
+            'vowel_ratio': vowel_ratio,
+            'consonant_clusters': clusters,
+            'first_letter_harsh': (col(lings, 'harshness', 0) > 60).astype(float),
+            'name_uniqueness': col(lings, 'uniqueness', 50),
+            'pronounceability': col(lings, 'pronounceability', 70),
+            'syllables_squared': syllables ** 2,
+            'harshness_squared': harshness ** 2,
+            'memorability_squared': memorability ** 2,
+            'syllable_harshness_ratio': syllables / (harshness / 50),
+            'memorability_length_ratio': memorability / length,
+            'consonant_vowel_balance': np.abs(0.6 - (1 - vowel_ratio)),
+            'phonetic_complexity': clusters + syllables * 0.5,
+            'name_rhythm_score': np.mod(syllables, 2) * 20,
+        })
+        
+        # CATEGORY 2-3: NAME-DERIVED FEATURES (once per unique name, then broadcast)
+        names = [p.get('name', '') for p in players]
+        unique_names, name_index = np.unique(np.array(names, dtype=object), return_inverse=True)
+        name_block = np.array([self._name_feature_vector(name) for name in unique_names],
+                              dtype=np.float64).reshape(len(unique_names), len(NAME_FEATURE_COLUMNS))
+        for j, key in enumerate(NAME_FEATURE_COLUMNS):
+            f[key] = name_block[name_index, j]
+        
+        sports = [c.get('sport') for c in contexts]
+        phoneme_match = {}
+        f['optimal_phoneme_match'] = np.array([
+            phoneme_match.setdefault((name, sport), self._calculate_phoneme_match({'name': name}, sport))
+            for name, sport in zip(names, sports)
+        ], dtype=np.float64)
+        f['phonetic_weight'] = harshness * length / 100
+        
+        # CATEGORY 4: POSITION-SPECIFIC (once per unique position)
+        positions = [p.get('position', 'UNKNOWN') for p in players]
+        unique_positions, position_index = np.unique(np.array(positions, dtype=object), return_inverse=True)
+        position_block = np.array([self._position_feature_vector(pos) for pos in unique_positions],
+                                  dtype=np.float64).reshape(len(unique_positions), len(POSITION_FEATURE_COLUMNS))
+        for j, key in enumerate(POSITION_FEATURE_COLUMNS):
+            f[key] = position_block[position_index, j]
+        f['position_formula_match'] = np.maximum(0, 100 - np.abs(harshness - f['position_optimal_harshness']))
+        
+        # CATEGORY 5: OPPONENT-RELATIVE
+        has_opponent = np.array([1.0 if o else 0.0 for o in opponents])
+        opp_lings = [(o or {}).get('linguistic_features', {}) for o in opponents]
+        harsh_diff = (harshness - col(opp_lings, 'harshness', 50)) * has_opponent
+        
+        opp_plosives = {}
+        clash = np.array([
+            self._clash_from_plosives(
+                f['plosive_count'][i],
+                opp_plosives.setdefault(o.get('name', ''), self._name_feature_vector(o.get('name', ''))[1])
+            ) if o else 0
+            for i, o in enumerate(opponents)
+        ], dtype=np.float64)
+        
+        f.update({
+            'harshness_differential': harsh_diff,
+            'syllables_differential': (syllables - col(opp_lings, 'syllables', 2.5)) * has_opponent,
+            'memorability_differential': (memorability - col(opp_lings, 'memorability', 50)) * has_opponent,
+            'length_differential': (length - col(opp_lings, 'length', 7)) * has_opponent,
+            'phonetic_clash': clash,
+            'name_contrast': (np.abs(harsh_diff) > 20).astype(float),
+        })
+        # In extract_all_features these read keys from the same update() call before they
+        # are populated, so they are always zero; kept identical here
+        for key in ['dominance_factor', 'dominance_absolute', 'memorability_advantage', 'linguistic_superiority']:
+            f[key] = np.zeros(n)
+        
+        # CATEGORY 6: TEMPORAL
+        years = col(players, 'years_in_league', 5)
+        years_or_zero = col(players, 'years_in_league', 0)
+        trend = col(players, 'performance_trend', 0)
+        f.update({
+            'years_in_league': years,
+            'career_stage': np.select([years <= 2, years <= 4, years <= 10, years <= 14], [1, 2, 3, 4], 5).astype(float),
+            'is_prime': ((years_or_zero >= 5) & (years_or_zero <= 10)).astype(float),
+            'is_rookie': (years <= 2).astype(float),
+            'is_veteran': (years_or_zero >= 11).astype(float),
+            'performance_trend': trend,
+            'career_trajectory': np.select([trend > 0.15, trend < -0.15], [1.0, -1.0], 0.0),
+            'games_this_season': col(players, 'games_played', 8),
+        })
+        
+        # CATEGORY 7: CONTEXT
+        primetime = flag(contexts, 'is_primetime')
+        playoff = flag(contexts, 'is_playoff')
+        championship = flag(contexts, 'is_championship')
+        rivalry = flag(contexts, 'is_rivalry')
+        national = flag(contexts, 'is_national_broadcast')
+        contract = flag(players, 'is_contract_year')
+        stakes = np.select([championship > 0, playoff > 0, rivalry > 0], [1.0, 0.8, 0.65], 0.5)
+        
+        f.update({
+            'is_primetime': primetime,
+            'is_playoff': playoff,
+            'is_championship': championship,
+            'is_rivalry': rivalry,
+            'is_national_broadcast': national,
+            'is_home_game': flag(contexts, 'is_home_game'),
+            'is_contract_year': contract,
+            'broadcast_reach': np.log(col(contexts, 'broadcast_reach', 1000000) + 1) / 10,
+            'stakes_score': stakes,
+            'attention_score': np.minimum(50 + 20 * primetime + 15 * national + 10 * playoff, 100),
+            'pressure_score': np.minimum(50 + stakes * 30 + 15 * contract, 100),
+            'context_count': primetime + playoff + rivalry + championship,
+            'universal_ratio': np.select(
+                [championship > 0, playoff > 0, rivalry > 0, primetime > 0],
+                [1.540, 1.420, 1.380, 1.360], 1.344
+            ),
+            'weather_factor': col(contexts, 'weather_severity', 0) / 10,
+            'altitude_factor': col(contexts, 'altitude', 0) / 5000,
+        })
+        
+        # CATEGORY 8: MEDIA
+        buzz = col(players, 'media_buzz', 50)
+        market_mult = col(players, 'market_size_mult', 1.0)
+        f.update({
+            'media_buzz': buzz,
+            'market_size_mult': market_mult,
+            'fantasy_ownership': col(players, 'fantasy_ownership', 50),
+            'social_media_mentions': np.log(col(players, 'social_mentions', 1000) + 1),
+            'google_trends': col(players, 'google_trends', 50),
+            'espn_mentions': col(players, 'espn_mentions', 0),
+            'hype_vs_substance': buzz - harshness,
+            'visibility_score': buzz * market_mult,
+        })
+        
+        # CATEGORY 9: MARKET BASIC
+        line = col(markets, 'line', 0)
+        baseline = col(players, 'baseline_average', 0)
+        displacement = line - baseline
+        displacement_pct = self._safe_pct(displacement, col(players, 'baseline_average', 1))
+        over_odds = col(markets, 'over_odds', -110)
+        under_odds = col(markets, 'under_odds', -110)
+        public = col(markets, 'public_percentage', 0.5)
+        f.update({
+            'market_line': line,
+            'player_baseline': baseline,
+            'line_displacement': displacement,
+            'line_displacement_pct': displacement_pct,
+            'over_odds': over_odds,
+            'under_odds': under_odds,
+            'odds_sum': np.abs(over_odds) + np.abs(under_odds),
+            'odds_imbalance': np.abs(over_odds) - np.abs(under_odds),
+            'total_vig': 1 / (1 + 100 / np.abs(over_odds)) + 1 / (1 + 100 / np.abs(under_odds)) - 1,
+            'public_percentage': public,
+        })
+        
+        # CATEGORY 10: MARKET ADVANCED
+        opening = np.array([m.get('opening_line', m.get('line', 0)) for m in markets], dtype=np.float64)
+        movement = line - opening
+        time_to_game = col(markets, 'time_to_game', 24)
+        contrarian = ((np.abs(displacement) > 3) & (public < 0.35)).astype(float)
+        volatility = col(markets, 'line_volatility', 0)
+        f.update({
+            'opening_line': opening,
+            'line_movement': movement,
+            'line_movement_pct': self._safe_pct(movement, col(markets, 'opening_line', 1)),
+            'time_to_game': time_to_game,
+            # Always zero in extract_all_features (reads line_movement before it is set)
+            'sharp_money_indicator': np.zeros(n),
+            'steam_move': np.zeros(n),
+            'contrarian_signal': contrarian,
+            'public_trap': ((public > 0.70) & (displacement_pct > 5)).astype(float),
+            'line_volatility': volatility,
+            'closing_line_value_historical': col(markets, 'avg_clv', 0),
+            'bet_volume': np.log(col(markets, 'total_bets', 1000) + 1),
+            'sharp_percentage': col(markets, 'sharp_percentage', 0.3),
+        })
+        
+        # CATEGORY 11: INTERACTION TERMS
+        team_sizes = np.array([self._get_team_size(sport) for sport in sports], dtype=np.float64)
+        f.update({
+            'harsh_short': harshness * (4 - syllables),
+            'memorable_short': memorability * (4 - syllables),
+            'harsh_memorable': harshness * memorability / 100,
+            'harsh_playoff': harshness * playoff,
+            'memorable_primetime': memorability * primetime,
+            'harshness_contact': harshness * f['position_contact_level'],
+            'syllables_team_size': syllables * team_sizes,
+            'dominance_stakes': harsh_diff * stakes,
+            'contrast_attention': f['name_contrast'] * f['attention_score'],
+            'superiority_pressure': f['linguistic_superiority'] * f['pressure_score'],
+            'edge_public': displacement * (1 - public),
+            'movement_time': movement * time_to_game / 24,
+            'contrarian_confidence': contrarian * harshness,
+            'steam_edge': f['steam_move'] * displacement,
+            'harsh_playoff_contrarian': harshness * playoff * contrarian,
+            'memorable_primetime_big_market': memorability * primetime * market_mult,
+            'dominance_championship_steam': f['dominance_absolute'] * championship * f['steam_move'],
+            'prime_rivalry': f['is_prime'] * rivalry,
+            'rookie_hype': f['is_rookie'] * buzz / 50,
+            'veteran_stability': f['is_veteran'] * (100 - volatility) / 100,
+        })
+        
+        # CATEGORY 12: META-FEATURES
+        # Helpers that read other meta-features see their defaults, as in extract_all_features
+        syllable_effect = col(lings, 'syllables', 2.5) * -0.3
+        memorability_effect = col(lings, 'memorability', 50) * 0.002
+        observed_ratio = np.ones(n)
+        positive = memorability_effect > 0
+        observed_ratio[positive] = np.abs(syllable_effect[positive] / memorability_effect[positive])
+        alignment = np.clip(100 - np.abs(observed_ratio - 1.344) * 50, 0, 100)
+        
+        enhancement_count = (
+            (harsh_diff > 10).astype(float) +
+            ((primetime + playoff) > 0) +
+            (contrarian > 0) +
+            (f['steam_move'] > 0) +
+            (buzz > 70)
+        )
+        signal_strength = np.mean([
+            np.abs(harshness - 50) / 50,
+            np.abs(harsh_diff) / 50,
+            stakes,
+            contrarian
+        ], axis=0) * 100
+        
+        f.update({
+            'total_nominative_score': (harshness + memorability - syllables * 20) / 3,
+            'universal_constant_alignment': alignment,
+            'cross_domain_score': np.full(n, 70.0),
+            'enhancement_count': enhancement_count,
+            'signal_strength': signal_strength,
+            'prediction_confidence': np.minimum(70 + 10 * (f['position_sample_quality'] > 85), 95),
+            'edge_quality': np.abs(displacement),
+            'risk_factor': np.minimum(50 + 15 * (volatility > 3) + 10 * f['is_rookie'], 100),
+            # edge_quality=0, signal_strength=50, risk_factor=50 defaults
+            'opportunity_score': np.full(n, 0 * 0.4 + 50 * 0.3 + (100 - 50) * 0.3),
+            'conviction_level': np.full(n, 70.0),
+        })
+        
+        matrix = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float32)
+        for j, key in enumerate(FEATURE_COLUMNS):
+            matrix[:, j] = f[key]
+        
+        return matrix, list(FEATURE_COLUMNS)
+    
+    def _broadcast_records(self, records: Union[Dict, Sequence[Dict], None], n: int) -> List[Dict]:
+        """Expand a shared dict (or None) to one record per row"""
+        if records is None:
+            return [{}] * n
+        if isinstance(records, dict):
+            return [records] * n
+        return [r or {} for r in records]
+    
+    def _safe_pct(self, numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """numerator / denominator * 100, with 0 where the denominator is 0"""
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator),
+                         where=denominator != 0) * 100
+    
+    def _name_feature_vector(self, name: str) -> List[float]:
+        """Name-only features in NAME_FEATURE_COLUMNS order"""
+        lower = name.lower()
+        return [
+            1 if lower[-1:] in 'kgdtbp' else 0,
+            sum(c in lower for c in 'ptkbdg'),
+            sum(c in lower for c in 'fvsz'),
+            sum(c in lower for c in 'ie'),
+            sum(c in lower for c in 'ou'),
+            sum(c in lower for c in 'lr'),
+            sum(c in lower for c in 'mn'),
+            len(set(lower)) / len(name) if name else 0,
+            sum(c in lower for c in 'ktb'),
+            sum(c in lower for c in 'sz'),
+            sum(c in lower for c in 'l'),
+            self._vowel_quality(name),
+            self._initial_strength(name),
+            self._final_strength(name),
+            self._sonority_score(name),
+            self._phoneme_position_score(name),
+            self._consonant_harmony(name),
+            self._vowel_harmony(name),
+        ]
+    
+    def _position_feature_vector(self, position: str) -> List[float]:
+        """Position lookups in POSITION_FEATURE_COLUMNS order"""
+        return [
+            self._get_position_contact(position),
+            self._get_position_precision(position),
+            self._get_position_recognition(position),
+            self._get_position_power(position),
+            self._get_position_optimal_harshness(position),
+            self._get_position_tier(position),
+            self._get_position_sample_quality(position),
+        ]
+    
+    def _clash_from_plosives(self, player_plosives: float, opponent_plosives: float) -> float:
+        """_phonetic_clash_score from precomputed plosive counts"""
+        diff = abs(player_plosives - opponent_plosives)
+        if diff >= 3:
+            return 75
+        elif diff >= 2:
+            return 60
+        return 50
+    
     def _calculate_phoneme_match(self, player_data: Dict, sport: str) -> float:
         """Calculate sport-optimal phoneme match"""
         name = player_data.get('name', '').lower()
@@ -487,7 +889,7 @@ class ComprehensiveFeatureExtractor:
     def _calculate_pressure(self, game_context: Dict, player_data: Dict) -> float:
         """Calculate pressure score"""
         pressure = 50
-        pressure += features['stakes_score'] * 30 if 'stakes_score' in features else 0
+        pressure += self._calculate_stakes(game_context) * 30
         if player_data.get('is_contract_year'):
             pressure += 15
         return min(pressure, 100)
@@ -11,9 +11,11 @@ Features:
 - Attention mechanisms (interpretable feature importance)
 - Transfer learning (pre-train on large corpus)
 - Multi-task learning (predict role + outcome simultaneously)
+- Batched inference with resident (LRU) models and optional TorchScript
 """
 
 import logging
+from collections import OrderedDict
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import json
@@ -142,7 +144,18 @@ class DeepLearningFatePredictor:
     Deep learning fate prediction system.
     """
     
-    def __init__(self, model_dir: str = 'models/fate_predictors'):
+    MAX_NAME_LENGTH = 30
+    
+    def __init__(self, model_dir: str = 'models/fate_predictors',
+                 max_resident_models: int = 8, torchscript: bool = False):
+        """
+        Args:
+            model_dir: Directory holding per-domain checkpoints
+            max_resident_models: Models kept in memory (least recently used
+                domains are unloaded beyond this)
+            torchscript: Run inference through traced, frozen TorchScript
+                modules (exported next to the checkpoints and reused)
+        """
         self.logger = logging.getLogger(__name__)
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
@@ -152,8 +165,10 @@ class DeepLearningFatePredictor:
         self.char_to_idx = {c: i+1 for i, c in enumerate(self.chars)}  # 0 reserved for padding
         self.idx_to_char = {i+1: c for i, c in enumerate(self.chars)}
         
-        # Models by domain
-        self.models = {}
+        # Resident models by domain, least recently used first
+        self.models = OrderedDict()
+        self.max_resident_models = max_resident_models
+        self.torchscript = torchscript
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
         self.logger.info(f"DeepLearningFatePredictor initialized (PyTorch: {PYTORCH_AVAILABLE}, Device: {self.device})")
@@ -259,7 +274,8 @@ class DeepLearningFatePredictor:
             'multi_task': multi_task
         }, model_path)
         
-        self.models[domain] = model
+        model.eval()
+        self._make_resident(domain, self._inference_module(domain, model))
         self.logger.info(f"Saved model to {model_path}")
         
         return {
@@ -281,72 +297,175 @@ class DeepLearningFatePredictor:
         Returns:
             Prediction with probabilities and attention weights
         """
-        if not PYTORCH_AVAILABLE:
-            return {'error': 'PyTorch not available'}
+        return self.predict_many([name], domain, include_attention=True)[0]
+    
+    def predict_many(self, names: List[str], domain: str, batch_size: int = 256,
+                     include_attention: bool = False) -> List[Dict]:
+        """
+        Predict fates for many names in CPU/GPU batches.
         
-        if domain not in self.models:
-            # Try loading from disk
-            if not self._load_model(domain):
-                return {'error': f'No model available for domain: {domain}'}
+        Names are padded to the same fixed length the model was trained on,
+        so each result matches predict() for that name.
         
-        model = self.models[domain]
-        model.eval()
+        Args:
+            names: Names to analyze
+            domain: Domain to use for prediction
+            batch_size: Names per forward pass
+            include_attention: Add per-character attention weights (slower)
         
-        # Prepare input
-        name_indices = [self.char_to_idx.get(c, 0) for c in name.lower()[:30]]
-        while len(name_indices) < 30:
-            name_indices.append(0)
+        Returns:
+            One prediction dict per name, in input order
+        """
+        if not PYTORCH_AVAILABLE:
+            return [{'error': 'PyTorch not available'} for _ in names]
         
-        name_tensor = torch.tensor([name_indices], dtype=torch.long).to(self.device)
+        model = self._get_model(domain)
+        if model is None:
+            return [{'error': f'No model available for domain: {domain}'} for _ in names]
         
-        # Predict
-        with torch.no_grad():
-            output, attention = model(name_tensor)
-            
-            if isinstance(output, tuple):  # Multi-task
-                role_output, outcome_output = output
-                role_probs = F.softmax(role_output, dim=1)[0]
-                outcome_probs = F.softmax(outcome_output, dim=1)[0]
-                
-                role_pred = torch.argmax(role_probs).item()
-                outcome_pred = torch.argmax(outcome_probs).item()
+        encoded = self._encode_names(names)
+        results = []
+        
+        with torch.inference_mode():
+            for start in range(0, len(names), batch_size):
+                batch = torch.from_numpy(encoded[start:start + batch_size]).to(self.device)
+                output, attention = model(batch)
+                attention = attention.squeeze(-1).cpu().numpy() if include_attention else None
                 
-                return {
-                    'name': name,
-                    'domain': domain,
-                    'role_prediction': {
-                        'class': role_pred,
-                        'probabilities': role_probs.cpu().numpy().tolist(),
-                        'confidence': float(role_probs[role_pred])
-                    },
-                    'outcome_prediction': {
-                        'class': outcome_pred,
-                        'probabilities': outcome_probs.cpu().numpy().tolist(),
-                        'confidence': float(outcome_probs[outcome_pred])
-                    },
-                    'attention_weights': self._format_attention(name, attention[0]),
-                    'method': 'Deep Learning (Bi-LSTM + Attention)'
-                }
-            else:
-                probs = F.softmax(output, dim=1)[0]
-                pred = torch.argmax(probs).item()
+                if isinstance(output, (tuple, list)):  # Multi-task
+                    role_probs = F.softmax(output[0], dim=1).cpu().numpy()
+                    outcome_probs = F.softmax(output[1], dim=1).cpu().numpy()
+                else:
+                    role_probs = F.softmax(output, dim=1).cpu().numpy()
+                    outcome_probs = None
                 
-                return {
-                    'name': name,
-                    'domain': domain,
-                    'predicted_class': pred,
-                    'probabilities': probs.cpu().numpy().tolist(),
-                    'confidence': float(probs[pred]),
-                    'attention_weights': self._format_attention(name, attention[0]),
-                    'method': 'Deep Learning (Bi-LSTM + Attention)'
-                }
+                for i, name in enumerate(names[start:start + batch_size]):
+                    results.append(self._prediction(
+                        name, domain, role_probs[i],
+                        outcome_probs[i] if outcome_probs is not None else None,
+                        attention[i] if attention is not None else None
+                    ))
+        
+        return results
+    
+    def _prediction(self, name: str, domain: str, probs: np.ndarray,
+                    outcome_probs: Optional[np.ndarray], attention: Optional[np.ndarray]) -> Dict:
+        """Result dict for one name (same shape as predict())"""
+        pred = int(np.argmax(probs))
+        
+        if outcome_probs is not None:
+            outcome_pred = int(np.argmax(outcome_probs))
+            result = {
+                'name': name,
+                'domain': domain,
+                'role_prediction': {
+                    'class': pred,
+                    'probabilities': probs.tolist(),
+                    'confidence': float(probs[pred])
+                },
+                'outcome_prediction': {
+                    'class': outcome_pred,
+                    'probabilities': outcome_probs.tolist(),
+                    'confidence': float(outcome_probs[outcome_pred])
+                },
+            }
+        else:
+            result = {
+                'name': name,
+                'domain': domain,
+                'predicted_class': pred,
+                'probabilities': probs.tolist(),
+                'confidence': float(probs[pred]),
+            }
+        
+        if attention is not None:
+            result['attention_weights'] = self._format_attention(name, attention)
+        result['method'] = 'Deep Learning (Bi-LSTM + Attention)'
+        return result
+    
+    def _encode_names(self, names: List[str]) -> np.ndarray:
+        """(n, MAX_NAME_LENGTH) character indices, zero-padded"""
+        encoded = np.zeros((len(names), self.MAX_NAME_LENGTH), dtype=np.int64)
+        for row, name in enumerate(names):
+            indices = [self.char_to_idx.get(c, 0) for c in name.lower()[:self.MAX_NAME_LENGTH]]
+            encoded[row, :len(indices)] = indices
+        return encoded
+    
+    def _get_model(self, domain: str):
+        """Resident model for a domain (loaded from disk on first use)"""
+        if domain in self.models:
+            self.models.move_to_end(domain)
+            return self.models[domain]
+        if not self._load_model(domain):
+            return None
+        return self.models[domain]
+    
+    def _make_resident(self, domain: str, model):
+        self.models[domain] = model
+        self.models.move_to_end(domain)
+        while len(self.models) > self.max_resident_models:
+            evicted, _ = self.models.popitem(last=False)
+            self.logger.info(f"Unloaded model for domain: {evicted}")
+    
+    def _inference_module(self, domain: str, model):
+        """The eval-mode model, or its TorchScript export when enabled"""
+        if not self.torchscript:
+            return model
+        try:
+            return self.export_torchscript(domain, model)
+        except Exception as e:
+            self.logger.warning(f"TorchScript export failed for {domain}, using eager model: {e}")
+            return model
+    
+    def export_torchscript(self, domain: str, model=None) -> 'torch.jit.ScriptModule':
+        """
+        Trace and freeze a domain model for inference and save it.
+        
+        The export is reused while it is newer than the domain checkpoint.
+        
+        Args:
+            domain: Domain name
+            model: Eval-mode eager model (default: load the checkpoint)
+        
+        Returns:
+            Frozen TorchScript module
+        """
+        checkpoint_path = self.model_dir / f"{domain}_fate_predictor.pt"
+        script_path = self.model_dir / f"{domain}_fate_predictor.torchscript.pt"
+        
+        if (script_path.exists() and checkpoint_path.exists()
+                and script_path.stat().st_mtime >= checkpoint_path.stat().st_mtime):
+            return torch.jit.load(str(script_path), map_location=self.device)
+        
+        if model is None:
+            model = self._load_eager_model(domain)
+            if model is None:
+                raise ValueError(f"No model available for domain: {domain}")
+        
+        example = torch.zeros((1, self.MAX_NAME_LENGTH), dtype=torch.long, device=self.device)
+        with torch.no_grad():
+            traced = torch.jit.freeze(torch.jit.trace(model.eval(), example))
+        
+        traced.save(str(script_path))
+        self.logger.info(f"Exported TorchScript model to {script_path}")
+        return traced
     
     def _load_model(self, domain: str) -> bool:
-        """Load model from disk."""
+        """Load model from disk and make it resident."""
+        model = self._load_eager_model(domain)
+        if model is None:
+            return False
+        
+        self._make_resident(domain, self._inference_module(domain, model))
+        self.logger.info(f"Loaded model for domain: {domain}")
+        return True
+    
+    def _load_eager_model(self, domain: str):
+        """Eval-mode model from the domain checkpoint, or None."""
         model_path = self.model_dir / f"{domain}_fate_predictor.pt"
         
         if not model_path.exists():
-            return False
+            return None
         
         try:
             checkpoint = torch.load(model_path, map_location=self.device)
@@ -360,18 +479,15 @@ class DeepLearningFatePredictor:
             model.load_state_dict(checkpoint['model_state'])
             model.eval()
             
-            self.models[domain] = model
             self.char_to_idx = checkpoint['char_to_idx']
-            
-            self.logger.info(f"Loaded model for domain: {domain}")
-            return True
+            return model
         except Exception as e:
             self.logger.error(f"Error loading model: {e}")
-            return False
+            return None
     
-    def _format_attention(self, name: str, attention_weights: torch.Tensor) -> List[Dict]:
+    def _format_attention(self, name: str, attention_weights: np.ndarray) -> List[Dict]:
         """Format attention weights for interpretability."""
-        attention = attention_weights.squeeze().cpu().numpy()
+        attention = np.asarray(attention_weights).squeeze()
         
         # Get top attention characters
         name_chars = list(name.lower()[:len(attention)])
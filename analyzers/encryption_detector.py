@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
 import logging
+from scipy.spatial.distance import cdist
 from sklearn.decomposition import PCA
 from sklearn.neighbors import NearestNeighbors
 
@@ -24,6 +25,23 @@ from utils.formula_engine import FormulaEngine, VisualEncoding, FormulaBase
 
 logger = logging.getLogger(__name__)
 
+# Numeric visual properties and the divisor used to normalize each difference
+# (matches EncryptionDetector._calculate_visual_difference)
+VISUAL_DIFFERENCE_SCALES = [
+    ('complexity', 1.0),
+    ('symmetry', 1.0),
+    ('angular_vs_curved', 2.0),
+    ('hue', 360.0),
+    ('saturation', 100.0),
+    ('brightness', 100.0),
+    ('x', 2.0),
+    ('y', 2.0),
+    ('z', 1.0),
+    ('glow_intensity', 1.0),
+    ('fractal_dimension', 1.0),
+    ('pattern_density', 1.0),
+]
+
 
 @dataclass
 class ReversibilityTest:
@@ -121,9 +139,10 @@ class EncryptionDetector:
     Tests transformation formulas for encryption-like properties
     """
     
-    def __init__(self):
+    def __init__(self, chunk_size: int = 2048):
         self.formula_engine = FormulaEngine()
         self.tolerance = 1e-6  # For detecting collisions
+        self.chunk_size = chunk_size  # Rows per block in pairwise distance kernels
     
     def analyze_formula(self, formula_id: str,
                        test_names: List[str],
@@ -157,7 +176,7 @@ class EncryptionDetector:
         )
         
         avalanche = self._test_avalanche_effect(
-            formula_id, test_names, linguistic_features
+            formula_id, test_names, linguistic_features, visual_encodings
         )
         
         key_space = self._analyze_key_space(
@@ -370,35 +389,23 @@ class EncryptionDetector:
         n_unique = len(set(visual_hashes.values()))
         collision_rate = 1.0 - (n_unique / len(names))
         
-        # Calculate visual distances
-        distances = []
-        for i, name1 in enumerate(names):
-            if name1 not in visual_vectors:
-                continue
-            for name2 in names[i+1:]:
-                if name2 not in visual_vectors:
-                    continue
-                dist = np.linalg.norm(visual_vectors[name1] - visual_vectors[name2])
-                distances.append(dist)
+        # Stack vectors in name order (duplicate names keep their own row, as before)
+        positions = [name for name in names if name in visual_vectors]
+        visual_matrix = (np.array([visual_vectors[name] for name in positions])
+                         if positions else np.empty((0, 9)))
         
-        mean_distance = float(np.mean(distances)) if distances else 0.0
-        min_distance = float(np.min(distances)) if distances else 0.0
+        # Calculate visual distances (streamed, never materializing all N² pairs)
+        mean_distance, min_distance = self._pairwise_distance_stats(visual_matrix)
         
         # Test similar names (edit distance 1)
-        similar_pairs_distances = []
-        for i, name1 in enumerate(names):
-            if name1 not in visual_vectors:
-                continue
-            for name2 in names[i+1:]:
-                if name2 not in visual_vectors:
-                    continue
-                # Calculate edit distance
-                edit_dist = self._edit_distance(name1, name2)
-                if edit_dist == 1:
-                    visual_dist = np.linalg.norm(visual_vectors[name1] - visual_vectors[name2])
-                    similar_pairs_distances.append(visual_dist)
-        
-        similar_divergence = float(np.mean(similar_pairs_distances)) if similar_pairs_distances else mean_distance
+        similar_pairs = self._edit_distance_one_pairs(positions)
+        if similar_pairs:
+            pair_index = np.array(similar_pairs)
+            similar_divergence = float(np.mean(np.linalg.norm(
+                visual_matrix[pair_index[:, 0]] - visual_matrix[pair_index[:, 1]], axis=1
+            )))
+        else:
+            similar_divergence = mean_distance
         
         is_resistant = collision_rate < 0.05
         
@@ -414,24 +421,39 @@ class EncryptionDetector:
         )
     
     def _test_avalanche_effect(self, formula_id: str, names: List[str],
-                               linguistic_features: Dict[str, Dict]) -> AvalancheTest:
-        """Test if small name changes create large visual changes"""
+                               linguistic_features: Dict[str, Dict],
+                               visual_encodings: Optional[Dict[str, VisualEncoding]] = None,
+                               max_names: Optional[int] = None) -> AvalancheTest:
+        """
+        Test if small name changes create large visual changes
+        
+        Originals are encoded once per name (reusing visual_encodings when given),
+        all variants are transformed in one pass, and differences are computed
+        on stacked arrays. Every name is tested unless max_names is set.
+        """
         logger.info("Testing avalanche effect...")
         
-        visual_changes = []
-        n_pairs = 0
+        visual_encodings = visual_encodings or {}
+        test_names = names[:max_names] if max_names else names
         
-        # Test first 100 names (for speed)
-        test_names = names[:100]
+        original_visuals = []
+        variant_visuals = []
         
         for name in test_names:
             if name not in linguistic_features:
                 continue
             
-            # Create slight variation
-            variants = self._create_name_variants(name)
+            original_visual = visual_encodings.get(name)
+            if original_visual is None:
+                try:
+                    original_visual = self.formula_engine.transform(
+                        name, linguistic_features[name], formula_id
+                    )
+                except Exception:
+                    continue
             
-            for variant in variants:
+            # Create slight variation
+            for variant in self._create_name_variants(name):
                 # Generate linguistic features for variant (simplified)
                 variant_features = linguistic_features.get(name, {}).copy()
                 # Slightly modify features
@@ -440,25 +462,19 @@ class EncryptionDetector:
                         variant_features[key] = len(variant)
                 
                 try:
-                    original_visual = self.formula_engine.transform(
-                        name, linguistic_features[name], formula_id
-                    )
                     variant_visual = self.formula_engine.transform(
                         variant, variant_features, formula_id
                     )
-                    
-                    # Calculate visual change
-                    visual_change = self._calculate_visual_difference(
-                        original_visual, variant_visual
-                    )
-                    
-                    visual_changes.append(visual_change)
-                    n_pairs += 1
-                    
-                except Exception as e:
-                    pass
-        
-        if not visual_changes:
+                except Exception:
+                    continue
+                
+                original_visuals.append(original_visual)
+                variant_visuals.append(variant_visual)
+        
+        visual_changes = self._visual_difference_batch(original_visuals, variant_visuals)
+        n_pairs = len(visual_changes)
+        
+        if n_pairs == 0:
             return AvalancheTest(
                 formula_id=formula_id,
                 n_name_pairs_tested=0,
@@ -695,6 +711,91 @@ class EncryptionDetector:
         # Average difference
         return float(np.mean(differences))
     
+    def _visual_difference_batch(self, visuals1: List[VisualEncoding],
+                                 visuals2: List[VisualEncoding]) -> np.ndarray:
+        """Vectorized _calculate_visual_difference over aligned lists of encodings"""
+        if not visuals1:
+            return np.empty(0)
+        
+        scales = np.array([scale for _, scale in VISUAL_DIFFERENCE_SCALES])
+        matrix1 = np.array([[getattr(v, attr) for attr, _ in VISUAL_DIFFERENCE_SCALES] for v in visuals1])
+        matrix2 = np.array([[getattr(v, attr) for attr, _ in VISUAL_DIFFERENCE_SCALES] for v in visuals2])
+        
+        numeric_total = (np.abs(matrix1 - matrix2) / scales).sum(axis=1)
+        
+        # Categorical properties contribute a 1.0 term only when they differ
+        categorical = np.array([
+            (v1.shape_type != v2.shape_type) + (v1.palette_family != v2.palette_family)
+            for v1, v2 in zip(visuals1, visuals2)
+        ], dtype=float)
+        
+        return (numeric_total + categorical) / (len(VISUAL_DIFFERENCE_SCALES) + categorical)
+    
+    def _pairwise_distance_stats(self, visual_matrix: np.ndarray) -> Tuple[float, float]:
+        """
+        Mean and min Euclidean distance over all i < j rows, streamed in blocks
+        
+        Memory is bounded by chunk_size x N regardless of corpus size.
+        """
+        n = len(visual_matrix)
+        if n < 2:
+            return 0.0, 0.0
+        
+        total = 0.0
+        count = 0
+        minimum = np.inf
+        
+        for start in range(0, n - 1, self.chunk_size):
+            stop = min(start + self.chunk_size, n - 1)
+            block = cdist(visual_matrix[start:stop], visual_matrix[start + 1:])
+            
+            # Row r (global index start + r) pairs with columns j > start + r
+            upper = np.arange(stop - start)[:, None] <= np.arange(n - start - 1)[None, :]
+            values = block[upper]
+            
+            total += values.sum()
+            count += values.size
+            minimum = min(minimum, values.min())
+        
+        return float(total / count), float(minimum)
+    
+    def _edit_distance_one_pairs(self, names: List[str]) -> List[Tuple[int, int]]:
+        """
+        All position pairs (i < j) whose names are exactly one edit apart
+        
+        Uses a deletion-neighborhood index: substitutions share a
+        (deleted string, position) key, and insertions/deletions map a
+        single-character deletion of the longer name onto the shorter name.
+        Candidates are verified, so the result matches the O(N²) edit-distance scan.
+        """
+        by_name = defaultdict(list)
+        by_deletion = defaultdict(list)
+        
+        for idx, name in enumerate(names):
+            by_name[name].append(idx)
+            for k in range(len(name)):
+                by_deletion[(name[:k] + name[k + 1:], k)].append(idx)
+        
+        pairs = set()
+        
+        # Substitutions: same length, same string with one position removed
+        for bucket in by_deletion.values():
+            if len(bucket) < 2:
+                continue
+            for a in range(len(bucket)):
+                for b in range(a + 1, len(bucket)):
+                    i, j = bucket[a], bucket[b]
+                    if names[i] != names[j]:
+                        pairs.add((min(i, j), max(i, j)))
+        
+        # Insertions/deletions: removing one character from the longer name gives the shorter
+        for idx, name in enumerate(names):
+            for k in range(len(name)):
+                for other in by_name.get(name[:k] + name[k + 1:], ()):
+                    pairs.add((min(idx, other), max(idx, other)))
+        
+        return sorted(pairs)
+    
     def _edit_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein edit distance"""
         if len(s1) < len(s2):
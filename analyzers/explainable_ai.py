@@ -11,12 +11,20 @@ Features:
 - Permutation importance
 - Partial dependence plots
 - Individual conditional expectation (ICE) plots
+- Explainer reuse, batch explanations and a persistent per-row cache
+- Background explanation jobs (submit, then poll)
 """
 
 import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 import json
+import joblib
 
 # Try importing explainability libraries
 try:
@@ -35,20 +43,122 @@ except ImportError:
 
 from sklearn.inspection import permutation_importance
 
+from utils.explanation_cache import ExplanationCache, context_key, row_key
+
 logger = logging.getLogger(__name__)
 
 
 class ExplainableAI:
     """
     Explainability tools for ML predictions.
+    
+    Explainers are built once per (model fingerprint, background data) and
+    reused; per-row results are cached on disk keyed by the feature vector,
+    so repeated requests for the same rows never recompute attributions.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ExplanationCache] = None,
+                 max_explainers: int = 16, background_size: int = 100,
+                 max_jobs: int = 256):
+        """
+        Args:
+            cache: Persistent result cache (default: data/explanations/cache.sqlite)
+            max_explainers: Explainers kept in memory (LRU)
+            background_size: Rows of X used as the Kernel SHAP background
+            max_jobs: Finished background jobs kept for polling
+        """
         self.logger = logging.getLogger(__name__)
-        self.explainers = {}
+        self.explainers = OrderedDict()
+        self.max_explainers = max_explainers
+        self.background_size = background_size
+        self.cache = cache if cache is not None else ExplanationCache()
+        self._explainers_lock = threading.Lock()
+        self._non_tree_models = set()
+        
+        # Background jobs
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._executor = None
         
         self.logger.info(f"ExplainableAI initialized (SHAP: {SHAP_AVAILABLE}, LIME: {LIME_AVAILABLE})")
     
+    # ------------------------------------------------------------------
+    # Fingerprints and explainer reuse
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _fingerprint(obj) -> Optional[str]:
+        """Content hash of a model or array (None if it cannot be hashed)"""
+        try:
+            return joblib.hash(obj)
+        except Exception:
+            return None
+    
+    def _get_explainer(self, key, factory: Callable):
+        with self._explainers_lock:
+            if key in self.explainers:
+                self.explainers.move_to_end(key)
+                return self.explainers[key]
+        
+        explainer = factory()
+        
+        with self._explainers_lock:
+            self.explainers[key] = explainer
+            self.explainers.move_to_end(key)
+            while len(self.explainers) > self.max_explainers:
+                self.explainers.popitem(last=False)
+        return explainer
+    
+    def _shap_explainer(self, model, model_key: str, background: np.ndarray):
+        """(kind, explainer): TreeExplainer when the model supports it, else Kernel SHAP"""
+        if model_key not in self._non_tree_models:
+            try:
+                explainer = self._get_explainer(('shap-tree', model_key), lambda: shap.TreeExplainer(model))
+                self.logger.info("Using TreeExplainer (faster)")
+                return 'tree', explainer, None
+            except Exception:
+                self._non_tree_models.add(model_key)
+        
+        background_key = self._fingerprint(background)
+        explainer = self._get_explainer(
+            ('shap-kernel', model_key, background_key),
+            lambda: shap.KernelExplainer(model.predict_proba, background)
+        )
+        self.logger.info("Using KernelExplainer (slower but model-agnostic)")
+        return 'kernel', explainer, background_key
+    
+    def _cached_rows(self, context: Optional[str], X: np.ndarray, rows: List[int],
+                     compute: Callable[[List[int]], List[Dict]]) -> List[Dict]:
+        """
+        Per-row results from the cache, computing only missing feature vectors
+        
+        Args:
+            context: Cache context key (None disables persistence)
+            X: Feature matrix
+            rows: Row indices to explain
+            compute: Explains a list of row indices (unique feature vectors)
+        """
+        keys = [row_key(X[i]) for i in rows]
+        results = self.cache.get_many(context, keys) if context else {}
+        
+        todo = {}
+        for i, key in zip(rows, keys):
+            if key not in results:
+                todo.setdefault(key, i)
+        
+        if todo:
+            computed = dict(zip(todo, compute(list(todo.values()))))
+            if context:
+                self.cache.put_many(context, computed)
+            results.update(computed)
+        
+        return [results[key] for key in keys]
+    
+    # ------------------------------------------------------------------
+    # SHAP
+    # ------------------------------------------------------------------
+    
     def explain_prediction_shap(self, model, X: np.ndarray, 
                                feature_names: List[str],
                                instance_idx: int = 0) -> Dict:
@@ -64,56 +174,90 @@ class ExplainableAI:
         Returns:
             SHAP explanation
         """
+        return self.explain_shap_batch(model, X, feature_names, rows=[instance_idx])[0]
+    
+    def explain_shap_batch(self, model, X: np.ndarray, feature_names: List[str],
+                           rows: Optional[Sequence[int]] = None) -> List[Dict]:
+        """
+        Explain many predictions with one SHAP call.
+        
+        Cached rows are served from disk; the remaining unique rows are passed
+        to the explainer together.
+        
+        Args:
+            model: Trained model
+            X: Feature matrix (its first background_size rows are the Kernel
+                SHAP background)
+            feature_names: Names of features
+            rows: Row indices to explain (default: all)
+        
+        Returns:
+            One SHAP explanation per row (same format as explain_prediction_shap)
+        """
+        X = np.asarray(X)
+        rows = list(range(len(X))) if rows is None else list(rows)
+        
         if not SHAP_AVAILABLE:
-            return self._fallback_explanation(model, X, feature_names, instance_idx)
+            return [self._fallback_explanation(model, X, feature_names, i) for i in rows]
         
         try:
-            # Create explainer (try TreeExplainer first, fallback to KernelExplainer)
-            try:
-                explainer = shap.TreeExplainer(model)
-                self.logger.info("Using TreeExplainer (faster)")
-            except:
-                explainer = shap.KernelExplainer(model.predict_proba, X[:100])
-                self.logger.info("Using KernelExplainer (slower but model-agnostic)")
-            
-            # Calculate SHAP values
-            shap_values = explainer.shap_values(X[instance_idx:instance_idx+1])
-            
-            # Format results
-            instance_features = X[instance_idx]
-            
-            # Handle multi-class output
-            if isinstance(shap_values, list):
-                # Multi-class: take values for predicted class
-                predicted_class = np.argmax(model.predict_proba(X[instance_idx:instance_idx+1])[0])
-                shap_vals = shap_values[predicted_class][0]
-            else:
-                shap_vals = shap_values[0]
-            
-            # Create feature importance ranking
-            feature_importance = []
-            for i, (name, shap_val, feature_val) in enumerate(zip(feature_names, shap_vals, instance_features)):
-                feature_importance.append({
-                    'feature': name,
-                    'value': float(feature_val),
-                    'shap_value': float(shap_val),
-                    'impact': 'increases' if shap_val > 0 else 'decreases',
-                    'magnitude': abs(float(shap_val))
-                })
+            model_fp = self._fingerprint(model)
+            model_key = model_fp or f"id-{id(model)}"
+            kind, explainer, background_key = self._shap_explainer(model, model_key, X[:self.background_size])
             
-            # Sort by absolute SHAP value
-            feature_importance.sort(key=lambda x: x['magnitude'], reverse=True)
+            context = None
+            if model_fp:
+                context = context_key('shap', kind, model_fp, background_key, list(feature_names))
             
-            return {
-                'method': 'SHAP',
-                'feature_importance': feature_importance,
-                'top_features': feature_importance[:5],
-                'interpretation': self._interpret_shap(feature_importance[:3])
-            }
-        
+            return self._cached_rows(
+                context, X, rows,
+                lambda todo: self._compute_shap(explainer, model, X[todo], feature_names)
+            )
         except Exception as e:
             self.logger.error(f"Error calculating SHAP values: {e}")
-            return self._fallback_explanation(model, X, feature_names, instance_idx)
+            return [self._fallback_explanation(model, X, feature_names, i) for i in rows]
+    
+    def _compute_shap(self, explainer, model, X_rows: np.ndarray,
+                      feature_names: List[str]) -> List[Dict]:
+        shap_values = explainer.shap_values(X_rows)
+        
+        # Handle multi-class output: take values for each row's predicted class
+        if isinstance(shap_values, list):
+            predicted = np.argmax(model.predict_proba(X_rows), axis=1)
+            per_row = np.stack([np.asarray(shap_values[c])[i] for i, c in enumerate(predicted)])
+        elif np.ndim(shap_values) == 3:
+            predicted = np.argmax(model.predict_proba(X_rows), axis=1)
+            per_row = np.asarray(shap_values)[np.arange(len(X_rows)), :, predicted]
+        else:
+            per_row = np.asarray(shap_values)
+        
+        return [
+            self._format_shap(feature_names, shap_vals, instance_features)
+            for shap_vals, instance_features in zip(per_row, X_rows)
+        ]
+    
+    def _format_shap(self, feature_names: List[str], shap_vals: np.ndarray,
+                     instance_features: np.ndarray) -> Dict:
+        # Create feature importance ranking
+        feature_importance = []
+        for name, shap_val, feature_val in zip(feature_names, shap_vals, instance_features):
+            feature_importance.append({
+                'feature': name,
+                'value': float(feature_val),
+                'shap_value': float(shap_val),
+                'impact': 'increases' if shap_val > 0 else 'decreases',
+                'magnitude': abs(float(shap_val))
+            })
+        
+        # Sort by absolute SHAP value
+        feature_importance.sort(key=lambda x: x['magnitude'], reverse=True)
+        
+        return {
+            'method': 'SHAP',
+            'feature_importance': feature_importance,
+            'top_features': feature_importance[:5],
+            'interpretation': self._interpret_shap(feature_importance[:3])
+        }
     
     def _fallback_explanation(self, model, X: np.ndarray, 
                             feature_names: List[str], instance_idx: int) -> Dict:
@@ -154,47 +298,89 @@ class ExplainableAI:
         Returns:
             LIME explanation
         """
+        return self.explain_lime_batch(model, X, feature_names, rows=[instance_idx],
+                                       n_features=n_features)[0]
+    
+    def explain_lime_batch(self, model, X: np.ndarray, feature_names: List[str],
+                           rows: Optional[Sequence[int]] = None,
+                           n_features: int = 10) -> List[Dict]:
+        """
+        Explain many predictions with LIME, reusing one explainer.
+        
+        LIME samples perturbations per row, so uncached rows are still
+        explained one at a time (each row's samples are scored in one
+        predict_proba call).
+        
+        Args:
+            model: Trained model
+            X: Feature matrix (LIME training statistics)
+            feature_names: Names of features
+            rows: Row indices to explain (default: all)
+            n_features: Number of features to show
+        
+        Returns:
+            One LIME explanation per row (same format as explain_lime)
+        """
+        X = np.asarray(X)
+        rows = list(range(len(X))) if rows is None else list(rows)
+        
         if not LIME_AVAILABLE:
-            return {'error': 'LIME not available'}
+            return [{'error': 'LIME not available'} for _ in rows]
         
         try:
-            explainer = lime_tabular.LimeTabularExplainer(
-                X,
-                feature_names=feature_names,
-                mode='classification',
-                discretize_continuous=True
+            data_key = self._fingerprint(X)
+            explainer = self._get_explainer(
+                ('lime', data_key or f"id-{id(X)}", tuple(feature_names)),
+                lambda: lime_tabular.LimeTabularExplainer(
+                    X,
+                    feature_names=feature_names,
+                    mode='classification',
+                    discretize_continuous=True
+                )
             )
             
-            explanation = explainer.explain_instance(
-                X[instance_idx],
-                model.predict_proba,
-                num_features=n_features
-            )
-            
-            # Extract feature importance
-            feature_importance = []
-            for feature, weight in explanation.as_list():
-                feature_importance.append({
-                    'feature': feature,
-                    'weight': float(weight),
-                    'impact': 'positive' if weight > 0 else 'negative'
-                })
+            model_fp = self._fingerprint(model)
+            context = None
+            if model_fp and data_key:
+                context = context_key('lime', model_fp, data_key, list(feature_names), n_features)
             
-            return {
-                'method': 'LIME',
-                'feature_importance': feature_importance,
-                'prediction_confidence': float(explanation.predict_proba[explanation.top_labels[0]])
-            }
-        
+            return self._cached_rows(
+                context, X, rows,
+                lambda todo: [self._compute_lime(explainer, model, X[i], n_features) for i in todo]
+            )
         except Exception as e:
             self.logger.error(f"Error with LIME: {e}")
-            return {'error': str(e)}
+            return [{'error': str(e)} for _ in rows]
+    
+    def _compute_lime(self, explainer, model, instance: np.ndarray, n_features: int) -> Dict:
+        explanation = explainer.explain_instance(
+            instance,
+            model.predict_proba,
+            num_features=n_features
+        )
+        
+        # Extract feature importance
+        feature_importance = []
+        for feature, weight in explanation.as_list():
+            feature_importance.append({
+                'feature': feature,
+                'weight': float(weight),
+                'impact': 'positive' if weight > 0 else 'negative'
+            })
+        
+        return {
+            'method': 'LIME',
+            'feature_importance': feature_importance,
+            'prediction_confidence': float(explanation.predict_proba[explanation.top_labels[0]])
+        }
     
     def permutation_importance_analysis(self, model, X: np.ndarray, y: np.ndarray,
                                        feature_names: List[str]) -> Dict:
         """
         Calculate permutation importance for all features.
         
+        Results are cached per (model, X, y), so repeated requests are free.
+        
         Args:
             model: Trained model
             X: Feature matrix
@@ -205,6 +391,15 @@ class ExplainableAI:
             Importance scores for each feature
         """
         try:
+            model_fp = self._fingerprint(model)
+            data_fp = self._fingerprint((np.asarray(X), np.asarray(y)))
+            context = None
+            if model_fp and data_fp:
+                context = context_key('permutation', model_fp, data_fp, list(feature_names))
+                cached = self.cache.get(context, 'all')
+                if cached is not None:
+                    return cached
+            
             result = permutation_importance(model, X, y, n_repeats=10, random_state=42)
             
             importance_data = []
@@ -218,16 +413,118 @@ class ExplainableAI:
             # Sort by importance
             importance_data.sort(key=lambda x: x['importance_mean'], reverse=True)
             
-            return {
+            analysis = {
                 'method': 'Permutation Importance',
                 'feature_importance': importance_data,
                 'top_features': importance_data[:10]
             }
+            if context:
+                self.cache.put(context, 'all', analysis)
+            return analysis
         
         except Exception as e:
             self.logger.error(f"Error calculating permutation importance: {e}")
             return {'error': str(e)}
     
+    # ------------------------------------------------------------------
+    # Background jobs
+    # ------------------------------------------------------------------
+    
+    def submit_explanation(self, method: str, model, X: np.ndarray, feature_names: List[str],
+                           rows: Optional[Sequence[int]] = None, y: Optional[np.ndarray] = None,
+                           **kwargs) -> str:
+        """
+        Queue an explanation on the background worker and return immediately.
+        
+        Poll get_job(job_id) for the result. Rows already in the cache make
+        the job finish almost instantly. The model must not be refitted while
+        its job is pending.
+        
+        Args:
+            method: 'shap', 'lime' or 'permutation'
+            model: Trained model
+            X: Feature matrix (copied)
+            feature_names: Names of features
+            rows: Row indices to explain (shap/lime; default: all)
+            y: Labels (permutation only)
+            kwargs: Extra method options (e.g. n_features for lime)
+        
+        Returns:
+            Job id
+        """
+        X = np.array(X, copy=True)
+        if method == 'shap':
+            task = lambda: self.explain_shap_batch(model, X, feature_names, rows=rows)
+        elif method == 'lime':
+            task = lambda: self.explain_lime_batch(model, X, feature_names, rows=rows, **kwargs)
+        elif method == 'permutation':
+            if y is None:
+                raise ValueError("Permutation importance needs labels (y)")
+            y = np.array(y, copy=True)
+            task = lambda: self.permutation_importance_analysis(model, X, y, feature_names)
+        else:
+            raise ValueError(f"Unknown explanation method: {method}")
+        
+        job_id = uuid.uuid4().hex
+        with self._jobs_lock:
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'method': method,
+                'status': 'pending',
+                'submitted_at': datetime.utcnow().isoformat(),
+                'completed_at': None,
+                'result': None,
+                'error': None,
+            }
+            self._prune_jobs()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='explainable-ai')
+        
+        self._executor.submit(self._run_job, job_id, task)
+        return job_id
+    
+    def _run_job(self, job_id: str, task: Callable):
+        self._update_job(job_id, status='running')
+        try:
+            result = task()
+        except Exception as e:
+            self.logger.error(f"Explanation job {job_id} failed: {e}")
+            self._update_job(job_id, status='error', error=str(e),
+                             completed_at=datetime.utcnow().isoformat())
+            return
+        self._update_job(job_id, status='done', result=result,
+                         completed_at=datetime.utcnow().isoformat())
+    
+    def _update_job(self, job_id: str, **fields):
+        with self._jobs_lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+    
+    def _prune_jobs(self):
+        # Drop the oldest finished jobs beyond max_jobs (pending ones are kept)
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] in ('done', 'error')]
+        for job_id in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job_id]
+    
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        Status of a background explanation job.
+        
+        Returns:
+            Job dict with 'status' ('pending', 'running', 'done', 'error') and
+            'result' when done, or None for unknown ids
+        """
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the background worker"""
+        with self._jobs_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
     def _interpret_shap(self, top_features: List[Dict]) -> str:
         """Generate human-readable interpretation of SHAP values."""
         if not top_features:
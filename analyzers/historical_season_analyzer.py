@@ -288,6 +288,131 @@ class HistoricalSeasonAnalyzer:
         
         return portfolio_analysis
     
+    def analyze_portfolio_rollup(self, rollup: List[Dict]) -> Dict:
+        """
+        Portfolio history from pre-aggregated rows (see BetTracker.get_settled_rollup)
+        
+        Produces the same by_sport / by_season / aggregate structure as
+        analyze_portfolio_history, classifying each game day once instead of
+        every bet. by_season entries carry per-sport totals only, not bet lists.
+        
+        Args:
+            rollup: Rows with sport, bet_status, year, month, day, bets, staked, profit
+            
+        Returns:
+            Complete portfolio historical analysis
+        """
+        # sport -> season year -> phase -> totals
+        phase_totals = defaultdict(lambda: defaultdict(lambda: defaultdict(self._empty_totals)))
+        sport_totals = defaultdict(self._empty_totals)
+        phase_cache = {}
+        
+        for row in rollup:
+            sport = row['sport']
+            self._add_totals(sport_totals[sport], row)
+            
+            if row['year'] is None:
+                continue
+            
+            key = (sport, row['year'], row['month'], row['day'])
+            if key not in phase_cache:
+                phase_cache[key] = self._determine_season_phase(
+                    datetime(row['year'], row['month'], row['day']), sport
+                )
+            season_year, phase = phase_cache[key]
+            
+            self._add_totals(phase_totals[sport][season_year][phase], row)
+        
+        portfolio_analysis = {
+            'by_sport': {},
+            'by_season': defaultdict(lambda: {'by_sport': {}}),
+            'aggregate': {}
+        }
+        
+        for sport in sport_totals:
+            sport_seasons = {}
+            for year, phases in phase_totals.get(sport, {}).items():
+                season_perf = {
+                    phase: self._totals_performance(totals, include_pushes=True)
+                    for phase, totals in phases.items()
+                }
+                
+                season_totals = self._empty_totals()
+                for totals in phases.values():
+                    for field, value in totals.items():
+                        season_totals[field] += value
+                season_perf['season_total'] = self._totals_performance(season_totals)
+                
+                sport_seasons[year] = season_perf
+                portfolio_analysis['by_season'][year]['by_sport'][sport] = season_perf['season_total']
+            
+            portfolio_analysis['by_sport'][sport] = {
+                'seasons': sport_seasons,
+                'comparison': self.compare_seasons(sport_seasons)
+            }
+        
+        if sport_totals:
+            overall = self._empty_totals()
+            for totals in sport_totals.values():
+                for field, value in totals.items():
+                    overall[field] += value
+            
+            decided = overall['wins'] + overall['losses']
+            portfolio_analysis['aggregate'] = {
+                'total_bets': overall['bets'],
+                'total_sports': len(sport_totals),
+                'total_staked': round(overall['staked'], 2),
+                'total_profit': round(overall['profit'], 2),
+                'overall_roi': round(overall['profit'] / overall['staked'] * 100, 2) if overall['staked'] > 0 else 0,
+                'overall_win_rate': round(overall['wins'] / decided * 100, 2) if decided > 0 else 0,
+                'by_sport_contribution': {
+                    sport: {
+                        'profit': round(totals['profit'], 2),
+                        'staked': round(totals['staked'], 2),
+                        'roi': round(totals['profit'] / totals['staked'] * 100, 2) if totals['staked'] > 0 else 0,
+                        'bet_count': totals['bets']
+                    }
+                    for sport, totals in sport_totals.items()
+                }
+            }
+        
+        return portfolio_analysis
+    
+    @staticmethod
+    def _empty_totals() -> Dict:
+        return {'bets': 0, 'wins': 0, 'losses': 0, 'pushes': 0, 'staked': 0.0, 'profit': 0.0}
+    
+    @staticmethod
+    def _add_totals(totals: Dict, row: Dict):
+        totals['bets'] += row['bets']
+        totals['staked'] += row['staked']
+        totals['profit'] += row['profit']
+        if row['bet_status'] == 'won':
+            totals['wins'] += row['bets']
+        elif row['bet_status'] == 'lost':
+            totals['losses'] += row['bets']
+        elif row['bet_status'] == 'push':
+            totals['pushes'] += row['bets']
+    
+    @staticmethod
+    def _totals_performance(totals: Dict, include_pushes: bool = False) -> Dict:
+        """Same fields and rounding as analyze_season_performance"""
+        decided = totals['wins'] + totals['losses']
+        performance = {
+            'total_bets': totals['bets'],
+            'wins': totals['wins'],
+            'losses': totals['losses'],
+        }
+        if include_pushes:
+            performance['pushes'] = totals['pushes']
+        performance.update({
+            'win_rate': round(totals['wins'] / decided * 100, 2) if decided > 0 else 0,
+            'total_staked': round(totals['staked'], 2),
+            'total_profit': round(totals['profit'], 2),
+            'roi': round(totals['profit'] / totals['staked'] * 100, 2) if totals['staked'] > 0 else 0
+        })
+        return performance
+    
     def _calculate_sport_contributions(self, bets_by_sport: Dict) -> Dict:
         """Calculate each sport's contribution to portfolio"""
         contributions = {}
@@ -36,13 +36,54 @@ Date: November 2025
 
 import logging
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from collections import Counter
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+class _AffixTrie:
+    """Character trie over prefixes (or, reversed, suffixes) of a fixed pattern set."""
+    
+    def __init__(self, suffixes: bool):
+        self.suffixes = suffixes
+        self.root: Dict = {}
+    
+    def add(self, affix: str, value):
+        node = self.root
+        for char in (reversed(affix) if self.suffixes else affix):
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(value)
+    
+    def matches(self, text: str) -> List:
+        """Values of every stored affix that text starts (or ends) with."""
+        found = []
+        node = self.root
+        for char in (reversed(text) if self.suffixes else text):
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                found += node[None]
+        return found
+
+
+_worker_classifier = None
+
+
+def _classify_values(values: List) -> List[Dict]:
+    """Classify raw column values in a worker process (one classifier per process)."""
+    global _worker_classifier
+    if _worker_classifier is None:
+        _worker_classifier = ImmigrationSurnameClassifier()
+    return [_worker_classifier._classify_value(value) for value in values]
+
+
 class ImmigrationSurnameClassifier:
     """Etymology-based classifier for surname semantic meaning analysis."""
     
@@ -210,11 +251,73 @@ class ImmigrationSurnameClassifier:
         'Levy': {'meaning': 'Levite (Jewish)', 'religious_reference': 'Judaism'},
     }
     
+    # Linguistic fallback patterns in priority order. 'match' is the form of the
+    # surname an affix is tested against: title-cased or lowercase.
+    AFFIX_PATTERNS = (
+        {'suffixes': ('son',), 'match': 'title', 'category': 'patronymic', 'meaning': 'son of', 'strip': 3,
+         'confidence': 70.0, 'pattern': '-son suffix', 'evidence': 'English/Scandinavian patronymic pattern'},
+        {'suffixes': ('ez', 'az', 'iz'), 'match': 'title', 'category': 'patronymic', 'meaning': 'son of', 'strip': 2,
+         'confidence': 70.0, 'pattern': '-ez/-az/-iz suffix', 'evidence': 'Spanish patronymic pattern'},
+        {'suffixes': ('ov', 'ev'), 'match': 'title', 'category': 'patronymic', 'meaning': 'son of', 'strip': 2,
+         'confidence': 70.0, 'pattern': '-ov/-ev suffix', 'evidence': 'Russian patronymic pattern'},
+        {'prefixes': ("O'", 'Mc', 'Mac'), 'match': 'title', 'category': 'patronymic', 'meaning': 'descendant of',
+         'strip': 2, 'confidence': 75.0, 'pattern': "O'/Mc/Mac prefix", 'evidence': 'Irish/Scottish patronymic pattern'},
+        {'suffixes': ('ano', 'ese'), 'match': 'lower', 'category': 'toponymic', 'meaning': 'from', 'strip': 3,
+         'confidence': 60.0, 'pattern': '-ano/-ese suffix', 'evidence': 'Italian toponymic pattern (likely place-based)'},
+        # German toponymic (Berliner, Frankfurter); short names and occupational -er excluded
+        {'suffixes': ('er',), 'match': 'lower', 'category': 'toponymic', 'meaning': 'from', 'strip': 2,
+         'confidence': 50.0, 'pattern': '-er suffix (German)', 'evidence': 'Possible German toponymic pattern',
+         'min_length': 7, 'exclude': ('baker', 'fisher')},
+    )
+    
+    # Etymology feature recorded for each database category: (feature key, info key)
+    DATABASE_FEATURES = {
+        'occupational': ('occupation', 'occupation'),
+        'descriptive': ('trait_type', 'trait'),
+        'patronymic': ('father_name', 'father_name'),
+        'religious': ('religious_reference', 'religious_reference'),
+    }
+    
+    # Built once per process from the tables above (see _compiled)
+    _known_surnames = None
+    _affix_tries = None
+    
     def __init__(self):
         """Initialize classifier with etymology databases."""
         logger.info(f"Initializing Immigration Surname Semantic Classifier v{self.VERSION}")
         self.classified_cache = {}
+        self._compiled()
+    
+    @classmethod
+    def _compiled(cls):
+        """Merged surname dictionary and affix tries, built on first use.
         
+        The merged dictionary answers all five database lookups with one hash
+        probe (earlier categories win, matching the lookup order). The tries
+        find every matching pattern in one pass over the surname.
+        """
+        if cls._known_surnames is None:
+            known = {}
+            for category, table in (('toponymic', cls.TOPONYMIC_SURNAMES),
+                                    ('occupational', cls.OCCUPATIONAL_SURNAMES),
+                                    ('descriptive', cls.DESCRIPTIVE_SURNAMES),
+                                    ('patronymic', cls.PATRONYMIC_SURNAMES),
+                                    ('religious', cls.RELIGIOUS_SURNAMES)):
+                for name, info in table.items():
+                    known.setdefault(name, (category, info))
+            
+            tries = {}
+            for priority, rule in enumerate(cls.AFFIX_PATTERNS):
+                for suffixes, affixes in ((True, rule.get('suffixes', ())), (False, rule.get('prefixes', ()))):
+                    for affix in affixes:
+                        key = (rule['match'] == 'lower', suffixes)
+                        tries.setdefault(key, _AffixTrie(suffixes)).add(affix, priority)
+            
+            # [(match lowercase form?, trie), ...]
+            cls._affix_tries = [(lower, trie) for (lower, _), trie in tries.items()]
+            cls._known_surnames = known
+        return cls._known_surnames, cls._affix_tries
+    
     def classify_surname(self, surname: str, additional_context: Optional[Dict] = None) -> Dict:
         """Classify a surname by its SEMANTIC MEANING in original language.
         
@@ -234,8 +337,20 @@ class ImmigrationSurnameClassifier:
         if surname in self.classified_cache:
             return self.classified_cache[surname]
         
-        logger.info(f"Classifying surname: {surname}")
+        logger.debug(f"Classifying surname: {surname}")
         
+        results = self._classify_normalized(surname)
+        self.classified_cache[surname] = results
+        return results
+    
+    def _classify_value(self, value) -> Dict:
+        """classify_surname without the per-instance cache (for bulk columns)."""
+        if not value or not isinstance(value, str):
+            return self._error_result("Invalid surname")
+        return self._classify_normalized(value.strip().title())
+    
+    def _classify_normalized(self, surname: str) -> Dict:
+        """Classify a stripped, title-cased surname."""
         results = {
             'surname': surname,
             'semantic_category': None,
@@ -248,104 +363,17 @@ class ImmigrationSurnameClassifier:
             'place_info': None
         }
         
-        # Check each semantic category
-        
-        # 1. Check TOPONYMIC (highest priority for this research)
-        if surname in self.TOPONYMIC_SURNAMES:
-            info = self.TOPONYMIC_SURNAMES[surname]
-            results.update({
-                'semantic_category': 'toponymic',
-                'is_toponymic': True,
-                'meaning_in_original': info['meaning'],
-                'confidence_score': 95.0,
-                'place_info': {
-                    'place_name': info['place'],
-                    'place_country': info['place_country'],
-                    'place_type': info['place_type'],
-                    'place_importance': info['importance']
-                },
-                'etymology_features': {
-                    'category': 'toponymic',
-                    'evidence': f"Known place-based surname meaning '{info['meaning']}'",
-                    'place_reference': info['place']
-                }
-            })
-            self.classified_cache[surname] = results
-            return results
-        
-        # 2. Check OCCUPATIONAL
-        if surname in self.OCCUPATIONAL_SURNAMES:
-            info = self.OCCUPATIONAL_SURNAMES[surname]
-            results.update({
-                'semantic_category': 'occupational',
-                'is_toponymic': False,
-                'meaning_in_original': info['meaning'],
-                'confidence_score': 95.0,
-                'etymology_features': {
-                    'category': 'occupational',
-                    'occupation': info['occupation'],
-                    'evidence': f"Known occupational surname meaning '{info['meaning']}'"
-                }
-            })
-            self.classified_cache[surname] = results
-            return results
-        
-        # 3. Check DESCRIPTIVE
-        if surname in self.DESCRIPTIVE_SURNAMES:
-            info = self.DESCRIPTIVE_SURNAMES[surname]
-            results.update({
-                'semantic_category': 'descriptive',
-                'is_toponymic': False,
-                'meaning_in_original': info['meaning'],
-                'confidence_score': 95.0,
-                'etymology_features': {
-                    'category': 'descriptive',
-                    'trait_type': info['trait'],
-                    'evidence': f"Known descriptive surname meaning '{info['meaning']}'"
-                }
-            })
-            self.classified_cache[surname] = results
-            return results
-        
-        # 4. Check PATRONYMIC
-        if surname in self.PATRONYMIC_SURNAMES:
-            info = self.PATRONYMIC_SURNAMES[surname]
-            results.update({
-                'semantic_category': 'patronymic',
-                'is_toponymic': False,
-                'meaning_in_original': info['meaning'],
-                'confidence_score': 95.0,
-                'etymology_features': {
-                    'category': 'patronymic',
-                    'father_name': info['father_name'],
-                    'evidence': f"Known patronymic surname meaning '{info['meaning']}'"
-                }
-            })
-            self.classified_cache[surname] = results
-            return results
-        
-        # 5. Check RELIGIOUS
-        if surname in self.RELIGIOUS_SURNAMES:
-            info = self.RELIGIOUS_SURNAMES[surname]
-            results.update({
-                'semantic_category': 'religious',
-                'is_toponymic': False,
-                'meaning_in_original': info['meaning'],
-                'confidence_score': 95.0,
-                'etymology_features': {
-                    'category': 'religious',
-                    'religious_reference': info['religious_reference'],
-                    'evidence': f"Known religious surname meaning '{info['meaning']}'"
-                }
-            })
-            self.classified_cache[surname] = results
+        # 1-5. Etymology database (toponymic, occupational, descriptive,
+        # patronymic, religious - in that order of precedence)
+        known = self._known_surnames.get(surname)
+        if known:
+            results.update(self._database_result(*known))
             return results
         
         # 6. Pattern-based classification (fallback)
         pattern_result = self._classify_by_pattern(surname)
         if pattern_result:
             results.update(pattern_result)
-            self.classified_cache[surname] = results
             return results
         
         # 7. Unknown - default to descriptive with low confidence
@@ -359,10 +387,42 @@ class ImmigrationSurnameClassifier:
                 'evidence': 'Not in etymology database, pattern matching failed'
             }
         })
-        
-        self.classified_cache[surname] = results
         return results
     
+    def _database_result(self, category: str, info: Dict) -> Dict:
+        """Classification fields for a surname found in the etymology database."""
+        if category == 'toponymic':
+            return {
+                'semantic_category': 'toponymic',
+                'is_toponymic': True,
+                'meaning_in_original': info['meaning'],
+                'confidence_score': 95.0,
+                'place_info': {
+                    'place_name': info['place'],
+                    'place_country': info['place_country'],
+                    'place_type': info['place_type'],
+                    'place_importance': info['importance']
+                },
+                'etymology_features': {
+                    'category': 'toponymic',
+                    'evidence': f"Known place-based surname meaning '{info['meaning']}'",
+                    'place_reference': info['place']
+                }
+            }
+        
+        feature_key, info_key = self.DATABASE_FEATURES[category]
+        return {
+            'semantic_category': category,
+            'is_toponymic': False,
+            'meaning_in_original': info['meaning'],
+            'confidence_score': 95.0,
+            'etymology_features': {
+                'category': category,
+                feature_key: info[info_key],
+                'evidence': f"Known {category} surname meaning '{info['meaning']}'"
+            }
+        }
+    
     def _classify_by_pattern(self, surname: str) -> Optional[Dict]:
         """Classify by linguistic patterns when not in database.
         
@@ -374,98 +434,29 @@ class ImmigrationSurnameClassifier:
         """
         surname_lower = surname.lower()
         
-        # Patronymic patterns
-        if surname.endswith('son'):
-            return {
-                'semantic_category': 'patronymic',
-                'is_toponymic': False,
-                'meaning_in_original': f"son of {surname[:-3]}",
-                'confidence_score': 70.0,
-                'etymology_features': {
-                    'category': 'patronymic',
-                    'pattern': '-son suffix',
-                    'evidence': 'English/Scandinavian patronymic pattern'
-                }
-            }
-        
-        if surname.endswith('ez') or surname.endswith('az') or surname.endswith('iz'):
-            return {
-                'semantic_category': 'patronymic',
-                'is_toponymic': False,
-                'meaning_in_original': f"son of {surname[:-2]}",
-                'confidence_score': 70.0,
-                'etymology_features': {
-                    'category': 'patronymic',
-                    'pattern': '-ez/-az/-iz suffix',
-                    'evidence': 'Spanish patronymic pattern'
-                }
-            }
+        candidates = []
+        for lower, trie in self._affix_tries:
+            candidates += trie.matches(surname_lower if lower else surname)
         
-        if surname.endswith('ov') or surname.endswith('ev'):
-            return {
-                'semantic_category': 'patronymic',
-                'is_toponymic': False,
-                'meaning_in_original': f"son of {surname[:-2]}",
-                'confidence_score': 70.0,
-                'etymology_features': {
-                    'category': 'patronymic',
-                    'pattern': '-ov/-ev suffix',
-                    'evidence': 'Russian patronymic pattern'
-                }
-            }
-        
-        if surname.startswith("O'") or surname.startswith('Mc') or surname.startswith('Mac'):
-            # Extract base name
-            if surname.startswith("O'"):
-                base_name = surname[2:]
-            elif surname.startswith('Mc') or surname.startswith('Mac'):
-                base_name = surname[2:]
-            else:
-                base_name = surname
+        # Highest-priority pattern whose conditions hold
+        for priority in sorted(candidates):
+            rule = self.AFFIX_PATTERNS[priority]
+            if len(surname) < rule.get('min_length', 0) or surname_lower in rule.get('exclude', ()):
+                continue
             
+            base_name = surname[rule['strip']:] if 'prefixes' in rule else surname[:-rule['strip']]
             return {
-                'semantic_category': 'patronymic',
-                'is_toponymic': False,
-                'meaning_in_original': f"descendant of {base_name}",
-                'confidence_score': 75.0,
-                'etymology_features': {
-                    'category': 'patronymic',
-                    'pattern': "O'/Mc/Mac prefix",
-                    'evidence': 'Irish/Scottish patronymic pattern'
-                }
-            }
-        
-        # Toponymic patterns (city/region suffixes)
-        if surname_lower.endswith('ano') or surname_lower.endswith('ese'):
-            # Italian place-based pattern
-            return {
-                'semantic_category': 'toponymic',
-                'is_toponymic': True,
-                'meaning_in_original': f"from {surname[:-3] if surname_lower.endswith('ano') else surname[:-3]}",
-                'confidence_score': 60.0,
+                'semantic_category': rule['category'],
+                'is_toponymic': rule['category'] == 'toponymic',
+                'meaning_in_original': f"{rule['meaning']} {base_name}",
+                'confidence_score': rule['confidence'],
                 'etymology_features': {
-                    'category': 'toponymic',
-                    'pattern': '-ano/-ese suffix',
-                    'evidence': 'Italian toponymic pattern (likely place-based)'
+                    'category': rule['category'],
+                    'pattern': rule['pattern'],
+                    'evidence': rule['evidence']
                 }
             }
         
-        if surname_lower.endswith('er') and surname_lower != 'baker' and surname_lower != 'fisher':
-            # German toponymic pattern (Berliner, Frankfurter)
-            # But need to exclude occupational -er endings
-            if len(surname) > 6:  # Avoid short names
-                return {
-                    'semantic_category': 'toponymic',
-                    'is_toponymic': True,
-                    'meaning_in_original': f"from {surname[:-2]}",
-                    'confidence_score': 50.0,
-                    'etymology_features': {
-                        'category': 'toponymic',
-                        'pattern': '-er suffix (German)',
-                        'evidence': 'Possible German toponymic pattern'
-                    }
-                }
-        
         return None
     
     def _error_result(self, message: str) -> Dict:
@@ -490,6 +481,45 @@ class ImmigrationSurnameClassifier:
         logger.info(f"Batch classification complete: {total} surnames")
         return results
     
+    def classify_column(self, surnames, chunk_size: int = 50000,
+                        workers: Optional[int] = None) -> pd.DataFrame:
+        """Classify a column of surnames (census/immigration scale).
+        
+        Each distinct value is classified once. When there are more distinct
+        values than chunk_size they are classified in chunks across worker
+        processes (workers=1 keeps everything in this process).
+        
+        Args:
+            surnames: pandas Series, pyarrow Array/ChunkedArray or sequence
+            chunk_size: Distinct values per worker task
+            workers: Worker processes (default: one per CPU)
+            
+        Returns:
+            DataFrame with one row per input value (keeping a Series' index) and
+            one column per classify_surname result key
+        """
+        if hasattr(surnames, 'to_pandas'):
+            surnames = surnames.to_pandas()
+        if not isinstance(surnames, pd.Series):
+            surnames = pd.Series(list(surnames), dtype=object)
+        
+        codes, uniques = pd.factorize(surnames.astype(object), use_na_sentinel=False)
+        uniques = list(uniques)
+        
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(uniques) <= chunk_size:
+            results = [self._classify_value(value) for value in uniques]
+        else:
+            chunks = [uniques[i:i + chunk_size] for i in range(0, len(uniques), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [result for chunk in pool.map(_classify_values, chunks) for result in chunk]
+        
+        logger.info(f"Classified {len(surnames)} surnames ({len(uniques)} distinct)")
+        
+        frame = pd.DataFrame.from_records(results).take(codes)
+        frame.index = surnames.index
+        return frame
+    
     def get_classification_summary(self, results: List[Dict]) -> Dict:
         """Generate summary statistics from classification results."""
         if not results:
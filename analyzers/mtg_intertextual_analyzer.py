@@ -13,6 +13,8 @@ Quantifies cultural sophistication by detecting:
 import logging
 from typing import Dict, List, Set
 
+from utils.lexicon_matcher import LexiconMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,6 +186,8 @@ class MTGIntertextualAnalyzer:
                 'category': 'religious',
                 'obscurity': self.biblical_references['obscurity'],
             }
+        
+        self.reference_matcher = LexiconMatcher.compile({'references': list(self.reference_index)})
     
     def analyze_intertextual_references(self, name: str, flavor_text: str = None) -> Dict:
         """Comprehensive intertextual reference analysis.
@@ -273,16 +277,11 @@ class MTGIntertextualAnalyzer:
     
     def _detect_references(self, text: str) -> List[Dict]:
         """Detect all references in given text."""
-        references = []
-        
-        for term, data in self.reference_index.items():
-            if term in text:
-                references.append({
-                    'term': term,
-                    **data
-                })
-        
-        return references
+        # Matches come back in reference index order
+        return [
+            {'term': term, **self.reference_index[term]}
+            for term in self.reference_matcher.find(text)
+        ]
     
     def _calculate_sophistication(self, name_refs: List, all_refs: List,
                                   breadth: int, obscurity: float) -> float:
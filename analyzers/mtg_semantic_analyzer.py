@@ -18,6 +18,8 @@ import re
 from typing import Dict, List, Set, Tuple
 import math
 
+from utils.lexicon_matcher import LexiconMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,6 +144,13 @@ class MTGSemanticAnalyzer:
                 if word not in self.word_to_fields:
                     self.word_to_fields[word] = []
                 self.word_to_fields[word].append(field)
+        
+        # Substring matcher keyed by (field, tier) for single-pass scoring
+        self.field_matcher = LexiconMatcher.compile({
+            (field, tier): data[tier]
+            for field, data in self.semantic_fields.items()
+            for tier in ('core', 'extended', 'related')
+        })
     
     def analyze_semantic_fields(self, name: str, oracle_text: str = None,
                                color_identity: str = None) -> Dict:
@@ -227,21 +236,14 @@ class MTGSemanticAnalyzer:
     def _calculate_field_scores(self, text: str) -> Dict[str, float]:
         """Calculate semantic field scores for given text."""
         scores = {}
+        counts = self.field_matcher.count(text)
         
-        for field, data in self.semantic_fields.items():
+        for field in self.semantic_fields:
+            # Core (highest weight), extended (medium) and related (lower) words
             score = 0.0
-            
-            # Core words (highest weight)
-            core_matches = sum(1 for word in data['core'] if word in text)
-            score += core_matches * 40
-            
-            # Extended words (medium weight)
-            extended_matches = sum(1 for word in data['extended'] if word in text)
-            score += extended_matches * 25
-            
-            # Related words (lower weight)
-            related_matches = sum(1 for word in data['related'] if word in text)
-            score += related_matches * 15
+            score += counts[(field, 'core')] * 40
+            score += counts[(field, 'extended')] * 25
+            score += counts[(field, 'related')] * 15
             
             # Normalize to 0-100
             scores[field] = min(100, score)
@@ -9,6 +9,7 @@ import logging
 # Import new standardized phonetic analysis
 from analyzers.phonetic_base import get_analyzer as get_phonetic_analyzer
 from analyzers.phonetic_composites import get_composite_analyzer
+from utils.lexicon_matcher import LexiconMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,24 @@ class NameAnalyzer:
             'fire', 'water', 'earth', 'air', 'ice', 'storm', 'thunder', 'lightning',
             'flame', 'ocean', 'wind', 'stone', 'crystal', 'plasma'
         }
+        
+        # One automaton over all six lists (tag order matters for categorization)
+        self.category_matcher = LexiconMatcher.compile({
+            'animal': sorted(self.animal_words),
+            'tech': sorted(self.tech_words),
+            'mythological': sorted(self.mythological_words),
+            'financial': sorted(self.financial_words),
+            'astronomical': sorted(self.astronomical_words),
+            'elemental': sorted(self.elemental_words),
+        })
+        self.semantic_category_labels = {
+            'animal': 'animal_reference',
+            'tech': 'technology',
+            'mythological': 'mythology',
+            'financial': 'finance',
+            'astronomical': 'astronomy',
+            'elemental': 'nature',
+        }
     
     def analyze_name(self, name, all_names=None, use_standardized=True):
         """
@@ -309,26 +328,9 @@ class NameAnalyzer:
         Returns: (primary_type, [tags])
         """
         name_lower = name.lower()
-        tags = []
-        
-        # Check each category
-        if any(word in name_lower for word in self.animal_words):
-            tags.append('animal')
-        
-        if any(word in name_lower for word in self.tech_words):
-            tags.append('tech')
-        
-        if any(word in name_lower for word in self.mythological_words):
-            tags.append('mythological')
-        
-        if any(word in name_lower for word in self.financial_words):
-            tags.append('financial')
-        
-        if any(word in name_lower for word in self.astronomical_words):
-            tags.append('astronomical')
-        
-        if any(word in name_lower for word in self.elemental_words):
-            tags.append('elemental')
+        # Check each category (single pass over the name)
+        hits = self.category_matcher.categories(name_lower)
+        tags = [category for category in self.category_matcher.categories_order if category in hits]
         
         # Check for acronym (all caps, 2-5 letters)
         if name.isupper() and 2 <= len(name) <= 5 and name.isalpha():
@@ -379,20 +381,12 @@ class NameAnalyzer:
         """Get the semantic meaning category of the name"""
         name_lower = name.lower()
         
-        if any(word in name_lower for word in self.animal_words):
-            return 'animal_reference'
-        elif any(word in name_lower for word in self.tech_words):
-            return 'technology'
-        elif any(word in name_lower for word in self.mythological_words):
-            return 'mythology'
-        elif any(word in name_lower for word in self.financial_words):
-            return 'finance'
-        elif any(word in name_lower for word in self.astronomical_words):
-            return 'astronomy'
-        elif any(word in name_lower for word in self.elemental_words):
-            return 'nature'
-        else:
-            return 'abstract'
+        hits = self.category_matcher.categories(name_lower)
+        
+        for category in self.category_matcher.categories_order:
+            if category in hits:
+                return self.semantic_category_labels[category]
+        return 'abstract'
     
     def _calculate_uniqueness(self, name, all_names):
         """
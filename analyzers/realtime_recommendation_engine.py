@@ -2,11 +2,20 @@
 Real-Time Recommendation Engine
 Generate live betting recommendations with current odds and player data
 Updates every 15 minutes with fresh opportunities
+
+The engine keeps each player's last analysis keyed by a fingerprint of its
+inputs (player data, game context, opponent, odds). A refresh re-analyzes
+only players whose inputs changed, and publishes what changed in the top-N
+to subscriber queues.
 """
 
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import hashlib
+import json
 import logging
+import queue
+import threading
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -15,11 +24,17 @@ logger = logging.getLogger(__name__)
 class RealtimeRecommendationEngine:
     """Generate and update betting recommendations in real-time"""
     
-    def __init__(self):
+    def __init__(self, top_n: int = 50):
         """Initialize real-time engine"""
         self.current_recommendations = []
         self.last_update = None
         self.update_interval = 900  # 15 minutes in seconds
+        self.top_n = top_n
+        
+        self._analyzer = None
+        self._player_state = {}  # recommendation id -> {'fingerprint', 'recommendation'}
+        self._subscribers = []
+        self._lock = threading.Lock()
     
     def generate_live_recommendations(self, games_today: List[Dict],
                                      market_odds: List[Dict],
@@ -35,68 +50,164 @@ class RealtimeRecommendationEngine:
         Returns:
             List of recommended bets with all analysis
         """
-        from analyzers.integrated_betting_analyzer import IntegratedBettingAnalyzer
-        from analyzers.position_specific_optimizer import PositionSpecificOptimizer
-        from analyzers.sport_specific_prominence_finder import SportSpecificProminenceFinder
-        
-        analyzer = IntegratedBettingAnalyzer()
-        position_optimizer = PositionSpecificOptimizer()
-        prominence_finder = SportSpecificProminenceFinder()
-        
-        recommendations = []
-        
-        for game in games_today:
-            # Determine if this is a high-prominence situation
-            game_context = self._extract_game_context(game)
+        with self._lock:
+            odds_index = self._index_odds(market_odds)
+            player_state = {}
+            recommendations = []
+            analyzed = 0
             
-            # Get players for this game
-            home_players = self._get_team_players(game['home_team'], player_database)
-            away_players = self._get_team_players(game['away_team'], player_database)
-            
-            # Analyze each player
-            for player in home_players + away_players:
-                # Get market odds for player (if available)
-                player_odds = self._find_player_odds(player, market_odds)
+            for game in games_today:
+                # Determine if this is a high-prominence situation
+                game_context = self._extract_game_context(game)
+                game_id = self._game_id(game)
                 
-                if not player_odds:
-                    continue  # No odds available
+                # Get players for this game
+                home_players = self._get_team_players(game['home_team'], player_database)
+                away_players = self._get_team_players(game['away_team'], player_database)
                 
-                # Run complete analysis
-                try:
-                    analysis = analyzer.complete_analysis(
-                        player_data=player,
-                        game_context=game_context,
-                        opponent_data=self._get_opponent(player, home_players, away_players),
-                        market_data=player_odds
-                    )
-                    
-                    # Filter by quality thresholds
-                    if (analysis['final_score'] >= 65 and 
-                        analysis['final_confidence'] >= 70 and
-                        analysis['expected_roi'] >= 15):
+                for team, players in ((game['home_team'], home_players), (game['away_team'], away_players)):
+                    for player in players:
+                        # Get market odds for player (if available)
+                        player_odds = self._find_player_odds(player, odds_index)
                         
-                        recommendations.append({
-                            **analysis,
-                            'game': game,
-                            'prop_available': player_odds,
-                            'timestamp': datetime.now().isoformat(),
-                            'priority': self._calculate_priority(analysis)
-                        })
-                
-                except Exception as e:
-                    logger.error(f"Error analyzing {player.get('name', 'unknown')}: {e}")
-                    continue
+                        if not player_odds:
+                            continue  # No odds available
+                        
+                        recommendation_id = f"{game_id}:{team}:{player.get('name')}"
+                        opponent = self._get_opponent(player, home_players, away_players)
+                        fingerprint = self._fingerprint(player, game_context, opponent, player_odds)
+                        
+                        # Re-analyze only when the player's inputs changed
+                        state = self._player_state.get(recommendation_id)
+                        if state is None or state['fingerprint'] != fingerprint:
+                            state = {
+                                'fingerprint': fingerprint,
+                                'recommendation': self._analyze_player(
+                                    recommendation_id, player, game, game_context, opponent, player_odds
+                                )
+                            }
+                            analyzed += 1
+                        
+                        player_state[recommendation_id] = state
+                        if state['recommendation']:
+                            recommendations.append(state['recommendation'])
+            
+            # Players no longer on the slate (or without odds) drop out here
+            self._player_state = player_state
+            
+            # Sort by expected ROI
+            recommendations.sort(key=lambda x: x['expected_roi'], reverse=True)
+            
+            # Update cache
+            previous = self.current_recommendations
+            self.current_recommendations = recommendations[:self.top_n]
+            self.last_update = datetime.now()
+            
+            delta = self._diff(previous, self.current_recommendations)
+            if delta['added'] or delta['removed'] or delta['changed']:
+                self._publish(delta)
         
-        # Sort by expected ROI
-        recommendations.sort(key=lambda x: x['expected_roi'], reverse=True)
+        logger.info(f"Generated {len(recommendations)} live recommendations "
+                    f"({analyzed} players analyzed, {len(player_state) - analyzed} unchanged)")
         
-        # Update cache
-        self.current_recommendations = recommendations[:50]  # Top 50
-        self.last_update = datetime.now()
+        return recommendations
+    
+    def _get_analyzer(self):
+        """Integrated analyzer, created once per engine"""
+        if self._analyzer is None:
+            from analyzers.integrated_betting_analyzer import IntegratedBettingAnalyzer
+            self._analyzer = IntegratedBettingAnalyzer()
+        return self._analyzer
+    
+    def _analyze_player(self, recommendation_id: str, player: Dict, game: Dict, game_context: Dict,
+                        opponent: Optional[Dict], player_odds: Dict) -> Optional[Dict]:
+        """Run complete analysis; returns a recommendation if it passes the quality thresholds"""
+        try:
+            analysis = self._get_analyzer().complete_analysis(
+                player_data=player,
+                game_context=game_context,
+                opponent_data=opponent,
+                market_data=player_odds
+            )
+        except Exception as e:
+            logger.error(f"Error analyzing {player.get('name', 'unknown')}: {e}")
+            return None
         
-        logger.info(f"Generated {len(recommendations)} live recommendations")
+        # Filter by quality thresholds
+        if (analysis['final_score'] >= 65 and 
+            analysis['final_confidence'] >= 70 and
+            analysis['expected_roi'] >= 15):
+            
+            return {
+                **analysis,
+                'recommendation_id': recommendation_id,
+                'game': game,
+                'prop_available': player_odds,
+                'timestamp': datetime.now().isoformat(),
+                'priority': self._calculate_priority(analysis)
+            }
         
-        return recommendations
+        return None
+    
+    def _game_id(self, game: Dict) -> str:
+        """Stable identifier for a game"""
+        if game.get('id') is not None:
+            return str(game['id'])
+        return f"{game.get('away_team')}@{game.get('home_team')}:{game.get('date', '')}"
+    
+    def _fingerprint(self, *inputs) -> str:
+        """Hash of a player's analysis inputs"""
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    # ========================================================================
+    # Subscriber feed
+    # ========================================================================
+    
+    def subscribe(self, max_pending: int = 100) -> queue.Queue:
+        """
+        Subscribe to recommendation deltas
+        
+        After every refresh that changes the top-N, each subscriber queue
+        receives {'generated_at', 'added', 'removed', 'changed'}: added and
+        changed are recommendations, removed are recommendation ids. When a
+        queue is full its oldest delta is dropped; a subscriber that falls
+        behind can resync from current_recommendations.
+        """
+        feed = queue.Queue(maxsize=max_pending)
+        with self._lock:
+            self._subscribers.append(feed)
+        return feed
+    
+    def unsubscribe(self, feed: queue.Queue):
+        """Stop delivering deltas to a subscriber queue"""
+        with self._lock:
+            if feed in self._subscribers:
+                self._subscribers.remove(feed)
+    
+    def _diff(self, previous: List[Dict], current: List[Dict]) -> Dict:
+        """Added, removed and re-analyzed entries between two top-N lists"""
+        before = {rec['recommendation_id']: rec for rec in previous}
+        after = {rec['recommendation_id']: rec for rec in current}
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'added': [rec for rec_id, rec in after.items() if rec_id not in before],
+            'removed': [rec_id for rec_id in before if rec_id not in after],
+            # Unchanged players keep the same recommendation object
+            'changed': [rec for rec_id, rec in after.items() if rec_id in before and rec is not before[rec_id]],
+        }
+    
+    def _publish(self, delta: Dict):
+        for feed in self._subscribers:
+            while True:
+                try:
+                    feed.put_nowait(delta)
+                    break
+                except queue.Full:
+                    try:
+                        feed.get_nowait()
+                    except queue.Empty:
+                        pass
     
     def _extract_game_context(self, game: Dict) -> Dict:
         """Extract game context from game data"""
@@ -171,10 +282,16 @@ class RealtimeRecommendationEngine:
         # For now, return structure
         return player_db.get(team_name, [])
     
-    def _find_player_odds(self, player: Dict, market_odds: List[Dict]) -> Optional[Dict]:
+    def _index_odds(self, market_odds: List[Dict]) -> Dict[str, Dict]:
+        """Market odds by player name (one pass per refresh)"""
+        return {odds['player_name']: odds for odds in market_odds or [] if odds.get('player_name')}
+    
+    def _find_player_odds(self, player: Dict, odds_index: Dict[str, Dict]) -> Optional[Dict]:
         """Find odds for specific player"""
-        # Would match player to odds data
-        # For now, return structure
+        if player.get('name') in odds_index:
+            return odds_index[player['name']]
+        
+        # No line posted for this player: default structure
         return {
             'player_name': player.get('name'),
             'prop_type': 'points',  # or rushing_yards, etc.
@@ -11,9 +11,12 @@ Features:
 - Semantic similarity scoring (cosine, Euclidean)
 - Embedding visualization (t-SNE, UMAP)
 - Transfer learning from large corpora
+- Persistent on-disk embedding store and nearest-neighbour meaning search
 """
 
 import logging
+import zlib
+from collections import OrderedDict
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import json
@@ -39,24 +42,43 @@ except ImportError:
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.manifold import TSNE
 
+from utils.embedding_store import EmbeddingIndex, EmbeddingStore
+
 logger = logging.getLogger(__name__)
 
+BOW_DIM = 100
+BOW_MODEL_KEY = f"bow:{BOW_DIM}"
+
 
 class SemanticEmbeddingAnalyzer:
     """
     Advanced semantic analysis using word embeddings.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[EmbeddingStore] = None, cache_size: int = 10000):
+        """
+        Args:
+            store: On-disk embedding store (default: data/embeddings)
+            cache_size: Max embeddings kept in the in-process LRU cache
+        """
         self.logger = logging.getLogger(__name__)
         
         # Models
         self.word2vec_model = None
+        self.word2vec_key = None
+        self.word2vec_persistent = False
         self.bert_model = None
         self.bert_tokenizer = None
+        self.bert_model_name = None
         
-        # Embedding cache
-        self.embedding_cache = {}
+        # Embedding cache (LRU in front of the persistent store)
+        self.embedding_cache = OrderedDict()
+        self.cache_size = cache_size
+        self.store = store if store is not None else EmbeddingStore()
+        
+        # Nearest-neighbour index over meanings (see build_meaning_index)
+        self.meaning_index = None
+        self.meaning_index_key = None
         
         self.logger.info(f"SemanticEmbeddingAnalyzer initialized (Gensim: {GENSIM_AVAILABLE}, Transformers: {TRANSFORMERS_AVAILABLE})")
     
@@ -79,6 +101,10 @@ class SemanticEmbeddingAnalyzer:
                 self.word2vec_model = KeyedVectors.load_word2vec_format(
                     pretrained_path, binary=True
                 )
+                stat = Path(pretrained_path).stat()
+                self.word2vec_key = (f"word2vec:{Path(pretrained_path).name}:"
+                                     f"{stat.st_size}:{int(stat.st_mtime)}")
+                self.word2vec_persistent = True
                 self.logger.info(f"Loaded pretrained Word2Vec from {pretrained_path}")
             elif corpus:
                 # Train from corpus
@@ -91,6 +117,10 @@ class SemanticEmbeddingAnalyzer:
                     workers=4,
                     epochs=10
                 )
+                # Multi-worker training is not reproducible, so vectors from
+                # this model are cached in memory only, never persisted
+                self.word2vec_key = f"word2vec:trained-{id(self.word2vec_model):x}"
+                self.word2vec_persistent = False
                 self.logger.info(f"Trained Word2Vec on {len(corpus)} documents")
             else:
                 self.logger.warning("No corpus or pretrained model provided")
@@ -116,6 +146,7 @@ class SemanticEmbeddingAnalyzer:
             self.bert_tokenizer = AutoTokenizer.from_pretrained(model_name)
             self.bert_model = AutoModel.from_pretrained(model_name)
             self.bert_model.eval()  # Set to evaluation mode
+            self.bert_model_name = model_name
             
             self.logger.info(f"Loaded BERT model: {model_name}")
             return True
@@ -138,30 +169,23 @@ class SemanticEmbeddingAnalyzer:
             # Fallback: simple bag-of-words encoding
             return self._simple_bow_encoding(text)
         
-        # Check cache
-        if text in self.embedding_cache:
-            return self.embedding_cache[text]
-        
-        words = simple_preprocess(text)
-        vectors = []
-        
-        for word in words:
-            try:
-                vectors.append(self.word2vec_model[word])
-            except KeyError:
-                # Word not in vocabulary
-                continue
-        
-        if not vectors:
-            return None
-        
-        # Average word vectors
-        embedding = np.mean(vectors, axis=0)
-        
-        # Cache
-        self.embedding_cache[text] = embedding
-        
-        return embedding
+        return self._cached_embeddings(self.word2vec_key, [text], self._compute_word2vec,
+                                       persist=self.word2vec_persistent)[0]
+    
+    def _compute_word2vec(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        embeddings = []
+        for text in texts:
+            vectors = []
+            for word in simple_preprocess(text):
+                try:
+                    vectors.append(self.word2vec_model[word])
+                except KeyError:
+                    # Word not in vocabulary
+                    continue
+            
+            # Average word vectors
+            embeddings.append(np.mean(vectors, axis=0) if vectors else None)
+        return embeddings
     
     def get_bert_embedding(self, text: str, pooling: str = 'cls') -> Optional[np.ndarray]:
         """
@@ -178,40 +202,188 @@ class SemanticEmbeddingAnalyzer:
             # Fallback to Word2Vec or simple encoding
             return self.get_word2vec_embedding(text)
         
-        # Check cache
-        cache_key = f"{text}_{pooling}"
-        if cache_key in self.embedding_cache:
-            return self.embedding_cache[cache_key]
+        return self._cached_embeddings(
+            self._bert_key(pooling), [text], lambda texts: self._compute_bert(texts, pooling)
+        )[0]
+    
+    def _bert_key(self, pooling: str) -> str:
+        if pooling not in ('cls', 'mean', 'max'):
+            pooling = 'cls'
+        return f"bert:{self.bert_model_name}:{pooling}"
+    
+    def _compute_bert(self, texts: List[str], pooling: str) -> List[np.ndarray]:
+        # Padded batch; pooling is masked so each row equals its unpadded result
+        inputs = self.bert_tokenizer(texts, return_tensors='pt', padding=True,
+                                     truncation=True, max_length=512)
+        
+        with torch.no_grad():
+            outputs = self.bert_model(**inputs)
+        
+        hidden = outputs.last_hidden_state
+        mask = inputs['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+        
+        # Pool embeddings
+        if pooling == 'mean':
+            # Mean of all token embeddings
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        elif pooling == 'max':
+            # Max pooling
+            pooled = hidden.masked_fill(mask == 0, float('-inf')).max(dim=1).values
+        else:
+            # Use [CLS] token embedding
+            pooled = hidden[:, 0, :]
+        
+        return list(pooled.numpy())
+    
+    def _cached_embeddings(self, model_key: str, texts: List[str], compute,
+                           batch_size: int = 32, persist: bool = True) -> List[Optional[np.ndarray]]:
+        """
+        Embeddings via LRU cache -> on-disk store -> compute (in batches)
         
-        try:
-            # Tokenize
-            inputs = self.bert_tokenizer(text, return_tensors='pt', 
-                                        truncation=True, max_length=512)
-            
-            # Get embeddings
-            with torch.no_grad():
-                outputs = self.bert_model(**inputs)
-            
-            # Pool embeddings
-            if pooling == 'cls':
-                # Use [CLS] token embedding
-                embedding = outputs.last_hidden_state[:, 0, :].numpy()[0]
-            elif pooling == 'mean':
-                # Mean of all token embeddings
-                embedding = outputs.last_hidden_state.mean(dim=1).numpy()[0]
-            elif pooling == 'max':
-                # Max pooling
-                embedding = outputs.last_hidden_state.max(dim=1).values.numpy()[0]
+        Args:
+            model_key: Encoder identity (store namespace)
+            texts: Input texts
+            compute: Function embedding a list of texts (None where impossible)
+            batch_size: Texts per compute call
+            persist: Read and write the on-disk store
+        """
+        results: Dict[str, Optional[np.ndarray]] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            key = (model_key, text)
+            if key in self.embedding_cache:
+                self.embedding_cache.move_to_end(key)
+                results[text] = self.embedding_cache[key]
             else:
-                embedding = outputs.last_hidden_state[:, 0, :].numpy()[0]
-            
-            # Cache
-            self.embedding_cache[cache_key] = embedding
+                missing.append(text)
+        
+        if missing and persist:
+            for text, embedding in zip(missing, self.store.get_many(model_key, missing)):
+                if embedding is not None:
+                    results[text] = embedding
+                    self._cache_put((model_key, text), embedding)
+            missing = [text for text in missing if text not in results]
+        
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            try:
+                computed = compute(batch)
+            except Exception as e:
+                self.logger.error(f"Error computing {model_key} embeddings: {e}")
+                computed = [None] * len(batch)
             
-            return embedding
-        except Exception as e:
-            self.logger.error(f"Error getting BERT embedding: {e}")
-            return None
+            if persist:
+                found = [(text, emb) for text, emb in zip(batch, computed) if emb is not None]
+                self.store.put_many(model_key, [text for text, _ in found], [emb for _, emb in found])
+            for text, embedding in zip(batch, computed):
+                results[text] = embedding
+                if embedding is not None:
+                    self._cache_put((model_key, text), embedding)
+        
+        return [results[text] for text in texts]
+    
+    def _cache_put(self, key: Tuple[str, str], embedding: np.ndarray):
+        self.embedding_cache[key] = embedding
+        self.embedding_cache.move_to_end(key)
+        while len(self.embedding_cache) > self.cache_size:
+            self.embedding_cache.popitem(last=False)
+    
+    def _resolve_encoder(self, method: str, pooling: str = 'cls'):
+        """
+        (model key, batch compute function) for a method
+        
+        Mirrors the single-text fallbacks: bert -> word2vec -> bag-of-words.
+        """
+        if method == 'bert' and self.bert_model and self.bert_tokenizer:
+            return self._bert_key(pooling), lambda texts: self._compute_bert(texts, pooling)
+        if method in ('bert', 'word2vec') and self.word2vec_model:
+            return self.word2vec_key, self._compute_word2vec
+        return BOW_MODEL_KEY, None
+    
+    def _persistent(self, model_key: str) -> bool:
+        return model_key != self.word2vec_key or self.word2vec_persistent
+    
+    def embed_texts(self, texts: List[str], method: str = 'bert', pooling: str = 'cls',
+                    batch_size: int = 32) -> Tuple[np.ndarray, List[int]]:
+        """
+        Embed a list of texts in batches.
+        
+        Cached and stored vectors are reused; only new texts are computed
+        (BERT runs one padded forward pass per batch).
+        
+        Args:
+            texts: Input texts
+            method: 'bert', 'word2vec', or 'simple'
+            pooling: BERT pooling method ('cls', 'mean', 'max')
+            batch_size: Texts per model call
+        
+        Returns:
+            (embedding matrix, indices of the texts each row belongs to);
+            texts without an embedding are left out
+        """
+        model_key, compute = self._resolve_encoder(method, pooling)
+        if compute is None:
+            embeddings = [self._simple_bow_encoding(text) for text in texts]
+        else:
+            embeddings = self._cached_embeddings(model_key, list(texts), compute, batch_size,
+                                                 persist=self._persistent(model_key))
+        
+        indices = [i for i, emb in enumerate(embeddings) if emb is not None]
+        if not indices:
+            return np.empty((0, 0)), []
+        return np.vstack([embeddings[i] for i in indices]), indices
+    
+    def build_meaning_index(self, meanings: List[str], method: str = 'bert',
+                            approximate: bool = False, **index_kwargs) -> EmbeddingIndex:
+        """
+        Build the nearest-neighbour index used by most_similar_meanings.
+        
+        Args:
+            meanings: Texts to index (e.g. prophetic meanings)
+            method: Embedding method ('bert', 'word2vec', or 'simple')
+            approximate: Use LSH buckets instead of scoring every meaning
+            index_kwargs: EmbeddingIndex options (n_bits, n_tables, seed)
+        
+        Returns:
+            The index (also kept on the analyzer)
+        """
+        embeddings, indices = self.embed_texts(meanings, method=method)
+        self.meaning_index = EmbeddingIndex(
+            embeddings.reshape(len(indices), -1), [meanings[i] for i in indices],
+            approximate=approximate, **index_kwargs
+        )
+        self.meaning_index_key = (method, self._resolve_encoder(method)[0])
+        
+        self.logger.info(f"Indexed {len(indices)} meanings ({self.meaning_index_key[1]}, "
+                         f"{'approximate' if approximate else 'exact'})")
+        return self.meaning_index
+    
+    def most_similar_meanings(self, text: str, k: int = 5) -> List[Dict]:
+        """
+        Most similar indexed meanings to a text.
+        
+        Args:
+            text: Query text
+            k: Number of results
+        
+        Returns:
+            List of {'meaning', 'similarity'} dicts, best first
+        """
+        if self.meaning_index is None:
+            raise ValueError("No meaning index built; call build_meaning_index first")
+        
+        method, model_key = self.meaning_index_key
+        if self._resolve_encoder(method)[0] != model_key:
+            raise ValueError(f"Meaning index was built with {model_key}; rebuild it for the current model")
+        
+        embeddings, indices = self.embed_texts([text], method=method)
+        if not indices:
+            return []
+        
+        return [
+            {'meaning': meaning, 'similarity': similarity}
+            for meaning, similarity in self.meaning_index.query(embeddings[0], k=k)
+        ]
     
     def semantic_similarity(self, text1: str, text2: str, 
                            method: str = 'bert', 
@@ -314,27 +486,13 @@ class SemanticEmbeddingAnalyzer:
             2D coordinates and metadata
         """
         # Get embeddings
-        embeddings = []
-        valid_texts = []
-        valid_labels = []
+        embeddings, indices = self.embed_texts(texts, method='bert' if method == 'bert' else 'word2vec')
+        valid_texts = [texts[i] for i in indices]
+        valid_labels = [labels[i] for i in indices] if labels else []
         
-        for i, text in enumerate(texts):
-            if method == 'bert':
-                emb = self.get_bert_embedding(text)
-            else:
-                emb = self.get_word2vec_embedding(text)
-            
-            if emb is not None:
-                embeddings.append(emb)
-                valid_texts.append(text)
-                if labels:
-                    valid_labels.append(labels[i])
-        
-        if not embeddings:
+        if not indices:
             return {'error': 'No valid embeddings generated'}
         
-        embeddings = np.array(embeddings)
-        
         # Reduce dimensions
         if reduction == 'tsne':
             reducer = TSNE(n_components=2, random_state=42)
@@ -356,10 +514,11 @@ class SemanticEmbeddingAnalyzer:
     def _simple_bow_encoding(self, text: str) -> np.ndarray:
         """Simple bag-of-words encoding as fallback."""
         words = text.lower().split()
-        # Create a simple hash-based encoding
-        encoding = np.zeros(100)
+        # Create a simple hash-based encoding (crc32 is stable across
+        # processes, unlike the salted built-in hash())
+        encoding = np.zeros(BOW_DIM)
         for word in words:
-            hash_val = hash(word) % 100
+            hash_val = zlib.crc32(word.encode('utf-8')) % BOW_DIM
             encoding[hash_val] += 1
         # Normalize
         if encoding.sum() > 0:
@@ -13,6 +13,9 @@ from analyzers.pattern_discovery import PatternDiscovery
 from analyzers.breakout_predictor import BreakoutPredictor
 from trackers.forward_validator import ForwardValidator
 from scanners.opportunity_finder import OpportunityFinder
+from scanners.crypto_screener import CryptoScreener
+from utils.response_cache import ResponseCache
+from utils.request_metrics import RequestMetrics
 from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
@@ -22,22 +25,15 @@ import numpy as np
 import io
 import random
 from functools import lru_cache
-import time
 
-# Simple in-memory cache for expensive computations
-_cache = {}
-_cache_timestamps = {}
+# Response cache for expensive endpoints - entries are invalidated by table
+# writes (committed ORM writes here, database watermark for other processes)
+# and expire after 5 minutes at most
+response_cache = ResponseCache(max_entries=256, db=db)
+response_cache.track_writes()
 
-def get_cached(key, ttl_seconds=300):
-    """Get cached value if not expired - DISABLED FOR NOW TO PREVENT STALE DATA"""
-    # CACHE DISABLED - Always return None to force fresh computation
-    return None
-
-def set_cached(key, value):
-    """Set cache value with timestamp"""
-    _cache[key] = value
-    _cache_timestamps[key] = time.time()
-    return value
+CRYPTO_TABLES = ('cryptocurrency', 'name_analysis', 'price_history')
+BETTING_TABLES = ('sports_bet',)
 
 # Configure logging
 logging.basicConfig(
@@ -110,6 +106,10 @@ except AttributeError:
 # Initialize database
 db.init_app(app)
 
+# Per-endpoint latency, SQL and payload metrics (served at /api/admin/metrics)
+request_metrics = RequestMetrics(slow_request_ms=1000)
+request_metrics.init_app(app)
+
 # Initialize services (crypto-only)
 data_collector = DataCollector()
 stats_analyzer = StatisticalAnalyzer()
@@ -122,6 +122,41 @@ pattern_discovery = PatternDiscovery()
 breakout_predictor = BreakoutPredictor()
 forward_validator = ForwardValidator()
 opportunity_finder = OpportunityFinder()
+crypto_screener = CryptoScreener(watermarks=response_cache)
+
+# Record analyzer entry points (the methods routes call) as spans of the request
+for service_name, service, methods in (
+    ('name_predictor', name_predictor, ('train',)),
+    ('confidence_scorer', confidence_scorer, ('score_cryptocurrency', 'score_all_cryptocurrencies',
+                                              'get_top_opportunities', 'get_signals_by_type',
+                                              'track_accuracy')),
+    ('backtester', backtester, ('run_backtest',)),
+    ('risk_analyzer', risk_analyzer, ('calculate_portfolio_risk', 'downside_protection_analysis',
+                                      'monte_carlo_simulation')),
+    ('portfolio_optimizer', portfolio_optimizer, ('optimize_weights', 'efficient_frontier')),
+    ('pattern_discovery', pattern_discovery, ('discover_all_patterns', 'find_anomalies')),
+    ('breakout_predictor', breakout_predictor, ('get_top_breakout_candidates', 'find_historical_twins',
+                                                'ensure_trained')),
+    ('opportunity_finder', opportunity_finder, ('find_undervalued_cryptos',)),
+    ('crypto_screener', crypto_screener, ('screen', 'live_rows')),
+):
+    request_metrics.instrument(service, service_name, methods)
+
+# Load registered models read-only (memory-mapped) so workers don't refit them;
+# consumers go through ensure_trained(), which only picks up newer registered
+# versions. Retraining happens after collection (retrain_models) or via
+# scripts/train_models.py, never inside a read request.
+name_predictor.load_registered_models()
+breakout_predictor.load_registered_model()
+
+
+def retrain_models():
+    """Refit and register predictors for freshly collected data"""
+    try:
+        name_predictor.retrain()
+        breakout_predictor.train_model()
+    except Exception as e:
+        logger.error(f"Model retraining failed: {e}")
 
 # Create database tables and auto-populate
 with app.app_context():
@@ -138,6 +173,7 @@ with app.app_context():
         
         try:
             stats = data_collector.collect_all_data(500)
+            retrain_models()
             total = stats['cryptocurrencies_added'] + stats['cryptocurrencies_updated']
             
             logger.info("="*60)
@@ -601,15 +637,17 @@ def get_live_recommendations():
         # Load from each sport - GET ALL DATA!
         for sport in ['football', 'basketball', 'baseball', 'mma']:
             # Get ALL athletes from database (not just 50!)
-            athletes = db_loader.load_athletes(sport, limit=1000)  # Load 1000 per sport = 4,000 total!
+            with request_metrics.span('athlete_loader.load_athletes'):
+                athletes = db_loader.load_athletes(sport, limit=1000)  # Load 1000 per sport = 4,000 total!
             
             for athlete in athletes:  # Process ALL athletes, not just 20!
                 try:
                     # Calculate betting score using real linguistic features
-                    score_result = analyzer.calculate_player_score(
-                        athlete['linguistic_features'],
-                        sport
-                    )
+                    with request_metrics.span('sports_betting.calculate_player_score'):
+                        score_result = analyzer.calculate_player_score(
+                            athlete['linguistic_features'],
+                            sport
+                        )
                     
                     # Skip if error
                     if not score_result or 'overall_score' not in score_result:
@@ -713,20 +751,19 @@ app._generate_contexts = _generate_contexts_helper
 
 
 @app.route('/api/betting/portfolio-history')
+@response_cache.cached(depends_on=BETTING_TABLES)
 def get_portfolio_history():
     """API: Get complete portfolio history across seasons"""
     try:
         from analyzers.historical_season_analyzer import HistoricalSeasonAnalyzer
-        from core.models import SportsBet
+        from trackers.bet_tracker import BetTracker
         
         analyzer = HistoricalSeasonAnalyzer()
         
-        # Get all bets from database
-        all_bets = SportsBet.query.filter(
-            SportsBet.bet_status.in_(['won', 'lost', 'push'])
-        ).all()
+        # Settled bets aggregated in SQL (one row per sport/outcome/game day)
+        rollup = BetTracker().get_settled_rollup()
         
-        if not all_bets:
+        if not rollup:
             # Return mock data for demonstration
             return jsonify({
                 'aggregate': {
@@ -742,16 +779,8 @@ def get_portfolio_history():
                 'note': 'No betting history yet - mock data shown'
             })
         
-        # Organize bets by sport
-        bets_by_sport = {}
-        for bet in all_bets:
-            sport = bet.sport
-            if sport not in bets_by_sport:
-                bets_by_sport[sport] = []
-            bets_by_sport[sport].append(bet.to_dict())
-        
         # Analyze portfolio
-        portfolio_analysis = analyzer.analyze_portfolio_history(bets_by_sport)
+        portfolio_analysis = analyzer.analyze_portfolio_rollup(rollup)
         
         return jsonify(portfolio_analysis)
     except Exception as e:
@@ -836,18 +865,30 @@ def get_venue_profiles():
 
 @app.route('/api/label-nominative/analyze-ensemble', methods=['POST'])
 def analyze_ensemble_prediction():
-    """API: Analyze ensemble nominative prediction for a player + context"""
+    """API: Analyze ensemble nominative prediction for a player (or a 'players' slate) + context"""
     try:
         from analyzers.enhanced_predictor import EnhancedNominativePredictor
         
         data = request.get_json()
         
-        player_data = data.get('player_data', {})
         game_context = data.get('game_context', {})
         market_data = data.get('market_data', {})
+        predictor = EnhancedNominativePredictor()
+        
+        # Slate request: every player shares the context, scored in one matrix pass
+        if 'players' in data:
+            predictions = predictor.predict_slate(
+                data['players'], game_context, market_data, data.get('opponents')
+            )
+            return jsonify({
+                'status': 'success',
+                'count': len(predictions),
+                'predictions': predictions
+            })
+        
+        player_data = data.get('player_data', {})
         opponent_data = data.get('opponent_data')
         
-        predictor = EnhancedNominativePredictor()
         result = predictor.predict(player_data, game_context, market_data, opponent_data)
         
         return jsonify({
@@ -1119,6 +1160,7 @@ def get_forward_accuracy():
 # =============================================================================
 
 @app.route('/api/signals/top')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_top_signals():
     """Get top-scoring cryptocurrencies with pagination"""
     try:
@@ -1126,22 +1168,13 @@ def get_top_signals():
         limit = request.args.get('limit', 20, type=int)
         offset = request.args.get('offset', 0, type=int)
         
-        # Cache key includes pagination params
-        cache_key = f'top_signals_{min_score}_{limit}_{offset}'
-        cached_result = get_cached(cache_key, ttl_seconds=180)  # 3 minute cache
-        if cached_result:
-            return jsonify(cached_result)
-        
         opportunities = confidence_scorer.get_top_opportunities(min_score=min_score, limit=limit)
         
         # Apply offset for pagination
         if offset > 0:
             opportunities = opportunities[offset:offset+limit]
         
-        result = opportunities
-        set_cached(cache_key, result)
-        
-        return jsonify(result)
+        return jsonify(opportunities)
     
     except Exception as e:
         logger.error(f"Error getting top signals: {e}")
@@ -1151,10 +1184,8 @@ def get_top_signals():
 @app.route('/api/admin/clear-cache')
 def clear_cache():
     """Clear all cached data (use after data updates)"""
-    global _cache, _cache_timestamps
-    count = len(_cache)
-    _cache = {}
-    _cache_timestamps = {}
+    count = response_cache.clear()
+    crypto_screener.invalidate()
     return jsonify({
         'status': 'cleared',
         'items_cleared': count,
@@ -1162,6 +1193,43 @@ def clear_cache():
     })
 
 
+@app.route('/api/admin/metrics')
+@RequestMetrics.protected
+def get_request_metrics():
+    """Per-endpoint latency histograms, SQL counts, payload sizes and spans"""
+    limit = request.args.get('limit', type=int)
+    return jsonify(request_metrics.snapshot(limit=limit))
+
+
+@app.route('/api/admin/metrics/reset', methods=['POST'])
+@RequestMetrics.protected
+def reset_request_metrics():
+    """Drop recorded request metrics and profiler samples"""
+    request_metrics.reset()
+    request_metrics.profiler.reset()
+    return jsonify({'status': 'reset'})
+
+
+@app.route('/api/admin/metrics/profiler', methods=['GET', 'POST'])
+@RequestMetrics.protected
+def request_profiler():
+    """
+    Sampling profiler: GET returns hot functions/stacks per endpoint,
+    POST {"enabled": true|false, "interval_ms": 5} switches it on or off
+    """
+    profiler = request_metrics.profiler
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if data.get('enabled', True):
+            interval_ms = data.get('interval_ms')
+            profiler.start(interval=float(interval_ms) / 1000 if interval_ms else None)
+        else:
+            profiler.stop()
+
+    top = request.args.get('top', 20, type=int)
+    return jsonify(profiler.report(top=top))
+
+
 @app.route('/api/formula/predict', methods=['POST'])
 def predict_using_formula():
     """Score a cryptocurrency using THE OPTIMAL FORMULA"""
@@ -1651,6 +1719,7 @@ def get_market_overview():
 
 
 @app.route('/api/crypto/advanced-stats')
+@response_cache.cached(depends_on=CRYPTO_TABLES + ('precomputed_stats',))
 def get_advanced_crypto_stats():
     """Comprehensive statistical analysis - INSTANT (pre-computed)"""
     try:
@@ -1801,9 +1870,6 @@ def get_advanced_crypto_stats():
             'cache_ttl': 300
         }
         
-        # Cache the result
-        set_cached('advanced_stats', result)
-        
         return jsonify(result)
     
     except Exception as e:
@@ -1812,6 +1878,7 @@ def get_advanced_crypto_stats():
 
 
 @app.route('/api/crypto/empirical-validation')
+@response_cache.cached(depends_on=CRYPTO_TABLES + ('precomputed_stats',))
 def get_empirical_validation():
     """
     EMPIRICAL VALIDATION - INSTANT (pre-computed)
@@ -2036,9 +2103,6 @@ def get_empirical_validation():
             'timestamp': datetime.now().isoformat()
         }
         
-        # Cache the result
-        set_cached('empirical_validation', result)
-        
         return jsonify(result)
     
     except Exception as e:
@@ -2066,84 +2130,28 @@ def get_advanced_filter():
         min_uniqueness = request.args.get('min_uniqueness', type=float)
         performance_filter = request.args.get('performance', 'all')  # 'winners', 'losers', 'breakouts', 'all'
         limit = request.args.get('limit', 100, type=int)
+        sort_by = request.args.get('sort_by', type=str)
+        descending = request.args.get('order', 'desc') != 'asc'
         
-        # Build query
-        latest_prices = db.session.query(
-            PriceHistory.crypto_id,
-            db.func.max(PriceHistory.date).label('max_date')
-        ).group_by(PriceHistory.crypto_id).subquery()
-        
-        query = db.session.query(
-            Cryptocurrency, NameAnalysis, PriceHistory
-        ).join(NameAnalysis, Cryptocurrency.id == NameAnalysis.crypto_id)\
-         .join(PriceHistory, Cryptocurrency.id == PriceHistory.crypto_id)\
-         .join(latest_prices, db.and_(
-             PriceHistory.crypto_id == latest_prices.c.crypto_id,
-             PriceHistory.date == latest_prices.c.max_date
-         ))
-        
-        # Apply filters
-        if rank_tier == 'top100':
-            query = query.filter(Cryptocurrency.rank <= 100)
-        elif rank_tier == '101-500':
-            query = query.filter(Cryptocurrency.rank > 100, Cryptocurrency.rank <= 500)
-        elif rank_tier == '501-1000':
-            query = query.filter(Cryptocurrency.rank > 500, Cryptocurrency.rank <= 1000)
-        elif rank_tier == '1000+':
-            query = query.filter(Cryptocurrency.rank > 1000)
-        
-        if market_cap_min:
-            query = query.filter(Cryptocurrency.market_cap >= market_cap_min)
-        if market_cap_max:
-            query = query.filter(Cryptocurrency.market_cap <= market_cap_max)
-        
-        if syllables:
-            query = query.filter(NameAnalysis.syllable_count == syllables)
-        if min_length:
-            query = query.filter(NameAnalysis.character_length >= min_length)
-        if max_length:
-            query = query.filter(NameAnalysis.character_length <= max_length)
-        if name_type:
-            query = query.filter(NameAnalysis.name_type == name_type)
-        if min_memorability:
-            query = query.filter(NameAnalysis.memorability_score >= min_memorability)
-        if min_uniqueness:
-            query = query.filter(NameAnalysis.uniqueness_score >= min_uniqueness)
-        
-        if performance_filter == 'winners':
-            query = query.filter(PriceHistory.price_1yr_change > 0)
-        elif performance_filter == 'losers':
-            query = query.filter(PriceHistory.price_1yr_change < 0)
-        elif performance_filter == 'breakouts':
-            query = query.filter(PriceHistory.price_1yr_change > 100)
-        
-        # Execute query
-        results = query.limit(limit).all()
-        
-        # Format results
-        data = []
-        for crypto, analysis, price in results:
-            data.append({
-                'id': crypto.id,
-                'name': crypto.name,
-                'symbol': crypto.symbol,
-                'rank': crypto.rank,
-                'market_cap': crypto.market_cap,
-                'current_price': crypto.current_price,
-                'analysis': {
-                    'syllables': analysis.syllable_count,
-                    'length': analysis.character_length,
-                    'memorability': analysis.memorability_score,
-                    'uniqueness': analysis.uniqueness_score,
-                    'phonetic': analysis.phonetic_score,
-                    'name_type': analysis.name_type
-                },
-                'performance': {
-                    'return_1yr': price.price_1yr_change,
-                    'return_30d': price.price_30d_change,
-                    'return_90d': price.price_90d_change
-                }
-            })
+        # Answered from the in-memory screener (refreshed on collector writes)
+        try:
+            data = crypto_screener.screen(
+                rank_tier=rank_tier,
+                market_cap_min=market_cap_min,
+                market_cap_max=market_cap_max,
+                syllables=syllables,
+                min_length=min_length,
+                max_length=max_length,
+                name_type=name_type,
+                min_memorability=min_memorability,
+                min_uniqueness=min_uniqueness,
+                performance=performance_filter,
+                sort_by=sort_by,
+                descending=descending,
+                limit=limit
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         # Calculate summary statistics for filtered results
         if data:
@@ -2181,32 +2189,8 @@ def get_advanced_filter():
 def get_live_screener():
     """Get live screener data with scores"""
     try:
-        # Get all scored cryptocurrencies
-        all_scores = confidence_scorer.score_all_cryptocurrencies()
-        
-        # Enrich with risk data
-        screener_data = []
-        for score_data in all_scores:
-            crypto_id = score_data['crypto_id']
-            
-            # Get risk analysis
-            risk_data = risk_analyzer.downside_protection_analysis(crypto_id)
-            risk_rating = risk_data['risk_rating'] if risk_data else 'MEDIUM'
-            
-            # Get price data
-            price_data = PriceHistory.query.filter_by(crypto_id=crypto_id).first()
-            return_1yr = price_data.price_1yr_change if price_data else 0
-            
-            screener_data.append({
-                'crypto_id': crypto_id,
-                'name': score_data['name'],
-                'symbol': score_data['symbol'],
-                'score': score_data['score'],
-                'signal': score_data['signal'],
-                'confidence': score_data['confidence'],
-                'return_1yr': round(return_1yr, 2),
-                'risk': risk_rating
-            })
+        # Scores and risk ratings are cached per crypto and recomputed only after writes
+        screener_data = crypto_screener.live_rows(confidence_scorer, risk_analyzer)
         
         return jsonify(screener_data)
     
@@ -2384,19 +2368,16 @@ def get_historical_twins(name):
 def get_model_performance():
     """Get breakout prediction model performance metrics"""
     try:
-        if not breakout_predictor.is_trained:
-            # Train model
-            result = breakout_predictor.train_model()
-            if not result['success']:
-                return jsonify({'error': 'Model training failed'}), 500
-            return jsonify(result)
-        else:
-            return jsonify({
-                'success': True,
-                'accuracy': round(breakout_predictor.accuracy, 3),
-                'feature_importance': breakout_predictor.feature_importance,
-                'is_trained': True
-            })
+        # Loads the newest registered model; retraining happens after collection
+        if not breakout_predictor.ensure_trained():
+            return jsonify({'error': 'Model training failed'}), 500
+        
+        return jsonify({
+            'success': True,
+            'accuracy': round(breakout_predictor.accuracy, 3),
+            'feature_importance': breakout_predictor.feature_importance,
+            'is_trained': True
+        })
     
     except Exception as e:
         logger.error(f"Error getting model performance: {e}")
@@ -2729,6 +2710,7 @@ def collect_prices_for_existing():
                 db.session.rollback()
         
         logger.info(f"Price collection complete: {added} added, {errors} errors")
+        retrain_models()
         
         return jsonify({
             'success': True,
@@ -2753,6 +2735,7 @@ def collect_data():
         logger.info(f"Starting data collection for {limit} cryptocurrencies...")
         
         stats = data_collector.collect_all_data(limit)
+        retrain_models()
         
         return jsonify({
             'success': True,
@@ -2839,6 +2822,7 @@ def model_accuracy():
 # =============================================================================
 
 @app.route('/api/stats/correlations')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_correlations():
     """Get correlation analysis"""
     try:
@@ -2852,6 +2836,7 @@ def get_correlations():
 
 
 @app.route('/api/stats/dataset')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_dataset():
     """Get full dataset for custom analysis"""
     try:
@@ -2868,6 +2853,7 @@ def get_dataset():
 # =============================================================================
 
 @app.route('/api/stats/advanced/interaction-effects')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_interaction_effects():
     """Discover significant 2-way and 3-way interaction effects"""
     try:
@@ -2891,6 +2877,7 @@ def get_interaction_effects():
 
 
 @app.route('/api/stats/advanced/non-linear-patterns')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_nonlinear_patterns():
     """Detect non-linear relationships using polynomial, spline, and threshold regression"""
     try:
@@ -2911,6 +2898,7 @@ def get_nonlinear_patterns():
 
 
 @app.route('/api/stats/advanced/clusters')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_cluster_analysis():
     """Perform clustering to find natural groupings of cryptocurrency names"""
     try:
@@ -2931,6 +2919,7 @@ def get_cluster_analysis():
 
 
 @app.route('/api/stats/advanced/causal-analysis')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_causal_analysis():
     """Estimate causal effects using propensity score matching"""
     try:
@@ -2954,6 +2943,7 @@ def get_causal_analysis():
 
 
 @app.route('/api/stats/advanced/linguistic-deep-dive')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_linguistic_deep_dive():
     """Comprehensive linguistic feature analysis"""
     try:
@@ -3026,6 +3016,7 @@ def get_linguistic_deep_dive():
 
 
 @app.route('/api/stats/advanced/comprehensive-report')
+@response_cache.cached(depends_on=CRYPTO_TABLES)
 def get_comprehensive_report():
     """Generate comprehensive analysis report with all advanced methods"""
     try:
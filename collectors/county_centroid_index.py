@@ -0,0 +1,227 @@
+"""County Centroid Spatial Index
+
+Offline replacement for per-point Census geocoder lookups. Holds every US county
+internal point (from the Census Gazetteer / TIGER county file) in a ball tree
+with a haversine metric, so an entire hurricane track can be matched against
+all counties in one vectorized radius query.
+
+The table lives at data/geography/county_centroids.csv and is generated from
+the Census Gazetteer counties file by scripts/build_county_centroids.py (run by
+install_dependencies.sh). Loading only reads the table; if it has not been
+built, load() returns None and callers fall back to the remote geocoder.
+"""
+
+import csv
+import io
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+from sklearn.neighbors import BallTree
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_MILES = 3959.0
+
+DEFAULT_CENTROID_PATH = (
+    Path(__file__).parent.parent / 'data' / 'geography' / 'county_centroids.csv'
+)
+
+GAZETTEER_URL = (
+    'https://www2.census.gov/geo/docs/maps-data/data/gazetteer/'
+    '2023_Gazetteer/2023_Gaz_counties_national.zip'
+)
+
+# Column names used by the Census Gazetteer counties file
+GAZETTEER_COLUMNS = {
+    'fips': 'GEOID',
+    'name': 'NAME',
+    'state': 'USPS',
+    'lat': 'INTPTLAT',
+    'lon': 'INTPTLONG',
+}
+
+
+class CountyCentroidIndex:
+    """Ball tree over county centroids answering batched radius queries."""
+
+    def __init__(self, fips: List[str], names: List[str], states: List[str],
+                 lats: np.ndarray, lons: np.ndarray):
+        self.fips = np.asarray(fips, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.states = np.asarray(states, dtype=object)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+
+        self.tree = BallTree(
+            np.radians(np.column_stack([self.lats, self.lons])),
+            metric='haversine'
+        )
+
+    def __len__(self) -> int:
+        return len(self.fips)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> Optional['CountyCentroidIndex']:
+        """
+        Load the centroid table (read only; never downloads).
+
+        Args:
+            path: CSV path (defaults to data/geography/county_centroids.csv)
+
+        Returns:
+            CountyCentroidIndex, or None if the table is missing or empty
+        """
+        path = Path(path) if path else DEFAULT_CENTROID_PATH
+
+        if not path.exists():
+            logger.info(f"County centroid table not found at {path}; "
+                        f"run scripts/build_county_centroids.py to build it")
+            return None
+
+        fips, names, states, lats, lons = [], [], [], [], []
+
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                try:
+                    lats.append(float(row['lat']))
+                    lons.append(float(row['lon']))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                fips.append(row['fips'].zfill(5))
+                names.append(row.get('name', ''))
+                states.append(row.get('state', ''))
+
+        if not fips:
+            logger.warning(f"County centroid table {path} has no usable rows")
+            return None
+
+        logger.info(f"Loaded {len(fips)} county centroids from {path}")
+        return cls(fips, names, states, np.array(lats), np.array(lons))
+
+    @staticmethod
+    def build_from_census(output_path: Optional[Path] = None, url: str = GAZETTEER_URL,
+                          timeout: int = 60) -> int:
+        """
+        Download the national counties Gazetteer file and convert it.
+
+        Args:
+            output_path: Destination CSV (defaults to the bundled table path)
+            url: Gazetteer zip URL
+
+        Returns:
+            Number of counties written
+        """
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            members = [name for name in archive.namelist() if name.endswith('.txt')]
+            if not members:
+                raise ValueError(f"No Gazetteer text file in {url}")
+            with tempfile.TemporaryDirectory() as tmp:
+                gazetteer_path = Path(archive.extract(members[0], tmp))
+                return CountyCentroidIndex.convert_gazetteer(gazetteer_path, output_path)
+
+    @staticmethod
+    def convert_gazetteer(gazetteer_path: Path, output_path: Optional[Path] = None) -> int:
+        """
+        Convert a Census Gazetteer counties file into the bundled CSV format.
+
+        Args:
+            gazetteer_path: Tab-delimited Gazetteer file (e.g. 2023_Gaz_counties_national.txt)
+            output_path: Destination CSV (defaults to the bundled table path)
+
+        Returns:
+            Number of counties written
+        """
+        output_path = Path(output_path) if output_path else DEFAULT_CENTROID_PATH
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write beside the target and swap in, so readers never see a partial table
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+
+        written = 0
+        with open(gazetteer_path, newline='', encoding='latin-1') as src, \
+             open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.DictReader(src, delimiter='\t')
+            # Gazetteer headers carry trailing whitespace on the last column
+            reader.fieldnames = [h.strip() for h in reader.fieldnames]
+
+            writer = csv.writer(dst)
+            writer.writerow(['fips', 'name', 'state', 'lat', 'lon'])
+
+            for row in reader:
+                try:
+                    lat = float(row[GAZETTEER_COLUMNS['lat']])
+                    lon = float(row[GAZETTEER_COLUMNS['lon']])
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+                writer.writerow([
+                    row[GAZETTEER_COLUMNS['fips']].strip().zfill(5),
+                    row[GAZETTEER_COLUMNS['name']].strip(),
+                    row[GAZETTEER_COLUMNS['state']].strip(),
+                    f"{lat:.6f}",
+                    f"{lon:.6f}",
+                ])
+                written += 1
+
+        os.replace(tmp_path, output_path)
+        return written
+
+    def query_track(self, lats: np.ndarray, lons: np.ndarray,
+                    radius_miles: float) -> Dict[str, np.ndarray]:
+        """
+        Find every county within radius of any track point.
+
+        All track points are queried in one batch; the per-county minimum
+        distance and the index of the closest track point are reduced with NumPy.
+
+        Args:
+            lats: Track point latitudes (degrees)
+            lons: Track point longitudes (degrees)
+            radius_miles: Search radius
+
+        Returns:
+            Dict of aligned arrays: county_idx, min_distance (miles), point_idx
+        """
+        empty = {
+            'county_idx': np.empty(0, dtype=np.intp),
+            'min_distance': np.empty(0, dtype=np.float64),
+            'point_idx': np.empty(0, dtype=np.intp),
+        }
+
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if lats.size == 0:
+            return empty
+
+        points = np.radians(np.column_stack([lats, lons]))
+        neighbors, distances = self.tree.query_radius(
+            points, r=radius_miles / EARTH_RADIUS_MILES, return_distance=True
+        )
+
+        counts = np.fromiter((len(n) for n in neighbors), dtype=np.intp, count=len(neighbors))
+        if counts.sum() == 0:
+            return empty
+
+        county_idx = np.concatenate(neighbors).astype(np.intp)
+        dist = np.concatenate(distances) * EARTH_RADIUS_MILES
+        point_idx = np.repeat(np.arange(len(neighbors), dtype=np.intp), counts)
+
+        # Sort by (county, distance) and keep the first hit per county
+        order = np.lexsort((point_idx, dist, county_idx))
+        county_idx, dist, point_idx = county_idx[order], dist[order], point_idx[order]
+        first = np.concatenate(([True], county_idx[1:] != county_idx[:-1]))
+
+        return {
+            'county_idx': county_idx[first],
+            'min_distance': dist[first],
+            'point_idx': point_idx[first],
+        }
@@ -7,6 +7,7 @@ Uses:
 - Haversine formula for distance calculations
 - Census TIGER/Line shapefiles for geographic boundaries
 - HURDAT2 track points for hurricane positions
+- Offline county centroid ball tree (falls back to the Census Geocoder API)
 """
 
 import logging
@@ -17,6 +18,7 @@ import json
 
 import requests
 
+from collectors.county_centroid_index import CountyCentroidIndex
 from core.models import Hurricane, HurricaneGeography, db
 
 logger = logging.getLogger(__name__)
@@ -25,9 +27,12 @@ logger = logging.getLogger(__name__)
 class HurricaneTrackGeocoder:
     """Map hurricane tracks to affected Census geographies."""
     
-    def __init__(self):
+    def __init__(self, centroid_index: Optional[CountyCentroidIndex] = None):
         self.census_geocoder_url = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
         
+        # Local county centroid index; None means use the remote geocoder
+        self.centroid_index = centroid_index if centroid_index is not None else CountyCentroidIndex.load()
+        
         # Impact severity thresholds (miles from track)
         self.severity_thresholds = {
             'direct': 50,       # 0-50 miles
@@ -230,7 +235,8 @@ class HurricaneTrackGeocoder:
         """
         Identify all counties within impact distance of hurricane track.
         
-        Uses a simplified approach: sample track points and find nearby counties.
+        Uses the offline county centroid index when available, otherwise
+        samples track points and queries the Census Geocoder.
         
         Args:
             track_points: List of track point dicts
@@ -238,6 +244,9 @@ class HurricaneTrackGeocoder:
         Returns:
             List of county info dicts with FIPS codes and impact details
         """
+        if self.centroid_index is not None:
+            return self._identify_affected_counties_indexed(track_points)
+        
         affected_counties = {}
         
         # Sample track points (every Nth point to avoid API overload)
@@ -276,6 +285,42 @@ class HurricaneTrackGeocoder:
         
         return list(affected_counties.values())
     
+    def _identify_affected_counties_indexed(self, track_points: List[Dict]) -> List[Dict]:
+        """
+        Identify affected counties with one batched radius query over all track points.
+        
+        Args:
+            track_points: List of track point dicts
+        
+        Returns:
+            List of county info dicts with FIPS codes and impact details
+        """
+        index = self.centroid_index
+        
+        matches = index.query_track(
+            [point['lat'] for point in track_points],
+            [point['lon'] for point in track_points],
+            self.severity_thresholds['peripheral']
+        )
+        
+        affected_counties = []
+        for county_idx, distance, point_idx in zip(matches['county_idx'],
+                                                   matches['min_distance'],
+                                                   matches['point_idx']):
+            fips = index.fips[county_idx]
+            affected_counties.append({
+                'fips': fips,
+                'state_fips': fips[:2],
+                'county_fips': fips[2:],
+                'name': index.names[county_idx],
+                'min_distance': float(distance),
+                'closest_point': track_points[point_idx]
+            })
+        
+        logger.debug(f"Matched {len(affected_counties)} counties from {len(track_points)} track points")
+        
+        return affected_counties
+    
     def _get_counties_near_point(self, lat: float, lon: float, radius_miles: float) -> List[Dict]:
         """
         Get counties near a geographic point using Census Geocoder.
@@ -35,6 +35,11 @@ class Config:
         'acronym', 'numeric', 'hybrid', 'geographical', 'other'
     ]
     
+    # Admin metrics endpoints (/api/admin/metrics*): off unless enabled; when a
+    # token is set, requests must send "Authorization: Bearer <token>"
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    
     # Statistical significance threshold
     SIGNIFICANCE_LEVEL = 0.05
 
@@ -10,12 +10,18 @@ Provides standardized interface to access entities across all research domains:
 - (Extensible to future domains)
 
 Enables formula testing across domains without domain-specific code.
+
+Domains can be loaded either as a list of UnifiedDomainEntity objects or as a
+columnar EntityBatch (NumPy arrays built from a single SQL query), which is
+the cheaper form for whole-domain statistics and correlation work.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import math
+import numpy as np
 from sqlalchemy import func, and_, or_
 
 from core.models import (
@@ -28,6 +34,9 @@ from core.models import (
 
 logger = logging.getLogger(__name__)
 
+# Feature default meaning "length of the entity's name"
+NAME_LENGTH = object()
+
 
 class DomainType(Enum):
     """Supported research domains"""
@@ -88,9 +97,172 @@ class UnifiedDomainEntity:
         }
 
 
+def _float_array(values: Sequence) -> np.ndarray:
+    """float64 array with None mapped to NaN"""
+    return np.array(values, dtype=float) if len(values) else np.empty(0)
+
+
+@dataclass
+class EntityBatch:
+    """
+    Columnar representation of a whole domain
+    
+    One NumPy array per attribute instead of one object per entity. Numeric
+    features are float64 with NaN for missing values (including rows without
+    a name analysis); categorical features are object arrays.
+    """
+    domain: Any
+    outcome_metric_name: str
+    entity_ids: np.ndarray
+    names: np.ndarray
+    outcomes: np.ndarray  # float64, NaN where no outcome
+    is_successful: np.ndarray  # bool (False where unknown)
+    has_features: np.ndarray  # bool, row has a name analysis
+    features: Dict[str, np.ndarray] = field(default_factory=dict)
+    metadata: Dict[str, np.ndarray] = field(default_factory=dict)
+    outcome_ranks: Optional[np.ndarray] = None  # float64, NaN where unranked
+    
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+    
+    @property
+    def has_outcome(self) -> np.ndarray:
+        """Mask of rows with an outcome metric"""
+        return ~np.isnan(self.outcomes)
+    
+    @property
+    def numeric_features(self) -> List[str]:
+        """Names of numeric feature columns"""
+        return [name for name, values in self.features.items() if values.dtype.kind == 'f']
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays (object arrays count pointers only)"""
+        arrays = [self.entity_ids, self.names, self.outcomes, self.is_successful, self.has_features]
+        arrays += list(self.features.values()) + list(self.metadata.values())
+        if self.outcome_ranks is not None:
+            arrays.append(self.outcome_ranks)
+        return sum(array.nbytes for array in arrays)
+    
+    def feature_matrix(self, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Numeric features as an (n_entities, n_features) float64 matrix
+        
+        Args:
+            names: Feature columns in order (default: all numeric features)
+        """
+        names = list(names) if names is not None else self.numeric_features
+        if not names:
+            return np.empty((len(self), 0))
+        return np.column_stack([self.features[name].astype(float) for name in names])
+    
+    def select(self, index: Union[np.ndarray, Sequence[int], slice]) -> 'EntityBatch':
+        """Subset of rows (boolean mask, integer indices or slice)"""
+        ranks = self.outcome_ranks[index] if self.outcome_ranks is not None else None
+        return EntityBatch(
+            domain=self.domain,
+            outcome_metric_name=self.outcome_metric_name,
+            entity_ids=self.entity_ids[index],
+            names=self.names[index],
+            outcomes=self.outcomes[index],
+            is_successful=self.is_successful[index],
+            has_features=self.has_features[index],
+            features={name: values[index] for name, values in self.features.items()},
+            metadata={name: values[index] for name, values in self.metadata.items()},
+            outcome_ranks=ranks,
+        )
+    
+    @staticmethod
+    def _value(values: np.ndarray, i: int):
+        value = values[i]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+    
+    def entity(self, i: int) -> UnifiedDomainEntity:
+        """Materialize one row as a UnifiedDomainEntity"""
+        features = {}
+        if self.has_features[i]:
+            features = {name: self._value(values, i) for name, values in self.features.items()}
+        
+        rank = self._value(self.outcome_ranks, i) if self.outcome_ranks is not None else None
+        return UnifiedDomainEntity(
+            name=self.names[i],
+            domain=self.domain,
+            entity_id=self.entity_ids[i],
+            outcome_metric=self._value(self.outcomes, i),
+            outcome_metric_name=self.outcome_metric_name,
+            outcome_rank=int(rank) if rank is not None else None,
+            is_successful=bool(self.is_successful[i]),
+            linguistic_features=features,
+            metadata={name: self._value(values, i) for name, values in self.metadata.items()},
+        )
+    
+    def to_entities(self) -> List[UnifiedDomainEntity]:
+        """Materialize every row (for consumers that still need objects)"""
+        return [self.entity(i) for i in range(len(self))]
+    
+    @classmethod
+    def from_entities(cls, domain, entities: List[UnifiedDomainEntity],
+                      outcome_metric_name: str = "") -> 'EntityBatch':
+        """Build a batch from already-loaded entities"""
+        if entities and not outcome_metric_name:
+            outcome_metric_name = entities[0].outcome_metric_name
+        
+        feature_names = list(dict.fromkeys(
+            name for entity in entities for name in entity.linguistic_features
+        ))
+        metadata_names = list(dict.fromkeys(
+            name for entity in entities for name in entity.metadata
+        ))
+        
+        features = {}
+        for name in feature_names:
+            values = [entity.linguistic_features.get(name) for entity in entities]
+            present = [value for value in values if value is not None]
+            if all(isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+                   for value in present):
+                features[name] = _float_array(values)
+            else:
+                features[name] = np.array(values, dtype=object)
+        
+        ranks = [entity.outcome_rank for entity in entities]
+        return cls(
+            domain=domain,
+            outcome_metric_name=outcome_metric_name,
+            entity_ids=np.array([str(entity.entity_id) for entity in entities], dtype=object),
+            names=np.array([entity.name for entity in entities], dtype=object),
+            outcomes=_float_array([entity.outcome_metric for entity in entities]),
+            is_successful=np.array([bool(entity.is_successful) for entity in entities], dtype=bool),
+            has_features=np.array([bool(entity.linguistic_features) for entity in entities], dtype=bool),
+            features=features,
+            metadata={
+                name: np.array([entity.metadata.get(name) for entity in entities], dtype=object)
+                for name in metadata_names
+            },
+            outcome_ranks=_float_array(ranks) if any(rank is not None for rank in ranks) else None,
+        )
+
+
 class DomainLoader:
     """Base class for domain-specific data loaders"""
     
+    # Batch loading spec. Loaders that set entity_model/analysis_model and
+    # implement _query() and _batch_outcomes() load batches with one
+    # column-only SQL query; others fall back to converting load_entities().
+    entity_model = None
+    analysis_model = None
+    name_attr = 'name'
+    outcome_metric_name = ""
+    # (feature name, analysis attribute, default if the model has no such attribute)
+    FEATURE_COLUMNS: Tuple = ()
+    # (metadata key, entity attribute, default if the model has no such attribute)
+    METADATA_COLUMNS: Tuple = ()
+    # Entity attributes the outcome is computed from (missing ones are skipped)
+    OUTCOME_COLUMNS: Tuple = ()
+    
     def __init__(self, domain_type: DomainType):
         self.domain_type = domain_type
     
@@ -99,6 +271,140 @@ class DomainLoader:
         """Load entities from this domain"""
         raise NotImplementedError
     
+    def _query(self, filters: Dict):
+        """Joined entity/analysis query with filters applied (no limit)"""
+        raise NotImplementedError
+    
+    def _filter_name(self, query, filters: Dict):
+        """
+        Apply the 'name' filter (case-insensitive exact match on name_attr)
+        
+        Loaders without an entity_model cannot filter by name;
+        get_entity_by_name scans them instead.
+        """
+        if filters.get('name'):
+            name_column = getattr(self.entity_model, self.name_attr)
+            query = query.filter(db.func.lower(name_column) == filters['name'].lower())
+        return query
+    
+    def _linguistic_features(self, analysis, name: str) -> Dict[str, Any]:
+        """Feature dict for one analysis row (empty if there is none)"""
+        if not analysis:
+            return {}
+        return {
+            feature: getattr(analysis, attr, len(name) if default is NAME_LENGTH else default)
+            for feature, attr, default in self.FEATURE_COLUMNS
+        }
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized outcome and success arrays
+        
+        Args:
+            columns: Entity attribute name -> raw column values (object arrays)
+                for the OUTCOME_COLUMNS present on the model
+        
+        Returns:
+            (outcomes float64 with NaN, is_successful bool)
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def _column_names(model) -> set:
+        return set(model.__mapper__.column_attrs.keys())
+    
+    def load_batch(self, limit: Optional[int] = None,
+                   filters: Optional[Dict] = None) -> EntityBatch:
+        """
+        Load this domain as an EntityBatch
+        
+        Selects only the id, name, feature, outcome and metadata columns in a
+        single query (same joins and filters as load_entities) and builds the
+        arrays directly, without creating ORM or entity objects.
+        """
+        if self.entity_model is None or self.analysis_model is None:
+            entities = self.load_entities(limit=limit, filters=filters)
+            return EntityBatch.from_entities(self.domain_type, entities, self.outcome_metric_name)
+        
+        entity_columns = self._column_names(self.entity_model)
+        analysis_columns = self._column_names(self.analysis_model)
+        analysis_pk = self.analysis_model.__mapper__.primary_key[0]
+        
+        labels = ['_id', '_name', '_analysis_id']
+        selected = [
+            self.entity_model.__mapper__.primary_key[0].label('_id'),
+            getattr(self.entity_model, self.name_attr).label('_name'),
+            analysis_pk.label('_analysis_id'),
+        ]
+        for feature, attr, _ in self.FEATURE_COLUMNS:
+            if attr in analysis_columns:
+                labels.append(f'f_{feature}')
+                selected.append(getattr(self.analysis_model, attr).label(f'f_{feature}'))
+        
+        entity_attrs = [attr for attr in self.OUTCOME_COLUMNS if attr in entity_columns]
+        entity_attrs += [
+            attr for _, attr, _ in self.METADATA_COLUMNS
+            if attr in entity_columns and attr not in entity_attrs
+        ]
+        for attr in entity_attrs:
+            labels.append(f'e_{attr}')
+            selected.append(getattr(self.entity_model, attr).label(f'e_{attr}'))
+        
+        query = self._query(filters or {}).with_entities(*selected)
+        if limit:
+            query = query.limit(limit)
+        rows = query.all()
+        
+        n = len(rows)
+        raw = {label: np.array(values, dtype=object) for label, values in zip(labels, zip(*rows))}
+        if not rows:
+            raw = {label: np.empty(0, dtype=object) for label in labels}
+        
+        names = raw['_name']
+        has_features = np.array([value is not None for value in raw['_analysis_id']], dtype=bool)
+        
+        features = {}
+        for feature, attr, default in self.FEATURE_COLUMNS:
+            if attr in analysis_columns:
+                values = raw[f'f_{feature}']
+            elif default is NAME_LENGTH:
+                values = np.array([len(name) for name in names], dtype=object)
+            else:
+                values = np.full(n, default, dtype=object)
+            
+            if isinstance(default, str):
+                column = values.copy()
+                column[~has_features] = None
+            else:
+                column = _float_array(values)
+                column[~has_features] = np.nan
+            features[feature] = column
+        
+        metadata = {}
+        for key, attr, default in self.METADATA_COLUMNS:
+            metadata[key] = raw[f'e_{attr}'] if attr in entity_columns else np.full(n, default, dtype=object)
+        
+        outcomes, is_successful = self._batch_outcomes(
+            {attr: raw[f'e_{attr}'] for attr in entity_attrs}
+        )
+        
+        return EntityBatch(
+            domain=self.domain_type,
+            outcome_metric_name=self.outcome_metric_name,
+            entity_ids=np.array([str(value) for value in raw['_id']], dtype=object),
+            names=names,
+            outcomes=outcomes,
+            is_successful=is_successful,
+            has_features=has_features,
+            features=features,
+            metadata=metadata,
+            outcome_ranks=self._batch_outcome_ranks(raw),
+        )
+    
+    def _batch_outcome_ranks(self, raw: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        """Outcome rank column, if the domain has one"""
+        return None
+    
     def get_linguistic_features(self, entity_id: str) -> Dict[str, Any]:
         """Get linguistic features for an entity"""
         raise NotImplementedError
@@ -111,15 +417,36 @@ class DomainLoader:
 class CryptoLoader(DomainLoader):
     """Loader for cryptocurrency domain"""
     
+    entity_model = Cryptocurrency
+    analysis_model = NameAnalysis
+    outcome_metric_name = "log_market_cap"
+    FEATURE_COLUMNS = (
+        ('syllable_count', 'syllable_count', 2),
+        ('character_length', 'character_length', NAME_LENGTH),
+        ('phonetic_score', 'phonetic_score', 0.5),
+        ('vowel_ratio', 'vowel_ratio', 0.4),
+        ('memorability_score', 'memorability_score', 0.5),
+        ('harshness_score', 'harshness_score', 0.5),
+        ('smoothness_score', 'smoothness_score', 0.5),
+        ('plosive_ratio', 'plosive_ratio', 0.2),
+        ('power_connotation_score', 'power_connotation_score', 0.0),
+        ('phonetic_complexity', 'phonetic_complexity', 0.5),
+        ('name_type', 'name_type', 'unknown'),
+        ('semantic_category', 'semantic_category', 'neutral'),
+        ('uniqueness_score', 'uniqueness_score', 50),
+        ('word_count', 'word_count', 1),
+    )
+    METADATA_COLUMNS = (
+        ('symbol', 'symbol', None),
+        ('market_cap', 'market_cap', None),
+        ('price', 'current_price', None),
+    )
+    OUTCOME_COLUMNS = ('market_cap',)
+    
     def __init__(self):
         super().__init__(DomainType.CRYPTO)
     
-    def load_entities(self, limit: Optional[int] = None, 
-                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
-        """Load cryptocurrency entities"""
-        filters = filters or {}
-        
-        # Build query
+    def _query(self, filters: Dict):
         query = db.session.query(Cryptocurrency, NameAnalysis, PriceHistory).join(
             NameAnalysis, Cryptocurrency.id == NameAnalysis.crypto_id, isouter=True
         ).join(
@@ -133,6 +460,19 @@ class CryptoLoader(DomainLoader):
         if filters.get('has_analysis'):
             query = query.filter(NameAnalysis.id.isnot(None))
         
+        return self._filter_name(query, filters)
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        market_cap = _float_array(columns['market_cap'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            outcomes = np.where(market_cap > 0, np.log10(market_cap), np.nan)
+        return outcomes, market_cap > 10000000
+    
+    def load_entities(self, limit: Optional[int] = None, 
+                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
+        """Load cryptocurrency entities"""
+        query = self._query(filters or {})
+        
         # Limit
         if limit:
             query = query.limit(limit)
@@ -140,24 +480,7 @@ class CryptoLoader(DomainLoader):
         entities = []
         for crypto, analysis, price in query.all():
             # Extract linguistic features (with safe defaults)
-            ling_features = {}
-            if analysis:
-                ling_features = {
-                    'syllable_count': getattr(analysis, 'syllable_count', 2),
-                    'character_length': getattr(analysis, 'character_length', len(crypto.name)),
-                    'phonetic_score': getattr(analysis, 'phonetic_score', 0.5),
-                    'vowel_ratio': getattr(analysis, 'vowel_ratio', 0.4),
-                    'memorability_score': getattr(analysis, 'memorability_score', 0.5),
-                    'harshness_score': getattr(analysis, 'harshness_score', 0.5),
-                    'smoothness_score': getattr(analysis, 'smoothness_score', 0.5),
-                    'plosive_ratio': getattr(analysis, 'plosive_ratio', 0.2),
-                    'power_connotation_score': getattr(analysis, 'power_connotation_score', 0.0),
-                    'phonetic_complexity': getattr(analysis, 'phonetic_complexity', 0.5),
-                    'name_type': getattr(analysis, 'name_type', 'unknown'),
-                    'semantic_category': getattr(analysis, 'semantic_category', 'neutral'),
-                    'uniqueness_score': getattr(analysis, 'uniqueness_score', 50),
-                    'word_count': getattr(analysis, 'word_count', 1),
-                }
+            ling_features = self._linguistic_features(analysis, crypto.name)
             
             # Outcome metric: market cap (log scale)
             outcome = None
@@ -216,15 +539,35 @@ class CryptoLoader(DomainLoader):
 class ElectionLoader(DomainLoader):
     """Loader for election domain"""
     
+    entity_model = ElectionCandidate
+    analysis_model = ElectionCandidateAnalysis
+    name_attr = 'full_name'
+    outcome_metric_name = "won_election"
+    FEATURE_COLUMNS = (
+        ('syllable_count', 'syllable_count', 2),
+        ('character_length', 'character_length', NAME_LENGTH),
+        ('word_count', 'word_count', 2),
+        ('harshness_score', 'harshness_score', 0.5),
+        ('smoothness_score', 'smoothness_score', 0.5),
+        ('power_connotation_score', 'power_connotation_score', 0.0),
+        ('authority_score', 'authority_score', 50.0),
+        ('memorability_score', 'memorability_score', 0.5),
+        ('vowel_ratio', 'vowel_ratio', 0.4),
+        ('plosive_ratio', 'plosive_ratio', 0.2),
+        ('phonetic_complexity', 'phonetic_complexity', 0.5),
+    )
+    METADATA_COLUMNS = (
+        ('position', 'position', 'Unknown'),
+        ('year', 'election_year', None),
+        ('party', 'party_simplified', 'Unknown'),
+        ('vote_share', 'vote_share_percentage', None),
+    )
+    OUTCOME_COLUMNS = ('won_election',)
+    
     def __init__(self):
         super().__init__(DomainType.ELECTION)
     
-    def load_entities(self, limit: Optional[int] = None, 
-                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
-        """Load election candidate entities"""
-        filters = filters or {}
-        
-        # Build query
+    def _query(self, filters: Dict):
         query = db.session.query(ElectionCandidate, ElectionCandidateAnalysis).join(
             ElectionCandidateAnalysis,
             ElectionCandidate.id == ElectionCandidateAnalysis.candidate_id,
@@ -238,6 +581,17 @@ class ElectionLoader(DomainLoader):
         if filters.get('year'):
             query = query.filter(ElectionCandidate.election_year == filters['year'])
         
+        return self._filter_name(query, filters)
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        won = np.array([bool(value) for value in columns['won_election']], dtype=bool)
+        return won.astype(float), won
+    
+    def load_entities(self, limit: Optional[int] = None, 
+                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
+        """Load election candidate entities"""
+        query = self._query(filters or {})
+        
         # Limit
         if limit:
             query = query.limit(limit)
@@ -245,21 +599,7 @@ class ElectionLoader(DomainLoader):
         entities = []
         for candidate, analysis in query.all():
             # Extract linguistic features (safe)
-            ling_features = {}
-            if analysis:
-                ling_features = {
-                    'syllable_count': getattr(analysis, 'syllable_count', 2),
-                    'character_length': getattr(analysis, 'character_length', len(candidate.full_name)),
-                    'word_count': getattr(analysis, 'word_count', 2),
-                    'harshness_score': getattr(analysis, 'harshness_score', 0.5),
-                    'smoothness_score': getattr(analysis, 'smoothness_score', 0.5),
-                    'power_connotation_score': getattr(analysis, 'power_connotation_score', 0.0),
-                    'authority_score': getattr(analysis, 'authority_score', 50.0),
-                    'memorability_score': getattr(analysis, 'memorability_score', 0.5),
-                    'vowel_ratio': getattr(analysis, 'vowel_ratio', 0.4),
-                    'plosive_ratio': getattr(analysis, 'plosive_ratio', 0.2),
-                    'phonetic_complexity': getattr(analysis, 'phonetic_complexity', 0.5),
-                }
+            ling_features = self._linguistic_features(analysis, candidate.full_name)
             
             # Outcome metric: won election (1.0 or 0.0)
             outcome = 1.0 if candidate.won_election else 0.0
@@ -287,15 +627,33 @@ class ElectionLoader(DomainLoader):
 class ShipLoader(DomainLoader):
     """Loader for naval ships domain"""
     
+    entity_model = Ship
+    analysis_model = ShipAnalysis
+    outcome_metric_name = "significance_score"
+    FEATURE_COLUMNS = (
+        ('syllable_count', 'syllable_count', 2),
+        ('character_length', 'character_length', NAME_LENGTH),
+        ('harshness_score', 'harshness_score', 0.5),
+        ('smoothness_score', 'softness_score', 0.5),
+        ('authority_score', 'authority_score', 50.0),
+        ('power_connotation_score', 'power_connotation_score', 0.0),
+        ('prestige_score', 'prestige_score', 50.0),
+        ('vowel_ratio', 'vowel_ratio', 0.4),
+        ('plosive_ratio', 'plosive_ratio', 0.2),
+        ('name_type', 'name_type', 'unknown'),
+    )
+    METADATA_COLUMNS = (
+        ('nation', 'nation', 'Unknown'),
+        ('ship_class', 'ship_class', 'Unknown'),
+        ('launch_year', 'launch_year', None),
+        ('major_events', 'major_events_count', 0),
+    )
+    OUTCOME_COLUMNS = ('historical_significance_score',)
+    
     def __init__(self):
         super().__init__(DomainType.SHIP)
     
-    def load_entities(self, limit: Optional[int] = None, 
-                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
-        """Load ship entities"""
-        filters = filters or {}
-        
-        # Build query
+    def _query(self, filters: Dict):
         query = db.session.query(Ship, ShipAnalysis).join(
             ShipAnalysis, Ship.id == ShipAnalysis.ship_id, isouter=True
         )
@@ -307,6 +665,17 @@ class ShipLoader(DomainLoader):
         if filters.get('has_events'):
             query = query.filter(Ship.major_events_count > 0)
         
+        return self._filter_name(query, filters)
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        outcomes = _float_array(columns['historical_significance_score'])
+        return outcomes, outcomes > 50
+    
+    def load_entities(self, limit: Optional[int] = None, 
+                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
+        """Load ship entities"""
+        query = self._query(filters or {})
+        
         # Limit
         if limit:
             query = query.limit(limit)
@@ -314,20 +683,7 @@ class ShipLoader(DomainLoader):
         entities = []
         for ship, analysis in query.all():
             # Extract linguistic features (safe)
-            ling_features = {}
-            if analysis:
-                ling_features = {
-                    'syllable_count': getattr(analysis, 'syllable_count', 2),
-                    'character_length': getattr(analysis, 'character_length', len(ship.name)),
-                    'harshness_score': getattr(analysis, 'harshness_score', 0.5),
-                    'smoothness_score': getattr(analysis, 'softness_score', 0.5),
-                    'authority_score': getattr(analysis, 'authority_score', 50.0),
-                    'power_connotation_score': getattr(analysis, 'power_connotation_score', 0.0),
-                    'prestige_score': getattr(analysis, 'prestige_score', 50.0),
-                    'vowel_ratio': getattr(analysis, 'vowel_ratio', 0.4),
-                    'plosive_ratio': getattr(analysis, 'plosive_ratio', 0.2),
-                    'name_type': getattr(analysis, 'name_type', 'unknown'),
-                }
+            ling_features = self._linguistic_features(analysis, ship.name)
             
             # Outcome metric: historical significance score
             outcome = getattr(ship, 'historical_significance_score', 0.0)
@@ -358,15 +714,33 @@ class ShipLoader(DomainLoader):
 class BoardGameLoader(DomainLoader):
     """Loader for board games domain"""
     
+    entity_model = BoardGame
+    analysis_model = BoardGameAnalysis
+    outcome_metric_name = "average_rating"
+    FEATURE_COLUMNS = (
+        ('syllable_count', 'syllable_count', 2),
+        ('character_length', 'character_length', NAME_LENGTH),
+        ('word_count', 'word_count', 2),
+        ('harshness_score', 'harshness_score', 0.5),
+        ('smoothness_score', 'smoothness_score', 0.5),
+        ('vowel_ratio', 'vowel_ratio', 0.4),
+        ('plosive_ratio', 'plosive_ratio', 0.2),
+        ('phonetic_complexity', 'phonetic_complexity', 0.5),
+        ('memorability_score', 'memorability_score', 0.5),
+        ('name_type', 'name_type', 'unknown'),
+    )
+    METADATA_COLUMNS = (
+        ('year_published', 'year_published', None),
+        ('complexity', 'complexity_average', None),
+        ('min_players', 'min_players', None),
+        ('max_players', 'max_players', None),
+    )
+    OUTCOME_COLUMNS = ('average_rating', 'bgg_rank')
+    
     def __init__(self):
         super().__init__(DomainType.BOARD_GAME)
     
-    def load_entities(self, limit: Optional[int] = None, 
-                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
-        """Load board game entities"""
-        filters = filters or {}
-        
-        # Build query
+    def _query(self, filters: Dict):
         query = db.session.query(BoardGame, BoardGameAnalysis).join(
             BoardGameAnalysis, BoardGame.id == BoardGameAnalysis.game_id, isouter=True
         )
@@ -375,6 +749,22 @@ class BoardGameLoader(DomainLoader):
         if filters.get('min_rating'):
             query = query.filter(BoardGame.average_rating >= filters['min_rating'])
         
+        return self._filter_name(query, filters)
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        rating = _float_array(columns['average_rating'])
+        # A zero rating means unrated
+        outcomes = np.where(rating == 0, np.nan, rating)
+        return outcomes, outcomes >= 7.5
+    
+    def _batch_outcome_ranks(self, raw: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        return _float_array(raw['e_bgg_rank'])
+    
+    def load_entities(self, limit: Optional[int] = None, 
+                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
+        """Load board game entities"""
+        query = self._query(filters or {})
+        
         # Limit
         if limit:
             query = query.limit(limit)
@@ -382,20 +772,7 @@ class BoardGameLoader(DomainLoader):
         entities = []
         for game, analysis in query.all():
             # Extract linguistic features (safe)
-            ling_features = {}
-            if analysis:
-                ling_features = {
-                    'syllable_count': getattr(analysis, 'syllable_count', 2),
-                    'character_length': getattr(analysis, 'character_length', len(game.name)),
-                    'word_count': getattr(analysis, 'word_count', 2),
-                    'harshness_score': getattr(analysis, 'harshness_score', 0.5),
-                    'smoothness_score': getattr(analysis, 'smoothness_score', 0.5),
-                    'vowel_ratio': getattr(analysis, 'vowel_ratio', 0.4),
-                    'plosive_ratio': getattr(analysis, 'plosive_ratio', 0.2),
-                    'phonetic_complexity': getattr(analysis, 'phonetic_complexity', 0.5),
-                    'memorability_score': getattr(analysis, 'memorability_score', 0.5),
-                    'name_type': getattr(analysis, 'name_type', 'unknown'),
-                }
+            ling_features = self._linguistic_features(analysis, game.name)
             
             # Outcome metric: average rating
             outcome = game.average_rating if game.average_rating else None
@@ -427,15 +804,33 @@ class BoardGameLoader(DomainLoader):
 class MLBPlayerLoader(DomainLoader):
     """Loader for MLB players domain"""
     
+    entity_model = MLBPlayer
+    analysis_model = MLBPlayerAnalysis
+    name_attr = 'full_name'
+    outcome_metric_name = "performance_metric"
+    FEATURE_COLUMNS = (
+        ('syllable_count', 'syllable_count', 2),
+        ('character_length', 'character_length', NAME_LENGTH),
+        ('harshness_score', 'harshness_score', 0.5),
+        ('smoothness_score', 'smoothness_score', 0.5),
+        ('power_connotation_score', 'power_connotation_score', 0.0),
+        ('memorability_score', 'memorability_score', 0.5),
+        ('vowel_ratio', 'vowel_ratio', 0.4),
+        ('plosive_ratio', 'plosive_ratio', 0.2),
+        ('phonetic_complexity', 'phonetic_complexity', 0.5),
+    )
+    METADATA_COLUMNS = (
+        ('position', 'primary_position', 'Unknown'),
+        ('debut_year', 'debut_year', None),
+        ('games_played', 'games_played', None),
+    )
+    # WAR when the model has it, batting average otherwise
+    OUTCOME_COLUMNS = ('war', 'batting_average')
+    
     def __init__(self):
         super().__init__(DomainType.MLB_PLAYER)
     
-    def load_entities(self, limit: Optional[int] = None, 
-                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
-        """Load MLB player entities"""
-        filters = filters or {}
-        
-        # Build query
+    def _query(self, filters: Dict):
         query = db.session.query(MLBPlayer, MLBPlayerAnalysis).join(
             MLBPlayerAnalysis, MLBPlayer.id == MLBPlayerAnalysis.player_id, isouter=True
         )
@@ -447,6 +842,18 @@ class MLBPlayerLoader(DomainLoader):
         if filters.get('min_games'):
             query = query.filter(MLBPlayer.games_played >= filters['min_games'])
         
+        return self._filter_name(query, filters)
+    
+    def _batch_outcomes(self, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        values = columns['war'] if 'war' in columns else columns['batting_average']
+        outcomes = _float_array(values)
+        return outcomes, outcomes > 0
+    
+    def load_entities(self, limit: Optional[int] = None, 
+                     filters: Optional[Dict] = None) -> List[UnifiedDomainEntity]:
+        """Load MLB player entities"""
+        query = self._query(filters or {})
+        
         # Limit
         if limit:
             query = query.limit(limit)
@@ -454,19 +861,7 @@ class MLBPlayerLoader(DomainLoader):
         entities = []
         for player, analysis in query.all():
             # Extract linguistic features (safe)
-            ling_features = {}
-            if analysis:
-                ling_features = {
-                    'syllable_count': getattr(analysis, 'syllable_count', 2),
-                    'character_length': getattr(analysis, 'character_length', len(player.full_name)),
-                    'harshness_score': getattr(analysis, 'harshness_score', 0.5),
-                    'smoothness_score': getattr(analysis, 'smoothness_score', 0.5),
-                    'power_connotation_score': getattr(analysis, 'power_connotation_score', 0.0),
-                    'memorability_score': getattr(analysis, 'memorability_score', 0.5),
-                    'vowel_ratio': getattr(analysis, 'vowel_ratio', 0.4),
-                    'plosive_ratio': getattr(analysis, 'plosive_ratio', 0.2),
-                    'phonetic_complexity': getattr(analysis, 'phonetic_complexity', 0.5),
-                }
+            ling_features = self._linguistic_features(analysis, player.full_name)
             
             # Outcome metric: Use batting average or default metric
             outcome = getattr(player, 'war', getattr(player, 'batting_average', None))
@@ -526,6 +921,19 @@ class UnifiedDomainInterface:
         
         return loader.load_entities(limit=limit, filters=filters)
     
+    def load_domain_batch(self, domain: DomainType, limit: Optional[int] = None,
+                          filters: Optional[Dict] = None) -> EntityBatch:
+        """
+        Load a domain as a columnar EntityBatch
+        
+        Same rows as load_domain, without building per-entity objects.
+        """
+        loader = self.loaders.get(domain)
+        if not loader:
+            raise ValueError(f"Unknown domain: {domain}")
+        
+        return loader.load_batch(limit=limit, filters=filters)
+    
     def load_all_domains(self, limit_per_domain: Optional[int] = None) -> Dict[DomainType, List[UnifiedDomainEntity]]:
         """
         Load entities from all domains
@@ -545,34 +953,38 @@ class UnifiedDomainInterface:
         return results
     
     def get_entity_by_name(self, name: str, domain: DomainType) -> Optional[UnifiedDomainEntity]:
-        """Find entity by name in specific domain"""
-        entities = self.load_domain(domain)
-        for entity in entities:
-            if entity.name.lower() == name.lower():
-                return entity
-        return None
+        """Find entity by name in specific domain (case-insensitive, matched in SQL)"""
+        loader = self.loaders.get(domain)
+        if loader is not None and loader.entity_model is None:
+            # Loader has no name column to filter on; scan its entities
+            for entity in self.load_domain(domain):
+                if entity.name.lower() == name.lower():
+                    return entity
+            return None
+        
+        entities = self.load_domain(domain, limit=1, filters={'name': name})
+        return entities[0] if entities else None
     
     def get_statistics(self, domain: DomainType) -> Dict[str, Any]:
         """Get statistics about a domain"""
-        entities = self.load_domain(domain)
+        batch = self.load_domain_batch(domain)
         
-        if not entities:
+        if not len(batch):
             return {'count': 0}
         
         # Calculate statistics
-        outcomes = [e.outcome_metric for e in entities if e.outcome_metric is not None]
-        successful = [e for e in entities if e.is_successful]
+        outcomes = batch.outcomes[batch.has_outcome]
+        successful_count = int(batch.is_successful.sum())
         
         stats = {
-            'count': len(entities),
-            'with_analysis': len([e for e in entities if e.linguistic_features]),
+            'count': len(batch),
+            'with_analysis': int(batch.has_features.sum()),
             'with_outcome': len(outcomes),
-            'successful_count': len(successful),
-            'success_rate': len(successful) / len(entities) if entities else 0,
+            'successful_count': successful_count,
+            'success_rate': successful_count / len(batch),
         }
         
-        if outcomes:
-            import numpy as np
+        if len(outcomes):
             stats['outcome_mean'] = float(np.mean(outcomes))
             stats['outcome_std'] = float(np.std(outcomes))
             stats['outcome_min'] = float(np.min(outcomes))
@@ -169,6 +169,8 @@ class StockLoader(DomainLoader):
 class HurricaneLoader(DomainLoader):
     """Loader for hurricanes"""
     
+    entity_model = Hurricane
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.HURRICANE)
     
@@ -179,6 +181,7 @@ class HurricaneLoader(DomainLoader):
         query = db.session.query(Hurricane, HurricaneAnalysis).join(
             HurricaneAnalysis, Hurricane.id == HurricaneAnalysis.hurricane_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -221,6 +224,8 @@ class HurricaneLoader(DomainLoader):
 class MTGCardLoader(DomainLoader):
     """Loader for Magic: The Gathering cards"""
     
+    entity_model = MTGCard
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.MTG_CARD)
     
@@ -231,6 +236,7 @@ class MTGCardLoader(DomainLoader):
         query = db.session.query(MTGCard, MTGCardAnalysis).join(
             MTGCardAnalysis, MTGCard.id == MTGCardAnalysis.card_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -274,6 +280,8 @@ class MTGCardLoader(DomainLoader):
 class BandLoader(DomainLoader):
     """Loader for music bands/artists"""
     
+    entity_model = Band
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.BAND)
     
@@ -284,6 +292,7 @@ class BandLoader(DomainLoader):
         query = db.session.query(Band, BandAnalysis).join(
             BandAnalysis, Band.id == BandAnalysis.band_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -326,6 +335,8 @@ class BandLoader(DomainLoader):
 class NBAPlayerLoader(DomainLoader):
     """Loader for NBA players"""
     
+    entity_model = NBAPlayer
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.NBA_PLAYER)
     
@@ -336,6 +347,7 @@ class NBAPlayerLoader(DomainLoader):
         query = db.session.query(NBAPlayer, NBAPlayerAnalysis).join(
             NBAPlayerAnalysis, NBAPlayer.id == NBAPlayerAnalysis.player_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -378,6 +390,8 @@ class NBAPlayerLoader(DomainLoader):
 class NFLPlayerLoader(DomainLoader):
     """Loader for NFL players"""
     
+    entity_model = NFLPlayer
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.NFL_PLAYER)
     
@@ -388,6 +402,7 @@ class NFLPlayerLoader(DomainLoader):
         query = db.session.query(NFLPlayer, NFLPlayerAnalysis).join(
             NFLPlayerAnalysis, NFLPlayer.id == NFLPlayerAnalysis.player_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -534,6 +549,9 @@ class AcademicLoader(DomainLoader):
 class FilmLoader(DomainLoader):
     """Loader for films/movies"""
     
+    entity_model = Film
+    name_attr = 'title'
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.FILM)
     
@@ -544,6 +562,7 @@ class FilmLoader(DomainLoader):
         query = db.session.query(Film, FilmAnalysis).join(
             FilmAnalysis, Film.id == FilmAnalysis.film_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -585,6 +604,9 @@ class FilmLoader(DomainLoader):
 class BookLoader(DomainLoader):
     """Loader for books"""
     
+    entity_model = Book
+    name_attr = 'title'
+    
     def __init__(self):
         super().__init__(ExtendedDomainType.BOOK)
     
@@ -595,6 +617,7 @@ class BookLoader(DomainLoader):
         query = db.session.query(Book, BookAnalysis).join(
             BookAnalysis, Book.id == BookAnalysis.book_id, isouter=True
         )
+        query = self._filter_name(query, filters)
         
         if limit:
             query = query.limit(limit)
@@ -18,10 +18,16 @@ Data sources:
 - Religious text analysis (Bible, Quran, etc.)
 """
 
+import hashlib
 import json
+import logging
+import os
+import re
 from typing import Dict, List, Optional
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Cultural traditions
 HEBREW = "hebrew"
 GREEK = "greek"
@@ -2740,14 +2746,203 @@ class NameEtymologyDatabase:
         }
 
 
-# Create singleton instance
-etymology_db = NameEtymologyDatabase()
+# Generated artifact: kept in the data cache directory, not next to the source
+COMPILED_PATH = Path(
+    os.environ.get('ETYMOLOGY_COMPILED_PATH')
+    or Path(__file__).parent.parent / 'cache' / 'name_etymology_compiled.json'
+)
+COMPILED_FORMAT_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _source_digest() -> str:
+    """SHA-1 of this module, used to detect a stale compiled store"""
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+def _build_compiled() -> Dict:
+    """Name records plus inverted indexes, built from the Python literals"""
+    names = NameEtymologyDatabase().names
+    
+    name_index = {}
+    for name in names:
+        name_index.setdefault(name.lower(), name)
+    
+    # Variants resolve to the first name listing them; real names always win
+    variant_index = {}
+    for name, data in names.items():
+        for variant in data.get('variants') or []:
+            key = variant.lower()
+            if key and key not in name_index:
+                variant_index.setdefault(key, name)
+    
+    meaning_index = {}
+    origin_index = {}
+    destiny_index = {}
+    for name, data in names.items():
+        for token in dict.fromkeys(_TOKEN_PATTERN.findall(data['meaning'].lower())):
+            meaning_index.setdefault(token, []).append(name)
+        # JSON keys must be strings; missing values are stored under ""
+        origin_index.setdefault(data.get('origin') or '', []).append(name)
+        destiny_index.setdefault(data.get('destiny_category') or '', []).append(name)
+    
+    return {
+        'format_version': COMPILED_FORMAT_VERSION,
+        'source_sha1': _source_digest(),
+        'names': names,
+        'indexes': {
+            'name': name_index,
+            'variant': variant_index,
+            'meaning_token': meaning_index,
+            'origin': origin_index,
+            'destiny_category': destiny_index,
+        },
+    }
+
+
+def _write_compiled(compiled: Dict, output_path: Path):
+    """Write a compiled store atomically (temp file + rename)"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(compiled, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def compile_database(output_path: Optional[str] = None) -> Path:
+    """
+    Write the compiled etymology store generated from this module.
+    
+    The compiled file holds the name records plus inverted indexes on
+    lower-cased names, variants, meaning tokens, origin and destiny category.
+    
+    Args:
+        output_path: Destination JSON (defaults to COMPILED_PATH)
+    
+    Returns:
+        Path written
+    """
+    output_path = Path(output_path) if output_path else COMPILED_PATH
+    _write_compiled(_build_compiled(), output_path)
+    return output_path
+
+
+class CompiledEtymologyStore(NameEtymologyDatabase):
+    """
+    Lazily loaded, index-backed view of the etymology database
+    
+    Nothing is read until the first lookup. The compiled JSON is then loaded
+    once; if it is missing, unreadable or older than this module it is rebuilt
+    from the source literals (and atomically rewritten when the cache
+    directory is writable).
+    """
+    
+    def __init__(self, compiled_path: Optional[str] = None):
+        self.compiled_path = Path(compiled_path) if compiled_path else COMPILED_PATH
+        self._names = None
+        self._indexes = None
+        self._positions = None
+        self._meaning_cache = {}
+    
+    @property
+    def names(self) -> Dict[str, Dict]:
+        if self._names is None:
+            self._load()
+        return self._names
+    
+    @property
+    def indexes(self) -> Dict[str, Dict]:
+        if self._indexes is None:
+            self._load()
+        return self._indexes
+    
+    def _load(self):
+        compiled = None
+        if self.compiled_path.exists():
+            try:
+                with open(self.compiled_path, encoding='utf-8') as f:
+                    compiled = json.load(f)
+            except (OSError, ValueError) as e:
+                # Truncated or corrupt file: treat as stale
+                logger.warning(f"Ignoring unreadable compiled etymology store {self.compiled_path}: {e}")
+            if (not isinstance(compiled, dict)
+                    or compiled.get('format_version') != COMPILED_FORMAT_VERSION
+                    or compiled.get('source_sha1') != _source_digest()):
+                compiled = None
+        
+        if compiled is None:
+            compiled = _build_compiled()
+            try:
+                _write_compiled(compiled, self.compiled_path)
+            except OSError:
+                pass  # Read-only install: keep the in-memory build
+        
+        self._names = compiled['names']
+        self._indexes = compiled['indexes']
+        self._positions = {name: i for i, name in enumerate(self._names)}
+    
+    def get_name(self, name: str) -> Optional[Dict]:
+        """Get etymology data for a name, resolving case and known variants"""
+        names = self.names
+        if name in names:
+            return names[name]
+        
+        canonical = self.resolve_name(name)
+        return names[canonical] if canonical else None
+    
+    def resolve_name(self, name: str) -> Optional[str]:
+        """Canonical database name for a name or variant (case-insensitive)"""
+        if not isinstance(name, str):
+            return None
+        key = name.strip().lower()
+        return self.indexes['name'].get(key) or self.indexes['variant'].get(key)
+    
+    def search_by_meaning(self, keyword: str) -> List[str]:
+        """Search names by meaning keyword (substring match, case-insensitive)"""
+        keyword_lower = keyword.lower()
+        if keyword_lower in self._meaning_cache:
+            return list(self._meaning_cache[keyword_lower])
+        
+        if _TOKEN_PATTERN.fullmatch(keyword_lower):
+            # A single-token keyword can only occur inside one meaning token,
+            # so scanning the token vocabulary is equivalent to scanning meanings
+            matched = set()
+            for token, token_names in self.indexes['meaning_token'].items():
+                if keyword_lower in token:
+                    matched.update(token_names)
+            results = sorted(matched, key=self._positions.__getitem__)
+        else:
+            results = [
+                name for name, data in self.names.items()
+                if keyword_lower in data['meaning'].lower()
+            ]
+        
+        self._meaning_cache[keyword_lower] = results
+        return list(results)
+    
+    def search_by_destiny_category(self, category: str) -> List[str]:
+        """Search names by destiny category"""
+        return list(self.indexes['destiny_category'].get(category, []))
+    
+    def search_by_origin(self, origin: str) -> List[str]:
+        """Search names by cultural origin"""
+        return list(self.indexes['origin'].get(origin, []))
+
+
+# Shared instance; loads the compiled store on first lookup
+etymology_db = CompiledEtymologyStore()
 
 # Export to JSON on module import
 if __name__ == "__main__":
     output_path = Path(__file__).parent / "name_etymology_database.json"
     etymology_db.export_to_json(str(output_path))
     print(f"Etymology database exported to: {output_path}")
+    print(f"Compiled store written to: {compile_database()}")
     print("\nDatabase Statistics:")
     stats = etymology_db.get_statistics()
     for key, value in stats.items():
@@ -25,6 +25,10 @@ echo ""
 echo "📥 Downloading spaCy language model..."
 python3 -m spacy download en_core_web_sm
 
+echo ""
+echo "🗺️  Building county centroid table (hurricane track geocoding)..."
+python3 scripts/build_county_centroids.py || echo "⚠️  Skipped: rerun scripts/build_county_centroids.py for offline county geocoding"
+
 echo ""
 echo "=================================="
 echo "✅ Installation Complete!"
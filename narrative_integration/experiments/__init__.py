@@ -6,7 +6,8 @@ and testing hypotheses systematically.
 """
 
 from .evaluation import NarrativeEvaluator
+from .feature_cache import FoldFeatureCache
 from .hypothesis_tests import HypothesisTest
 
-__all__ = ['NarrativeEvaluator', 'HypothesisTest']
+__all__ = ['NarrativeEvaluator', 'FoldFeatureCache', 'HypothesisTest']
 
@@ -11,14 +11,18 @@ Date: November 2025
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
-from sklearn.model_selection import cross_validate, cross_val_predict
+from sklearn.base import clone
+from sklearn.model_selection import check_cv, cross_validate
+from sklearn.utils import _safe_indexing
 from sklearn.metrics import (
     accuracy_score, f1_score, precision_score, recall_score,
     roc_auc_score, matthews_corrcoef, confusion_matrix,
-    classification_report, make_scorer
+    classification_report, make_scorer, get_scorer
 )
 import logging
 
+from .feature_cache import FoldFeatureCache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -27,7 +31,8 @@ class NarrativeEvaluator:
     """Evaluate narrative pipelines with comprehensive metrics."""
     
     def __init__(self, cv_strategy, metrics: Optional[List[str]] = None,
-                 random_seed: int = 42):
+                 random_seed: int = 42,
+                 feature_cache: Optional[FoldFeatureCache] = None):
         """
         Initialize evaluator.
         
@@ -35,9 +40,12 @@ class NarrativeEvaluator:
             cv_strategy: Cross-validation strategy (e.g., StratifiedKFold)
             metrics: List of metric names to compute
             random_seed: Random seed for reproducibility
+            feature_cache: Shared per-fold transformer output cache; when set,
+                each transformer is fit once per fold across all pipelines
         """
         self.cv_strategy = cv_strategy
         self.random_seed = random_seed
+        self.feature_cache = feature_cache
         
         # Default metrics
         if metrics is None:
@@ -70,22 +78,24 @@ class NarrativeEvaluator:
         scoring = self._build_scoring_dict()
         
         try:
-            # Cross-validation
-            cv_results = cross_validate(
-                pipeline, X, y,
-                cv=self.cv_strategy,
-                scoring=scoring,
-                return_train_score=True,
-                n_jobs=-1,
-                error_score='raise'
-            )
-            
-            # Get predictions for confusion matrix
-            y_pred = cross_val_predict(
-                pipeline, X, y,
-                cv=self.cv_strategy,
-                n_jobs=-1
-            )
+            # Cross-validation; predictions come from the same fitted folds
+            if self.feature_cache is not None and self.feature_cache.is_cacheable(pipeline):
+                cv_results, y_pred = self._cross_validate_cached(pipeline, X, y, scoring)
+            else:
+                cv_results = cross_validate(
+                    pipeline, X, y,
+                    cv=self.cv_strategy,
+                    scoring=scoring,
+                    return_train_score=True,
+                    return_estimator=True,
+                    return_indices=True,
+                    n_jobs=-1,
+                    error_score='raise'
+                )
+                y_pred = self._collect_predictions(
+                    (estimator, _safe_indexing(X, test_idx), test_idx)
+                    for estimator, test_idx in zip(cv_results['estimator'], cv_results['indices']['test'])
+                )
             
             # Calculate confusion matrix
             cm = confusion_matrix(y, y_pred)
@@ -125,6 +135,56 @@ class NarrativeEvaluator:
             logger.error(f"  ✗ Error evaluating {pipeline_name}: {str(e)}")
             raise
     
+    def _cross_validate_cached(self, pipeline, X, y, scoring: Dict[str, Any]) -> Tuple[Dict, np.ndarray]:
+        """
+        Cross-validate using cached per-fold transformer outputs.
+        
+        Equivalent to cross_validate + cross_val_predict on the same folds, but
+        only the final estimator is fit per fold; transformer features come
+        from self.feature_cache.
+        
+        Returns:
+            (cv_results in cross_validate's test_/train_ format, out-of-fold predictions)
+        """
+        y = np.asarray(y)
+        cv = check_cv(self.cv_strategy, y, classifier=True)
+        scorers = {
+            name: get_scorer(scorer) if isinstance(scorer, str) else scorer
+            for name, scorer in scoring.items()
+        }
+        
+        cv_results = {f'{split}_{name}': [] for name in scorers for split in ('test', 'train')}
+        fold_predictions = []
+        
+        for train_idx, test_idx in cv.split(X, y):
+            X_train, X_test = self.feature_cache.pipeline_features(pipeline, X, y, train_idx, test_idx)
+            y_train, y_test = y[train_idx], y[test_idx]
+            
+            estimator = clone(pipeline.steps[-1][1]).fit(X_train, y_train)
+            
+            for name, scorer in scorers.items():
+                cv_results[f'test_{name}'].append(scorer(estimator, X_test, y_test))
+                cv_results[f'train_{name}'].append(scorer(estimator, X_train, y_train))
+            
+            fold_predictions.append((estimator, X_test, test_idx))
+        
+        cv_results = {key: np.array(values) for key, values in cv_results.items()}
+        
+        return cv_results, self._collect_predictions(fold_predictions)
+    
+    @staticmethod
+    def _collect_predictions(folds) -> np.ndarray:
+        """Assemble out-of-fold predictions from (estimator, X_test, test_idx) triples."""
+        indices, predictions = [], []
+        for estimator, X_test, test_idx in folds:
+            indices.append(np.asarray(test_idx))
+            predictions.append(estimator.predict(X_test))
+        
+        indices = np.concatenate(indices)
+        y_pred = np.empty(len(indices), dtype=predictions[0].dtype)
+        y_pred[indices] = np.concatenate(predictions)
+        return y_pred
+    
     def compare_pipelines(self, results_list: List[Dict]) -> pd.DataFrame:
         """
         Compare multiple pipeline results.
@@ -0,0 +1,145 @@
+"""
+Fold Feature Cache
+
+Caches narrative transformer outputs per cross-validation fold so each
+transformer is fit once per fold and its features are reused by every
+pipeline that contains it (single-transformer pipelines, the combined
+FeatureUnion pipeline, and pipelines that only differ in classifier).
+
+Author: Narrative Integration System
+Date: November 2025
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.pipeline import FeatureUnion, Pipeline
+from sklearn.utils import _safe_indexing
+
+logger = logging.getLogger(__name__)
+
+
+class FoldFeatureCache:
+    """Transformer outputs keyed by (transformer config, data, fold)."""
+
+    def __init__(self):
+        self._features: Dict[Tuple, Tuple[Any, Any]] = {}
+        self._data_keys: Dict[int, Tuple[Any, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def transformer_key(transformer) -> Tuple[str, str]:
+        """Identify a transformer by class and constructor parameters."""
+        cls = type(transformer)
+        return f"{cls.__module__}.{cls.__qualname__}", joblib.hash(transformer.get_params(deep=True))
+
+    def data_key(self, X) -> str:
+        """Content hash of the input data (memoized per object)."""
+        cached = self._data_keys.get(id(X))
+        if cached is not None and cached[0] is X:
+            return cached[1]
+        key = joblib.hash(X)
+        self._data_keys[id(X)] = (X, key)
+        return key
+
+    @staticmethod
+    def is_cacheable(pipeline) -> bool:
+        """Pipelines of transformers / unweighted FeatureUnions ending in an estimator."""
+        if not isinstance(pipeline, Pipeline):
+            return False
+        for _, step in pipeline.steps[:-1]:
+            if step is None or step == 'passthrough':
+                return False
+            if isinstance(step, FeatureUnion) and step.transformer_weights:
+                return False
+        return True
+
+    def fold_features(self, transformer, X, y, train_idx: np.ndarray,
+                      test_idx: np.ndarray) -> Tuple[Any, Any]:
+        """
+        Train/test features for one fold, fitting the transformer at most once.
+
+        Args:
+            transformer: Unfitted transformer (cloned before fitting)
+            X: Full input data
+            y: Full labels
+            train_idx: Training row indices
+            test_idx: Test row indices
+
+        Returns:
+            (train_features, test_features)
+        """
+        key = (
+            self.transformer_key(transformer),
+            self.data_key(X),
+            joblib.hash(np.asarray(train_idx)),
+            joblib.hash(np.asarray(test_idx)),
+        )
+
+        cached = self._features.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        fitted = clone(transformer)
+        X_train = _safe_indexing(X, train_idx)
+        X_test = _safe_indexing(X, test_idx)
+        y_train = _safe_indexing(y, train_idx) if y is not None else None
+
+        features = (fitted.fit_transform(X_train, y_train), fitted.transform(X_test))
+        self._features[key] = features
+        return features
+
+    def pipeline_features(self, pipeline: Pipeline, X, y, train_idx: np.ndarray,
+                          test_idx: np.ndarray) -> Tuple[Any, Any]:
+        """
+        Features reaching the pipeline's final estimator for one fold.
+
+        FeatureUnion members are looked up individually, so a combined pipeline
+        reuses the features already computed for its single-transformer pipelines.
+        """
+        X_train = X_test = None
+
+        for _, step in pipeline.steps[:-1]:
+            if X_train is None:
+                X_train, X_test = self._step_features(step, X, y, train_idx, test_idx)
+            else:
+                # Later steps consume the previous step's output; fit directly
+                fitted = clone(step)
+                y_train = _safe_indexing(y, train_idx) if y is not None else None
+                X_train, X_test = fitted.fit_transform(X_train, y_train), fitted.transform(X_test)
+
+        return X_train, X_test
+
+    def _step_features(self, step, X, y, train_idx, test_idx) -> Tuple[Any, Any]:
+        if not isinstance(step, FeatureUnion):
+            return self.fold_features(step, X, y, train_idx, test_idx)
+
+        parts = [
+            self.fold_features(transformer, X, y, train_idx, test_idx)
+            for _, transformer in step.transformer_list
+            if transformer not in (None, 'drop')
+        ]
+        return self._hstack([p[0] for p in parts]), self._hstack([p[1] for p in parts])
+
+    @staticmethod
+    def _hstack(blocks: List[Any]):
+        # Same stacking rule as FeatureUnion
+        if any(sparse.issparse(block) for block in blocks):
+            return sparse.hstack(blocks).tocsr()
+        return np.hstack(blocks)
+
+    def stats(self) -> Dict[str, int]:
+        """Cache hit/miss counters."""
+        return {'entries': len(self._features), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        """Drop all cached features."""
+        self._features.clear()
+        self._data_keys.clear()
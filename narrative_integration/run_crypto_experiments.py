@@ -37,6 +37,7 @@ sys.path.insert(0, str(project_root))
 
 from narrative_integration.pipelines.pipeline_builder import NarrativePipelineBuilder
 from narrative_integration.experiments.evaluation import NarrativeEvaluator
+from narrative_integration.experiments.feature_cache import FoldFeatureCache
 from narrative_integration.experiments.hypothesis_tests import HypothesisTest
 
 
@@ -151,12 +152,15 @@ def main():
     logger.info("STEP 3: Running Cross-Validation Experiments")
     logger.info("-"*80)
     
-    # Setup evaluator
+    # Setup evaluator (transformers are fit once per fold and shared across
+    # pipelines, including the combined pipeline)
     cv_strategy = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    feature_cache = FoldFeatureCache()
     evaluator = NarrativeEvaluator(
         cv_strategy=cv_strategy,
         metrics=['f1_macro', 'f1_weighted', 'accuracy', 'roc_auc', 
-                'precision_macro', 'recall_macro', 'matthews_corrcoef']
+                'precision_macro', 'recall_macro', 'matthews_corrcoef'],
+        feature_cache=feature_cache
     )
     
     # Evaluate each pipeline
@@ -171,7 +175,7 @@ def main():
             continue
     
     logger.info("")
-    logger.info("✓ All experiments complete")
+    logger.info(f"✓ All experiments complete (feature cache: {feature_cache.stats()})")
     logger.info("")
     
     # =========================================================================
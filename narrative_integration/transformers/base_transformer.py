@@ -201,6 +201,23 @@ class TextNarrativeTransformer(NarrativeTransformer):
         
         return text
     
+    @staticmethod
+    def _row_entropy(matrix) -> np.ndarray:
+        """
+        Shannon entropy of each row's non-zero weights of a CSR matrix.
+        
+        Computed on the sparse data array directly (0 for empty rows).
+        """
+        row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+        counts_per_row = np.diff(matrix.indptr)
+        probs = matrix.data / np.repeat(np.where(row_sums > 0, row_sums, 1), counts_per_row)
+        terms = probs * np.log(probs + 1e-10)
+        
+        entropy = np.zeros(matrix.shape[0])
+        nonempty = counts_per_row > 0
+        entropy[nonempty] = -np.add.reduceat(terms, matrix.indptr[:-1][nonempty])
+        return entropy
+    
     def _validate_input(self, X):
         """Validate that input is list of texts."""
         super()._validate_input(X)
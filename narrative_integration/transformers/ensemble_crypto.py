@@ -19,6 +19,7 @@ Date: November 2025
 """
 
 import numpy as np
+from scipy import sparse
 from typing import List, Dict, Set
 from collections import Counter
 from sklearn.feature_extraction.text import CountVectorizer
@@ -28,6 +29,16 @@ from .base_transformer import TextNarrativeTransformer
 class EnsembleNarrativeTransformer(TextNarrativeTransformer):
     """Extract ensemble and network effects features."""
     
+    # Ecosystem breadth categories: technical, financial, community
+    ECOSYSTEM_CATEGORIES = (
+        ('bit', 'chain', 'block', 'crypto', 'token', 'protocol'),
+        ('coin', 'cash', 'finance', 'bank', 'pay', 'value'),
+        ('social', 'community', 'people', 'network'),
+    )
+    MAJOR_CRYPTOS = ('bitcoin', 'ethereum', 'btc', 'eth', 'solana', 'cardano')
+    EARLY_TERMS = ('new', 'emerging', 'innovative', 'next', 'future')
+    LATE_TERMS = ('established', 'dominant', 'leader', 'major', 'foundational')
+    
     def __init__(self, n_top_terms: int = 50, min_cooccurrence: int = 2,
                  network_metrics: bool = True, diversity_metrics: bool = True):
         """
@@ -95,6 +106,10 @@ class EnsembleNarrativeTransformer(TextNarrativeTransformer):
         """
         Transform texts to ensemble features.
         
+        The term matrix stays sparse; per-document statistics over present
+        terms are computed for the whole batch with sparse matrix products, so
+        memory scales with the number of non-zeros.
+        
         Args:
             X: List of narrative descriptions
         
@@ -104,118 +119,64 @@ class EnsembleNarrativeTransformer(TextNarrativeTransformer):
         self._validate_fitted()
         self._validate_input(X)
         
-        # Transform to term matrix
-        term_matrix = self.vectorizer.transform(X).toarray()
+        # Transform to (sparse) term matrix
+        term_matrix = self.vectorizer.transform(X).tocsr()
+        presence = term_matrix.copy()
+        presence.data = np.ones_like(presence.data, dtype=np.float64)
         
-        features = []
-        for i, text in enumerate(X):
-            doc_features = self._extract_document_features(text, term_matrix[i])
-            features.append(doc_features)
-        
-        return np.array(features, dtype=np.float32)
-    
-    def _extract_document_features(self, text: str, term_vector: np.ndarray) -> List[float]:
-        """Extract ensemble features from document."""
-        doc_features = []
+        n_terms = len(self.top_terms)
+        norm = self.metadata['total_docs'] + 1
+        features = np.zeros((len(X), self._calculate_n_features()), dtype=np.float64)
         
         # 1. Ensemble size (number of tracked terms present)
-        ensemble_size = np.sum(term_vector > 0)
-        doc_features.append(ensemble_size / len(self.top_terms))  # Normalized
+        ensemble_size = np.diff(presence.indptr).astype(np.float64)
+        has_terms = ensemble_size > 0
+        has_pairs = ensemble_size > 1
+        safe_size = np.maximum(ensemble_size, 1)
+        features[:, 0] = ensemble_size / n_terms
         
-        # 2. Co-occurrence density
-        # Average co-occurrence with all terms
-        if ensemble_size > 0:
-            present_term_indices = np.where(term_vector > 0)[0]
-            cooccur_scores = []
-            for idx in present_term_indices:
-                cooccur_scores.append(np.sum(self.cooccurrence_matrix[idx]))
-            avg_cooccurrence = np.mean(cooccur_scores) if cooccur_scores else 0
-        else:
-            avg_cooccurrence = 0
-        doc_features.append(avg_cooccurrence / (self.metadata['total_docs'] + 1))
+        # 2. Co-occurrence density (average total co-occurrence of present terms)
+        term_cooccurrence = self.cooccurrence_matrix.sum(axis=1)
+        features[:, 1] = np.where(has_terms, (presence @ term_cooccurrence) / safe_size, 0) / norm
         
         # 3. Shannon diversity (term distribution entropy)
-        if ensemble_size > 0:
-            term_counts = term_vector[term_vector > 0]
-            term_probs = term_counts / np.sum(term_counts)
-            shannon_entropy = -np.sum(term_probs * np.log(term_probs + 1e-10))
-        else:
-            shannon_entropy = 0
-        doc_features.append(shannon_entropy)
-        
-        # 4. Network centrality (how connected are the document's terms?)
-        if ensemble_size > 1:
-            present_indices = np.where(term_vector > 0)[0]
-            submatrix = self.cooccurrence_matrix[np.ix_(present_indices, present_indices)]
-            centrality = np.mean(np.sum(submatrix, axis=1))
-        else:
-            centrality = 0
-        doc_features.append(centrality / (self.metadata['total_docs'] + 1))
-        
-        # 5. Ensemble coherence (how much do terms co-occur with each other?)
-        if ensemble_size > 1:
-            present_indices = np.where(term_vector > 0)[0]
-            coherence_scores = []
-            for i, idx1 in enumerate(present_indices):
-                for idx2 in present_indices[i+1:]:
-                    coherence_scores.append(self.cooccurrence_matrix[idx1, idx2])
-            coherence = np.mean(coherence_scores) if coherence_scores else 0
-        else:
-            coherence = 0
-        doc_features.append(coherence / (self.metadata['total_docs'] + 1))
-        
-        # 6. Ecosystem breadth (term diversity across semantic categories)
-        # Categories: technical, financial, community, etc.
-        tech_terms = ['bit', 'chain', 'block', 'crypto', 'token', 'protocol']
-        finance_terms = ['coin', 'cash', 'finance', 'bank', 'pay', 'value']
-        community_terms = ['social', 'community', 'people', 'network']
-        
-        text_lower = text.lower()
-        categories_present = 0
-        if any(term in text_lower for term in tech_terms):
-            categories_present += 1
-        if any(term in text_lower for term in finance_terms):
-            categories_present += 1
-        if any(term in text_lower for term in community_terms):
-            categories_present += 1
-        
-        ecosystem_breadth = categories_present / 3.0
-        doc_features.append(ecosystem_breadth)
-        
-        # 7. Major crypto connection (mentions of top cryptos)
-        major_cryptos = ['bitcoin', 'ethereum', 'btc', 'eth', 'solana', 'cardano']
-        has_major_connection = 1.0 if any(crypto in text_lower for crypto in major_cryptos) else 0.0
-        doc_features.append(has_major_connection)
-        
-        # 8. Term rarity score (uses rare vs common terms)
-        if ensemble_size > 0:
-            # Approximate rarity by position in top terms (earlier = more common)
-            present_terms = [self.top_terms[i] for i in range(len(term_vector)) if term_vector[i] > 0]
-            rarity_scores = []
-            for term in present_terms:
-                term_idx = np.where(self.top_terms == term)[0]
-                if len(term_idx) > 0:
-                    rarity = term_idx[0] / len(self.top_terms)  # Later terms = rarer
-                    rarity_scores.append(rarity)
-            avg_rarity = np.mean(rarity_scores) if rarity_scores else 0.5
-        else:
-            avg_rarity = 0.5
-        doc_features.append(avg_rarity)
-        
-        # 9. Ecosystem positioning (early vs late stage terminology)
-        early_terms = ['new', 'emerging', 'innovative', 'next', 'future']
-        late_terms = ['established', 'dominant', 'leader', 'major', 'foundational']
-        
-        early_count = sum(1 for term in early_terms if term in text_lower)
-        late_count = sum(1 for term in late_terms if term in text_lower)
-        
-        if early_count + late_count > 0:
-            positioning = late_count / (early_count + late_count)
-        else:
-            positioning = 0.5
-        doc_features.append(positioning)
-        
-        return doc_features
+        features[:, 2] = self._row_entropy(term_matrix)
+        
+        # 4. Network centrality / 5. ensemble coherence: both are functions of the
+        # summed co-occurrence among a document's present terms
+        cooccurrence = sparse.csr_matrix(self.cooccurrence_matrix)
+        within = np.asarray(presence.multiply(presence @ cooccurrence).sum(axis=1)).ravel()
+        features[:, 3] = np.where(has_pairs, within / safe_size, 0) / norm
+        # Symmetric with zero diagonal: mean over pairs i<j = within / (k * (k - 1))
+        features[:, 4] = np.where(has_pairs, within / (safe_size * np.maximum(ensemble_size - 1, 1)), 0) / norm
+        
+        # 8. Term rarity score (position in top terms; later terms = rarer)
+        rarity = np.arange(n_terms) / n_terms
+        features[:, 7] = np.where(has_terms, (presence @ rarity) / safe_size, 0.5)
+        
+        # 6, 7, 9. Vocabulary-list features over raw text (short lists, so plain
+        # substring checks are cheaper than building an automaton)
+        for i, text in enumerate(X):
+            text_lower = text.lower()
+            
+            # 6. Ecosystem breadth (term diversity across semantic categories)
+            categories_present = sum(
+                1 for terms in self.ECOSYSTEM_CATEGORIES if any(term in text_lower for term in terms)
+            )
+            features[i, 5] = categories_present / 3.0
+            
+            # 7. Major crypto connection (mentions of top cryptos)
+            features[i, 6] = 1.0 if any(crypto in text_lower for crypto in self.MAJOR_CRYPTOS) else 0.0
+            
+            # 9. Ecosystem positioning (early vs late stage terminology)
+            early_count = sum(1 for term in self.EARLY_TERMS if term in text_lower)
+            late_count = sum(1 for term in self.LATE_TERMS if term in text_lower)
+            if early_count + late_count > 0:
+                features[i, 8] = late_count / (early_count + late_count)
+            else:
+                features[i, 8] = 0.5
+        
+        return features.astype(np.float32)
     
     def _calculate_n_features(self) -> int:
         """Calculate number of output features."""
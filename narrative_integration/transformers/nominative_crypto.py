@@ -18,6 +18,7 @@ import re
 import numpy as np
 from typing import List, Dict
 from collections import Counter
+from utils.lexicon_matcher import LexiconMatcher
 from .base_transformer import TextNarrativeTransformer
 
 
@@ -69,6 +70,8 @@ class NominativeAnalysisTransformer(TextNarrativeTransformer):
                 'power': ['strong', 'power', 'force', 'might'],
                 'quality': ['good', 'best', 'great', 'prime', 'top']
             }
+        
+        self.field_matcher = LexiconMatcher.compile(self.semantic_fields)
     
     def fit(self, X, y=None):
         """
@@ -88,10 +91,7 @@ class NominativeAnalysisTransformer(TextNarrativeTransformer):
         total_docs = len(X)
         
         for text in X:
-            text_lower = text.lower()
-            for field_name, field_words in self.semantic_fields.items():
-                if any(word in text_lower for word in field_words):
-                    field_counts[field_name] += 1
+            field_counts.update(self.field_matcher.categories(text.lower()))
         
         # Store metadata
         self.metadata['field_frequencies'] = {
@@ -130,24 +130,21 @@ class NominativeAnalysisTransformer(TextNarrativeTransformer):
         text_lower = text.lower()
         doc_features = []
         
+        # Matched word counts per field, in semantic_fields order
+        field_counts = self.field_matcher.count(text_lower)
+        
         # 1. Semantic field presence (binary for each field)
         for field_name in sorted(self.semantic_fields.keys()):
-            field_words = self.semantic_fields[field_name]
-            has_field = 1.0 if any(word in text_lower for word in field_words) else 0.0
+            has_field = 1.0 if field_counts[field_name] > 0 else 0.0
             doc_features.append(has_field)
         
         # 2. Semantic field density (count / text length)
+        n_words = len(text_lower.split()) + 1
         for field_name in sorted(self.semantic_fields.keys()):
-            field_words = self.semantic_fields[field_name]
-            count = sum(1 for word in field_words if word in text_lower)
-            density = count / (len(text_lower.split()) + 1)
+            density = field_counts[field_name] / n_words
             doc_features.append(density)
         
         # 3. Dominant semantic field (one-hot across fields)
-        field_counts = {}
-        for field_name, field_words in self.semantic_fields.items():
-            field_counts[field_name] = sum(1 for word in field_words if word in text_lower)
-        
         dominant_field = max(field_counts, key=field_counts.get) if max(field_counts.values()) > 0 else None
         
         for field_name in sorted(self.semantic_fields.keys()):
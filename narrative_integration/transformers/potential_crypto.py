@@ -20,6 +20,7 @@ Date: November 2025
 import re
 import numpy as np
 from typing import List
+from utils.lexicon_matcher import LexiconMatcher
 from .base_transformer import TextNarrativeTransformer
 
 
@@ -86,6 +87,24 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
             'mature': ['established', 'mature', 'proven', 'stable'],
             'dominant': ['leader', 'dominant', 'major', 'leading', 'top', 'foundational']
         }
+        
+        # Past orientation and flexibility markers (used alongside the sets above)
+        self.past_markers = ['historical', 'established', 'proven']
+        self.flexibility_markers = ['adapt', 'flexible', 'evolving', 'dynamic']
+        
+        # Every marker set in one automaton; stages keyed as ('stage', name)
+        lexicons = {
+            'future': self.future_markers,
+            'possibility': self.possibility_markers,
+            'growth': self.growth_markers,
+            'innovation': self.innovation_markers_list,
+            'openness': self.openness_markers,
+            'past': self.past_markers,
+            'flexibility': self.flexibility_markers,
+        }
+        for stage, markers in self.stage_markers.items():
+            lexicons[('stage', stage)] = markers
+        self.marker_matcher = LexiconMatcher.compile(lexicons)
     
     def fit(self, X, y=None):
         """
@@ -108,15 +127,11 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
         innovation_count = 0
         
         for text in X:
-            text_lower = text.lower()
-            if any(marker in text_lower for marker in self.future_markers):
-                future_count += 1
-            if any(marker in text_lower for marker in self.possibility_markers):
-                possibility_count += 1
-            if any(marker in text_lower for marker in self.growth_markers):
-                growth_count += 1
-            if any(marker in text_lower for marker in self.innovation_markers_list):
-                innovation_count += 1
+            hits = self.marker_matcher.categories(text.lower())
+            future_count += 'future' in hits
+            possibility_count += 'possibility' in hits
+            growth_count += 'growth' in hits
+            innovation_count += 'innovation' in hits
         
         # Store metadata
         self.metadata['corpus_stats'] = {
@@ -158,42 +173,43 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
         words = text_lower.split()
         n_words = len(words) + 1
         
+        # Matched marker counts for every set, from a single pass
+        counts = self.marker_matcher.count(text_lower)
+        
         doc_features = []
         
         # 1. Future orientation
-        future_count = sum(1 for marker in self.future_markers if marker in text_lower)
+        future_count = counts['future']
         future_density = future_count / n_words
         has_future = 1.0 if future_count > 0 else 0.0
         doc_features.extend([future_density, has_future])
         
         # 2. Possibility language
-        possibility_count = sum(1 for marker in self.possibility_markers if marker in text_lower)
+        possibility_count = counts['possibility']
         possibility_density = possibility_count / n_words
         has_possibility = 1.0 if possibility_count > 0 else 0.0
         doc_features.extend([possibility_density, has_possibility])
         
         # 3. Growth orientation
-        growth_count = sum(1 for marker in self.growth_markers if marker in text_lower)
+        growth_count = counts['growth']
         growth_density = growth_count / n_words
         has_growth = 1.0 if growth_count > 0 else 0.0
         doc_features.extend([growth_density, has_growth])
         
         # 4. Innovation language
-        innovation_count = sum(1 for marker in self.innovation_markers_list if marker in text_lower)
+        innovation_count = counts['innovation']
         innovation_density = innovation_count / n_words
         has_innovation = 1.0 if innovation_count > 0 else 0.0
         doc_features.extend([innovation_density, has_innovation])
         
         # 5. Openness
-        openness_count = sum(1 for marker in self.openness_markers if marker in text_lower)
+        openness_count = counts['openness']
         openness_density = openness_count / n_words
         has_openness = 1.0 if openness_count > 0 else 0.0
         doc_features.extend([openness_density, has_openness])
         
         # 6. Development stage (one-hot)
-        stage_scores = {}
-        for stage, markers in self.stage_markers.items():
-            stage_scores[stage] = sum(1 for marker in markers if marker in text_lower)
+        stage_scores = {stage: counts[('stage', stage)] for stage in self.stage_markers}
         
         dominant_stage = max(stage_scores, key=stage_scores.get) if max(stage_scores.values()) > 0 else 'unknown'
         
@@ -202,7 +218,7 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
             doc_features.append(is_stage)
         
         # 7. Temporal breadth (uses both past and future)
-        has_past = 1.0 if any(marker in text_lower for marker in ['historical', 'established', 'proven']) else 0.0
+        has_past = 1.0 if counts['past'] > 0 else 0.0
         temporal_breadth = has_past * has_future
         doc_features.append(temporal_breadth)
         
@@ -211,7 +227,7 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
         doc_features.append(momentum_score)
         
         # 9. Possibility richness (variety of possibility markers)
-        possibility_variety = sum(1 for marker in self.possibility_markers if marker in text_lower)
+        possibility_variety = counts['possibility']
         possibility_richness = possibility_variety / len(self.possibility_markers)
         doc_features.append(possibility_richness)
         
@@ -234,9 +250,8 @@ class NarrativePotentialTransformer(TextNarrativeTransformer):
         doc_features.append(trajectory)
         
         # 12. Flexibility indicators
-        flexibility_markers = ['adapt', 'flexible', 'evolving', 'dynamic']
-        flexibility_count = sum(1 for marker in flexibility_markers if marker in text_lower)
-        flexibility_score = flexibility_count / len(flexibility_markers)
+        flexibility_count = counts['flexibility']
+        flexibility_score = flexibility_count / len(self.flexibility_markers)
         doc_features.append(flexibility_score)
         
         return doc_features
@@ -25,6 +25,10 @@ from sklearn.metrics.pairwise import cosine_similarity
 from .base_transformer import TextNarrativeTransformer
 
 
+# Documents per similarity block in transform()
+SIMILARITY_CHUNK_SIZE = 2048
+
+
 class RelationalValueTransformer(TextNarrativeTransformer):
     """Extract relational value and complementarity features."""
     
@@ -69,8 +73,8 @@ class RelationalValueTransformer(TextNarrativeTransformer):
             stop_words='english'
         )
         
-        # Fit and transform corpus
-        self.corpus_vectors = self.vectorizer.fit_transform(X).toarray()
+        # Fit and transform corpus (kept sparse; rows are L2-normalized by TF-IDF)
+        self.corpus_vectors = self.vectorizer.fit_transform(X).tocsr()
         
         # Store metadata
         self.metadata['n_features_output'] = self._calculate_n_features()
@@ -93,81 +97,49 @@ class RelationalValueTransformer(TextNarrativeTransformer):
         self._validate_fitted()
         self._validate_input(X)
         
-        # Transform to TF-IDF vectors
-        doc_vectors = self.vectorizer.transform(X).toarray()
+        # Transform to (sparse) TF-IDF vectors
+        doc_vectors = self.vectorizer.transform(X).tocsr()
         
-        features = []
-        for i, doc_vec in enumerate(doc_vectors):
-            doc_features = self._extract_document_features(doc_vec)
-            features.append(doc_features)
-        
-        return np.array(features, dtype=np.float32)
-    
-    def _extract_document_features(self, doc_vector: np.ndarray) -> List[float]:
-        """Extract relational features from document vector."""
-        doc_features = []
+        features = np.zeros((doc_vectors.shape[0], self._calculate_n_features()), dtype=np.float64)
         
         # 1. Internal complementarity (diversity within document)
         # Measured by entropy of TF-IDF weights
-        nonzero_weights = doc_vector[doc_vector > 0]
-        if len(nonzero_weights) > 0:
-            weight_probs = nonzero_weights / np.sum(nonzero_weights)
-            internal_diversity = -np.sum(weight_probs * np.log(weight_probs + 1e-10))
-        else:
-            internal_diversity = 0
-        doc_features.append(internal_diversity)
-        
-        # 2. Relational density (average similarity to corpus)
-        similarities = cosine_similarity([doc_vector], self.corpus_vectors)[0]
-        avg_similarity = np.mean(similarities)
-        doc_features.append(avg_similarity)
-        
-        # 3. Complementarity score (how many docs are complementary?)
-        # Complementary = similar but not too similar (threshold)
-        complementary_count = np.sum(
-            (similarities > self.complementarity_threshold) & 
-            (similarities < 0.8)
-        )
-        complementarity_score = complementary_count / len(self.corpus_vectors)
-        doc_features.append(complementarity_score)
-        
-        # 4. Differentiation score (uniqueness)
-        # Low similarity = high differentiation
-        max_similarity = np.max(similarities)
-        differentiation = 1.0 - max_similarity
-        doc_features.append(differentiation)
-        
-        # 5. Niche positioning (similarity to only a few others)
-        # Count docs with similarity > 0.5
-        niche_connections = np.sum(similarities > 0.5)
-        niche_score = 1.0 - (niche_connections / len(self.corpus_vectors))
-        doc_features.append(niche_score)
-        
-        # 6. Synergy potential (non-linear interactions)
-        # Documents with moderate similarity across many = high synergy
-        moderate_sims = np.sum((similarities > 0.3) & (similarities < 0.7))
-        synergy_score = moderate_sims / len(self.corpus_vectors)
-        doc_features.append(synergy_score)
-        
-        # 7. Relational coherence (consistency of relationships)
-        # Std of similarities (low std = consistent relationships)
-        relationship_std = np.std(similarities)
-        coherence = 1.0 / (1.0 + relationship_std)
-        doc_features.append(coherence)
-        
-        # 8. Portfolio fit (potential for diversification)
-        # High if different from most but similar to some
-        diversity_cluster_size = np.sum((similarities > 0.4) & (similarities < 0.7))
-        portfolio_fit = diversity_cluster_size / len(self.corpus_vectors)
-        doc_features.append(portfolio_fit)
-        
-        # 9. Semantic reach (breadth of connections)
-        # Count of non-zero connections
-        reach = np.sum(similarities > 0.1)
-        semantic_reach = reach / len(self.corpus_vectors)
-        doc_features.append(semantic_reach)
-        
-        return doc_features
+        features[:, 0] = self._row_entropy(doc_vectors)
+        
+        # 2-9. Corpus relationships, from a sparse similarity product per chunk
+        # of documents so only chunk_size x n_corpus similarities are held at once
+        for start in range(0, doc_vectors.shape[0], SIMILARITY_CHUNK_SIZE):
+            stop = min(start + SIMILARITY_CHUNK_SIZE, doc_vectors.shape[0])
+            similarities = cosine_similarity(doc_vectors[start:stop], self.corpus_vectors)
+            features[start:stop, 1:] = self._relational_features(similarities)
+        
+        return features.astype(np.float32)
+    
+    def _relational_features(self, similarities: np.ndarray) -> np.ndarray:
+        """Features 2-9 for a block of documents from their corpus similarities."""
+        n_corpus = similarities.shape[1]
+        
+        def share(mask):
+            return mask.sum(axis=1) / n_corpus
+        
+        return np.column_stack([
+            # 2. Relational density (average similarity to corpus)
+            similarities.mean(axis=1),
+            # 3. Complementarity score: similar but not too similar
+            share((similarities > self.complementarity_threshold) & (similarities < 0.8)),
+            # 4. Differentiation score (low max similarity = unique)
+            1.0 - similarities.max(axis=1),
+            # 5. Niche positioning (similarity > 0.5 to only a few others)
+            1.0 - share(similarities > 0.5),
+            # 6. Synergy potential (moderate similarity across many)
+            share((similarities > 0.3) & (similarities < 0.7)),
+            # 7. Relational coherence (low std = consistent relationships)
+            1.0 / (1.0 + similarities.std(axis=1)),
+            # 8. Portfolio fit (different from most but similar to some)
+            share((similarities > 0.4) & (similarities < 0.7)),
+            # 9. Semantic reach (breadth of connections)
+            share(similarities > 0.1),
+        ])
     
     def _calculate_n_features(self) -> int:
         """Calculate number of output features."""
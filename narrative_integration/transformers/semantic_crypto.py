@@ -52,6 +52,7 @@ class SemanticNarrativeTransformer(TextNarrativeTransformer):
         self.lsa = None
         self.kmeans = None
         self.cluster_centers = None
+        self.cluster_max_distances = None
     
     def fit(self, X, y=None):
         """
@@ -84,6 +85,15 @@ class SemanticNarrativeTransformer(TextNarrativeTransformer):
         cluster_labels = self.kmeans.fit_predict(lsa_embeddings)
         self.cluster_centers = self.kmeans.cluster_centers_
         
+        # Spread of each cluster (max member distance to its center), used to
+        # normalize semantic coherence at transform time
+        member_distances = np.linalg.norm(
+            self.lsa.transform(tfidf_matrix) - self.cluster_centers[cluster_labels], axis=1
+        )
+        self.cluster_max_distances = np.ones(self.n_clusters)
+        for cluster in np.unique(cluster_labels):
+            self.cluster_max_distances[cluster] = member_distances[cluster_labels == cluster].max()
+        
         # Calculate clustering quality
         if len(X) > self.n_clusters:
             silhouette = silhouette_score(lsa_embeddings, cluster_labels)
@@ -122,79 +132,71 @@ class SemanticNarrativeTransformer(TextNarrativeTransformer):
         lsa_embeddings = self.lsa.transform(tfidf_matrix)
         cluster_labels = self.kmeans.predict(lsa_embeddings)
         
-        features = []
-        for i, embedding in enumerate(lsa_embeddings):
-            doc_features = self._extract_document_features(
-                embedding, cluster_labels[i], lsa_embeddings
-            )
-            features.append(doc_features)
-        
-        return np.array(features, dtype=np.float32)
+        return self._extract_batch_features(lsa_embeddings, cluster_labels).astype(np.float32)
     
-    def _extract_document_features(self, embedding: np.ndarray, 
-                                   cluster_label: int,
-                                   all_embeddings: np.ndarray) -> List[float]:
-        """Extract semantic features from document."""
-        doc_features = []
+    def _extract_batch_features(self, embeddings: np.ndarray,
+                                cluster_labels: np.ndarray) -> np.ndarray:
+        """Extract semantic features for a batch of LSA embeddings."""
+        n_docs = len(embeddings)
+        rows = np.arange(n_docs)
+        
+        # Distance from every document to every cluster center
+        center_distances = np.column_stack([
+            np.linalg.norm(embeddings - center, axis=1) for center in self.cluster_centers
+        ])
         
         # 1. LSA embedding (semantic dimensions) - use top 20 components
-        doc_features.extend(embedding[:20].tolist())
+        lsa_dims = embeddings[:, :20]
         
         # 2. Cluster membership (one-hot)
-        cluster_onehot = np.zeros(self.n_clusters)
-        cluster_onehot[cluster_label] = 1.0
-        doc_features.extend(cluster_onehot.tolist())
+        cluster_onehot = np.eye(self.n_clusters)[cluster_labels]
         
         # 3. Distance to assigned cluster center
-        cluster_center = self.cluster_centers[cluster_label]
-        distance_to_center = np.linalg.norm(embedding - cluster_center)
-        doc_features.append(distance_to_center)
+        distance_to_center = center_distances[rows, cluster_labels]
         
         # 4. Distance to nearest other cluster
-        other_cluster_distances = []
-        for i, center in enumerate(self.cluster_centers):
-            if i != cluster_label:
-                dist = np.linalg.norm(embedding - center)
-                other_cluster_distances.append(dist)
-        min_other_distance = np.min(other_cluster_distances) if other_cluster_distances else 0
-        doc_features.append(min_other_distance)
-        
-        # 5. Cluster separation (how far from nearest other cluster)
-        if min_other_distance > 0:
-            separation_ratio = min_other_distance / (distance_to_center + 1e-6)
+        if self.n_clusters > 1:
+            other_distances = center_distances.copy()
+            other_distances[rows, cluster_labels] = np.inf
+            min_other_distance = other_distances.min(axis=1)
         else:
-            separation_ratio = 0
-        doc_features.append(separation_ratio)
+            min_other_distance = np.zeros(n_docs)
         
-        # 6. Semantic coherence (within-cluster similarity)
-        # Distance to centroid normalized
-        max_distance_in_cluster = np.max([
-            np.linalg.norm(emb - cluster_center)
-            for emb in all_embeddings[self.kmeans.labels_ == cluster_label]
-        ]) if np.sum(self.kmeans.labels_ == cluster_label) > 0 else 1.0
+        # 5. Cluster separation (how far from nearest other cluster)
+        separation_ratio = np.where(
+            min_other_distance > 0, min_other_distance / (distance_to_center + 1e-6), 0
+        )
         
-        coherence = 1.0 - (distance_to_center / (max_distance_in_cluster + 1e-6))
-        doc_features.append(coherence)
+        # 6. Semantic coherence (distance to centroid normalized by cluster spread)
+        coherence = 1.0 - distance_to_center / (self.cluster_max_distances[cluster_labels] + 1e-6)
         
         # 7. Semantic complexity (norm of embedding vector)
-        complexity = np.linalg.norm(embedding)
-        doc_features.append(complexity)
+        complexity = np.linalg.norm(embeddings, axis=1)
         
         # 8. Dominant semantic dimension (which LSA component is strongest)
-        dominant_dim = np.argmax(np.abs(embedding))
-        dominant_dim_normalized = dominant_dim / self.n_components
-        doc_features.append(dominant_dim_normalized)
+        abs_weights = np.abs(embeddings)
+        dominant_dim_normalized = np.argmax(abs_weights, axis=1) / self.n_components
         
         # 9. Semantic spread (entropy of LSA weights)
-        abs_weights = np.abs(embedding)
-        if np.sum(abs_weights) > 0:
-            weight_probs = abs_weights / np.sum(abs_weights)
-            semantic_entropy = -np.sum(weight_probs * np.log(weight_probs + 1e-10))
-        else:
-            semantic_entropy = 0
-        doc_features.append(semantic_entropy)
+        weight_sums = abs_weights.sum(axis=1, keepdims=True)
+        weight_probs = abs_weights / np.where(weight_sums > 0, weight_sums, 1)
+        semantic_entropy = np.where(
+            weight_sums[:, 0] > 0,
+            -np.sum(weight_probs * np.log(weight_probs + 1e-10), axis=1),
+            0
+        )
         
-        return doc_features
+        return np.column_stack([
+            lsa_dims,
+            cluster_onehot,
+            distance_to_center,
+            min_other_distance,
+            separation_ratio,
+            coherence,
+            complexity,
+            dominant_dim_normalized,
+            semantic_entropy,
+        ])
     
     def _calculate_n_features(self) -> int:
         """Calculate number of output features."""
@@ -0,0 +1,442 @@
+"""
+Crypto Screener
+In-memory columnar snapshot of cryptocurrency + name analysis + latest price
+for fast filter/sort queries without hitting the database per request
+"""
+
+from core.models import db, Cryptocurrency, NameAnalysis, PriceHistory
+from utils.response_cache import ResponseCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import numpy as np
+import threading
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# (exclusive lower bound, inclusive upper bound) on rank
+RANK_TIERS = {
+    'top100': (None, 100),
+    '101-500': (100, 500),
+    '501-1000': (500, 1000),
+    '1000+': (1000, None),
+}
+
+# Force a full reload at least this often (seconds). Other processes' in-place
+# edits to price/analysis rows leave no watermark (those tables have no update
+# timestamp), so this bounds how long such edits can go unseen.
+MAX_SNAPSHOT_AGE = 300
+
+# Tables whose database watermark drives cross-process sync
+WATERMARK_TABLES = ('cryptocurrency', 'price_history', 'name_analysis')
+
+
+class CryptoScreener:
+    """Columnar screener refreshed incrementally from ORM writes"""
+
+    def __init__(self, max_age: float = MAX_SNAPSHOT_AGE, watermarks: ResponseCache = None):
+        """
+        Args:
+            max_age: Seconds before a forced full reload
+            watermarks: Response cache whose throttled database watermark is shared
+                for cross-process sync (defaults to a private one)
+        """
+        self._lock = threading.RLock()
+        self._pending_key = f'crypto_screener_pending_{id(self)}'
+        self.max_age = max_age
+        self.watermarks = watermarks if watermarks is not None else ResponseCache(max_entries=0, db=db)
+
+        # Database watermark seen at the last sync and time of the last full load
+        self._watermark = None
+        self._loaded_at = None
+
+        # Joined rows (crypto + analysis + latest price), keyed by crypto id
+        self._records = {}
+        self._loaded = False
+        self._dirty = set()
+
+        # Live screener rows (score + risk), keyed by crypto id
+        self._live = {}
+        self._live_loaded = False
+        self._live_dirty = set()
+
+        self._build_snapshot()
+
+        # Track writes from any session (collector, API handlers, scripts)
+        event.listen(Session, 'after_flush', self._collect_changes)
+        event.listen(Session, 'after_commit', self._apply_changes)
+        event.listen(Session, 'after_soft_rollback', self._discard_changes)
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _collect_changes(self, session, flush_context):
+        """Record crypto ids touched by a flush (applied on commit)"""
+        pending = session.info.setdefault(self._pending_key, set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            if isinstance(obj, Cryptocurrency):
+                pending.add(obj.id)
+            elif isinstance(obj, (NameAnalysis, PriceHistory)):
+                pending.add(obj.crypto_id)
+
+    def _apply_changes(self, session):
+        pending = session.info.pop(self._pending_key, None)
+        if pending:
+            self.mark_dirty(pending)
+
+    def _discard_changes(self, session, previous_transaction):
+        session.info.pop(self._pending_key, None)
+
+    def mark_dirty(self, crypto_ids):
+        """Schedule crypto ids for reload on the next query"""
+        with self._lock:
+            ids = {crypto_id for crypto_id in crypto_ids if crypto_id is not None}
+            self._dirty.update(ids)
+            self._live_dirty.update(ids)
+
+    def invalidate(self):
+        """Drop everything; the next query reloads from the database"""
+        with self._lock:
+            self._loaded = False
+            self._live_loaded = False
+            self._dirty.clear()
+            self._live_dirty.clear()
+            self._watermark = None
+
+    def _sync_external(self):
+        """
+        Pick up writes made outside this process before serving.
+
+        Session events only see this process's commits. Compares the shared
+        database watermark (re-queried at most every few seconds by the
+        response cache) with the one seen last time and marks the crypto ids
+        written since as dirty; a shrinking table (delete) or an expired
+        snapshot triggers a full reload instead.
+        """
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at > self.max_age:
+                self.invalidate()
+
+            current = self.watermarks.watermark(WATERMARK_TABLES)
+            if current is None:
+                # Watermark unavailable; serve the snapshot as of the last sync
+                return
+            previous = self._watermark
+            self._watermark = current
+            if previous is None:
+                # Full reload pending (first use or invalidated)
+                self._loaded_at = time.monotonic()
+                return
+            if previous == current:
+                return
+
+            (crypto_count, _, crypto_updated) = previous['cryptocurrency']
+            (price_count, price_max_id, _) = previous['price_history']
+            (analysis_count, analysis_max_id, _) = previous['name_analysis']
+
+            if (current['cryptocurrency'][0] < crypto_count
+                    or current['price_history'][0] < price_count
+                    or current['name_analysis'][0] < analysis_count):
+                self.invalidate()
+                self._watermark = current
+                self._loaded_at = time.monotonic()
+                return
+
+            changed = set()
+            if crypto_updated is None:
+                changed.update(crypto_id for (crypto_id,) in db.session.query(Cryptocurrency.id))
+            else:
+                changed.update(crypto_id for (crypto_id,) in db.session.query(Cryptocurrency.id)
+                               .filter(Cryptocurrency.last_updated >= crypto_updated))
+            changed.update(crypto_id for (crypto_id,) in db.session.query(PriceHistory.crypto_id)
+                           .filter(PriceHistory.id > (price_max_id or 0)))
+            changed.update(crypto_id for (crypto_id,) in db.session.query(NameAnalysis.crypto_id)
+                           .filter(NameAnalysis.id > (analysis_max_id or 0)))
+            self.mark_dirty(changed)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _query_rows(self, crypto_ids=None):
+        """Crypto/analysis/latest-price join, optionally restricted to some ids"""
+        latest_prices = db.session.query(
+            PriceHistory.crypto_id,
+            db.func.max(PriceHistory.date).label('max_date')
+        )
+        if crypto_ids is not None:
+            latest_prices = latest_prices.filter(PriceHistory.crypto_id.in_(crypto_ids))
+        latest_prices = latest_prices.group_by(PriceHistory.crypto_id).subquery()
+
+        query = db.session.query(
+            Cryptocurrency, NameAnalysis, PriceHistory
+        ).join(NameAnalysis, Cryptocurrency.id == NameAnalysis.crypto_id)\
+         .join(PriceHistory, Cryptocurrency.id == PriceHistory.crypto_id)\
+         .join(latest_prices, db.and_(
+             PriceHistory.crypto_id == latest_prices.c.crypto_id,
+             PriceHistory.date == latest_prices.c.max_date
+         ))
+        if crypto_ids is not None:
+            query = query.filter(Cryptocurrency.id.in_(crypto_ids))
+
+        return query.all()
+
+    @staticmethod
+    def _to_record(crypto, analysis, price):
+        return {
+            'id': crypto.id,
+            'name': crypto.name,
+            'symbol': crypto.symbol,
+            'rank': crypto.rank,
+            'market_cap': crypto.market_cap,
+            'current_price': crypto.current_price,
+            'analysis': {
+                'syllables': analysis.syllable_count,
+                'length': analysis.character_length,
+                'memorability': analysis.memorability_score,
+                'uniqueness': analysis.uniqueness_score,
+                'phonetic': analysis.phonetic_score,
+                'name_type': analysis.name_type
+            },
+            'performance': {
+                'return_1yr': price.price_1yr_change,
+                'return_30d': price.price_30d_change,
+                'return_90d': price.price_90d_change
+            }
+        }
+
+    def _refresh(self):
+        """Full load on first use, then reload only dirty crypto ids"""
+        with self._lock:
+            self._sync_external()
+            if self._loaded and not self._dirty:
+                return
+
+            if not self._loaded:
+                crypto_ids = None
+                self._records = {}
+            else:
+                crypto_ids = list(self._dirty)
+                for crypto_id in crypto_ids:
+                    self._records.pop(crypto_id, None)
+            self._dirty.clear()
+
+            for crypto, analysis, price in self._query_rows(crypto_ids):
+                # One row per crypto even if several prices share the latest date
+                self._records.setdefault(crypto.id, self._to_record(crypto, analysis, price))
+
+            self._loaded = True
+            self._build_snapshot()
+
+            logger.info(f"Screener refreshed: {len(self._records)} rows "
+                        f"({'full' if crypto_ids is None else f'{len(crypto_ids)} updated'})")
+
+    def _build_snapshot(self):
+        """Typed columns plus bitmap and sorted indexes over the current records"""
+        records = list(self._records.values())
+        n = len(records)
+
+        def numeric(getter):
+            values = np.full(n, np.nan)
+            for i, record in enumerate(records):
+                value = getter(record)
+                if value is not None:
+                    values[i] = value
+            return values
+
+        columns = {
+            'rank': numeric(lambda r: r['rank']),
+            'market_cap': numeric(lambda r: r['market_cap']),
+            'current_price': numeric(lambda r: r['current_price']),
+            'syllables': numeric(lambda r: r['analysis']['syllables']),
+            'length': numeric(lambda r: r['analysis']['length']),
+            'memorability': numeric(lambda r: r['analysis']['memorability']),
+            'uniqueness': numeric(lambda r: r['analysis']['uniqueness']),
+            'phonetic': numeric(lambda r: r['analysis']['phonetic']),
+            'return_1yr': numeric(lambda r: r['performance']['return_1yr']),
+            'return_30d': numeric(lambda r: r['performance']['return_30d']),
+            'return_90d': numeric(lambda r: r['performance']['return_90d']),
+        }
+
+        # Sorted index per numeric column (NULLs excluded, like SQL comparisons)
+        sorted_index = {}
+        for name, values in columns.items():
+            valid = np.flatnonzero(~np.isnan(values))
+            order = valid[np.argsort(values[valid], kind='stable')]
+            sorted_index[name] = (order, values[order])
+
+        # Bitmaps for categorical filters
+        rank = columns['rank']
+        tier_bitmaps = {}
+        with np.errstate(invalid='ignore'):
+            for tier, (low, high) in RANK_TIERS.items():
+                mask = ~np.isnan(rank)
+                if low is not None:
+                    mask &= rank > low
+                if high is not None:
+                    mask &= rank <= high
+                tier_bitmaps[tier] = mask
+
+        syllable_bitmaps = {
+            int(value): columns['syllables'] == value
+            for value in np.unique(columns['syllables'][~np.isnan(columns['syllables'])])
+        }
+
+        name_types = [r['analysis']['name_type'] for r in records]
+        name_type_bitmaps = {}
+        for i, name_type in enumerate(name_types):
+            if name_type is not None:
+                name_type_bitmaps.setdefault(name_type, np.zeros(n, dtype=bool))[i] = True
+
+        # Swap in atomically so concurrent readers see a consistent snapshot
+        self._snapshot = {
+            'records': records,
+            'columns': columns,
+            'sorted': sorted_index,
+            'rank_tiers': tier_bitmaps,
+            'syllables': syllable_bitmaps,
+            'name_types': name_type_bitmaps,
+        }
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _range_mask(snapshot, column, low=None, high=None, strict=False):
+        """Rows with low <= value <= high (exclusive bounds if strict) via the sorted index"""
+        order, values = snapshot['sorted'][column]
+        start = 0 if low is None else np.searchsorted(values, low, 'right' if strict else 'left')
+        stop = len(values) if high is None else np.searchsorted(values, high, 'left' if strict else 'right')
+
+        mask = np.zeros(len(snapshot['records']), dtype=bool)
+        mask[order[start:stop]] = True
+        return mask
+
+    def screen(self, rank_tier='all', market_cap_min=None, market_cap_max=None,
+               syllables=None, min_length=None, max_length=None, name_type=None,
+               min_memorability=None, min_uniqueness=None, performance='all',
+               sort_by=None, descending=True, limit=100):
+        """
+        Filter and sort the screener dataset.
+
+        Filter arguments follow /api/crypto/advanced-filter: falsy values
+        (None or 0) leave a filter off, and NULL columns never pass a filter.
+
+        Args:
+            rank_tier: 'top100', '101-500', '501-1000', '1000+' or 'all'
+            performance: 'winners', 'losers', 'breakouts' or 'all'
+            sort_by: Any numeric column (NULLs last); None keeps load order
+            descending: Sort direction
+            limit: Max rows returned
+
+        Returns: List of result dicts (same shape as the endpoint rows)
+        """
+        self._refresh()
+        snapshot = self._snapshot
+        n = len(snapshot['records'])
+        mask = np.ones(n, dtype=bool)
+
+        if rank_tier in RANK_TIERS:
+            mask &= snapshot['rank_tiers'][rank_tier]
+
+        if market_cap_min or market_cap_max:
+            mask &= self._range_mask(snapshot, 'market_cap',
+                                     low=market_cap_min or None, high=market_cap_max or None)
+
+        if syllables:
+            mask &= snapshot['syllables'].get(int(syllables), np.zeros(n, dtype=bool))
+        if min_length or max_length:
+            mask &= self._range_mask(snapshot, 'length',
+                                     low=min_length or None, high=max_length or None)
+        if name_type:
+            mask &= snapshot['name_types'].get(name_type, np.zeros(n, dtype=bool))
+        if min_memorability:
+            mask &= self._range_mask(snapshot, 'memorability', low=min_memorability)
+        if min_uniqueness:
+            mask &= self._range_mask(snapshot, 'uniqueness', low=min_uniqueness)
+
+        if performance == 'winners':
+            mask &= self._range_mask(snapshot, 'return_1yr', low=0, strict=True)
+        elif performance == 'losers':
+            mask &= self._range_mask(snapshot, 'return_1yr', high=0, strict=True)
+        elif performance == 'breakouts':
+            mask &= self._range_mask(snapshot, 'return_1yr', low=100, strict=True)
+
+        if sort_by:
+            if sort_by not in snapshot['sorted']:
+                raise ValueError(f"Unknown sort column: {sort_by}")
+            # Walk the presorted order instead of sorting the selection
+            order = snapshot['sorted'][sort_by][0]
+            if descending:
+                order = order[::-1]
+            valid = np.zeros(n, dtype=bool)
+            valid[order] = True
+            selected = np.concatenate([order[mask[order]], np.flatnonzero(mask & ~valid)])
+        else:
+            selected = np.flatnonzero(mask)
+
+        if limit is not None:
+            selected = selected[:limit]
+
+        records = snapshot['records']
+        return [records[i] for i in selected]
+
+    def live_rows(self, scorer, risk_analyzer):
+        """
+        Scored screener rows for /api/screener/live.
+
+        Each crypto is scored and risk-rated once; afterwards only cryptos
+        written since the last call are recomputed.
+
+        Returns: List of row dicts sorted by score (highest first)
+        """
+        with self._lock:
+            self._sync_external()
+            if not self._live_loaded:
+                crypto_ids = [crypto_id for (crypto_id,) in db.session.query(Cryptocurrency.id)]
+                self._live = {}
+            else:
+                crypto_ids = list(self._live_dirty)
+            self._live_dirty.clear()
+
+            for crypto_id in crypto_ids:
+                row = self._live_row(crypto_id, scorer, risk_analyzer)
+                if row:
+                    self._live[crypto_id] = row
+                else:
+                    self._live.pop(crypto_id, None)
+
+            self._live_loaded = True
+            rows = list(self._live.values())
+
+        rows.sort(key=lambda row: row['score'], reverse=True)
+        return rows
+
+    @staticmethod
+    def _live_row(crypto_id, scorer, risk_analyzer):
+        score_data = scorer.score_cryptocurrency(crypto_id)
+        if not score_data:
+            return None
+
+        # Get risk analysis
+        risk_data = risk_analyzer.downside_protection_analysis(crypto_id)
+        risk_rating = risk_data['risk_rating'] if risk_data else 'MEDIUM'
+
+        # Get price data
+        price_data = PriceHistory.query.filter_by(crypto_id=crypto_id).first()
+        return_1yr = price_data.price_1yr_change if price_data else 0
+
+        return {
+            'crypto_id': crypto_id,
+            'name': score_data['name'],
+            'symbol': score_data['symbol'],
+            'score': score_data['score'],
+            'signal': score_data['signal'],
+            'confidence': score_data['confidence'],
+            'return_1yr': round(return_1yr or 0, 2),
+            'risk': risk_rating
+        }
@@ -0,0 +1,56 @@
+"""Build the Offline County Centroid Table
+
+Converts the Census Gazetteer counties file (internal point lat/lon per county,
+derived from TIGER/Line) into data/geography/county_centroids.csv, which
+HurricaneTrackGeocoder loads into a ball tree for offline track geocoding.
+
+Without a file argument the national counties Gazetteer file is downloaded
+from the Census Bureau (see county_centroid_index.GAZETTEER_URL). Other
+vintages are listed at:
+    https://www.census.gov/geographies/reference-files/time-series/geo/gazetteer-files.html
+
+Usage:
+    python scripts/build_county_centroids.py
+    python scripts/build_county_centroids.py 2023_Gaz_counties_national.txt
+    python scripts/build_county_centroids.py gazetteer.txt --output /tmp/centroids.csv
+"""
+
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from collectors.county_centroid_index import CountyCentroidIndex, DEFAULT_CENTROID_PATH
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build offline county centroid table')
+    parser.add_argument('gazetteer', type=Path, nargs='?',
+                        help='Census Gazetteer counties file (tab-delimited); downloaded if omitted')
+    parser.add_argument('--output', type=Path, default=DEFAULT_CENTROID_PATH,
+                        help='Output CSV path')
+    args = parser.parse_args()
+
+    if args.gazetteer:
+        written = CountyCentroidIndex.convert_gazetteer(args.gazetteer, args.output)
+    else:
+        written = CountyCentroidIndex.build_from_census(args.output)
+    logger.info(f"Wrote {written} county centroids to {args.output}")
+
+    index = CountyCentroidIndex.load(args.output)
+    if index is None:
+        logger.error("Centroid table could not be loaded back")
+        sys.exit(1)
+
+    logger.info(f"Ball tree built over {len(index)} counties")
+
+
+if __name__ == '__main__':
+    main()
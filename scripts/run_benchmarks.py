@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Benchmarks
+
+Measure ops/sec and peak memory for the platform's hot paths on seeded
+synthetic corpora, and compare against a saved baseline.
+
+Usage:
+    # Record a baseline (1k / 100k / 1m rows)
+    python3 scripts/run_benchmarks.py run --scale 1k
+
+    # Re-run and flag paths more than 10% slower (or hungrier) than the baseline
+    python3 scripts/run_benchmarks.py compare --tolerance 0.10
+
+    # Compare two saved reports
+    python3 scripts/run_benchmarks.py compare --baseline before.json --current after.json
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.benchmarks.harness import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_MEMORY_OPS,
+    DEFAULT_TOLERANCE,
+    HOT_PATHS,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def print_report(report):
+    print(f"\nScale: {report['scale']} (n={report['n']}, seed={report['seed']})")
+    print(f"{'hot path':<42} {'ops':>9} {'ops/sec':>14} {'peak MB':>9}")
+    print('-' * 77)
+    for name, result in report['results'].items():
+        if result['status'] != 'ok':
+            print(f"{name:<42} {result['status']}: {result.get('reason', '')}")
+            continue
+        print(f"{name:<42} {result['ops']:>9} {result['ops_per_sec']:>14,.1f} "
+              f"{result['peak_memory_bytes'] / 1e6:>9.2f}")
+
+
+def print_comparison(comparison):
+    print(f"\nTolerance: throughput -{comparison['tolerance']:.0%}, "
+          f"memory +{comparison['memory_tolerance']:.0%}")
+    print(f"{'hot path':<42} {'speed':>8} {'memory':>8}  status")
+    print('-' * 77)
+    for name, result in comparison['comparisons'].items():
+        if result['status'] == 'not_compared':
+            print(f"{name:<42} {'-':>8} {'-':>8}  not compared "
+                  f"(baseline {result['baseline_status']}, current {result['current_status']})")
+            continue
+        status = 'REGRESSION (' + ', '.join(result['flags']) + ')' if result['flags'] else 'ok'
+        # Paths that broke or disappeared have no ratios
+        speed = f"{result['speed_ratio']:.2f}x" if result.get('speed_ratio') is not None else '-'
+        memory = f"{result['memory_ratio']:.2f}x" if result.get('memory_ratio') is not None else '-'
+        print(f"{name:<42} {speed:>8} {memory:>8}  {status}")
+
+
+def add_run_arguments(parser):
+    parser.add_argument('--scale', default='1k', help='Corpus size: 1k, 100k, 1m or a row count')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic data seed')
+    parser.add_argument('--only', nargs='+', choices=sorted(HOT_PATHS), help='Hot paths to run')
+    parser.add_argument('--max-ops', type=int, help='Cap on timed operations per hot path')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed repetitions (fastest is kept)')
+    parser.add_argument('--memory-ops', type=int, default=DEFAULT_MEMORY_OPS,
+                        help='Operations in the traced peak-memory pass')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot-path benchmarks on synthetic corpora')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Benchmark and save a report')
+    add_run_arguments(run_parser)
+    run_parser.add_argument('--output', default=str(DEFAULT_BASELINE_PATH), help='Report path')
+
+    compare_parser = subparsers.add_parser('compare', help='Flag regressions against a baseline')
+    compare_parser.add_argument('--baseline', default=str(DEFAULT_BASELINE_PATH), help='Baseline report')
+    compare_parser.add_argument('--current', help='Saved report to compare (default: run now)')
+    compare_parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                                help='Allowed relative throughput drop')
+    compare_parser.add_argument('--memory-tolerance', type=float,
+                                help='Allowed relative peak-memory growth (default: --tolerance)')
+    compare_parser.add_argument('--repeat', type=int, default=1, help='Timed repetitions (fastest is kept)')
+    compare_parser.add_argument('--output', help='Save the current report here')
+
+    subparsers.add_parser('list', help='List hot paths')
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for name, path in HOT_PATHS.items():
+            print(f"{name:<42} {path.description}")
+        return 0
+
+    if args.command == 'run':
+        report = run_benchmarks(args.scale, seed=args.seed, only=args.only, max_ops=args.max_ops,
+                                repeat=args.repeat, memory_ops=args.memory_ops)
+        print_report(report)
+        path = save_report(report, args.output)
+        print(f"\nSaved report to {path}")
+        return 0
+
+    baseline = load_report(args.baseline)
+    if args.current:
+        current = load_report(args.current)
+    else:
+        # Re-run with the baseline's corpus and limits so results line up
+        only = [name for name in baseline['results'] if name in HOT_PATHS]
+        current = run_benchmarks(baseline['n'], seed=baseline['seed'], only=only,
+                                 max_ops=baseline.get('max_ops'), repeat=args.repeat,
+                                 memory_ops=baseline.get('memory_ops', DEFAULT_MEMORY_OPS))
+        print_report(current)
+        if args.output:
+            save_report(current, args.output)
+
+    comparison = compare_reports(baseline, current, tolerance=args.tolerance,
+                                 memory_tolerance=args.memory_tolerance)
+    print_comparison(comparison)
+
+    if comparison['regressions']:
+        print(f"\n{len(comparison['regressions'])} regression(s): {', '.join(comparison['regressions'])}")
+        return 1
+    print('\nNo regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
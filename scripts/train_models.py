@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Model Training Script
+Refits and registers the name and breakout predictors for the current data.
+
+Request-serving workers only load registered models, so run this after
+collection jobs that write outside the app (cron, collection scripts).
+Versions whose training data did not change are loaded, not refitted.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+from core.config import Config
+from core.models import db
+from utils.predictor import NamePredictor
+from analyzers.breakout_predictor import BreakoutPredictor
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = Flask(__name__)
+app.config.from_object(Config)
+db.init_app(app)
+
+
+def main():
+    with app.app_context():
+        for metric, scores in NamePredictor().retrain().items():
+            logger.info(f"name_predictor_{metric}: {scores}")
+
+        result = BreakoutPredictor().train_model()
+        logger.info(f"breakout_predictor: {result}")
+
+
+if __name__ == '__main__':
+    main()
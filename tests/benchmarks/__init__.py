@@ -0,0 +1,26 @@
+"""
+Hot-Path Benchmarks
+Seeded synthetic corpora and a throughput/peak-memory harness
+
+Run with scripts/run_benchmarks.py; results are JSON reports that can be
+compared against a saved baseline to catch performance regressions offline.
+"""
+
+from tests.benchmarks.harness import (
+    HOT_PATHS,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+from tests.benchmarks.synthetic_data import SCALES, SyntheticDataGenerator
+
+__all__ = [
+    'HOT_PATHS',
+    'SCALES',
+    'SyntheticDataGenerator',
+    'compare_reports',
+    'load_report',
+    'run_benchmarks',
+    'save_report',
+]
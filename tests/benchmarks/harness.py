@@ -0,0 +1,327 @@
+"""
+Benchmark Harness
+Throughput and peak-memory measurements for the platform's hot paths
+
+Each hot path is a setup function that builds its inputs from the synthetic
+corpora (untimed) and returns a runner. The runner executes up to `limit`
+operations and returns how many it ran, so the same benchmark scales from a
+quick 1k smoke run to a 1M soak.
+
+Throughput is measured without tracing; peak memory is measured in a separate
+tracemalloc pass (tracing slows allocation-heavy code several-fold).
+"""
+
+import json
+import logging
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from tests.benchmarks.synthetic_data import SyntheticDataGenerator, scale_size
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+DEFAULT_TOLERANCE = 0.10
+DEFAULT_MEMORY_OPS = 10_000
+BOOTSTRAP_ITERATIONS = 200
+
+Runner = Callable[[Optional[int]], int]
+
+
+@dataclass
+class HotPath:
+    """A benchmarked code path"""
+    name: str
+    description: str
+    setup: Callable[[SyntheticDataGenerator, int], Runner]
+
+
+HOT_PATHS: Dict[str, HotPath] = {}
+
+
+def hot_path(name: str, description: str):
+    """Register a setup function `(generator, n) -> runner` as a hot path"""
+    def decorator(setup):
+        HOT_PATHS[name] = HotPath(name, description, setup)
+        return setup
+    return decorator
+
+
+def _per_item(items: List, fn: Callable) -> Runner:
+    """Runner applying fn to each item (one operation per item)"""
+    def run(limit: Optional[int] = None) -> int:
+        batch = items if limit is None else items[:limit]
+        for item in batch:
+            fn(item)
+        return len(batch)
+    return run
+
+
+# ============================================================================
+# Hot paths
+# ============================================================================
+
+@hot_path('phonetic_base.analyze', 'PhoneticBase.analyze per name')
+def _phonetic_analyze(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from analyzers.phonetic_base import PhoneticBase
+    analyzer = PhoneticBase()
+    return _per_item(generator.names(n), analyzer.analyze)
+
+
+@hot_path('name_analyzer.analyze_name', 'NameAnalyzer.analyze_name per name (standardized)')
+def _name_analyze(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from analyzers.name_analyzer import NameAnalyzer
+    analyzer = NameAnalyzer()
+    return _per_item(generator.names(n), analyzer.analyze_name)
+
+
+@hot_path('formula_engine.transform', 'FormulaEngine.transform (hybrid) per feature dict')
+def _formula_transform(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from utils.formula_engine import FormulaEngine
+    engine = FormulaEngine()
+    return _per_item(generator.name_features(n),
+                     lambda features: engine.transform(features['name'], features, 'hybrid'))
+
+
+@hot_path('sports_betting.calculate_player_score', 'SportsBettingAnalyzer.calculate_player_score per athlete')
+def _player_score(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from analyzers.sports_betting_analyzer import SportsBettingAnalyzer
+    analyzer = SportsBettingAnalyzer()
+    athletes = generator.athletes(n)
+    items = list(zip(
+        athletes[['syllables', 'harshness', 'memorability', 'length']].to_dict('records'),
+        athletes['sport'].tolist()
+    ))
+    return _per_item(items, lambda item: analyzer.calculate_player_score(*item))
+
+
+@hot_path('statistical_suite.cohens_d_bootstrap',
+          'UniversalStatisticalSuite.cohens_d bootstrap resamples (football vs basketball harshness)')
+def _cohens_d_bootstrap(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from analyzers.universal_statistical_suite import UniversalStatisticalSuite
+    suite = UniversalStatisticalSuite(bootstrap_iterations=BOOTSTRAP_ITERATIONS)
+    athletes = generator.athletes(n)
+    football = athletes.loc[athletes['sport'] == 'football', 'harshness'].to_numpy()
+    basketball = athletes.loc[athletes['sport'] == 'basketball', 'harshness'].to_numpy()
+
+    def run(limit: Optional[int] = None) -> int:
+        # The bootstrap draws from the global NumPy stream
+        np.random.seed(generator.seed)
+        suite.cohens_d(football, basketball)
+        return BOOTSTRAP_ITERATIONS
+    return run
+
+
+@hot_path('statistical_suite.correlation_bootstrap',
+          'UniversalStatisticalSuite.correlation_with_ci bootstrap resamples (bet score vs profit)')
+def _correlation_bootstrap(generator: SyntheticDataGenerator, n: int) -> Runner:
+    from analyzers.universal_statistical_suite import UniversalStatisticalSuite
+    suite = UniversalStatisticalSuite(bootstrap_iterations=BOOTSTRAP_ITERATIONS)
+    bets = generator.bet_logs(n)
+    scores = bets['player_score'].to_numpy(dtype=float)
+    profit = bets['profit'].to_numpy(dtype=float)
+
+    def run(limit: Optional[int] = None) -> int:
+        np.random.seed(generator.seed)
+        suite.correlation_with_ci(scores, profit)
+        return BOOTSTRAP_ITERATIONS
+    return run
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def _measure(runner: Runner, limit: Optional[int], repeat: int, memory_ops: int) -> Dict:
+    best = None
+    ops = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        ops = runner(limit)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    memory_limit = memory_ops if limit is None else min(limit, memory_ops)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        memory_ops_run = runner(memory_limit)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'status': 'ok',
+        'ops': ops,
+        'seconds': round(best, 6),
+        'ops_per_sec': round(ops / best, 3) if best > 0 else None,
+        'peak_memory_bytes': int(peak),
+        'memory_ops': memory_ops_run,
+    }
+
+
+def run_benchmarks(scale='1k', seed: int = 42, only: Optional[Iterable[str]] = None,
+                   max_ops: Optional[int] = None, repeat: int = 1,
+                   memory_ops: int = DEFAULT_MEMORY_OPS) -> Dict:
+    """
+    Benchmark hot paths on a synthetic corpus
+
+    Args:
+        scale: Corpus size label ('1k', '100k', '1m') or row count
+        seed: Synthetic data seed
+        only: Hot path names to run (default: all)
+        max_ops: Cap on timed operations per hot path (default: whole corpus)
+        repeat: Timed repetitions; the fastest is recorded
+        memory_ops: Operations in the traced peak-memory pass
+
+    Returns:
+        Report dict (see save_report)
+    """
+    n = scale_size(scale)
+    generator = SyntheticDataGenerator(seed)
+
+    names = list(only) if only else list(HOT_PATHS)
+    unknown = [name for name in names if name not in HOT_PATHS]
+    if unknown:
+        raise ValueError(f"Unknown hot paths: {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        path = HOT_PATHS[name]
+        try:
+            runner = path.setup(generator, n)
+        except ImportError as e:
+            logger.warning(f"Skipping {name}: {e}")
+            results[name] = {'status': 'skipped', 'reason': str(e)}
+            continue
+
+        logger.info(f"Benchmarking {name} (n={n})")
+        try:
+            results[name] = _measure(runner, max_ops, repeat, memory_ops)
+        except Exception as e:
+            logger.error(f"Benchmark {name} failed: {e}")
+            results[name] = {'status': 'error', 'reason': str(e)}
+
+    return {
+        'created_at': datetime.utcnow().isoformat(),
+        'scale': str(scale),
+        'n': n,
+        'seed': seed,
+        'max_ops': max_ops,
+        'memory_ops': memory_ops,
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+        },
+        'results': results,
+    }
+
+
+def save_report(report: Dict, path: Path = DEFAULT_BASELINE_PATH) -> Path:
+    """Write a benchmark report as JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_report(path: Path = DEFAULT_BASELINE_PATH) -> Dict:
+    """Read a benchmark report written by save_report"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ============================================================================
+# Comparison
+# ============================================================================
+
+def compare_reports(baseline: Dict, current: Dict, tolerance: float = DEFAULT_TOLERANCE,
+                    memory_tolerance: Optional[float] = None) -> Dict:
+    """
+    Flag hot paths that got slower or hungrier than the baseline
+
+    A path regresses when its throughput falls below (1 - tolerance) x baseline
+    or its peak memory exceeds (1 + memory_tolerance) x baseline, or when it ran
+    in the baseline but now errors or is missing from the current report.
+    Paths skipped in either run (optional dependency absent) are not compared.
+
+    Args:
+        baseline: Report from an earlier run
+        current: Report from this run (same scale and seed)
+        tolerance: Allowed relative throughput drop
+        memory_tolerance: Allowed relative peak-memory growth (default: tolerance)
+
+    Returns:
+        {'regressions': [...], 'comparisons': {name: {...}}}
+    """
+    if (baseline.get('n'), baseline.get('seed')) != (current.get('n'), current.get('seed')):
+        raise ValueError(
+            f"Reports are not comparable: baseline n={baseline.get('n')} seed={baseline.get('seed')}, "
+            f"current n={current.get('n')} seed={current.get('seed')}"
+        )
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+
+    comparisons = {}
+    regressions = []
+
+    for name, base in baseline.get('results', {}).items():
+        cur = current.get('results', {}).get(name)
+        current_status = cur.get('status') if cur else 'missing'
+        if base.get('status') == 'ok' and current_status in ('error', 'missing'):
+            comparisons[name] = {
+                'status': 'regression',
+                'flags': [current_status],
+                'baseline_status': 'ok',
+                'current_status': current_status,
+                'reason': cur.get('reason') if cur else None,
+            }
+            regressions.append(name)
+            continue
+        if base.get('status') != 'ok' or current_status != 'ok':
+            comparisons[name] = {
+                'status': 'not_compared',
+                'baseline_status': base.get('status'),
+                'current_status': current_status,
+            }
+            continue
+
+        speed_ratio = cur['ops_per_sec'] / base['ops_per_sec'] if base['ops_per_sec'] else None
+        memory_ratio = (cur['peak_memory_bytes'] / base['peak_memory_bytes']
+                        if base['peak_memory_bytes'] else None)
+
+        flags = []
+        if speed_ratio is not None and speed_ratio < 1 - tolerance:
+            flags.append('throughput')
+        if memory_ratio is not None and memory_ratio > 1 + memory_tolerance:
+            flags.append('memory')
+
+        comparisons[name] = {
+            'status': 'regression' if flags else 'ok',
+            'flags': flags,
+            'baseline_ops_per_sec': base['ops_per_sec'],
+            'current_ops_per_sec': cur['ops_per_sec'],
+            'speed_ratio': round(speed_ratio, 3) if speed_ratio is not None else None,
+            'baseline_peak_memory_bytes': base['peak_memory_bytes'],
+            'current_peak_memory_bytes': cur['peak_memory_bytes'],
+            'memory_ratio': round(memory_ratio, 3) if memory_ratio is not None else None,
+        }
+        if flags:
+            regressions.append(name)
+
+    return {
+        'tolerance': tolerance,
+        'memory_tolerance': memory_tolerance,
+        'regressions': regressions,
+        'comparisons': comparisons,
+    }
@@ -0,0 +1,266 @@
+"""
+Synthetic Data Generator
+Seeded corpora for offline benchmarking (no database or network access)
+
+Every dataset draws from its own random stream derived from the seed, so
+names(n) returns the same rows whether or not athletes() or bet_logs() were
+generated first, and a 1k corpus is reproducible across runs and machines.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+# Stream ids keep each dataset independent of generation order
+_STREAMS = {
+    'names': 1,
+    'name_features': 2,
+    'athletes': 3,
+    'price_histories': 4,
+    'bet_logs': 5,
+}
+
+ONSETS = ('b', 'br', 'c', 'ch', 'd', 'dr', 'f', 'g', 'gr', 'h', 'j', 'k', 'kr', 'l',
+          'm', 'n', 'p', 'pr', 'qu', 'r', 's', 'sh', 'st', 't', 'th', 'tr', 'v', 'w', 'z', '')
+NUCLEI = ('a', 'e', 'i', 'o', 'u', 'ai', 'ea', 'ee', 'oo', 'ou', 'y')
+CODAS = ('', '', '', 'n', 'r', 'x', 'k', 'l', 'm', 's', 'th', 'ng', 'ck', 'rd')
+CRYPTO_SUFFIXES = ('coin', 'swap', 'chain', 'token', 'verse', 'fi', 'x')
+
+SPORTS = ('football', 'basketball', 'baseball')
+BET_TYPES = ('moneyline', 'spread', 'total', 'prop')
+NAME_TYPES = ('invented', 'compound', 'real_word', 'acronym')
+SEMANTIC_CATEGORIES = ('technology', 'finance', 'animal_reference', 'astronomy', 'mythology', 'nature')
+
+
+def scale_size(scale) -> int:
+    """Row count for a scale label ('1k', '100k', '1m') or an explicit integer"""
+    if isinstance(scale, int):
+        return scale
+    key = str(scale).lower()
+    if key in SCALES:
+        return SCALES[key]
+    if key.isdigit():
+        return int(key)
+    raise ValueError(f"Unknown scale: {scale} (expected one of {', '.join(SCALES)} or an integer)")
+
+
+class SyntheticDataGenerator:
+    """Seeded generator for names, athletes, price histories and bet logs"""
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+
+    def _rng(self, dataset: str) -> np.random.Generator:
+        return np.random.default_rng([self.seed, _STREAMS[dataset]])
+
+    # ------------------------------------------------------------------
+    # Names
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _syllable_words(rng: np.random.Generator, n: int, min_syllables: int = 1,
+                        max_syllables: int = 4) -> Tuple[List[str], np.ndarray]:
+        syllables = rng.integers(min_syllables, max_syllables + 1, size=n)
+        total = int(syllables.sum())
+
+        onsets = np.asarray(ONSETS, dtype=object)[rng.integers(0, len(ONSETS), size=total)]
+        nuclei = np.asarray(NUCLEI, dtype=object)[rng.integers(0, len(NUCLEI), size=total)]
+        codas = np.asarray(CODAS, dtype=object)[rng.integers(0, len(CODAS), size=total)]
+        parts = onsets + nuclei + codas
+
+        bounds = np.concatenate(([0], np.cumsum(syllables)))
+        words = [''.join(parts[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+        return words, syllables
+
+    def names(self, n: int) -> List[str]:
+        """
+        Mixed corpus of crypto-style and person-style names
+
+        Roughly half are single invented words (some with a crypto suffix or
+        upper-cased ticker form), the rest are "First Last" names.
+        """
+        rng = self._rng('names')
+        first, _ = self._syllable_words(rng, n)
+        last, _ = self._syllable_words(rng, n, min_syllables=2, max_syllables=3)
+
+        style = rng.random(n)
+        suffixes = np.asarray(CRYPTO_SUFFIXES, dtype=object)[rng.integers(0, len(CRYPTO_SUFFIXES), size=n)]
+
+        names = []
+        for i in range(n):
+            word = first[i]
+            if style[i] < 0.30:
+                names.append(word.capitalize())
+            elif style[i] < 0.45:
+                names.append(word.capitalize() + suffixes[i])
+            elif style[i] < 0.50:
+                names.append(word[:4].upper())
+            else:
+                names.append(f"{word.capitalize()} {last[i].capitalize()}")
+        return names
+
+    def name_features(self, n: int) -> List[Dict]:
+        """
+        Linguistic feature dicts shaped like NameAnalyzer output
+
+        Lets feature consumers (formula transforms, scorers) be benchmarked
+        without paying for name analysis in the setup.
+        """
+        rng = self._rng('name_features')
+        names = self.names(n)
+        lengths = np.fromiter((len(name) for name in names), dtype=int, count=n)
+        words = np.fromiter((name.count(' ') + 1 for name in names), dtype=int, count=n)
+
+        syllables = np.clip(np.round(lengths / 3 + rng.normal(0, 0.5, n)), 1, None).astype(int)
+        harshness = np.clip(rng.normal(50, 15, n), 0, 100)
+        smoothness = np.clip(100 - harshness + rng.normal(0, 10, n), 0, 100)
+        vowel_ratio = np.clip(rng.normal(0.4, 0.08, n), 0.05, 0.9)
+        plosive_ratio = np.clip(rng.normal(0.2, 0.07, n), 0, 1)
+        complexity = np.clip(rng.normal(50, 15, n), 0, 100)
+        power = np.clip(rng.normal(50, 20, n), 0, 100)
+        authority = np.clip(rng.normal(50, 20, n), 0, 100)
+        prestige = np.clip(rng.normal(50, 20, n), 0, 100)
+        memorability = np.clip(rng.normal(50, 15, n), 0, 100)
+        name_types = np.asarray(NAME_TYPES, dtype=object)[rng.integers(0, len(NAME_TYPES), size=n)]
+        categories = np.asarray(SEMANTIC_CATEGORIES, dtype=object)[rng.integers(0, len(SEMANTIC_CATEGORIES), size=n)]
+
+        return [
+            {
+                'name': names[i],
+                'character_length': int(lengths[i]),
+                'word_count': int(words[i]),
+                'syllable_count': int(syllables[i]),
+                'harshness_score': float(harshness[i]),
+                'smoothness_score': float(smoothness[i]),
+                'vowel_ratio': float(vowel_ratio[i]),
+                'plosive_ratio': float(plosive_ratio[i]),
+                'phonetic_complexity': float(complexity[i]),
+                'power_connotation_score': float(power[i]),
+                'authority_score': float(authority[i]),
+                'prestige_score': float(prestige[i]),
+                'memorability_score': float(memorability[i]),
+                'name_type': name_types[i],
+                'semantic_category': categories[i],
+            }
+            for i in range(n)
+        ]
+
+    # ------------------------------------------------------------------
+    # Tabular datasets
+    # ------------------------------------------------------------------
+
+    def athletes(self, n: int) -> pd.DataFrame:
+        """
+        Athletes with the linguistic features SportsBettingAnalyzer scores
+
+        Columns: name, sport, syllables, harshness, memorability, length, performance
+        """
+        rng = self._rng('athletes')
+        first, first_syllables = self._syllable_words(rng, n, max_syllables=3)
+        last, last_syllables = self._syllable_words(rng, n, min_syllables=1, max_syllables=3)
+        names = [f"{a.capitalize()} {b.capitalize()}" for a, b in zip(first, last)]
+
+        sports = np.asarray(SPORTS, dtype=object)[rng.integers(0, len(SPORTS), size=n)]
+        harshness = np.clip(rng.normal(50, 15, n), 0, 100)
+        memorability = np.clip(rng.normal(50, 15, n), 0, 100)
+        syllables = first_syllables + last_syllables
+        lengths = np.fromiter((len(name) - 1 for name in names), dtype=int, count=n)
+
+        # Weak harshness effect, strongest in football (as in the meta-analysis)
+        effect = np.where(sports == 'football', 0.4, 0.2)
+        performance = 50 + effect * (harshness - 50) + rng.normal(0, 12, n)
+
+        return pd.DataFrame({
+            'name': names,
+            'sport': sports,
+            'syllables': syllables,
+            'harshness': harshness,
+            'memorability': memorability,
+            'length': lengths,
+            'performance': performance,
+        })
+
+    def price_histories(self, n: int, days: int = 365) -> pd.DataFrame:
+        """
+        Daily OHLCV rows for ceil(n / days) assets (geometric Brownian motion)
+
+        Columns: symbol, date, open, high, low, close, volume (n rows total)
+        """
+        rng = self._rng('price_histories')
+        n_assets = max(1, -(-n // days))
+        symbols = [f"SYN{i:06d}" for i in range(n_assets)]
+
+        drift = rng.normal(0.0005, 0.001, n_assets)
+        vol = rng.uniform(0.02, 0.08, n_assets)
+        start = rng.lognormal(0, 2, n_assets)
+
+        shocks = rng.normal(0, 1, (n_assets, days))
+        log_paths = np.cumsum(drift[:, None] - vol[:, None] ** 2 / 2 + vol[:, None] * shocks, axis=1)
+        close = start[:, None] * np.exp(log_paths)
+        prev_close = np.concatenate((start[:, None], close[:, :-1]), axis=1)
+        spread = np.abs(rng.normal(0, 1, (n_assets, days))) * vol[:, None] * close
+        high = np.maximum(prev_close, close) + spread / 2
+        low = np.maximum(np.minimum(prev_close, close) - spread / 2, close * 0.01)
+        volume = rng.lognormal(14, 1.5, (n_assets, days))
+
+        dates = pd.date_range('2020-01-01', periods=days, freq='D')
+        frame = pd.DataFrame({
+            'symbol': np.repeat(symbols, days),
+            'date': np.tile(dates, n_assets),
+            'open': prev_close.ravel(),
+            'high': high.ravel(),
+            'low': low.ravel(),
+            'close': close.ravel(),
+            'volume': volume.ravel(),
+        })
+        return frame.iloc[:n].reset_index(drop=True)
+
+    def bet_logs(self, n: int) -> pd.DataFrame:
+        """
+        Settled bets shaped like the bet tracker's records
+
+        Columns: sport, bet_type, player_name, player_score, american_odds,
+        stake, result, profit, placed_at
+        """
+        rng = self._rng('bet_logs')
+        first, _ = self._syllable_words(rng, n, max_syllables=3)
+        last, _ = self._syllable_words(rng, n, max_syllables=3)
+
+        sports = np.asarray(SPORTS, dtype=object)[rng.integers(0, len(SPORTS), size=n)]
+        bet_types = np.asarray(BET_TYPES, dtype=object)[rng.integers(0, len(BET_TYPES), size=n)]
+        scores = np.clip(rng.normal(55, 12, n), 0, 100)
+
+        favorite = rng.random(n) < 0.5
+        odds = np.where(favorite, -rng.integers(105, 300, n), rng.integers(100, 400, n))
+        decimal = np.where(odds > 0, 1 + odds / 100, 1 + 100 / np.abs(odds))
+
+        # Implied probability nudged by the name score (a small edge to find)
+        win_prob = np.clip(1 / decimal + (scores - 55) / 1000, 0.01, 0.99)
+        won = rng.random(n) < win_prob
+        push = rng.random(n) < 0.02
+
+        stake = np.round(rng.lognormal(3.5, 0.6, n), 2)
+        profit = np.where(push, 0.0, np.where(won, stake * (decimal - 1), -stake))
+        result = np.where(push, 'push', np.where(won, 'won', 'lost'))
+
+        placed_at = (pd.Timestamp('2023-09-01')
+                     + pd.to_timedelta(np.sort(rng.integers(0, 365 * 24 * 3600, n)), unit='s'))
+
+        return pd.DataFrame({
+            'sport': sports,
+            'bet_type': bet_types,
+            'player_name': [f"{a.capitalize()} {b.capitalize()}" for a, b in zip(first, last)],
+            'player_score': scores,
+            'american_odds': odds,
+            'stake': stake,
+            'result': result,
+            'profit': np.round(profit, 2),
+            'placed_at': placed_at,
+        })
@@ -0,0 +1,82 @@
+"""
+Test Benchmark Tooling
+Synthetic corpora are reproducible and regressions are flagged
+"""
+
+import pytest
+
+from tests.benchmarks.harness import compare_reports
+from tests.benchmarks.synthetic_data import SyntheticDataGenerator, scale_size
+
+
+def _report(ops_per_sec, peak, n=1000, seed=42):
+    return {
+        'n': n,
+        'seed': seed,
+        'results': {
+            'path': {'status': 'ok', 'ops_per_sec': ops_per_sec, 'peak_memory_bytes': peak},
+        },
+    }
+
+
+class TestSyntheticDataGenerator:
+    """Test seeded corpora"""
+
+    def test_same_seed_same_data(self):
+        """Datasets are reproducible and independent of generation order"""
+        first = SyntheticDataGenerator(seed=7)
+        second = SyntheticDataGenerator(seed=7)
+        second.bet_logs(50)
+
+        assert first.names(50) == second.names(50)
+        assert first.athletes(50).equals(second.athletes(50))
+
+    def test_sizes(self):
+        """Each dataset returns the requested number of rows"""
+        generator = SyntheticDataGenerator()
+        assert len(generator.name_features(20)) == 20
+        assert len(generator.price_histories(400)) == 400
+        assert len(generator.bet_logs(20)) == 20
+
+    def test_scale_size(self):
+        """Scale labels map to row counts"""
+        assert scale_size('100k') == 100_000
+        assert scale_size(250) == 250
+        with pytest.raises(ValueError):
+            scale_size('huge')
+
+
+class TestCompareReports:
+    """Test regression detection"""
+
+    def test_within_tolerance(self):
+        """Small slowdowns are not regressions"""
+        comparison = compare_reports(_report(1000, 100), _report(950, 105), tolerance=0.10)
+        assert comparison['regressions'] == []
+
+    def test_throughput_and_memory_regressions(self):
+        """Slowdowns and memory growth beyond tolerance are flagged"""
+        comparison = compare_reports(_report(1000, 100), _report(800, 150), tolerance=0.10)
+        assert comparison['regressions'] == ['path']
+        assert comparison['comparisons']['path']['flags'] == ['throughput', 'memory']
+
+    def test_broken_and_missing_paths(self):
+        """A path that ran in the baseline but now errors or disappears is flagged"""
+        baseline = _report(1000, 100)
+        baseline['results']['gone'] = dict(baseline['results']['path'])
+        baseline['results']['optional'] = {'status': 'skipped', 'reason': 'no torch'}
+        current = _report(1000, 100)
+        current['results']['path'] = {'status': 'error', 'reason': 'boom'}
+        current['results']['optional'] = {'status': 'error', 'reason': 'boom'}
+
+        comparison = compare_reports(baseline, current)
+
+        assert comparison['regressions'] == ['path', 'gone']
+        assert comparison['comparisons']['path']['flags'] == ['error']
+        assert comparison['comparisons']['gone']['flags'] == ['missing']
+        assert comparison['comparisons']['optional']['status'] == 'not_compared'
+
+    def test_mismatched_corpus(self):
+        """Reports from different corpora are not compared"""
+        with pytest.raises(ValueError):
+            compare_reports(_report(1000, 100), _report(1000, 100, n=100_000))
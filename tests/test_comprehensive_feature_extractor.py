@@ -0,0 +1,100 @@
+"""
+Test Comprehensive Feature Extractor
+Checks that the columnar slate extractor matches the per-player dict path
+"""
+
+import pytest
+import numpy as np
+from analyzers.comprehensive_feature_extractor import (
+    ComprehensiveFeatureExtractor,
+    FEATURE_COLUMNS
+)
+
+
+@pytest.fixture
+def slate():
+    """Small mixed slate with missing fields and optional opponents"""
+    players = [
+        {'name': 'Nick Chubb', 'position': 'RB', 'years_in_league': 6, 'baseline_average': 85.5,
+         'media_buzz': 75, 'market_size_mult': 1.2,
+         'linguistic_features': {'syllables': 2, 'harshness': 72, 'memorability': 68, 'length': 9}},
+        {'name': 'Zion Williamson', 'position': 'PF', 'is_contract_year': True,
+         'linguistic_features': {'syllables': 5, 'harshness': 40, 'memorability': 80, 'length': 15}},
+        {'name': 'Nick Chubb', 'position': 'XX',
+         'linguistic_features': {'syllables': 2, 'harshness': 72}},
+    ]
+    opponents = [
+        {'name': 'Fred Warner', 'linguistic_features': {'syllables': 3, 'harshness': 45, 'memorability': 52, 'length': 11}},
+        None,
+        {'name': 'Bo', 'linguistic_features': {'harshness': 95}},
+    ]
+    contexts = [
+        {'sport': 'football', 'is_primetime': True, 'is_playoff': True},
+        {'sport': 'basketball', 'is_championship': True, 'is_national_broadcast': True},
+        {'sport': 'football', 'is_rivalry': True},
+    ]
+    markets = [
+        {'line': 88.5, 'opening_line': 85.5, 'public_percentage': 0.32, 'time_to_game': 48},
+        {'line': 27.5, 'public_percentage': 0.80, 'line_volatility': 4},
+        {'line': 70.0},
+    ]
+    return players, opponents, contexts, markets
+
+
+class TestExtractFeatureMatrix:
+    """Test columnar extraction"""
+    
+    def test_schema(self, slate):
+        """Matrix uses the fixed float32 column schema"""
+        extractor = ComprehensiveFeatureExtractor()
+        
+        matrix, columns = extractor.extract_feature_matrix(*slate)
+        
+        assert columns == FEATURE_COLUMNS
+        assert matrix.shape == (3, len(FEATURE_COLUMNS))
+        assert matrix.dtype == np.float32
+    
+    def test_matches_dict_path(self, slate):
+        """Every row equals extract_all_features for the same inputs"""
+        extractor = ComprehensiveFeatureExtractor()
+        players, opponents, contexts, markets = slate
+        
+        matrix, columns = extractor.extract_feature_matrix(players, opponents, contexts, markets)
+        
+        for row, (player, opponent, context, market) in enumerate(zip(players, opponents, contexts, markets)):
+            expected = extractor.extract_all_features(player, opponent, context, market)
+            assert list(expected.keys()) == columns
+            assert matrix[row] == pytest.approx(
+                np.array([float(expected[key]) for key in columns], dtype=np.float32), rel=1e-5, abs=1e-4
+            )
+    
+    def test_shared_context(self, slate):
+        """A single context dict is broadcast to every player"""
+        extractor = ComprehensiveFeatureExtractor()
+        players, opponents, _, markets = slate
+        
+        matrix, columns = extractor.extract_feature_matrix(
+            players, opponents, {'sport': 'football', 'is_playoff': True}, markets
+        )
+        
+        assert (matrix[:, columns.index('is_playoff')] == 1).all()
+
+
+class TestPredictSlate:
+    """Test the enhanced predictor's matrix-backed slate path"""
+    
+    def test_matches_per_player_predict(self, slate):
+        """predict_slate agrees with predict for every player in a shared context"""
+        from analyzers.enhanced_predictor import EnhancedNominativePredictor
+        
+        predictor = EnhancedNominativePredictor()
+        players, opponents, _, markets = slate
+        context = {'sport': 'football', 'team_name': 'Cleveland Browns', 'is_playoff': True}
+        
+        results = predictor.predict_slate(players, context, markets[0], opponents)
+        
+        assert len(results) == len(players)
+        for result, player, opponent in zip(results, players, opponents):
+            expected = predictor.predict(player, context, markets[0], opponent)
+            assert result['base_prediction'] == pytest.approx(expected['base_prediction'], rel=1e-5)
+            assert result['final_prediction'] == pytest.approx(expected['final_prediction'], rel=1e-5)
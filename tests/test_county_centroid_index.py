@@ -0,0 +1,83 @@
+"""
+Test County Centroid Index
+Checks the batched radius query against the per-point haversine loop
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from collectors.county_centroid_index import CountyCentroidIndex
+from collectors.hurricane_track_geocoder import HurricaneTrackGeocoder
+
+
+@pytest.fixture
+def index():
+    """Synthetic Gulf/Atlantic coast counties"""
+    rng = np.random.default_rng(11)
+    n = 400
+    lats = rng.uniform(24, 36, n)
+    lons = rng.uniform(-98, -75, n)
+    fips = [f"{i:05d}" for i in range(n)]
+    return CountyCentroidIndex(fips, [f"County {i}" for i in range(n)], ['XX'] * n, lats, lons)
+
+
+def _haversine_loop(index, track, radius):
+    """Reference: every track point against every county (the pre-index approach)"""
+    geocoder = HurricaneTrackGeocoder(centroid_index=index)
+    best = {}
+    for point_idx, (lat, lon) in enumerate(track):
+        for county_idx in range(len(index)):
+            distance = geocoder._haversine_distance(lat, lon, index.lats[county_idx], index.lons[county_idx])
+            if distance <= radius and (county_idx not in best or distance < best[county_idx][0]):
+                best[county_idx] = (distance, point_idx)
+    return best
+
+
+class TestQueryTrack:
+    """Test batched radius queries"""
+
+    def test_matches_haversine_loop(self, index):
+        """Same counties, minimum distances and closest points as the brute-force loop"""
+        track = [(25 + 0.4 * i, -90 + 0.3 * i) for i in range(25)]
+
+        matches = index.query_track([p[0] for p in track], [p[1] for p in track], 200)
+        expected = _haversine_loop(index, track, 200)
+
+        assert sorted(matches['county_idx'].tolist()) == sorted(expected)
+        for county_idx, distance, point_idx in zip(matches['county_idx'], matches['min_distance'],
+                                                   matches['point_idx']):
+            assert distance == pytest.approx(expected[county_idx][0], rel=1e-6)
+            assert point_idx == expected[county_idx][1]
+
+    def test_empty_track(self, index):
+        """No track points, no matches"""
+        assert len(index.query_track([], [], 200)['county_idx']) == 0
+
+
+class TestLoad:
+    """Test table loading"""
+
+    def test_missing_table_does_not_download(self, tmp_path, monkeypatch):
+        """A missing table returns None without any network access"""
+        import collectors.county_centroid_index as module
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("load() must not download")
+        monkeypatch.setattr(module.requests, 'get', no_network)
+
+        assert CountyCentroidIndex.load(tmp_path / 'missing.csv') is None
+
+    def test_round_trip(self, tmp_path):
+        """A built table loads back with zero-padded FIPS codes"""
+        path = tmp_path / 'centroids.csv'
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['fips', 'name', 'state', 'lat', 'lon'])
+            writer.writerow(['1001', 'Autauga County', 'AL', '32.532237', '-86.646440'])
+
+        index = CountyCentroidIndex.load(path)
+
+        assert len(index) == 1
+        assert index.fips[0] == '01001'
@@ -0,0 +1,52 @@
+"""
+Test Model Registry
+Single-flight training across processes
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from utils import model_registry
+from utils.model_registry import ModelRegistry
+
+
+def _train_once(root, log_path):
+    def fit():
+        with open(log_path, 'a') as f:
+            f.write('fit\n')
+        time.sleep(0.5)
+        return {'weights': [1, 2, 3]}, {'scores': {}}
+
+    ModelRegistry(root).get_or_train('model', 'abc123', fit)
+
+
+@pytest.mark.skipif(model_registry.fcntl is None, reason="training lock needs fcntl")
+class TestGetOrTrain:
+    """Test concurrent trainers"""
+
+    def test_concurrent_trainers_fit_once(self, tmp_path):
+        """Processes racing on the same version fit it once; the rest load it"""
+        log_path = tmp_path / 'fits.log'
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_train_once, args=(tmp_path / 'models', log_path))
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert log_path.read_text().count('fit') == 1
+        assert ModelRegistry(tmp_path / 'models').current_fingerprint('model') == 'abc123'
+
+    def test_registered_version_not_refitted(self, tmp_path):
+        """A registered fingerprint loads without calling the fit function"""
+        registry = ModelRegistry(tmp_path)
+        registry.save('model', 'abc123', {'weights': [1]}, {'scores': {}})
+
+        result = registry.get_or_train('model', 'abc123', lambda: pytest.fail("refitted"))
+
+        assert result['trained'] is False
+        assert list(result['artifacts']['weights']) == [1]
@@ -0,0 +1,104 @@
+"""
+Test Portfolio Optimizer Engine
+Critical line frontier checked against SLSQP on random problems
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+
+from utils.portfolio_optimizer_engine import _critical_line, _frontier_at, _max_sharpe
+
+TOL = 1e-9
+
+
+def _problems(count, seed=0, max_assets=15):
+    """Random (returns, cov) pairs with some all-negative-return cases"""
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        n = int(rng.integers(3, max_assets))
+        factors = rng.normal(size=(n, n)) * rng.uniform(0.1, 0.8)
+        cov = factors @ factors.T / n + np.diag(rng.uniform(0.01, 0.2, n))
+        yield rng.normal(0.2, 0.4, n), cov
+
+
+def _bounds(n, min_weight, max_weight):
+    return np.full(n, min(min_weight, 1.0 / n)), np.full(n, max(max_weight, 1.0 / n))
+
+
+def _reference(objective, lower, upper, extra=()):
+    """SLSQP solution from equal weights, or None if it did not converge"""
+    n = len(lower)
+    result = minimize(
+        objective, np.full(n, 1.0 / n), method='SLSQP',
+        bounds=list(zip(lower, upper)),
+        constraints=[{'type': 'eq', 'fun': lambda w: w.sum() - 1.0}, *extra],
+        options={'ftol': 1e-12, 'maxiter': 500}
+    )
+    return result if result.success else None
+
+
+def _feasible(weights, lower, upper):
+    weights = np.atleast_2d(weights)
+    return (weights >= lower - TOL).all() and (weights <= upper + TOL).all() \
+        and np.allclose(weights.sum(axis=1), 1.0, atol=TOL)
+
+
+BOUNDS = [(0.05, 0.40), (0.0, 1.0), (0.02, 0.15)]
+
+
+@pytest.mark.parametrize('min_weight,max_weight', BOUNDS)
+class TestCriticalLine:
+    """Turning points, minimum variance and frontier points"""
+
+    def test_turning_points_within_bounds(self, min_weight, max_weight):
+        """Every turning point is fully invested and inside the box"""
+        for returns, cov in _problems(150):
+            lower, upper = _bounds(len(returns), min_weight, max_weight)
+            assert _feasible(_critical_line(returns, cov, lower, upper), lower, upper)
+
+    def test_minimum_variance_matches_reference(self, min_weight, max_weight):
+        """The last turning point is no riskier than the SLSQP minimum"""
+        for returns, cov in _problems(60, seed=1):
+            lower, upper = _bounds(len(returns), min_weight, max_weight)
+            weights = _critical_line(returns, cov, lower, upper)[-1]
+            reference = _reference(lambda w: w @ cov @ w, lower, upper)
+
+            assert weights @ cov @ weights <= reference.fun * (1 + 1e-6) + 1e-12
+
+    def test_frontier_points_match_reference(self, min_weight, max_weight):
+        """Interpolated frontier weights are the minimum-variance portfolios for their return"""
+        for returns, cov in _problems(20, seed=2):
+            lower, upper = _bounds(len(returns), min_weight, max_weight)
+            turning_points = _critical_line(returns, cov, lower, upper)
+            levels = turning_points @ returns
+            targets = np.linspace(levels[-1], levels[0], 5)
+
+            frontier = _frontier_at(turning_points, returns, targets)
+            assert _feasible(frontier, lower, upper)
+            for weights, target in zip(frontier, targets):
+                reference = _reference(
+                    lambda w: w @ cov @ w, lower, upper,
+                    extra=[{'type': 'eq', 'fun': lambda w, target=target: w @ returns - target}]
+                )
+                if reference is not None:
+                    assert weights @ cov @ weights <= reference.fun * (1 + 1e-6) + 1e-12
+
+
+@pytest.mark.parametrize('min_weight,max_weight', BOUNDS)
+class TestMaxSharpe:
+    """Maximum Sharpe ratio portfolio"""
+
+    def test_matches_reference(self, min_weight, max_weight):
+        """Feasible and at least as good as SLSQP, including all-negative returns"""
+        for returns, cov in _problems(60, seed=3):
+            lower, upper = _bounds(len(returns), min_weight, max_weight)
+            weights = _max_sharpe(_critical_line(returns, cov, lower, upper), returns, cov, lower, upper)
+
+            def negative_sharpe(w):
+                return -(w @ returns) / np.sqrt(w @ cov @ w)
+
+            reference = _reference(negative_sharpe, lower, upper)
+            assert _feasible(weights, lower, upper)
+            if reference is not None:
+                assert negative_sharpe(weights) <= reference.fun + 1e-6
@@ -0,0 +1,101 @@
+"""
+Test Response Cache
+Write tracking, LRU eviction and watermark throttling
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from utils.response_cache import ResponseCache
+
+Base = declarative_base()
+
+
+class Widget(Base):
+    __tablename__ = 'widget'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+
+
+@pytest.fixture(scope='module')
+def cache():
+    """One tracking cache per module; session listeners are process-wide"""
+    cache = ResponseCache(max_entries=3)
+    cache.track_writes()
+    return cache
+
+
+@pytest.fixture
+def session(cache):
+    cache.clear()
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestWriteTracking:
+    """Test invalidation from ORM session events"""
+
+    def test_commit_invalidates(self, cache, session):
+        """A committed write to a dependent table drops the entry"""
+        cache.set('widgets', [1], depends_on=('widget',))
+        session.add(Widget(name='a'))
+        session.commit()
+
+        assert cache.get('widgets') is None
+
+    def test_rollback_keeps_entry(self, cache, session):
+        """A flushed but rolled-back write leaves the entry servable"""
+        cache.set('widgets', [1], depends_on=('widget',))
+        session.add(Widget(name='a'))
+        session.flush()
+        session.rollback()
+
+        assert cache.get('widgets') == [1]
+
+    def test_unrelated_table_keeps_entry(self, cache, session):
+        """Writes to other tables do not invalidate"""
+        cache.set('others', [2], depends_on=('other',))
+        session.add(Widget(name='a'))
+        session.commit()
+
+        assert cache.get('others') == [2]
+
+
+class TestEviction:
+    """Test LRU bound"""
+
+    def test_least_recently_used_evicted(self):
+        """Reading an entry protects it from the next eviction"""
+        cache = ResponseCache(max_entries=2)
+        cache.set('a', 1, depends_on=())
+        cache.set('b', 2, depends_on=())
+        cache.get('a')
+        cache.set('c', 3, depends_on=())
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        assert cache.evictions == 1
+
+
+class TestWatermark:
+    """Test database watermark throttling"""
+
+    def test_watermark_queried_once_per_interval(self, monkeypatch):
+        """Lookups within the interval reuse the last watermark"""
+        cache = ResponseCache(db=object(), watermark_interval=60)
+        calls = []
+
+        def query_watermark(tables):
+            calls.append(tables)
+            return {'widget': (len(calls), None, None)}
+        monkeypatch.setattr(cache, '_query_watermark', query_watermark)
+
+        cache.set('a', 1, depends_on=('widget',))
+        for _ in range(5):
+            assert cache.get('a') == 1
+
+        assert calls == [('widget',)]
@@ -0,0 +1,49 @@
+"""
+Test Unified Domain Model
+Entity lookup by name across base and extended domains
+"""
+
+import pytest
+from flask import Flask
+
+from core.models import db, Band
+from core.unified_domain_model_extended import ExtendedDomainInterface, ExtendedDomainType
+
+
+@pytest.fixture
+def interface():
+    """Extended interface over an in-memory database with a few bands"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        for i, name in enumerate(['Radiohead', 'Portishead', 'Massive Attack']):
+            db.session.add(Band(id=f'band-{i}', name=name))
+        db.session.commit()
+        yield ExtendedDomainInterface()
+        db.session.remove()
+
+
+class TestGetEntityByName:
+    """Test name lookup on an extended domain"""
+
+    def test_matches_requested_name(self, interface):
+        """Returns the named band, not the first row"""
+        entity = interface.get_entity_by_name('portishead', ExtendedDomainType.BAND)
+
+        assert entity is not None
+        assert entity.name == 'Portishead'
+
+    def test_unknown_name(self, interface):
+        """No match returns None"""
+        assert interface.get_entity_by_name('Nirvana', ExtendedDomainType.BAND) is None
+
+    def test_scan_fallback_without_name_column(self, interface, monkeypatch):
+        """Loaders that cannot filter in SQL are scanned case-insensitively"""
+        loader = interface.loaders[ExtendedDomainType.BAND]
+        monkeypatch.setattr(loader, 'entity_model', None)
+
+        entity = interface.get_entity_by_name('MASSIVE ATTACK', ExtendedDomainType.BAND)
+
+        assert entity.name == 'Massive Attack'
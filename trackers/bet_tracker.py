@@ -263,6 +263,46 @@ class BetTracker:
         
         return [snapshot.to_dict() for snapshot in snapshots]
     
+    def get_settled_rollup(self) -> list:
+        """
+        Settled bets aggregated in SQL by sport, outcome and game day
+        
+        Returns one row per (sport, bet_status, game day) with bet count,
+        total stake and total profit, so portfolio history is computed from a
+        few hundred rows instead of every bet. Bets without a game date are
+        grouped under year/month/day None.
+        """
+        year = db.extract('year', SportsBet.game_date)
+        month = db.extract('month', SportsBet.game_date)
+        day = db.extract('day', SportsBet.game_date)
+        
+        rows = db.session.query(
+            SportsBet.sport,
+            SportsBet.bet_status,
+            year, month, day,
+            db.func.count(SportsBet.id),
+            db.func.sum(SportsBet.stake),
+            db.func.sum(db.func.coalesce(SportsBet.profit, 0))
+        ).filter(
+            SportsBet.bet_status.in_(['won', 'lost', 'push'])
+        ).group_by(
+            SportsBet.sport, SportsBet.bet_status, year, month, day
+        ).all()
+        
+        return [
+            {
+                'sport': sport,
+                'bet_status': status,
+                'year': int(y) if y is not None else None,
+                'month': int(m) if m is not None else None,
+                'day': int(d) if d is not None else None,
+                'bets': count,
+                'staked': staked or 0,
+                'profit': profit or 0
+            }
+            for sport, status, y, m, d, count, staked, profit in rows
+        ]
+    
     def get_recent_performance(self, days: int = 30) -> dict:
         """Get performance summary for recent period"""
         from datetime import timedelta
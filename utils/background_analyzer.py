@@ -5,9 +5,15 @@ Computes and stores all expensive analysis so pages load in <100ms
 Extended to support dynamic multi-domain computation.
 """
 
+import hashlib
+import importlib.util
 import json
+import multiprocessing
+import multiprocessing.connection
+import os
 import time
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -17,12 +23,28 @@ from scipy.stats import pearsonr, spearmanr
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score, mean_squared_error
+from flask import current_app, has_app_context
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process memory caps
+    resource = None
 
 from core.models import db, Cryptocurrency, NameAnalysis, PriceHistory, PreComputedStats
 from core.research_framework import FRAMEWORK
 
 logger = logging.getLogger(__name__)
 
+DOMAIN_CONFIG_DIR = Path(__file__).parent.parent / "core" / "domain_configs"
+
+# Bump when domain result computation changes so stored results are recomputed
+DOMAIN_STATS_VERSION = 1
+
+DOMAIN_TIMEOUT_SECONDS = 600
+DOMAIN_MEMORY_LIMIT_MB = 4096
+DOMAIN_RETRIES = 1
+POLL_INTERVAL_SECONDS = 0.5
+
 
 class BackgroundAnalyzer:
     """Pre-compute and store all analysis results"""
@@ -390,7 +412,7 @@ class BackgroundAnalyzer:
             return {'status': 'error', 'error': str(e)}
     
     def _store_result(self, stat_type, result, sample_size, duration):
-        """Store result in PreComputedStats table"""
+        """Store result in PreComputedStats table; returns False if the write failed"""
         try:
             # Mark old results as not current
             PreComputedStats.query.filter_by(stat_type=stat_type, is_current=True).update({'is_current': False})
@@ -409,10 +431,12 @@ class BackgroundAnalyzer:
             db.session.commit()
             
             logger.info(f"  Stored {stat_type} in database")
+            return True
             
         except Exception as e:
             logger.error(f"Error storing {stat_type}: {e}")
             db.session.rollback()
+            return False
     
     def get_precomputed(self, stat_type):
         """Get pre-computed result (instant!)"""
@@ -430,6 +454,111 @@ class BackgroundAnalyzer:
             logger.error(f"Error retrieving {stat_type}: {e}")
             return None
     
+    # ========================================================================
+    # DOMAIN STATISTICS
+    # ========================================================================
+    
+    @staticmethod
+    def _load_domain_config(domain_id: str) -> Dict:
+        """Load a domain's YAML config ({} if there is none)"""
+        config_file = DOMAIN_CONFIG_DIR / f"{domain_id}.yaml"
+        if not config_file.exists():
+            logger.warning(f"No config file found for {domain_id}, using metadata only")
+            return {}
+        with open(config_file, 'r') as f:
+            return yaml.safe_load(f) or {}
+    
+    def _compute_domain_result(self, domain_id: str, config: Dict) -> Dict:
+        """Run the domain's analyzer (or generic statistics); no database writes"""
+        analyzer_class = config.get('analyzer_class')
+        if not analyzer_class:
+            logger.info("No analyzer specified, using generic statistics")
+            return self._compute_generic_stats(domain_id, config)
+        
+        try:
+            analyzer_module, analyzer_class_name = analyzer_class.rsplit('.', 1)
+            analyzer_mod = __import__(analyzer_module, fromlist=[analyzer_class_name])
+            analyzer_cls = getattr(analyzer_mod, analyzer_class_name)
+            
+            logger.info(f"Running {analyzer_class_name}...")
+            analyzer = analyzer_cls()
+            
+            if hasattr(analyzer, 'run_full_analysis'):
+                return analyzer.run_full_analysis()
+            
+            logger.warning(f"Analyzer has no run_full_analysis method")
+            return self._compute_generic_stats(domain_id, config)
+            
+        except Exception as e:
+            logger.error(f"Failed to run analyzer: {e}")
+            return self._compute_generic_stats(domain_id, config)
+    
+    def domain_input_hash(self, domain_id: str, config: Optional[Dict] = None) -> str:
+        """
+        Content hash of everything a domain's statistics are computed from.
+        
+        Covers the domain YAML, the analyzer module's source and, for each
+        model listed in the config, the row count, highest primary key and
+        latest last_updated/updated_at timestamp (for models that have one),
+        so inserts, deletes and timestamped in-place updates all change it.
+        If none of these changed, recomputing would reproduce the stored result.
+        
+        Args:
+            domain_id: Domain identifier
+            config: Domain config (loaded if not given)
+        
+        Returns:
+            16-character hex digest
+        """
+        if config is None:
+            config = self._load_domain_config(domain_id)
+        
+        digest = hashlib.sha256()
+        digest.update(f"{DOMAIN_STATS_VERSION}:{domain_id}".encode())
+        
+        config_file = DOMAIN_CONFIG_DIR / f"{domain_id}.yaml"
+        if config_file.exists():
+            digest.update(config_file.read_bytes())
+        
+        analyzer_class = config.get('analyzer_class')
+        if analyzer_class:
+            try:
+                spec = importlib.util.find_spec(analyzer_class.rsplit('.', 1)[0])
+                if spec and spec.origin and Path(spec.origin).exists():
+                    digest.update(Path(spec.origin).read_bytes())
+            except (ImportError, ValueError):
+                digest.update(b'analyzer-unavailable')
+        
+        from core import models
+        for model_name in config.get('models', []):
+            model_cls = getattr(models, model_name, None)
+            digest.update(model_name.encode())
+            if model_cls is None:
+                digest.update(b'missing')
+                continue
+            try:
+                pk = model_cls.__mapper__.primary_key[0]
+                aggregates = [db.func.count(pk), db.func.max(pk)]
+                aggregates += [
+                    db.func.max(model_cls.__table__.c[column])
+                    for column in ('last_updated', 'updated_at')
+                    if column in model_cls.__table__.c
+                ]
+                row = db.session.query(*aggregates).one()
+                digest.update(':'.join(str(value) for value in row).encode())
+            except Exception:
+                db.session.rollback()
+                digest.update(b'unavailable')
+        
+        return digest.hexdigest()[:16]
+    
+    def _stored_input_hash(self, domain_id: str) -> Optional[str]:
+        """Input hash recorded with the current stored result, if any"""
+        stored = self.get_precomputed(f"{domain_id}_analysis")
+        if isinstance(stored, dict):
+            return stored.get('input_hash')
+        return None
+    
     def compute_domain_stats(self, domain_id: str) -> Dict:
         """
         Compute statistics for any registered domain.
@@ -450,43 +579,17 @@ class BackgroundAnalyzer:
             if not domain_meta:
                 raise ValueError(f"Unknown domain: {domain_id}")
             
-            # Load domain config
-            config_file = Path(__file__).parent.parent / "core" / "domain_configs" / f"{domain_id}.yaml"
-            if not config_file.exists():
-                logger.warning(f"No config file found for {domain_id}, using metadata only")
-                config = {}
-            else:
-                with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
-            
-            # Try to load analyzer
-            analyzer_class = config.get('analyzer_class')
-            if analyzer_class:
-                try:
-                    analyzer_module, analyzer_class_name = analyzer_class.rsplit('.', 1)
-                    analyzer_mod = __import__(analyzer_module, fromlist=[analyzer_class_name])
-                    analyzer_cls = getattr(analyzer_mod, analyzer_class_name)
-                    
-                    logger.info(f"Running {analyzer_class_name}...")
-                    analyzer = analyzer_cls()
-                    
-                    if hasattr(analyzer, 'run_full_analysis'):
-                        result = analyzer.run_full_analysis()
-                    else:
-                        logger.warning(f"Analyzer has no run_full_analysis method")
-                        result = self._compute_generic_stats(domain_id, config)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to run analyzer: {e}")
-                    result = self._compute_generic_stats(domain_id, config)
-            else:
-                logger.info("No analyzer specified, using generic statistics")
-                result = self._compute_generic_stats(domain_id, config)
+            config = self._load_domain_config(domain_id)
+            input_hash = self.domain_input_hash(domain_id, config)
+            result = self._compute_domain_result(domain_id, config)
+            if isinstance(result, dict):
+                result['input_hash'] = input_hash
             
             # Store result
             duration = time.time() - start_time
-            self._store_result(f"{domain_id}_analysis", result, 
-                             result.get('sample_size', 0), duration)
+            if not self._store_result(f"{domain_id}_analysis", result,
+                                      result.get('sample_size', 0), duration):
+                return {'status': 'error', 'error': f"could not store {domain_id} result"}
             
             logger.info(f"✓ {domain_id} statistics computed in {duration:.1f}s")
             return {'status': 'success', 'duration': duration, 'result': result}
@@ -533,10 +636,29 @@ class BackgroundAnalyzer:
         
         return result
     
-    def compute_all_domains(self) -> Dict:
+    def compute_all_domains(self, max_workers: Optional[int] = None,
+                            timeout: float = DOMAIN_TIMEOUT_SECONDS,
+                            memory_limit_mb: Optional[int] = DOMAIN_MEMORY_LIMIT_MB,
+                            retries: int = DOMAIN_RETRIES,
+                            force: bool = False) -> Dict:
         """
         Compute statistics for all active domains.
         
+        Each domain runs in its own worker process (at most max_workers at
+        once) with a wall-clock timeout and an address-space cap, so a slow,
+        crashing or memory-hungry domain is retried and then reported as an
+        error without holding up the others. Workers only compute; this
+        process is the single writer of PreComputedStats rows. Domains whose
+        input hash matches the stored result are skipped.
+        
+        Args:
+            max_workers: Concurrent domain workers (default: CPU count, max 4)
+            timeout: Seconds before a domain attempt is killed
+            memory_limit_mb: Memory a worker may allocate beyond its starting
+                footprint (None for no cap)
+            retries: Extra attempts after a failure or timeout
+            force: Recompute even if inputs are unchanged
+        
         Returns:
             Results dictionary for all domains
         """
@@ -548,14 +670,35 @@ class BackgroundAnalyzer:
         logger.info(f"Active domains: {len(active_domains)}")
         
         results = {}
+        jobs = []
         
         for domain_id in active_domains:
-            logger.info(f"\n{'='*70}")
-            logger.info(f"Domain: {domain_id}")
-            logger.info(f"{'='*70}")
+            try:
+                config = self._load_domain_config(domain_id)
+                input_hash = self.domain_input_hash(domain_id, config)
+            except Exception as e:
+                logger.error(f"Error preparing {domain_id}: {e}")
+                results[domain_id] = {'status': 'error', 'error': str(e)}
+                continue
+            
+            if not force and self._stored_input_hash(domain_id) == input_hash:
+                logger.info(f"{domain_id}: inputs unchanged ({input_hash}), skipping")
+                results[domain_id] = {'status': 'skipped', 'input_hash': input_hash}
+                continue
             
-            result = self.compute_domain_stats(domain_id)
-            results[domain_id] = result
+            jobs.append((domain_id, input_hash))
+        
+        if jobs:
+            if max_workers is None:
+                max_workers = min(4, os.cpu_count() or 1)
+            executor = DomainPrecomputeExecutor(
+                self, max_workers=max_workers, timeout=timeout,
+                memory_limit_mb=memory_limit_mb, retries=retries
+            )
+            results.update(executor.run(jobs))
+        
+        # Report in framework order, not completion order
+        results = {domain_id: results[domain_id] for domain_id in active_domains if domain_id in results}
         
         logger.info("\n" + "="*70)
         logger.info("✅ ALL DOMAIN STATISTICS COMPUTED")
@@ -567,3 +710,180 @@ class BackgroundAnalyzer:
         
         return results
 
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _domain_worker(domain_id: str, database_uri: Optional[str],
+                   memory_limit_mb: Optional[int], conn):
+    """
+    Worker process entry point: compute one domain and send the result back.
+    
+    Sends ('success', result_json, sample_size, duration) or
+    ('error', message). Never writes to the database.
+    """
+    start_time = time.time()
+    try:
+        if memory_limit_mb and resource is not None:
+            # Cap on top of what the (possibly forked) process already maps
+            limit = _address_space_bytes() + int(memory_limit_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        
+        if has_app_context():
+            # Forked: drop the parent's pooled connections without closing them
+            db.engine.dispose(close=False)
+        else:
+            # Spawned: build a minimal app bound to the same database
+            from flask import Flask
+            from core.config import Config
+            app = Flask(__name__)
+            app.config.from_object(Config)
+            if database_uri:
+                app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+            db.init_app(app)
+            app.app_context().push()
+        
+        analyzer = BackgroundAnalyzer()
+        config = analyzer._load_domain_config(domain_id)
+        result = analyzer._compute_domain_result(domain_id, config)
+        payload = json.dumps(result)
+        conn.send(('success', payload, result.get('sample_size', 0), time.time() - start_time))
+        
+    except MemoryError:
+        conn.send(('error', f"exceeded memory limit ({memory_limit_mb} MB)"))
+    except Exception as e:
+        conn.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class DomainPrecomputeExecutor:
+    """
+    Process pool for per-domain precompute with timeouts, memory caps and retries.
+    
+    One short-lived process per domain attempt (rather than a shared
+    concurrent.futures pool) so an attempt that overruns its timeout can be
+    killed without affecting other domains. Results come back over pipes and
+    are written by the calling process only.
+    """
+    
+    def __init__(self, analyzer: BackgroundAnalyzer, max_workers: int = 4,
+                 timeout: float = DOMAIN_TIMEOUT_SECONDS,
+                 memory_limit_mb: Optional[int] = DOMAIN_MEMORY_LIMIT_MB,
+                 retries: int = DOMAIN_RETRIES):
+        self.analyzer = analyzer
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.retries = max(0, retries)
+        
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+    
+    def _start(self, domain_id: str, attempt: int) -> Dict:
+        if self._context.get_start_method() == 'fork':
+            # Return this process's connection to the pool before forking
+            db.session.remove()
+        
+        database_uri = current_app.config.get('SQLALCHEMY_DATABASE_URI') if has_app_context() else None
+        parent_conn, child_conn = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_domain_worker,
+            args=(domain_id, database_uri, self.memory_limit_mb, child_conn),
+            name=f"precompute-{domain_id}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        
+        logger.info(f"Started {domain_id} (attempt {attempt}, pid {process.pid})")
+        return {'process': process, 'conn': parent_conn, 'started': time.time(), 'attempt': attempt}
+    
+    @staticmethod
+    def _stop(job: Dict):
+        process = job['process']
+        if process.is_alive():
+            process.kill()
+        process.join(timeout=5)
+        job['conn'].close()
+    
+    def _poll(self, job: Dict) -> Optional[tuple]:
+        """Message from a finished job, or None while it is still running"""
+        conn, process = job['conn'], job['process']
+        
+        if conn.poll():
+            try:
+                return conn.recv()
+            except (EOFError, OSError):
+                pass
+        elif process.is_alive():
+            if time.time() - job['started'] > self.timeout:
+                return ('error', f"timed out after {self.timeout:.0f}s")
+            return None
+        
+        process.join(timeout=1)
+        return ('error', f"worker exited with code {process.exitcode}")
+    
+    def run(self, jobs: List) -> Dict:
+        """
+        Compute and store each (domain_id, input_hash) job.
+        
+        Returns:
+            {domain_id: {'status', 'duration', 'attempts', ...}}
+        """
+        pending = deque((domain_id, input_hash, 1) for domain_id, input_hash in jobs)
+        running = {}
+        results = {}
+        
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                domain_id, input_hash, attempt = pending.popleft()
+                job = self._start(domain_id, attempt)
+                job['input_hash'] = input_hash
+                running[domain_id] = job
+            
+            multiprocessing.connection.wait(
+                [job['conn'] for job in running.values()], timeout=POLL_INTERVAL_SECONDS
+            )
+            
+            for domain_id, job in list(running.items()):
+                message = self._poll(job)
+                if message is None:
+                    continue
+                
+                self._stop(job)
+                del running[domain_id]
+                attempt = job['attempt']
+                
+                if message[0] == 'success':
+                    _, payload, sample_size, duration = message
+                    results[domain_id] = self._store(domain_id, job['input_hash'], payload,
+                                                     sample_size, duration, attempt)
+                elif attempt <= self.retries:
+                    logger.warning(f"{domain_id} attempt {attempt} failed ({message[1]}), retrying")
+                    pending.append((domain_id, job['input_hash'], attempt + 1))
+                else:
+                    logger.error(f"Error computing {domain_id} stats: {message[1]}")
+                    results[domain_id] = {'status': 'error', 'error': message[1], 'attempts': attempt}
+        
+        return results
+    
+    def _store(self, domain_id: str, input_hash: str, payload: str, sample_size: int,
+               duration: float, attempt: int) -> Dict:
+        """Single writer: store a worker's result from this process"""
+        result = json.loads(payload)
+        if isinstance(result, dict):
+            result['input_hash'] = input_hash
+        if not self.analyzer._store_result(f"{domain_id}_analysis", result, sample_size, duration):
+            return {'status': 'error', 'error': f"could not store {domain_id} result",
+                    'attempts': attempt, 'input_hash': input_hash}
+        
+        logger.info(f"✓ {domain_id} statistics computed in {duration:.1f}s")
+        return {'status': 'success', 'duration': duration, 'attempts': attempt,
+                'input_hash': input_hash, 'result': result}
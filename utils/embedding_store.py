@@ -0,0 +1,279 @@
+"""
+Embedding Store - Persistent Text Embeddings and Nearest-Neighbour Index
+
+Stores text embeddings on disk keyed by encoder (model key) and a hash of the
+text, so vectors computed once survive restarts and are shared between worker
+processes through the page cache.
+
+Layout:
+    <root>/<model_slug>/meta.json     model key, dimension, dtype
+    <root>/<model_slug>/keys.txt      one text hash per line (row order)
+    <root>/<model_slug>/vectors.f32   float32 rows, memory-mapped read-only
+
+Shards are append-only: new vectors are appended under a file lock and other
+processes pick them up on their next lookup.
+
+EmbeddingIndex answers "most similar" queries over a matrix of embeddings,
+either exactly (one matrix-vector product) or approximately with random-
+hyperplane LSH followed by exact re-ranking of the candidates.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_DIR = Path(
+    os.environ.get('EMBEDDING_STORE_DIR')
+    or Path(__file__).parent.parent / 'data' / 'embeddings'
+)
+
+DTYPE = np.float32
+
+
+def text_hash(text: str) -> str:
+    """Stable 32-character hex digest of a text"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class _Shard:
+    """Vectors for one model key"""
+
+    def __init__(self, directory: Path, model_key: str):
+        self.directory = directory
+        self.model_key = model_key
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self.n_rows = 0
+        self._keys_offset = 0
+        self._vectors: Optional[np.memmap] = None
+        self._mapped_rows = 0
+
+    @property
+    def keys_path(self) -> Path:
+        return self.directory / 'keys.txt'
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.directory / 'vectors.f32'
+
+    def refresh(self):
+        """Pick up rows appended since the last refresh (by any process)"""
+        if self.dim is None and (self.directory / 'meta.json').exists():
+            with open(self.directory / 'meta.json', encoding='utf-8') as f:
+                self.dim = json.load(f)['dim']
+        if self.dim is None or not self.keys_path.exists():
+            return
+        if self.keys_path.stat().st_size == self._keys_offset:
+            return
+
+        # Only rows whose vector bytes are fully written count
+        complete_rows = self.vectors_path.stat().st_size // (self.dim * DTYPE().itemsize)
+        with open(self.keys_path, 'rb') as f:
+            f.seek(self._keys_offset)
+            for line in f:
+                if not line.endswith(b'\n') or self.n_rows >= complete_rows:
+                    break
+                self.rows.setdefault(line[:-1].decode('ascii'), self.n_rows)
+                self.n_rows += 1
+                self._keys_offset += len(line)
+
+    def vectors(self) -> np.ndarray:
+        """Read-only view of all stored rows"""
+        n = self.n_rows
+        if self._vectors is None or self._mapped_rows != n:
+            if n == 0:
+                return np.empty((0, self.dim or 0), dtype=DTYPE)
+            self._vectors = np.memmap(self.vectors_path, dtype=DTYPE, mode='r', shape=(n, self.dim))
+            self._mapped_rows = n
+        return self._vectors
+
+    @staticmethod
+    def _truncate(path: Path, size: int):
+        if path.exists() and path.stat().st_size > size:
+            os.truncate(path, size)
+
+    def append(self, hashes: List[str], matrix: np.ndarray):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.refresh()
+        if self.dim is None:
+            self.dim = int(matrix.shape[1])
+            tmp = self.directory / f'.meta-{os.getpid()}.json'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'model_key': self.model_key, 'dim': self.dim, 'dtype': 'float32'}, f)
+            os.replace(tmp, self.directory / 'meta.json')
+        elif matrix.shape[1] != self.dim:
+            raise ValueError(f"Embedding dimension {matrix.shape[1]} does not match "
+                             f"store dimension {self.dim} for {self.model_key}")
+
+        with open(self.directory / '.lock', 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self.refresh()
+            # A writer that died between its two writes leaves vector bytes
+            # (or a partial key line) past the last committed row; drop them
+            # so row i of keys.txt stays row i of vectors.f32
+            self._truncate(self.vectors_path, self.n_rows * self.dim * DTYPE().itemsize)
+            self._truncate(self.keys_path, self._keys_offset)
+            new = {}
+            for h, row in zip(hashes, matrix):
+                if h not in self.rows:
+                    new.setdefault(h, row)
+            new = list(new.items())
+            if not new:
+                return
+            # Vectors first: a row is only visible once its key line exists
+            with open(self.vectors_path, 'ab') as f:
+                f.write(np.ascontiguousarray([row for _, row in new], dtype=DTYPE).tobytes())
+            with open(self.keys_path, 'ab') as f:
+                f.write(''.join(h + '\n' for h, _ in new).encode('ascii'))
+            self.refresh()
+
+
+class EmbeddingStore:
+    """On-disk embedding store keyed by (model key, text hash)"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else DEFAULT_EMBEDDING_DIR
+        self._shards: Dict[str, _Shard] = {}
+
+    @staticmethod
+    def _slug(model_key: str) -> str:
+        readable = re.sub(r'[^A-Za-z0-9._-]+', '_', model_key)[:48]
+        return f"{readable}-{hashlib.sha256(model_key.encode('utf-8')).hexdigest()[:8]}"
+
+    def _shard(self, model_key: str) -> _Shard:
+        shard = self._shards.get(model_key)
+        if shard is None:
+            shard = _Shard(self.root / self._slug(model_key), model_key)
+            self._shards[model_key] = shard
+        shard.refresh()
+        return shard
+
+    def get(self, model_key: str, text: str) -> Optional[np.ndarray]:
+        """Stored embedding for one text, or None"""
+        return self.get_many(model_key, [text])[0]
+
+    def get_many(self, model_key: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Stored embeddings for several texts (None where missing)"""
+        shard = self._shard(model_key)
+        if not shard.rows:
+            return [None] * len(texts)
+        vectors = shard.vectors()
+        rows = [shard.rows.get(text_hash(text)) for text in texts]
+        return [np.array(vectors[row]) if row is not None else None for row in rows]
+
+    def put(self, model_key: str, text: str, embedding: np.ndarray):
+        """Store one embedding"""
+        self.put_many(model_key, [text], [embedding])
+
+    def put_many(self, model_key: str, texts: Sequence[str], embeddings: Sequence[np.ndarray]):
+        """
+        Store embeddings for texts (already-stored texts are skipped)
+
+        Write failures (read-only deployments) are logged, not raised; callers
+        still have the computed vectors.
+        """
+        if not texts:
+            return
+        try:
+            self._shard(model_key).append(
+                [text_hash(text) for text in texts],
+                np.asarray(embeddings, dtype=DTYPE).reshape(len(texts), -1)
+            )
+        except OSError as e:
+            logger.warning(f"Could not store embeddings for {model_key}: {e}")
+
+    def count(self, model_key: str) -> int:
+        """Number of stored embeddings for a model key"""
+        return len(self._shard(model_key).rows)
+
+
+class EmbeddingIndex:
+    """
+    Nearest-neighbour index over embeddings (cosine similarity)
+
+    Exact mode scores every row. Approximate mode hashes rows into buckets
+    with n_tables random-hyperplane LSH tables of n_bits each, and re-ranks
+    only the rows that share a bucket with the query (falling back to exact
+    search when fewer than k candidates are found).
+    """
+
+    def __init__(self, embeddings: np.ndarray, labels: Sequence, approximate: bool = False,
+                 n_bits: int = 12, n_tables: int = 8, seed: int = 42):
+        embeddings = np.asarray(embeddings, dtype=DTYPE)
+        if embeddings.ndim != 2 or len(embeddings) != len(labels):
+            raise ValueError("embeddings must be a 2-D array with one row per label")
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self.vectors = embeddings / np.where(norms == 0, 1, norms)
+        self.labels = list(labels)
+        self.approximate = approximate
+
+        self._planes = None
+        self._tables: List[Dict[int, np.ndarray]] = []
+        if approximate and len(self.labels):
+            rng = np.random.default_rng(seed)
+            self._planes = rng.standard_normal((n_tables, embeddings.shape[1], n_bits)).astype(DTYPE)
+            self._weights = 1 << np.arange(n_bits, dtype=np.int64)
+            for codes in self._codes(self.vectors).T:
+                order = np.argsort(codes, kind='stable')
+                bucket_codes, starts = np.unique(codes[order], return_index=True)
+                self._tables.append(dict(zip(bucket_codes.tolist(), np.split(order, starts[1:]))))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _codes(self, vectors: np.ndarray) -> np.ndarray:
+        """(n, n_tables) bucket codes"""
+        bits = np.einsum('nd,tdb->ntb', vectors, self._planes) > 0
+        return bits.astype(np.int64) @ self._weights
+
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        codes = self._codes(query[None, :])[0]
+        parts = [table.get(int(code)) for table, code in zip(self._tables, codes)]
+        parts = [part for part in parts if part is not None]
+        return np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+    def query(self, embedding: np.ndarray, k: int = 5) -> List[Tuple[object, float]]:
+        """
+        Most similar rows to an embedding
+
+        Returns:
+            [(label, cosine similarity), ...] best first
+        """
+        query = np.asarray(embedding, dtype=DTYPE).ravel()
+        norm = np.linalg.norm(query)
+        if norm == 0 or not self.labels:
+            return []
+        query = query / norm
+
+        candidates = None
+        if self.approximate:
+            candidates = self._candidates(query)
+            if len(candidates) < k:
+                candidates = None
+
+        if candidates is None:
+            scores = self.vectors @ query
+            rows = np.arange(len(scores))
+        else:
+            scores = self.vectors[candidates] @ query
+            rows = candidates
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.labels[rows[i]], float(scores[i])) for i in top]
@@ -0,0 +1,132 @@
+"""
+Explanation Cache - Persistent Per-Row Model Explanations
+
+Stores explanation results (SHAP attributions, LIME weights, permutation
+importances) in a SQLite file so an explanation is computed once per
+(method, model fingerprint, background data, parameters, feature vector) and
+served from disk afterwards, across restarts and worker processes.
+
+Keys:
+    context  - hash of method, model fingerprint, background fingerprint and
+               explanation parameters (see context_key)
+    row      - hash of the feature vector's float64 bytes (see row_key)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get('EXPLANATION_CACHE_PATH')
+    or Path(__file__).parent.parent / 'data' / 'explanations' / 'cache.sqlite'
+)
+
+
+def row_key(row: np.ndarray) -> str:
+    """Stable hash of one feature vector"""
+    row = np.ascontiguousarray(row, dtype=np.float64).ravel()
+    return hashlib.blake2b(row.tobytes(), digest_size=16).hexdigest()
+
+
+def context_key(*parts: Any) -> str:
+    """Stable hash of JSON-serializable explanation context"""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:24]
+
+
+class ExplanationCache:
+    """SQLite-backed cache of explanation results keyed by (context, row)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self._local = threading.local()
+        self._disabled = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=30)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS explanations ('
+                    'context TEXT NOT NULL, row TEXT NOT NULL, result TEXT NOT NULL, '
+                    'PRIMARY KEY (context, row))'
+                )
+                conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                # Read-only deployments still explain; they just don't persist
+                logger.warning(f"Explanation cache disabled ({self.path}): {e}")
+                self._disabled = True
+                return None
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, context: str, rows: Iterable[str]) -> Dict[str, Any]:
+        """Cached results for row keys (missing keys are absent)"""
+        rows = list(dict.fromkeys(rows))
+        conn = self._connection()
+        if conn is None or not rows:
+            return {}
+
+        found = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(rows), 500):
+            chunk = rows[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(
+                f'SELECT row, result FROM explanations WHERE context = ? AND row IN ({placeholders})',
+                [context] + chunk
+            )
+            found.update((row, json.loads(result)) for row, result in cursor)
+        return found
+
+    def put_many(self, context: str, results: Dict[str, Any]):
+        """Store results by row key"""
+        conn = self._connection()
+        if conn is None or not results:
+            return
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO explanations (context, row, result) VALUES (?, ?, ?)',
+                [(context, row, json.dumps(result)) for row, result in results.items()]
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store explanations: {e}")
+
+    def get(self, context: str, row: str) -> Optional[Any]:
+        return self.get_many(context, [row]).get(row)
+
+    def put(self, context: str, row: str, result: Any):
+        self.put_many(context, {row: result})
+
+    def clear(self, context: Optional[str] = None) -> int:
+        """Delete cached results (one context or all); returns rows removed"""
+        conn = self._connection()
+        if conn is None:
+            return 0
+        if context is None:
+            cursor = conn.execute('DELETE FROM explanations')
+        else:
+            cursor = conn.execute('DELETE FROM explanations WHERE context = ?', (context,))
+        conn.commit()
+        return cursor.rowcount
+
+    def count(self) -> int:
+        conn = self._connection()
+        if conn is None:
+            return 0
+        return conn.execute('SELECT COUNT(*) FROM explanations').fetchone()[0]
@@ -0,0 +1,145 @@
+"""
+Lexicon Matcher - Compiled Multi-Pattern Substring Matching
+
+Aho-Corasick automaton over a set of categorized word lists. Replaces scans of
+the form `any(word in text for word in words)` or `for term in index: if term
+in text` with a single pass over the text, so per-text cost depends on the text
+length rather than the size of the lexicon.
+
+Substring semantics are preserved exactly: a term "matches" when `term in text`
+would be True (overlapping and nested occurrences included), and counts are the
+number of lexicon entries present, not the number of occurrences.
+"""
+
+import logging
+from typing import Dict, Hashable, Iterable, List, Mapping, Set
+
+logger = logging.getLogger(__name__)
+
+_MATCHER_CACHE: Dict[tuple, 'LexiconMatcher'] = {}
+
+
+class LexiconMatcher:
+    """Aho-Corasick automaton answering per-category substring hits in one pass"""
+
+    def __init__(self, lexicons: Mapping[Hashable, Iterable[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            lexicons: Mapping of category -> terms. A term may appear in several
+                categories; duplicate entries within a category are counted
+                the same way a list scan would count them.
+        """
+        self.categories_order = list(lexicons.keys())
+
+        self.terms: List[str] = []
+        term_ids: Dict[str, int] = {}
+        # term id -> {category: number of entries}
+        self._term_categories: List[Dict[Hashable, int]] = []
+
+        for category, terms in lexicons.items():
+            for term in terms:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = len(self.terms)
+                    term_ids[term] = term_id
+                    self.terms.append(term)
+                    self._term_categories.append({})
+                entry = self._term_categories[term_id]
+                entry[category] = entry.get(category, 0) + 1
+
+        self._build(term_ids)
+
+    @classmethod
+    def compile(cls, lexicons: Mapping[Hashable, Iterable[str]]) -> 'LexiconMatcher':
+        """
+        Shared matcher for a lexicon, built once per process.
+
+        Analyzers instantiated repeatedly (or different analyzers using the same
+        word lists) get the same compiled automaton back.
+        """
+        key = tuple((category, tuple(terms)) for category, terms in lexicons.items())
+        matcher = _MATCHER_CACHE.get(key)
+        if matcher is None:
+            matcher = cls(dict(key))
+            _MATCHER_CACHE[key] = matcher
+        return matcher
+
+    def _build(self, term_ids: Dict[str, int]):
+        """Construct goto, failure and output tables."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        # The empty string is a substring of every text
+        self._always = [term_ids['']] if '' in term_ids else []
+
+        for term, term_id in term_ids.items():
+            if not term:
+                continue
+            state = 0
+            for ch in term:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(term_id)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(ch, 0)
+                # BFS order guarantees the failure state's outputs are complete
+                outputs[child].extend(outputs[fail[child]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(out) for out in outputs]
+
+    def _scan(self, text: str) -> Set[int]:
+        """Ids of all distinct terms occurring in text."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = set(self._always)
+        state = 0
+
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+
+        return found
+
+    def find(self, text: str) -> List[str]:
+        """Distinct terms present in text, in lexicon order."""
+        return [self.terms[term_id] for term_id in sorted(self._scan(text))]
+
+    def categories(self, text: str) -> Set[Hashable]:
+        """Categories with at least one term present in text."""
+        hits = set()
+        for term_id in self._scan(text):
+            hits.update(self._term_categories[term_id])
+        return hits
+
+    def count(self, text: str) -> Dict[Hashable, int]:
+        """
+        Number of lexicon entries present in text for every category.
+
+        Equivalent to `sum(1 for term in terms if term in text)` per category.
+        """
+        counts = dict.fromkeys(self.categories_order, 0)
+        for term_id in self._scan(text):
+            for category, n in self._term_categories[term_id].items():
+                counts[category] += n
+        return counts
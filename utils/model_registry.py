@@ -0,0 +1,227 @@
+"""
+Model Registry - Persistent Fitted-Model Store
+
+Stores fitted models, scalers and feature-name lists on disk, keyed by model
+name and a fingerprint of the training data. Models are fitted out of band
+(after a collector run, or scripts/train_models.py); request-serving workers
+only load the newest registered version. Training holds a per-model file lock,
+so concurrent trainers fit a version once and the others load it.
+
+Layout:
+    <root>/<model_name>/<fingerprint>/artifacts.joblib   fitted objects
+    <root>/<model_name>/<fingerprint>/metadata.json      feature names, scores, etc.
+    <root>/<model_name>/current.json                     most recently saved fingerprint
+    <root>/<model_name>/.train.lock                      held while training
+
+Artifacts are written uncompressed so NumPy arrays can be memory-mapped
+read-only on load and shared between workers through the page cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process training lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_DIR = Path(
+    os.environ.get('MODEL_REGISTRY_DIR')
+    or Path(__file__).parent.parent / 'data' / 'models'
+)
+
+
+class ModelRegistry:
+    """On-disk registry of fitted models keyed by training-data fingerprint"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else DEFAULT_REGISTRY_DIR
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> str:
+        """
+        Stable hash of training-data descriptors
+
+        Args:
+            parts: JSON-serializable values, NumPy arrays or pandas objects
+                (e.g. aggregate query results, a model version string)
+
+        Returns:
+            16-character hex digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, np.ndarray):
+                digest.update(np.ascontiguousarray(part).tobytes())
+            elif hasattr(part, 'columns'):
+                import pandas as pd
+                digest.update(','.join(map(str, part.columns)).encode())
+                digest.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+            else:
+                digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+            digest.update(b'\x00')
+        return digest.hexdigest()[:16]
+
+    def _model_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def load(self, name: str, fingerprint: str, mmap: bool = True) -> Optional[Dict]:
+        """
+        Load artifacts saved for an exact data fingerprint
+
+        Returns:
+            {'artifacts': ..., 'metadata': ...} or None if not registered
+        """
+        version_dir = self._model_dir(name) / fingerprint
+        artifacts_path = version_dir / 'artifacts.joblib'
+        if not artifacts_path.exists():
+            return None
+
+        try:
+            artifacts = joblib.load(artifacts_path, mmap_mode='r' if mmap else None)
+            with open(version_dir / 'metadata.json', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load registered model {name}/{fingerprint}: {e}")
+            return None
+
+        logger.info(f"Loaded registered model {name}/{fingerprint}")
+        return {'artifacts': artifacts, 'metadata': metadata}
+
+    def current_fingerprint(self, name: str) -> Optional[str]:
+        """Fingerprint of the most recently saved version, or None"""
+        pointer = self._model_dir(name) / 'current.json'
+        if not pointer.exists():
+            return None
+        try:
+            with open(pointer, encoding='utf-8') as f:
+                return json.load(f)['fingerprint']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def load_current(self, name: str, mmap: bool = True) -> Optional[Dict]:
+        """Load the most recently saved version (no database access needed)"""
+        fingerprint = self.current_fingerprint(name)
+        if fingerprint is None:
+            return None
+        return self.load(name, fingerprint, mmap=mmap)
+
+    def save(self, name: str, fingerprint: str, artifacts: Dict, metadata: Dict) -> Path:
+        """
+        Register fitted artifacts for a data fingerprint
+
+        Writes to a temporary directory and renames it into place, so workers
+        never observe a partially written version. If another process saved
+        the same version first, its copy is kept.
+
+        Returns:
+            Version directory
+        """
+        model_dir = self._model_dir(name)
+        model_dir.mkdir(parents=True, exist_ok=True)
+        version_dir = model_dir / fingerprint
+
+        metadata = dict(metadata)
+        metadata.update({
+            'model_name': name,
+            'fingerprint': fingerprint,
+            'saved_at': datetime.utcnow().isoformat(),
+        })
+
+        if not version_dir.exists():
+            staging = Path(tempfile.mkdtemp(prefix=f'.{fingerprint}-', dir=model_dir))
+            try:
+                joblib.dump(artifacts, staging / 'artifacts.joblib')
+                with open(staging / 'metadata.json', 'w', encoding='utf-8') as f:
+                    json.dump(metadata, f, indent=2, default=str)
+                os.replace(staging, version_dir)
+            except OSError:
+                if not version_dir.exists():
+                    raise
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+        pointer_tmp = model_dir / f'.current-{os.getpid()}.json'
+        with open(pointer_tmp, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'saved_at': metadata['saved_at']}, f)
+        os.replace(pointer_tmp, model_dir / 'current.json')
+
+        logger.info(f"Registered model {name}/{fingerprint}")
+        return version_dir
+
+    def get_or_train(self, name: str, fingerprint: str,
+                     train_fn: Callable[[], Tuple[Dict, Dict]]) -> Dict:
+        """
+        Load a registered version or train and register it
+
+        Training runs under a per-model file lock. A process that waited on
+        the lock re-checks the registry and loads the version the lock holder
+        saved instead of fitting it again.
+
+        Args:
+            name: Model name
+            fingerprint: Training-data fingerprint
+            train_fn: Returns (artifacts, metadata) when the version is missing
+
+        Returns:
+            {'artifacts': ..., 'metadata': ..., 'trained': bool}
+        """
+        loaded = self.load(name, fingerprint)
+        if loaded is not None:
+            loaded['trained'] = False
+            return loaded
+
+        model_dir = self._model_dir(name)
+        try:
+            model_dir.mkdir(parents=True, exist_ok=True)
+            lock = open(model_dir / '.train.lock', 'w')
+        except OSError as e:
+            # Read-only deployments still work; they just retrain per process
+            logger.warning(f"Could not lock model {name} for training: {e}")
+            lock = None
+
+        try:
+            if lock is not None and fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                loaded = self.load(name, fingerprint)
+                if loaded is not None:
+                    loaded['trained'] = False
+                    return loaded
+
+            artifacts, metadata = train_fn()
+            try:
+                self.save(name, fingerprint, artifacts, metadata)
+            except OSError as e:
+                logger.warning(f"Could not register model {name}/{fingerprint}: {e}")
+        finally:
+            if lock is not None:
+                lock.close()
+
+        return {'artifacts': artifacts, 'metadata': metadata, 'trained': True}
+
+    def prune(self, name: str, keep: int = 3) -> int:
+        """Delete all but the newest `keep` versions; returns number removed"""
+        model_dir = self._model_dir(name)
+        if not model_dir.exists():
+            return 0
+
+        versions = sorted(
+            (path for path in model_dir.iterdir() if path.is_dir() and not path.name.startswith('.')),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        for path in versions[keep:]:
+            shutil.rmtree(path, ignore_errors=True)
+        return max(0, len(versions) - keep)
@@ -1,15 +1,218 @@
 """
 Portfolio Optimization Engine
 Modern Portfolio Theory implementation for name-based diversification
+
+Returns for all requested assets are loaded with one query into a daily
+return matrix. Expected returns are the trailing 1-year changes; risk is a
+Ledoit-Wolf shrinkage covariance of daily returns (annualized). The
+box-constrained efficient frontier is traced exactly with the critical line
+algorithm, so frontier, minimum-variance and maximum-Sharpe portfolios are
+deterministic and need no sampling.
 """
 
 import numpy as np
-from core.models import Cryptocurrency, NameAnalysis, PriceHistory
+import pandas as pd
+from scipy.optimize import minimize
+from sklearn.covariance import ledoit_wolf
+from sqlalchemy import type_coerce
+from core.models import db, Cryptocurrency, NameAnalysis, PriceHistory
 from analyzers.confidence_scorer import ConfidenceScorer
 import logging
 
 logger = logging.getLogger(__name__)
 
+TRADING_DAYS = 365  # crypto trades every day
+LOOKBACK_DAYS = 365
+MIN_RETURN_OBSERVATIONS = 30
+MIN_VOLATILITY = 0.01
+
+
+def _critical_line(returns, cov, lower, upper, tol=1e-12):
+    """
+    Turning points of the box-constrained efficient frontier (critical line algorithm)
+    
+    Traces the solutions of  min 1/2 w'cov w - lam * returns'w  subject to
+    sum(w) = 1 and lower <= w <= upper as lam falls from infinity (maximum
+    return) to 0 (minimum variance). Between turning points the weights are
+    linear in lam, and hence in the portfolio return, so the turning points
+    describe the whole frontier exactly.
+    
+    Args:
+        returns: (n,) expected returns
+        cov: (n, n) positive definite covariance
+        lower, upper: (n,) weight bounds with sum(lower) <= 1 <= sum(upper)
+    
+    Returns:
+        (k, n) weights of the turning points, highest return first
+    """
+    n = len(returns)
+    
+    # lam = infinity: fill the highest-return assets first; the asset that
+    # takes the remainder is the one free weight
+    weights = np.asarray(lower, dtype=float).copy()
+    remaining = 1.0 - weights.sum()
+    free = []
+    for idx in np.argsort(-returns, kind='stable'):
+        add = min(upper[idx] - weights[idx], remaining)
+        weights[idx] += add
+        remaining -= add
+        if remaining <= tol:
+            free = [int(idx)]
+            break
+    if not free:
+        return weights[None, :]
+    
+    # Inverse of cov restricted to the free assets, updated as assets enter/leave
+    inv = np.array([[1.0 / cov[free[0], free[0]]]])
+    turning_points = [weights.copy()]
+    lam = np.inf
+    # The last event, which may not be undone at the same lam: an asset that
+    # just entered cannot hit the bound it left, one that just left cannot re-enter
+    entered, entered_at_lower, left = None, False, None
+    
+    for _ in range(10 * n + 10):
+        F = np.array(free)
+        is_free = np.zeros(n, dtype=bool)
+        is_free[F] = True
+        bound = ~is_free
+        
+        # Free weights and the budget multiplier are affine in lam:
+        # w = w0 + lam * w1, gamma = gamma[0] + lam * gamma[1]
+        fixed = np.where(bound, weights, 0.0)
+        inv_rhs = inv @ np.column_stack([-cov[F] @ fixed, returns[F]])
+        inv_ones = inv.sum(axis=1)
+        gamma = (np.array([1.0 - fixed.sum(), 0.0]) - inv_rhs.sum(axis=0)) / inv_ones.sum()
+        solution = inv_rhs + np.outer(inv_ones, gamma)
+        
+        w0 = fixed
+        w1 = np.zeros(n)
+        w0[F] = solution[:, 0]
+        w1[F] = solution[:, 1]
+        
+        candidates = np.full(n, -np.inf)
+        
+        # A bound weight's multiplier changes sign (it wants to move inward)
+        g0 = cov @ w0 - gamma[0]
+        g1 = cov @ w1 - returns - gamma[1]
+        at_lower = weights <= lower + tol
+        entering = bound & (np.abs(g1) > tol) & ((g1 > 0) == at_lower)
+        candidates[entering] = -g0[entering] / g1[entering]
+        candidates[candidates >= lam] = -np.inf
+        if left is not None:
+            candidates[left] = -np.inf
+        
+        # A free weight reaches a bound (at once if it already sits on the
+        # bound it is moving past); lam decreasing moves w by -w1
+        slope = w1[F]
+        moving = np.abs(slope) > tol
+        to_lower = slope > 0
+        target = np.where(to_lower, lower[F], upper[F])
+        hits = np.full(len(F), -np.inf)
+        hits[moving] = np.minimum((target[moving] - w0[F][moving]) / slope[moving], lam)
+        if entered is not None:
+            hits[(F == entered) & (to_lower == entered_at_lower)] = -np.inf
+        candidates[F] = hits
+        
+        candidates[candidates <= 0] = -np.inf
+        
+        idx = int(np.argmax(candidates))
+        if not np.isfinite(candidates[idx]):
+            # No more events before lam = 0: minimum variance
+            turning_points.append(np.clip(w0, lower, upper))
+            break
+        
+        # Rounding can put an event fractionally outside (0, lam]
+        lam = min(candidates[idx], lam)
+        weights = np.clip(w0 + lam * w1, lower, upper)
+        if is_free[idx]:
+            weights[idx] = lower[idx] if w1[idx] > 0 else upper[idx]
+            entered, left = None, idx
+            position = free.index(idx)
+            keep = np.arange(len(free)) != position
+            inv = (inv[np.ix_(keep, keep)]
+                   - np.outer(inv[keep, position], inv[position, keep]) / inv[position, position])
+            free.pop(position)
+        else:
+            column = cov[F, idx]
+            u = inv @ column
+            schur = cov[idx, idx] - column @ u
+            k = len(free)
+            grown = np.empty((k + 1, k + 1))
+            grown[:k, :k] = inv + np.outer(u, u) / schur
+            grown[:k, k] = grown[k, :k] = -u / schur
+            grown[k, k] = 1.0 / schur
+            inv = grown
+            free.append(idx)
+            entered, entered_at_lower, left = idx, bool(at_lower[idx]), None
+        turning_points.append(weights.copy())
+    
+    return np.array(turning_points)
+
+
+def _frontier_at(turning_points, returns, targets):
+    """Frontier weights for target returns, interpolated between turning points"""
+    if len(turning_points) == 1:
+        return np.repeat(turning_points, len(targets), axis=0)
+    
+    # Walk the turning points from minimum variance up so returns increase
+    points = turning_points[::-1]
+    levels = points @ returns
+    targets = np.clip(targets, levels[0], levels[-1])
+    
+    upper_idx = np.clip(np.searchsorted(levels, targets), 1, len(levels) - 1)
+    lower_idx = upper_idx - 1
+    span = levels[upper_idx] - levels[lower_idx]
+    fraction = np.divide(targets - levels[lower_idx], span, out=np.zeros_like(targets), where=span > 0)
+    return points[lower_idx] + fraction[:, None] * (points[upper_idx] - points[lower_idx])
+
+
+def _max_sharpe(turning_points, returns, cov, lower, upper):
+    """
+    Maximum Sharpe ratio (risk-free rate 0) portfolio within the bounds
+    
+    When some portfolio has a positive return the optimum lies on the
+    efficient frontier. Along each segment w = a + t (b - a), the ratio
+    (p + q t) / sqrt(A + 2Bt + Ct^2) has a single stationary point, so each
+    segment is checked in closed form.
+    
+    When every portfolio loses money the best ratio takes on more risk, off
+    the frontier, and the problem is no longer convex; SLSQP is then started
+    from each turning point and from equal weights, and the best local
+    optimum kept.
+    """
+    best_weights, best_sharpe = turning_points[0], -np.inf
+    
+    def consider(weights):
+        nonlocal best_weights, best_sharpe
+        variance = weights @ cov @ weights
+        if variance > 0 and weights @ returns / np.sqrt(variance) > best_sharpe:
+            best_weights, best_sharpe = weights, weights @ returns / np.sqrt(variance)
+    
+    for start, end in zip(turning_points[:-1], turning_points[1:]):
+        consider(start)
+        step = end - start
+        p, q = start @ returns, step @ returns
+        A, B, C = start @ cov @ start, start @ cov @ step, step @ cov @ step
+        denominator = q * B - p * C
+        if denominator != 0:
+            t = (p * B - q * A) / denominator
+            if 0 < t < 1:
+                consider(start + t * step)
+    consider(turning_points[-1])
+    
+    if best_sharpe <= 0:
+        constraints = [{'type': 'eq', 'fun': lambda w: w.sum() - 1.0}]
+        equal = np.clip(np.full(len(returns), 1.0 / len(returns)), lower, upper)
+        for start in [*turning_points, equal]:
+            result = minimize(
+                lambda w: -(w @ returns) / np.sqrt(max(w @ cov @ w, 1e-18)), start,
+                method='SLSQP', bounds=list(zip(lower, upper)), constraints=constraints,
+                options={'ftol': 1e-12, 'maxiter': 200}
+            )
+            if result.success:
+                consider(np.clip(result.x, lower, upper))
+    return best_weights
+
 
 class PortfolioOptimizer:
     """Optimize cryptocurrency portfolios based on name metrics and performance"""
@@ -34,27 +237,19 @@ class PortfolioOptimizer:
             
             constraints = constraints or {'min_weight': 0.05, 'max_weight': 0.40}
             
-            # Get returns for each crypto
-            returns = []
-            valid_ids = []
-            
-            for crypto_id in crypto_ids:
-                price_data = PriceHistory.query.filter_by(crypto_id=crypto_id).first()
-                if price_data and price_data.price_1yr_change is not None:
-                    returns.append(price_data.price_1yr_change / 100)
-                    valid_ids.append(crypto_id)
+            # Get returns and covariance for all cryptos in one query
+            valid_ids, returns_array, cov = self.load_returns(crypto_ids)
             
             if len(valid_ids) < 2:
                 return None
             
-            returns_array = np.array(returns)
             n_assets = len(valid_ids)
             
             # Optimization
             if objective == 'sharpe':
-                weights = self._optimize_sharpe(returns_array, constraints)
+                weights = self._optimize_sharpe(returns_array, constraints, cov)
             elif objective == 'min_variance':
-                weights = self._minimize_variance(returns_array, constraints)
+                weights = self._minimize_variance(returns_array, constraints, cov)
             elif objective == 'max_return':
                 weights = self._maximize_return(returns_array, constraints)
             else:
@@ -62,21 +257,21 @@ class PortfolioOptimizer:
                 weights = np.ones(n_assets) / n_assets
             
             # Calculate portfolio metrics
-            portfolio_return = np.dot(weights, returns_array)
-            portfolio_variance = np.dot(weights**2, returns_array**2)  # Simplified
-            portfolio_volatility = np.sqrt(portfolio_variance)
-            sharpe_ratio = portfolio_return / portfolio_volatility if portfolio_volatility > 0 else 0
+            portfolio_return, portfolio_volatility, sharpe_ratio = self._portfolio_metrics(
+                weights, returns_array, cov
+            )
             
             # Format output
+            cryptos = self._cryptos_by_id(valid_ids)
             allocations = []
             for crypto_id, weight in zip(valid_ids, weights):
-                crypto = Cryptocurrency.query.get(crypto_id)
+                crypto = cryptos.get(crypto_id)
                 allocations.append({
                     'crypto_id': crypto_id,
                     'name': crypto.name if crypto else 'Unknown',
                     'symbol': crypto.symbol if crypto else '',
-                    'weight': round(weight, 4),
-                    'weight_percent': round(weight * 100, 2)
+                    'weight': round(float(weight), 4),
+                    'weight_percent': round(float(weight) * 100, 2)
                 })
             
             return {
@@ -94,38 +289,112 @@ class PortfolioOptimizer:
             logger.error(f"Portfolio optimization error: {e}")
             return None
     
-    def _optimize_sharpe(self, returns, constraints):
-        """Optimize for maximum Sharpe ratio"""
-        n_assets = len(returns)
+    def load_returns(self, crypto_ids, lookback_days=LOOKBACK_DAYS):
+        """
+        Expected returns and shrinkage covariance for a set of cryptos
         
-        # Simplified optimization - weight by returns with constraints
-        positive_returns = np.maximum(returns, 0.01)  # Avoid division by zero
-        raw_weights = positive_returns / positive_returns.sum()
+        One query loads every price row for the requested ids. Expected
+        returns are each asset's latest 1-year change. The covariance is a
+        Ledoit-Wolf estimate over daily returns in the last lookback_days,
+        annualized; assets with fewer than MIN_RETURN_OBSERVATIONS returns
+        fall back to |1-year change| as volatility, uncorrelated with the rest.
         
-        # Apply constraints
-        min_w = constraints.get('min_weight', 0.05)
-        max_w = constraints.get('max_weight', 0.40)
+        Args:
+            crypto_ids: Cryptocurrency IDs (order is preserved)
+            lookback_days: Covariance window
         
-        weights = np.clip(raw_weights, min_w, max_w)
-        weights = weights / weights.sum()  # Normalize
+        Returns: (valid_ids, expected_returns, covariance)
+        """
+        crypto_ids = list(dict.fromkeys(crypto_ids))
+        query = db.session.query(
+            PriceHistory.crypto_id,
+            # Raw driver value: per-row date conversion dominates the load on SQLite
+            type_coerce(PriceHistory.date, db.String).label('date'),
+            PriceHistory.price,
+            PriceHistory.price_1yr_change
+        ).filter(
+            PriceHistory.crypto_id.in_(crypto_ids)
+        ).order_by(PriceHistory.date)
+        frame = pd.read_sql(query.statement, db.session.connection())
         
-        return weights
-    
-    def _minimize_variance(self, returns, constraints):
-        """Minimize portfolio variance (equal weight with constraints)"""
-        n_assets = len(returns)
+        if frame.empty:
+            return [], np.empty(0), np.empty((0, 0))
         
-        # Start with equal weights
-        weights = np.ones(n_assets) / n_assets
+        latest_change = frame.dropna(subset=['price_1yr_change']).groupby('crypto_id')['price_1yr_change'].last()
         
-        # Apply constraints
-        min_w = constraints.get('min_weight', 0.05)
-        max_w = constraints.get('max_weight', 0.40)
+        valid_ids = [crypto_id for crypto_id in crypto_ids if crypto_id in latest_change.index]
+        if not valid_ids:
+            return [], np.empty(0), np.empty((0, 0))
         
-        weights = np.clip(weights, min_w, max_w)
-        weights = weights / weights.sum()
+        returns = latest_change.loc[valid_ids].to_numpy(dtype=float) / 100
         
-        return weights
+        cov = self._diagonal_risk(returns)
+        
+        frame = frame[frame['crypto_id'].isin(valid_ids)].assign(date=lambda f: pd.to_datetime(f['date']))
+        start = frame['date'].max() - pd.Timedelta(days=lookback_days)
+        prices = frame[frame['date'] > start].pivot_table(
+            index='date', columns='crypto_id', values='price', aggfunc='last'
+        ).sort_index().ffill()
+        
+        daily = prices.pct_change(fill_method=None).iloc[1:].replace([np.inf, -np.inf], np.nan)
+        counts = daily.notna().sum()
+        history_ids = [crypto_id for crypto_id in valid_ids
+                       if counts.get(crypto_id, 0) >= MIN_RETURN_OBSERVATIONS]
+        
+        if history_ids:
+            # Days before an asset's first price count as flat
+            matrix = daily[history_ids].fillna(0.0).to_numpy()
+            shrunk, _ = ledoit_wolf(matrix)
+            positions = [valid_ids.index(crypto_id) for crypto_id in history_ids]
+            cov[np.ix_(positions, positions)] = shrunk * TRADING_DAYS
+        
+        return valid_ids, returns, cov
+    
+    @staticmethod
+    def _diagonal_risk(returns):
+        """Fallback covariance: |1-year change| as volatility, no correlation"""
+        return np.diag(np.maximum(np.abs(returns), MIN_VOLATILITY) ** 2)
+    
+    @staticmethod
+    def _bounds(n_assets, constraints):
+        """Weight bounds, relaxed just enough to be feasible for n_assets"""
+        min_w = constraints.get('min_weight', 0.05)
+        max_w = constraints.get('max_weight', 0.40)
+        lower = np.full(n_assets, min(min_w, 1.0 / n_assets))
+        upper = np.full(n_assets, max(max_w, 1.0 / n_assets))
+        return lower, upper
+    
+    @staticmethod
+    def _portfolio_metrics(weights, returns, cov):
+        """(return, volatility, Sharpe ratio) of a weight vector"""
+        portfolio_return = float(weights @ returns)
+        portfolio_volatility = float(np.sqrt(max(weights @ cov @ weights, 0.0)))
+        sharpe = portfolio_return / portfolio_volatility if portfolio_volatility > 0 else 0
+        return portfolio_return, portfolio_volatility, sharpe
+    
+    @staticmethod
+    def _cryptos_by_id(crypto_ids):
+        return {
+            crypto.id: crypto
+            for crypto in Cryptocurrency.query.filter(Cryptocurrency.id.in_(list(crypto_ids))).all()
+        }
+    
+    def _turning_points(self, returns, cov, constraints):
+        lower, upper = self._bounds(len(returns), constraints)
+        return _critical_line(returns, cov, lower, upper)
+    
+    def _optimize_sharpe(self, returns, constraints, cov=None):
+        """Maximum Sharpe ratio (risk-free rate 0) portfolio within the weight bounds"""
+        if cov is None:
+            cov = self._diagonal_risk(returns)
+        lower, upper = self._bounds(len(returns), constraints)
+        return _max_sharpe(_critical_line(returns, cov, lower, upper), returns, cov, lower, upper)
+    
+    def _minimize_variance(self, returns, constraints, cov=None):
+        """Minimum-variance portfolio within the weight bounds"""
+        if cov is None:
+            cov = self._diagonal_risk(returns)
+        return self._turning_points(returns, cov, constraints)[-1]
     
     def _maximize_return(self, returns, constraints):
         """Maximize expected return"""
@@ -150,51 +419,50 @@ class PortfolioOptimizer:
         
         return weights
     
-    def efficient_frontier(self, crypto_ids, num_portfolios=50):
+    def efficient_frontier(self, crypto_ids, num_portfolios=50, constraints=None,
+                           include_weights=False):
         """
         Generate efficient frontier
         
         Args:
             crypto_ids: List of cryptocurrency IDs
-            num_portfolios: Number of portfolios to generate
+            num_portfolios: Number of frontier points (evenly spaced target returns)
+            constraints: Dict with 'min_weight' and 'max_weight' (default long-only, 0-1)
+            include_weights: Add each portfolio's weights by crypto ID
         
         Returns: list of portfolios with returns and risk
         """
         try:
-            # Get returns
-            returns = []
-            valid_ids = []
-            
-            for crypto_id in crypto_ids:
-                price_data = PriceHistory.query.filter_by(crypto_id=crypto_id).first()
-                if price_data and price_data.price_1yr_change is not None:
-                    returns.append(price_data.price_1yr_change / 100)
-                    valid_ids.append(crypto_id)
+            valid_ids, returns_array, cov = self.load_returns(crypto_ids)
             
             if len(valid_ids) < 2:
                 return []
             
-            returns_array = np.array(returns)
-            n_assets = len(valid_ids)
+            constraints = constraints or {'min_weight': 0.0, 'max_weight': 1.0}
+            turning_points = self._turning_points(returns_array, cov, constraints)
+            
+            # Evenly spaced target returns from minimum variance to maximum return
+            levels = turning_points @ returns_array
+            targets = np.linspace(levels[-1], levels[0], num_portfolios)
+            frontier = _frontier_at(turning_points, returns_array, targets)
             
             portfolios = []
             
-            for i in range(num_portfolios):
-                # Generate random weights
-                weights = np.random.random(n_assets)
-                weights = weights / weights.sum()
-                
-                # Calculate metrics
-                portfolio_return = np.dot(weights, returns_array)
-                portfolio_variance = np.dot(weights**2, returns_array**2)
-                portfolio_volatility = np.sqrt(portfolio_variance)
-                sharpe = portfolio_return / portfolio_volatility if portfolio_volatility > 0 else 0
+            for weights in frontier:
+                portfolio_return, portfolio_volatility, sharpe = self._portfolio_metrics(
+                    weights, returns_array, cov
+                )
                 
-                portfolios.append({
+                portfolio = {
                     'return': round(portfolio_return * 100, 2),
                     'volatility': round(portfolio_volatility * 100, 2),
                     'sharpe_ratio': round(sharpe, 2)
-                })
+                }
+                if include_weights:
+                    portfolio['weights'] = {
+                        crypto_id: round(float(weight), 4) for crypto_id, weight in zip(valid_ids, weights)
+                    }
+                portfolios.append(portfolio)
             
             # Sort by Sharpe ratio
             portfolios.sort(key=lambda x: x['sharpe_ratio'], reverse=True)
@@ -211,30 +479,17 @@ class PortfolioOptimizer:
         Equal risk contribution from each asset
         """
         try:
-            # Get volatilities
-            volatilities = []
-            valid_ids = []
-            
-            for crypto_id in crypto_ids:
-                price_data = PriceHistory.query.filter_by(crypto_id=crypto_id).first()
-                if price_data and price_data.price_1yr_change is not None:
-                    # Use absolute change as proxy for volatility
-                    vol = abs(price_data.price_1yr_change) / 100
-                    volatilities.append(max(vol, 0.01))  # Minimum volatility
-                    valid_ids.append(crypto_id)
+            valid_ids, _, cov = self.load_returns(crypto_ids)
             
-            if not volatilities:
+            if not valid_ids:
                 return None
             
-            volatilities_array = np.array(volatilities)
-            
-            # Inverse volatility weighting
-            inv_vol = 1 / volatilities_array
-            weights = inv_vol / inv_vol.sum()
+            weights = self._equal_risk_contribution(cov)
             
+            cryptos = self._cryptos_by_id(valid_ids)
             allocations = []
             for crypto_id, weight in zip(valid_ids, weights):
-                crypto = Cryptocurrency.query.get(crypto_id)
+                crypto = cryptos.get(crypto_id)
                 allocations.append({
                     'crypto_id': crypto_id,
                     'name': crypto.name if crypto else 'Unknown',
@@ -251,6 +506,28 @@ class PortfolioOptimizer:
             logger.error(f"Risk parity error: {e}")
             return None
     
+    @staticmethod
+    def _equal_risk_contribution(cov, max_iter=100, tol=1e-10):
+        """
+        Weights whose risk contributions w_i * (cov w)_i are all equal
+        
+        Newton's method on the convex problem min 1/2 y'cov y - sum(log y),
+        whose solution normalized to sum 1 is the risk parity portfolio
+        (inverse volatility when cov is diagonal).
+        """
+        y = 1 / np.sqrt(np.diag(cov))
+        for _ in range(max_iter):
+            gradient = cov @ y - 1 / y
+            if np.abs(gradient * y).max() < tol:
+                break
+            step = np.linalg.solve(cov + np.diag(1 / y ** 2), gradient)
+            # Damped step keeps y strictly positive
+            t = 1.0
+            while np.any(y - t * step <= 0):
+                t /= 2
+            y = y - t * step
+        return y / y.sum()
+    
     def name_based_diversification(self, target_count=10):
         """
         Create diversified portfolio based on name characteristics
@@ -11,21 +11,40 @@ from core.models import db, Cryptocurrency, NameAnalysis, PriceHistory
 from analyzers.advanced_analyzer import AdvancedAnalyzer
 from analyzers.esoteric_analyzer import EsotericAnalyzer
 from analyzers.name_analyzer import NameAnalyzer
+from utils.model_registry import ModelRegistry
 import json
+import time
+
+
+# Bump when feature extraction or model configuration changes so registered
+# models trained with the old code are not reused
+MODEL_VERSION = 1
+
+# Seconds between registry checks for a newer model version in ensure_trained()
+FRESHNESS_CHECK_INTERVAL = 60
+
+TIMEFRAMES = ['price_30d_change', 'price_90d_change', 'price_1yr_change', 'price_ath_change']
 
 
 class NamePredictor:
     """Predict cryptocurrency success from name characteristics"""
     
-    def __init__(self):
+    def __init__(self, registry=None, check_interval=FRESHNESS_CHECK_INTERVAL):
         self.name_analyzer = NameAnalyzer()
         self.advanced_analyzer = AdvancedAnalyzer()
         self.esoteric_analyzer = EsotericAnalyzer()
         
+        self.registry = registry or ModelRegistry()
+        
         self.models = {}
         self.scalers = {}
         self.feature_names = []
+        self.fingerprints = {}  # performance_metric -> training data fingerprint
+        self.training_scores = {}
         self.is_trained = False
+        
+        self.check_interval = check_interval
+        self._checked_at = {}  # performance_metric -> monotonic time of last fingerprint check
     
     def extract_features(self, name, launch_date=None):
         """
@@ -64,21 +83,129 @@ class NamePredictor:
         
         return features
     
+    def _training_query(self, performance_metric):
+        """Cryptocurrencies with complete data for a target metric"""
+        return db.session.query(Cryptocurrency, NameAnalysis, PriceHistory)\
+            .join(NameAnalysis, Cryptocurrency.id == NameAnalysis.crypto_id)\
+            .join(PriceHistory, Cryptocurrency.id == PriceHistory.crypto_id)\
+            .filter(getattr(PriceHistory, performance_metric).isnot(None))
+    
+    def training_fingerprint(self, performance_metric='price_1yr_change'):
+        """
+        Fingerprint of the training data (one aggregate query, no feature extraction)
+        
+        Changes whenever rows are added/removed, a target value changes, or a
+        cryptocurrency record (name, launch date) is updated.
+        """
+        target = getattr(PriceHistory, performance_metric)
+        stats = self._training_query(performance_metric).with_entities(
+            db.func.count(),
+            db.func.sum(target),
+            db.func.max(PriceHistory.id),
+            db.func.count(db.distinct(Cryptocurrency.id)),
+            db.func.max(Cryptocurrency.last_updated)
+        ).one()
+        
+        return ModelRegistry.fingerprint(MODEL_VERSION, performance_metric, list(stats))
+    
     def train(self, performance_metric='price_1yr_change'):
         """
         Train prediction models on existing data
         
+        Models already registered for the current training data are loaded from
+        the model registry instead of being refitted.
+        
         Args:
             performance_metric: Target metric to predict
         """
+        fingerprint = self.training_fingerprint(performance_metric)
+        
+        registered = self.registry.get_or_train(
+            f'name_predictor_{performance_metric}',
+            fingerprint,
+            lambda: self._fit(performance_metric)
+        )
+        self._install(performance_metric, registered, fingerprint)
+        
+        return registered['metadata']['scores']
+    
+    def ensure_trained(self, performance_metric='price_1yr_change'):
+        """
+        Install the newest registered model (never retrains on data changes)
+        
+        Models are retrained out of band by retrain() after collection runs.
+        This checks the registry pointer at most once per check_interval
+        seconds per metric and loads a newer version if one was registered.
+        Only when nothing is registered yet does it train, under the
+        registry's lock, so one worker fits and the others load the result.
+        """
+        now = time.monotonic()
+        checked_at = self._checked_at.get(performance_metric)
+        if performance_metric in self.models and checked_at is not None \
+                and now - checked_at < self.check_interval:
+            return
+        self._checked_at[performance_metric] = now
+        
+        name = f'name_predictor_{performance_metric}'
+        current = self.registry.current_fingerprint(name)
+        if current is not None and current != self.fingerprints.get(performance_metric):
+            registered = self.registry.load(name, current)
+            if registered is not None:
+                self._install(performance_metric, registered, current)
+        
+        if performance_metric not in self.models:
+            self.train(performance_metric)
+    
+    def retrain(self, metrics=None):
+        """
+        Fit and register models for the current training data (out of band)
+        
+        Run after collection; metrics whose data did not change load from the
+        registry instead of refitting.
+        
+        Returns:
+            Dict of metric -> scores, or error message
+        """
+        results = {}
+        for metric in metrics or TIMEFRAMES:
+            try:
+                results[metric] = self.train(metric)
+            except Exception as e:
+                results[metric] = {'error': str(e)}
+        return results
+    
+    def load_registered_models(self, metrics=None):
+        """
+        Load the most recently registered models without touching the database
+        
+        Intended for worker startup; ensure_trained() later picks up newer versions.
+        
+        Returns:
+            List of metrics loaded
+        """
+        loaded = []
+        for metric in metrics or TIMEFRAMES:
+            registered = self.registry.load_current(f'name_predictor_{metric}')
+            if registered is not None:
+                self._install(metric, registered, registered['metadata']['fingerprint'])
+                loaded.append(metric)
+        return loaded
+    
+    def _install(self, performance_metric, registered, fingerprint):
+        artifacts, metadata = registered['artifacts'], registered['metadata']
+        self.models[performance_metric] = artifacts['models']
+        self.scalers[performance_metric] = artifacts['scaler']
+        self.feature_names = list(metadata['feature_names'])
+        self.fingerprints[performance_metric] = fingerprint
+        self.training_scores[performance_metric] = metadata['scores']
+        self.is_trained = True
+    
+    def _fit(self, performance_metric):
+        """Fit scaler + model ensemble; returns (artifacts, metadata) for the registry"""
         print(f"Training predictor for {performance_metric}...")
         
         # Get all cryptocurrencies with complete data
-        cryptos = db.session.query(Cryptocurrency, NameAnalysis, PriceHistory)\
-            .join(NameAnalysis, Cryptocurrency.id == NameAnalysis.crypto_id)\
-            .join(PriceHistory, Cryptocurrency.id == PriceHistory.crypto_id)\
-            .filter(getattr(PriceHistory, performance_metric).isnot(None))\
-            .all()
+        cryptos = self._training_query(performance_metric).all()
         
         if len(cryptos) < 10:
             raise ValueError("Insufficient training data (need at least 10 samples)")
@@ -114,8 +241,8 @@ class NamePredictor:
             raise ValueError("Insufficient valid training samples")
         
         # Convert to consistent feature vectors
-        self.feature_names = sorted(X_data[0].keys())
-        X = np.array([[sample.get(f, 0) for f in self.feature_names] for sample in X_data])
+        feature_names = sorted(X_data[0].keys())
+        X = np.array([[sample.get(f, 0) for f in feature_names] for sample in X_data])
         y = np.array(y_data)
         
         # Scale features
@@ -132,19 +259,22 @@ class NamePredictor:
         for name, model in models.items():
             model.fit(X_scaled, y)
         
-        # Store trained models
-        self.models[performance_metric] = models
-        self.scalers[performance_metric] = scaler
-        self.is_trained = True
-        
         # Calculate training scores
         scores = {}
         for name, model in models.items():
-            scores[name] = model.score(X_scaled, y)
+            scores[name] = float(model.score(X_scaled, y))
         
         print(f"Training complete. R² scores: {scores}")
         
-        return scores
+        artifacts = {'models': models, 'scaler': scaler}
+        metadata = {
+            'feature_names': feature_names,
+            'scores': scores,
+            'performance_metric': performance_metric,
+            'training_samples': len(X_data),
+            'model_version': MODEL_VERSION,
+        }
+        return artifacts, metadata
     
     def predict(self, name, performance_metric='price_1yr_change', launch_date=None):
         """
@@ -158,8 +288,8 @@ class NamePredictor:
         Returns:
             Dict with predictions and confidence intervals
         """
-        if not self.is_trained or performance_metric not in self.models:
-            raise ValueError(f"Model not trained for {performance_metric}. Call train() first.")
+        # Picks up a newer registered model; training happens out of band
+        self.ensure_trained(performance_metric)
         
         # Extract features
         features = self.extract_features(name, launch_date)
@@ -211,10 +341,8 @@ class NamePredictor:
         Returns:
             Dict with predictions for 30d, 90d, 1yr, ATH
         """
-        timeframes = ['price_30d_change', 'price_90d_change', 'price_1yr_change', 'price_ath_change']
-        
         results = {}
-        for timeframe in timeframes:
+        for timeframe in TIMEFRAMES:
             try:
                 if timeframe in self.models:
                     results[timeframe] = self.predict(name, timeframe, launch_date)
@@ -336,8 +464,7 @@ class NamePredictor:
         Returns:
             Dict of feature: importance
         """
-        if not self.is_trained or performance_metric not in self.models:
-            raise ValueError("Model not trained")
+        self.ensure_trained(performance_metric)
         
         rf_model = self.models[performance_metric]['random_forest']
         
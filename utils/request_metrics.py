@@ -0,0 +1,571 @@
+"""
+Request Metrics - Per-Endpoint Latency, SQL and Payload Instrumentation
+
+Records, for every Flask endpoint: a latency histogram, SQL statement counts
+and time, response bytes and analyzer-level spans. Statements repeated many
+times within one request are reported as likely N+1 patterns, and the slowest
+recent requests are kept with their breakdown.
+
+SQL is tracked through SQLAlchemy engine events and spans through a context
+manager (or by wrapping a service object's entry-point methods), so routes
+don't need to change to be measured. A sampling profiler can be switched on at
+runtime to attribute wall time to call stacks per endpoint.
+
+Usage:
+    request_metrics = RequestMetrics()
+    request_metrics.init_app(app)
+    request_metrics.instrument(crypto_screener, 'crypto_screener', ('screen', 'live_rows'))
+
+    with request_metrics.span('athlete_loader.load_athletes'):
+        athletes = loader.load_athletes(sport)
+"""
+
+import hmac
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Iterable, List, Optional
+
+from flask import current_app, g, has_app_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BACKGROUND_ENDPOINT = '<background>'
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_QUERY_START_KEY = 'request_metrics_query_start'
+
+
+class _RequestState:
+    """Measurements for the request in flight (stored on flask.g)"""
+
+    __slots__ = ('endpoint', 'start', 'statements', 'sql_seconds', 'statement_counts', 'spans')
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.start = time.perf_counter()
+        self.statements = 0
+        self.sql_seconds = 0.0
+        self.statement_counts: Counter = Counter()
+        self.spans: Dict[str, List[float]] = {}
+
+
+class RequestMetrics:
+    """Per-endpoint request instrumentation for a Flask app"""
+
+    def __init__(self, buckets_ms: Iterable[float] = DEFAULT_BUCKETS_MS,
+                 repeated_statement_threshold: int = 10,
+                 slow_request_ms: float = 1000,
+                 max_slow_requests: int = 50):
+        """
+        Initialize metrics
+
+        Args:
+            buckets_ms: Latency histogram upper bounds (an overflow bucket is added)
+            repeated_statement_threshold: Executions of one statement within a
+                request at which it is reported as a likely N+1 pattern
+            slow_request_ms: Requests at least this slow are kept in the slow log
+            max_slow_requests: Size of the slow-request log
+        """
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self.repeated_statement_threshold = repeated_statement_threshold
+        self.slow_request_ms = slow_request_ms
+
+        self._endpoints: Dict[str, Dict] = {}
+        self._slow_requests = deque(maxlen=max_slow_requests)
+        self._lock = threading.Lock()
+        self._tracking_queries = False
+        self.profiler = SamplingProfiler()
+
+    # ------------------------------------------------------------------
+    # Flask integration
+    # ------------------------------------------------------------------
+
+    def init_app(self, app):
+        """Measure every request handled by the app (including blueprints)"""
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        self.track_queries()
+
+    def track_queries(self):
+        """Count and time SQL statements executed during requests"""
+        if self._tracking_queries:
+            return
+        event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._tracking_queries = True
+
+    @staticmethod
+    def protected(view):
+        """
+        Decorator gating a metrics endpoint on app config
+
+        The client address is not used: behind a reverse proxy every request
+        arrives from 127.0.0.1. The endpoint is off unless METRICS_ENABLED is
+        set; when METRICS_TOKEN is set the request must also send
+        'Authorization: Bearer <token>'.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get('METRICS_ENABLED'):
+                return jsonify({'error': 'metrics endpoints are disabled'}), 404
+            if not RequestMetrics._token_presented():
+                return jsonify({'error': 'invalid metrics token'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+
+    @staticmethod
+    def _token_presented() -> bool:
+        """True if no METRICS_TOKEN is configured or the request sends it"""
+        token = current_app.config.get('METRICS_TOKEN')
+        return not token or hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}')
+
+    @staticmethod
+    def _endpoint_key() -> str:
+        rule = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+        return f"{request.method} {rule}"
+
+    def _before_request(self):
+        state = _RequestState(self._endpoint_key())
+        g.request_metrics = state
+        self.profiler.enter(state.endpoint)
+
+    def _after_request(self, response):
+        state = g.pop('request_metrics', None)
+        if state is None:
+            return response
+
+        elapsed_ms = (time.perf_counter() - state.start) * 1000
+        size = response.content_length
+        if size is None and not response.direct_passthrough and not response.is_streamed:
+            size = len(response.get_data())
+
+        self._record_request(state, elapsed_ms, response.status_code, size or 0)
+
+        # Timing and statement counts are exposed under the same gate as the metrics endpoints
+        if not current_app.config.get('METRICS_ENABLED') or not self._token_presented():
+            return response
+
+        db_ms = state.sql_seconds * 1000
+        response.headers.add(
+            'Server-Timing',
+            f'app;dur={elapsed_ms:.1f}, db;dur={db_ms:.1f};desc="{state.statements} statements"'
+        )
+        return response
+
+    def _teardown_request(self, exc=None):
+        self.profiler.leave()
+
+    # ------------------------------------------------------------------
+    # SQL tracking
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _current_state() -> Optional[_RequestState]:
+        if not has_app_context():
+            return None
+        return g.get('request_metrics')
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_QUERY_START_KEY)
+        elapsed = time.perf_counter() - starts.pop() if starts else 0.0
+
+        state = self._current_state()
+        if state is None:
+            return
+        state.statements += 1
+        state.sql_seconds += elapsed
+        # Statements are parameterized, so N+1 loops repeat the same text
+        state.statement_counts[statement] += 1
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block as a named span of the current request"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_span(name, (time.perf_counter() - start) * 1000)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator recording each call as a span (default name: function qualname)"""
+        def decorator(fn):
+            span_name = name or fn.__qualname__
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._record_span(span_name, (time.perf_counter() - start) * 1000)
+            return wrapper
+        return decorator
+
+    def instrument(self, obj, prefix: str, methods: Iterable[str]):
+        """
+        Record calls to a service object's entry-point methods as spans
+
+        Wraps the listed bound methods on the instance (the class is
+        untouched). A listed method called while another listed method of the
+        same object is already running on this thread is not recorded again,
+        so internal calls never double-count the outer span.
+
+        Args:
+            obj: Analyzer/service instance
+            prefix: Span name prefix, e.g. 'crypto_screener'
+            methods: Entry-point method names the routes call
+        """
+        running = threading.local()
+        for attr in methods:
+            method = getattr(obj, attr)
+            setattr(obj, attr, self._outermost_span(f"{prefix}.{attr}", method, running))
+        return obj
+
+    def _outermost_span(self, name: str, fn, running: threading.local):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if getattr(running, 'active', False):
+                return fn(*args, **kwargs)
+            running.active = True
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                running.active = False
+                self._record_span(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def _record_span(self, name: str, elapsed_ms: float):
+        state = self._current_state()
+        if state is not None:
+            entry = state.spans.get(name)
+            if entry is None:
+                state.spans[name] = [1, elapsed_ms, elapsed_ms]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed_ms
+                entry[2] = max(entry[2], elapsed_ms)
+            return
+
+        # Outside a request (startup, background threads)
+        with self._lock:
+            stats = self._endpoint_stats(BACKGROUND_ENDPOINT)
+            self._merge_span(stats['spans'], name, 1, elapsed_ms, elapsed_ms)
+
+    @staticmethod
+    def _merge_span(spans: Dict, name: str, count: int, total_ms: float, max_ms: float):
+        entry = spans.get(name)
+        if entry is None:
+            spans[name] = {'count': count, 'total_ms': total_ms, 'max_ms': max_ms}
+        else:
+            entry['count'] += count
+            entry['total_ms'] += total_ms
+            entry['max_ms'] = max(entry['max_ms'], max_ms)
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def _endpoint_stats(self, endpoint: str) -> Dict:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = {
+                'requests': 0,
+                'errors': 0,
+                'histogram': [0] * (len(self.buckets_ms) + 1),
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'statements': 0,
+                'max_statements': 0,
+                'sql_ms': 0.0,
+                'bytes': 0,
+                'max_bytes': 0,
+                'spans': {},
+                'repeated_statements': Counter(),
+            }
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def _record_request(self, state: _RequestState, elapsed_ms: float, status: int, size: int):
+        repeated = [
+            (statement, count) for statement, count in state.statement_counts.items()
+            if count >= self.repeated_statement_threshold
+        ]
+
+        with self._lock:
+            stats = self._endpoint_stats(state.endpoint)
+            stats['requests'] += 1
+            if status >= 500:
+                stats['errors'] += 1
+            stats['histogram'][bisect_left(self.buckets_ms, elapsed_ms)] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['statements'] += state.statements
+            stats['max_statements'] = max(stats['max_statements'], state.statements)
+            stats['sql_ms'] += state.sql_seconds * 1000
+            stats['bytes'] += size
+            stats['max_bytes'] = max(stats['max_bytes'], size)
+
+            for name, (count, total_ms, max_ms) in state.spans.items():
+                self._merge_span(stats['spans'], name, count, total_ms, max_ms)
+            for statement, count in repeated:
+                stats['repeated_statements'][statement] = max(stats['repeated_statements'][statement], count)
+
+            if elapsed_ms >= self.slow_request_ms:
+                self._slow_requests.append({
+                    'endpoint': state.endpoint,
+                    'path': request.full_path.rstrip('?'),
+                    'status': status,
+                    'latency_ms': round(elapsed_ms, 1),
+                    'statements': state.statements,
+                    'sql_ms': round(state.sql_seconds * 1000, 1),
+                    'bytes': size,
+                    'spans': {
+                        name: round(total_ms, 1)
+                        for name, (_, total_ms, _) in sorted(
+                            state.spans.items(), key=lambda item: item[1][1], reverse=True
+                        )[:10]
+                    },
+                    'repeated_statements': len(repeated),
+                    'at': time.time(),
+                })
+
+    def _percentile(self, histogram: List[int], fraction: float) -> Optional[float]:
+        """Upper bound of the bucket containing the given fraction of requests"""
+        total = sum(histogram)
+        if not total:
+            return None
+        target = fraction * total
+        running = 0
+        for bound, count in zip(self.buckets_ms + (None,), histogram):
+            running += count
+            if running >= target:
+                return bound
+        return None
+
+    def snapshot(self, limit: Optional[int] = None) -> Dict:
+        """
+        Per-endpoint summary, slowest (by total time) first
+
+        Percentiles and histogram bounds are bucket upper bounds in ms (None
+        means above the largest bucket).
+        """
+        with self._lock:
+            endpoints = []
+            for endpoint, stats in self._endpoints.items():
+                requests = stats['requests']
+                endpoints.append({
+                    'endpoint': endpoint,
+                    'requests': requests,
+                    'errors': stats['errors'],
+                    'total_ms': round(stats['total_ms'], 1),
+                    'mean_ms': round(stats['total_ms'] / requests, 2) if requests else None,
+                    'max_ms': round(stats['max_ms'], 1),
+                    'p50_ms': self._percentile(stats['histogram'], 0.50),
+                    'p95_ms': self._percentile(stats['histogram'], 0.95),
+                    'p99_ms': self._percentile(stats['histogram'], 0.99),
+                    'histogram': [
+                        {'le_ms': bound, 'count': count}
+                        for bound, count in zip(self.buckets_ms + (None,), stats['histogram'])
+                    ],
+                    'sql': {
+                        'statements': stats['statements'],
+                        'mean_statements': round(stats['statements'] / requests, 2) if requests else None,
+                        'max_statements': stats['max_statements'],
+                        'total_ms': round(stats['sql_ms'], 1),
+                    },
+                    'bytes': {
+                        'total': stats['bytes'],
+                        'mean': round(stats['bytes'] / requests) if requests else None,
+                        'max': stats['max_bytes'],
+                    },
+                    'spans': {
+                        name: {
+                            'count': span['count'],
+                            'total_ms': round(span['total_ms'], 1),
+                            'mean_ms': round(span['total_ms'] / span['count'], 2),
+                            'max_ms': round(span['max_ms'], 1),
+                        }
+                        for name, span in sorted(
+                            stats['spans'].items(), key=lambda item: item[1]['total_ms'], reverse=True
+                        )
+                    },
+                    'repeated_statements': [
+                        {'statement': statement[:300], 'max_per_request': count}
+                        for statement, count in stats['repeated_statements'].most_common(5)
+                    ],
+                })
+
+            slow_requests = list(self._slow_requests)
+
+        endpoints.sort(key=lambda item: item['total_ms'], reverse=True)
+        return {
+            'endpoints': endpoints[:limit] if limit else endpoints,
+            'endpoint_count': len(endpoints),
+            'slow_requests': slow_requests[::-1],
+            'slow_request_ms': self.slow_request_ms,
+            'repeated_statement_threshold': self.repeated_statement_threshold,
+            'profiler': {'running': self.profiler.running, 'samples': self.profiler.samples},
+        }
+
+    def reset(self):
+        """Drop all recorded measurements"""
+        with self._lock:
+            self._endpoints.clear()
+            self._slow_requests.clear()
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler attributing stacks to endpoints
+
+    A daemon thread periodically reads the stack of every thread currently
+    serving a request (sys._current_frames). Overhead is proportional to the
+    sampling rate, not to the code being profiled, so it can be toggled on in
+    production for a while and switched off again.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 48):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+
+        self._active: Dict[int, str] = {}
+        self._stacks: Counter = Counter()
+        self._labels: Dict = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def enter(self, endpoint: str):
+        """Mark the calling thread as serving an endpoint"""
+        self._active[threading.get_ident()] = endpoint
+
+    def leave(self):
+        self._active.pop(threading.get_ident(), None)
+
+    def start(self, interval: Optional[float] = None):
+        """Start sampling (no-op if already running)"""
+        if interval:
+            self.interval = interval
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='request-metrics-profiler', daemon=True)
+        self._thread.start()
+        logger.info(f"Sampling profiler started ({self.interval * 1000:.1f}ms interval)")
+
+    def stop(self):
+        """Stop sampling; collected samples are kept until reset()"""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+        logger.info(f"Sampling profiler stopped ({self.samples} samples)")
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(_PROJECT_ROOT):
+                filename = os.path.relpath(filename, _PROJECT_ROOT)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            active = dict(self._active)
+            if not active:
+                continue
+            frames = sys._current_frames()
+
+            sampled = []
+            for ident, endpoint in active.items():
+                frame = frames.get(ident)
+                if frame is None or ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                sampled.append((endpoint, tuple(reversed(stack))))
+
+            with self._lock:
+                for key in sampled:
+                    self._stacks[key] += 1
+                self.samples += len(sampled)
+
+    def report(self, top: int = 20) -> Dict:
+        """
+        Hottest functions and stacks per endpoint
+
+        'self' counts samples where a function was executing, 'cumulative'
+        samples where it was anywhere on the stack; 'stacks' are in collapsed
+        flame-graph format ("outer;inner;leaf").
+        """
+        with self._lock:
+            stacks = list(self._stacks.items())
+            samples = self.samples
+
+        by_endpoint = defaultdict(list)
+        for (endpoint, stack), count in stacks:
+            by_endpoint[endpoint].append((stack, count))
+
+        endpoints = {}
+        for endpoint, entries in by_endpoint.items():
+            self_counts = Counter()
+            cumulative = Counter()
+            for stack, count in entries:
+                if stack:
+                    self_counts[stack[-1]] += count
+                for label in set(stack):
+                    cumulative[label] += count
+
+            total = sum(count for _, count in entries)
+            endpoints[endpoint] = {
+                'samples': total,
+                'self': [{'function': label, 'samples': count, 'share': round(count / total, 3)}
+                         for label, count in self_counts.most_common(top)],
+                'cumulative': [{'function': label, 'samples': count, 'share': round(count / total, 3)}
+                               for label, count in cumulative.most_common(top)],
+                'stacks': [f"{';'.join(stack)} {count}"
+                           for stack, count in sorted(entries, key=lambda item: item[1], reverse=True)[:top]],
+            }
+
+        return {
+            'running': self.running,
+            'interval_ms': self.interval * 1000,
+            'samples': samples,
+            'endpoints': dict(sorted(endpoints.items(), key=lambda item: item[1]['samples'], reverse=True)),
+        }
@@ -0,0 +1,309 @@
+"""
+Response Cache - Dependency-Tracked In-Process Caching
+
+Caches expensive JSON responses and intermediate results. Every entry declares
+the tables it depends on and is served only while the table versions it was
+computed against are still current. A table's version combines:
+
+- a per-process counter bumped on every committed ORM write in this process
+  (SQLAlchemy session events, so the collector, API handlers and scripts
+  invalidate dependents without calling the cache), and
+- when a database handle is given, an aggregate watermark read from the
+  database (row count, max primary key, max last_updated), which sees
+  inserts, deletes and timestamped updates made by other workers or
+  processes. The watermark is re-read at most every watermark_interval
+  seconds per table set, so lookups do not pay for aggregate queries; writes
+  from other processes become visible within that interval.
+
+Entries have no TTL: they are served exactly as long as their versions hold.
+The cache is bounded with LRU eviction. Writes that leave no watermark (raw
+SQL, or in-place updates to tables without last_updated from another
+process) should call bump().
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+from flask import current_app, make_response, request
+from sqlalchemy import event, func, literal, select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_TABLES_KEY = 'response_cache_pending_tables'
+
+
+class ResponseCache:
+    """LRU cache whose entries are invalidated by per-table write versions"""
+
+    def __init__(self, max_entries: int = 256, db=None, watermark_interval: float = 2.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum cached entries before least-recently-used eviction
+            db: Flask-SQLAlchemy handle; when given, versions include a database watermark
+            watermark_interval: Minimum seconds between watermark queries per table set
+        """
+        self.max_entries = max_entries
+        self.db = db
+        self.watermark_interval = watermark_interval
+        self._entries: 'OrderedDict[str, Tuple[Any, Tuple[str, ...], Tuple]]' = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._watermarks: Dict[Tuple[str, ...], Tuple[Optional[Dict[str, Tuple]], float]] = {}
+        self._lock = threading.Lock()
+        self._tracking = False
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Versions
+    # ------------------------------------------------------------------
+
+    def versions(self, tables: Iterable[str]) -> Tuple:
+        """Current write versions for a set of tables (local counters + database watermark)"""
+        tables = tuple(tables)
+        return tuple(self._versions.get(table, 0) for table in tables) + self._db_watermark(tables)
+
+    def _db_watermark(self, tables: Tuple[str, ...]) -> Tuple:
+        """Database watermark for a table set as a comparable tuple"""
+        if self.db is None or not tables:
+            return ()
+        watermark = self.watermark(tables)
+        # Unequal to anything stored, so nothing is served until the query recovers
+        return (object(),) if watermark is None else tuple(watermark.values())
+
+    def watermark(self, tables: Iterable[str]) -> Optional[Dict[str, Tuple]]:
+        """
+        Per-table (row count, max primary key, max last_updated) from the database
+
+        Re-queried at most every watermark_interval seconds per table set and
+        shared by every caller (the crypto screener syncs from it too). Missing
+        columns read as None; returns None without a database or if the query failed.
+        """
+        tables = tuple(tables)
+        if self.db is None or not tables:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._watermarks.get(tables)
+        if cached is not None and now - cached[1] < self.watermark_interval:
+            return cached[0]
+
+        watermark = self._query_watermark(tables)
+        with self._lock:
+            self._watermarks[tables] = (watermark, now)
+        return watermark
+
+    def _query_watermark(self, tables: Tuple[str, ...]) -> Optional[Dict[str, Tuple]]:
+        """Row count, max primary key and max last_updated per table, in one round trip"""
+        null = literal(None)
+        names = []
+        aggregates = []
+        for name in tables:
+            table = self.db.metadata.tables.get(name)
+            if table is None:
+                continue
+            names.append(name)
+            primary_key = list(table.primary_key.columns)
+            aggregates.append(select(func.count()).select_from(table).scalar_subquery())
+            aggregates.append(select(func.max(primary_key[0])).scalar_subquery()
+                              if len(primary_key) == 1 else null)
+            aggregates.append(select(func.max(table.c.last_updated)).scalar_subquery()
+                              if 'last_updated' in table.c else null)
+        if not aggregates:
+            return {}
+
+        try:
+            # Own connection: never touches the request session's transaction
+            with self.db.engine.connect() as connection:
+                row = connection.execute(select(*aggregates)).one()
+        except Exception as e:
+            logger.warning(f"Response cache watermark query failed: {e}")
+            return None
+        return {name: tuple(row[3 * i:3 * i + 3]) for i, name in enumerate(names)}
+
+    def bump(self, *tables: str):
+        """Mark tables as written; dependent entries become stale"""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def track_writes(self):
+        """Bump table versions automatically on every committed ORM write"""
+        if self._tracking:
+            return
+        event.listen(Session, 'after_flush', self._collect_flushed_tables)
+        event.listen(Session, 'do_orm_execute', self._collect_bulk_tables)
+        event.listen(Session, 'after_commit', self._commit_tables)
+        event.listen(Session, 'after_soft_rollback', self._discard_tables)
+        self._tracking = True
+
+    @staticmethod
+    def _collect_flushed_tables(session, flush_context):
+        pending = session.info.setdefault(_PENDING_TABLES_KEY, set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            table = getattr(obj, '__tablename__', None)
+            if table:
+                pending.add(table)
+
+    @staticmethod
+    def _collect_bulk_tables(orm_execute_state):
+        # query.update() / query.delete() / insert() bypass the flush
+        if orm_execute_state.is_select:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            pending = orm_execute_state.session.info.setdefault(_PENDING_TABLES_KEY, set())
+            pending.add(mapper.local_table.name)
+
+    def _commit_tables(self, session):
+        pending = session.info.pop(_PENDING_TABLES_KEY, None)
+        if pending:
+            self.bump(*pending)
+
+    @staticmethod
+    def _discard_tables(session, previous_transaction):
+        session.info.pop(_PENDING_TABLES_KEY, None)
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None, versions: Optional[Tuple] = None) -> Any:
+        """
+        Cached value if present and none of its tables changed since, else default
+
+        Args:
+            key: Cache key
+            default: Returned on a miss
+            versions: Current versions of the entry's tables, if the caller already
+                read them (saves a second read when the caller will also set())
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return default
+
+        value, tables, stored_versions = entry
+        # Version check outside the lock: it may query the database
+        if versions is None:
+            versions = self.versions(tables)
+
+        with self._lock:
+            if stored_versions != versions:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, depends_on: Iterable[str],
+            versions: Optional[Tuple] = None) -> Any:
+        """
+        Store a value computed from the given tables
+
+        Args:
+            key: Cache key
+            value: Value to store
+            depends_on: Table names the value was computed from
+            versions: Table versions read before computing (defaults to current);
+                passing them keeps a result that raced a write from being served
+
+        Returns:
+            value (for chaining)
+        """
+        tables = tuple(depends_on)
+        if versions is None:
+            versions = self.versions(tables)
+        with self._lock:
+            self._entries[key] = (value, tables, versions)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def clear(self) -> int:
+        """Drop all entries; returns the number removed"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'watermark_interval': self.watermark_interval,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            'table_versions': dict(self._versions),
+        }
+
+    # ------------------------------------------------------------------
+    # Flask integration
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def request_key() -> str:
+        """Cache key for the current request (path + sorted query string)"""
+        args = sorted(request.args.items(multi=True))
+        return f"{request.path}?{urlencode(args)}" if args else request.path
+
+    def cached(self, depends_on: Iterable[str]):
+        """
+        Decorator caching a GET endpoint's successful JSON response
+
+        Args:
+            depends_on: Table names the endpoint reads
+
+        Usage:
+            @app.route('/api/stats/dataset')
+            @response_cache.cached(depends_on=('cryptocurrency', 'price_history'))
+            def get_dataset(): ...
+        """
+        tables = tuple(depends_on)
+
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if request.method != 'GET':
+                    return view(*args, **kwargs)
+
+                key = self.request_key()
+                # One version read serves both the lookup and the store on a miss
+                versions = self.versions(tables)
+                cached = self.get(key, versions=versions)
+                if cached is not None:
+                    body, mimetype = cached
+                    return current_app.response_class(body, status=200, mimetype=mimetype)
+
+                response = make_response(view(*args, **kwargs))
+
+                # Only cache successful JSON; errors are always recomputed
+                if response.status_code == 200 and response.is_json:
+                    self.set(key, (response.get_data(), response.mimetype), tables, versions)
+
+                return response
+            return wrapper
+        return decorator
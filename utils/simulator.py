@@ -5,14 +5,20 @@ Monte Carlo simulations and A/B testing for cryptocurrency names
 
 import numpy as np
 from predictor import NamePredictor
-import random
+
+
+# Upper bound on simulated values held in memory at once (~64 MB of float64)
+MAX_CHUNK_CELLS = 8_000_000
+
+SUMMARY_PERCENTILES = [1, 5, 25, 50, 75, 95]
 
 
 class MarketSimulator:
     """Simulate market performance for name testing"""
     
-    def __init__(self):
+    def __init__(self, seed=None):
         self.predictor = NamePredictor()
+        self.rng = np.random.default_rng(seed)
     
     def monte_carlo_simulation(self, name, performance_metric='price_1yr_change', 
                                simulations=1000, volatility=0.3):
@@ -28,48 +34,122 @@ class MarketSimulator:
         Returns:
             Dict with simulation results
         """
-        # Ensure predictor is trained
-        if not self.predictor.is_trained or performance_metric not in self.predictor.models:
-            self.predictor.train(performance_metric)
+        return self.simulate_many([name], performance_metric, simulations, volatility,
+                                  skip_errors=False)[0]
+    
+    def simulate_many(self, names, performance_metric='price_1yr_change',
+                      simulations=1000, volatility=0.3, skip_errors=True):
+        """
+        Run Monte Carlo simulations for many names in one vectorized pass
         
-        # Get base prediction
-        base_prediction = self.predictor.predict(name, performance_metric)
+        Args:
+            names: List of cryptocurrency names
+            performance_metric: Which metric to simulate
+            simulations: Number of simulation runs per name
+            volatility: Price volatility factor (0-1)
+            skip_errors: Drop names whose prediction fails instead of raising
+            
+        Returns:
+            List of simulation result dicts (same format as monte_carlo_simulation)
+        """
+        # Ensure predictor is trained on the current data (loads registered models when possible)
+        self.predictor.ensure_trained(performance_metric)
         
-        # Run simulations
-        results = []
+        predicted_names = []
+        base_predictions = []
+        for name in names:
+            try:
+                base_predictions.append(self.predictor.predict(name, performance_metric)['prediction'])
+                predicted_names.append(name)
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                print(f"Error simulating {name}: {e}")
+        
+        if not predicted_names:
+            return []
         
-        for _ in range(simulations):
-            # Add randomness based on volatility and prediction uncertainty
-            noise_std = volatility * abs(base_prediction['prediction'])
-            simulated_return = np.random.normal(
-                base_prediction['prediction'],
-                max(noise_std, 10)  # Minimum 10% std
-            )
-            results.append(simulated_return)
+        stats = self.simulate_returns(np.array(base_predictions, dtype=float), simulations, volatility)
         
-        results = np.array(results)
+        return [
+            self._summarize(name, simulations, base, {key: values[i] for key, values in stats.items()})
+            for i, (name, base) in enumerate(zip(predicted_names, base_predictions))
+        ]
+    
+    def simulate_returns(self, base_predictions, simulations=1000, volatility=0.3,
+                         max_chunk_cells=MAX_CHUNK_CELLS):
+        """
+        Draw a (names x simulations) return matrix and summarize each row
+        
+        Returns are normal around each base prediction with std
+        max(volatility * |prediction|, 10). Rows are processed in chunks so at
+        most max(max_chunk_cells, simulations) values are held at once, which
+        keeps 10^6-path runs over hundreds of names in bounded memory.
         
-        # Calculate statistics
+        Args:
+            base_predictions: Array of predicted returns, one per name
+            simulations: Number of paths per name
+            volatility: Price volatility factor (0-1)
+            max_chunk_cells: Memory bound for a chunk of simulated values
+            
+        Returns:
+            Dict of per-name statistic arrays (mean, median, std, min, max,
+            p1..p95, prob_positive, prob_above_50, prob_above_100)
+        """
+        base_predictions = np.asarray(base_predictions, dtype=float)
+        n_names = len(base_predictions)
+        # Minimum 10% std
+        noise_std = np.maximum(volatility * np.abs(base_predictions), 10)
+        
+        keys = ['mean', 'median', 'std', 'min', 'max', 'prob_positive', 'prob_above_50', 'prob_above_100']
+        keys += [f'p{q}' for q in SUMMARY_PERCENTILES]
+        stats = {key: np.empty(n_names) for key in keys}
+        
+        rows_per_chunk = max(1, max_chunk_cells // max(simulations, 1))
+        for start in range(0, n_names, rows_per_chunk):
+            rows = slice(start, min(start + rows_per_chunk, n_names))
+            results = self.rng.standard_normal((rows.stop - rows.start, simulations))
+            results *= noise_std[rows, None]
+            results += base_predictions[rows, None]
+            
+            stats['mean'][rows] = results.mean(axis=1)
+            stats['std'][rows] = results.std(axis=1)
+            stats['min'][rows] = results.min(axis=1)
+            stats['max'][rows] = results.max(axis=1)
+            stats['prob_positive'][rows] = (results > 0).mean(axis=1) * 100
+            stats['prob_above_50'][rows] = (results > 50).mean(axis=1) * 100
+            stats['prob_above_100'][rows] = (results > 100).mean(axis=1) * 100
+            
+            percentiles = np.percentile(results, SUMMARY_PERCENTILES, axis=1)
+            for q, values in zip(SUMMARY_PERCENTILES, percentiles):
+                stats[f'p{q}'][rows] = values
+            stats['median'][rows] = stats['p50'][rows]
+        
+        return stats
+    
+    @staticmethod
+    def _summarize(name, simulations, base_prediction, stats):
+        """Result dict for one name from its row of simulate_returns() statistics"""
         return {
             'name': name,
             'simulations': simulations,
-            'mean_return': round(float(np.mean(results)), 2),
-            'median_return': round(float(np.median(results)), 2),
-            'std_dev': round(float(np.std(results)), 2),
-            'min_return': round(float(np.min(results)), 2),
-            'max_return': round(float(np.max(results)), 2),
+            'mean_return': round(float(stats['mean']), 2),
+            'median_return': round(float(stats['median']), 2),
+            'std_dev': round(float(stats['std']), 2),
+            'min_return': round(float(stats['min']), 2),
+            'max_return': round(float(stats['max']), 2),
             'percentiles': {
-                '5th': round(float(np.percentile(results, 5)), 2),
-                '25th': round(float(np.percentile(results, 25)), 2),
-                '75th': round(float(np.percentile(results, 75)), 2),
-                '95th': round(float(np.percentile(results, 95)), 2)
+                '5th': round(float(stats['p5']), 2),
+                '25th': round(float(stats['p25']), 2),
+                '75th': round(float(stats['p75']), 2),
+                '95th': round(float(stats['p95']), 2)
             },
-            'probability_positive': round(float(np.sum(results > 0) / len(results) * 100), 2),
-            'probability_above_50': round(float(np.sum(results > 50) / len(results) * 100), 2),
-            'probability_above_100': round(float(np.sum(results > 100) / len(results) * 100), 2),
-            'value_at_risk_5': round(float(np.percentile(results, 5)), 2),  # 5% VaR
-            'value_at_risk_1': round(float(np.percentile(results, 1)), 2),  # 1% VaR
-            'base_prediction': base_prediction['prediction']
+            'probability_positive': round(float(stats['prob_positive']), 2),
+            'probability_above_50': round(float(stats['prob_above_50']), 2),
+            'probability_above_100': round(float(stats['prob_above_100']), 2),
+            'value_at_risk_5': round(float(stats['p5']), 2),  # 5% VaR
+            'value_at_risk_1': round(float(stats['p1']), 2),  # 1% VaR
+            'base_prediction': base_prediction
         }
     
     def ab_test(self, name_a, name_b, performance_metric='price_1yr_change', 
@@ -87,8 +167,8 @@ class MarketSimulator:
             Dict with A/B test results and winner
         """
         # Run simulations for both names
-        sim_a = self.monte_carlo_simulation(name_a, performance_metric, simulations)
-        sim_b = self.monte_carlo_simulation(name_b, performance_metric, simulations)
+        sim_a, sim_b = self.simulate_many([name_a, name_b], performance_metric, simulations,
+                                          skip_errors=False)
         
         # Calculate probability that A > B
         # Using normal distribution assumption
@@ -141,21 +221,18 @@ class MarketSimulator:
         if len(names) < 2:
             raise ValueError("Need at least 2 names for tournament")
         
-        # Get predictions for all names
-        predictions = []
-        for name in names:
-            try:
-                sim = self.monte_carlo_simulation(name, performance_metric, simulations=500)
-                predictions.append({
-                    'name': name,
-                    'mean_return': sim['mean_return'],
-                    'median_return': sim['median_return'],
-                    'std_dev': sim['std_dev'],
-                    'prob_positive': sim['probability_positive'],
-                    'prob_above_100': sim['probability_above_100']
-                })
-            except Exception as e:
-                print(f"Error simulating {name}: {e}")
+        # Simulate all names in one batch (names that fail prediction are skipped)
+        predictions = [
+            {
+                'name': sim['name'],
+                'mean_return': sim['mean_return'],
+                'median_return': sim['median_return'],
+                'std_dev': sim['std_dev'],
+                'prob_positive': sim['probability_positive'],
+                'prob_above_100': sim['probability_above_100']
+            }
+            for sim in self.simulate_many(names, performance_metric, simulations=500)
+        ]
         
         # Sort by mean return
         predictions.sort(key=lambda x: x['mean_return'], reverse=True)
@@ -185,6 +262,12 @@ class MarketSimulator:
             Dict with risk metrics
         """
         sim = self.monte_carlo_simulation(name, performance_metric, simulations=10000)
+        return self._risk_from_simulation(sim, investment_amount)
+    
+    @staticmethod
+    def _risk_from_simulation(sim, investment_amount):
+        """Risk metrics for a simulation result"""
+        name = sim['name']
         
         # Calculate potential returns
         returns = {
@@ -241,18 +324,25 @@ class MarketSimulator:
         Returns:
             Dict comparing scenarios
         """
+        # Simulate every distinct name once, as a single batch
+        sims = {
+            sim['name']: sim
+            for sim in self.simulate_many(list(dict.fromkeys(names_dict.values())),
+                                          performance_metric, simulations=10000)
+        }
+        
         scenarios = {}
         
         for scenario_name, crypto_name in names_dict.items():
-            try:
-                risk = self.risk_analysis(crypto_name, performance_metric)
-                scenarios[scenario_name] = {
-                    'name': crypto_name,
-                    'expected_return': risk['risk_metrics'],
-                    'probabilities': risk['probabilities']
-                }
-            except Exception as e:
-                print(f"Error analyzing scenario {scenario_name}: {e}")
+            if crypto_name not in sims:
+                print(f"Error analyzing scenario {scenario_name}: simulation failed for {crypto_name}")
+                continue
+            risk = self._risk_from_simulation(sims[crypto_name], investment_amount=10000)
+            scenarios[scenario_name] = {
+                'name': crypto_name,
+                'expected_return': risk['risk_metrics'],
+                'probabilities': risk['probabilities']
+            }
         
         return {
             'scenarios': scenarios,